@@ -1,13 +1,22 @@
 """Opentrons analyze CLI."""
+import contextlib
+import os
+import time
 import click
 
 from anyio import run, Path as AsyncPath
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from pydantic import BaseModel
 from typing import Any, Dict, List, Optional, Sequence, Union
 from typing_extensions import Literal
 
+from opentrons_shared_data.pipette import (
+    model_config as load_pipette_model_config,
+    name_config as load_pipette_name_config,
+)
+
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_reader import (
     ProtocolReader,
@@ -41,13 +50,37 @@ from opentrons_shared_data.robot.dev_types import RobotType
     help="Return analysis results as machine-readable JSON.",
     type=click.Path(path_type=AsyncPath),
 )
-def analyze(files: Sequence[Path], json_output: Optional[Path]) -> None:
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help=(
+        "Analyze each given file or directory as a separate protocol,"
+        " in parallel. Each protocol's results are written to --json-output"
+        " as one line of JSON, as soon as they are ready."
+    ),
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="How many protocols to analyze at once with --batch. Defaults to one per CPU.",
+)
+def analyze(
+    files: Sequence[Path],
+    json_output: Optional[Path],
+    batch: bool,
+    workers: Optional[int],
+) -> None:
     """Analyze a protocol.
 
     You can use `opentrons analyze` to get a protocol's expected
     equipment and commands.
     """
-    run(_analyze, files, json_output)
+    if batch:
+        _analyze_batch(files, json_output, workers)
+    else:
+        run(_analyze, files, json_output)
 
 
 def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
@@ -66,45 +99,9 @@ async def _analyze(
     files_and_dirs: Sequence[Path],
     json_output: Optional[AsyncPath],
 ) -> None:
-    input_files = _get_input_files(files_and_dirs)
-
-    try:
-        protocol_source = await ProtocolReader().read_saved(
-            files=input_files,
-            directory=None,
-        )
-    except ProtocolFilesInvalidError as error:
-        raise click.ClickException(str(error))
-
-    runner = await create_simulating_runner(robot_type=protocol_source.robot_type)
-    analysis = await runner.run(protocol_source)
+    results = await _get_results(_get_input_files(files_and_dirs))
 
     if json_output:
-        results = AnalyzeResults.construct(
-            createdAt=datetime.now(tz=timezone.utc),
-            files=[
-                ProtocolFile.construct(name=f.path.name, role=f.role)
-                for f in protocol_source.files
-            ],
-            config=(
-                JsonConfig.construct(
-                    schemaVersion=protocol_source.config.schema_version
-                )
-                if isinstance(protocol_source.config, JsonProtocolConfig)
-                else PythonConfig.construct(
-                    apiVersion=protocol_source.config.api_version
-                )
-            ),
-            metadata=protocol_source.metadata,
-            robotType=protocol_source.robot_type,
-            commands=analysis.commands,
-            errors=analysis.state_summary.errors,
-            labware=analysis.state_summary.labware,
-            pipettes=analysis.state_summary.pipettes,
-            modules=analysis.state_summary.modules,
-            liquids=analysis.state_summary.liquids,
-        )
-
         await json_output.write_text(
             results.json(exclude_none=True),
             encoding="utf-8",
@@ -116,6 +113,99 @@ async def _analyze(
         )
 
 
+def _analyze_batch(
+    files_and_dirs: Sequence[Path],
+    json_output: Optional[Path],
+    workers: Optional[int],
+) -> None:
+    if not json_output:
+        raise click.UsageError(
+            "Currently, this tool only supports JSON mode. Use `--json-output`."
+        )
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers or os.cpu_count() or 1, len(files_and_dirs)),
+        initializer=_warm_up_worker,
+    ) as executor, open(json_output, "w", encoding="utf-8") as output_file:
+        futures = [
+            executor.submit(_analyze_batch_entry, entry) for entry in files_and_dirs
+        ]
+
+        for future in as_completed(futures):
+            output_file.write(future.result() + "\n")
+            output_file.flush()
+
+
+def _warm_up_worker() -> None:
+    """Load what every analysis needs, once per worker process."""
+    load_pipette_name_config()
+    load_pipette_model_config()
+
+    # Stopping a run imports the OT-3 hardware controller, if it's installed,
+    # to check whether it's controlling an OT-3.
+    with contextlib.suppress(ImportError):
+        import opentrons.hardware_control.ot3api  # noqa: F401
+
+
+def _analyze_batch_entry(file_or_dir: Path) -> str:
+    """Analyze one protocol of a batch, returning its line of JSON output."""
+    start_time = time.perf_counter()
+    results: Optional[AnalyzeResults] = None
+    error: Optional[str] = None
+
+    # Report anything that goes wrong as this protocol's error,
+    # rather than stopping the rest of the batch.
+    try:
+        results = run(_get_results, _get_input_files([file_or_dir]))
+    except click.ClickException as e:
+        error = e.format_message()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return BatchAnalyzeResult.construct(
+        source=str(file_or_dir),
+        analysisSeconds=time.perf_counter() - start_time,
+        results=results,
+        error=error,
+    ).json(exclude_none=True)
+
+
+async def _get_results(input_files: List[Path]) -> "AnalyzeResults":
+    try:
+        protocol_source = await ProtocolReader().read_saved(
+            files=input_files,
+            directory=None,
+        )
+    except ProtocolFilesInvalidError as error:
+        raise click.ClickException(str(error))
+
+    runner = await create_simulating_runner(
+        robot_type=protocol_source.robot_type, use_virtual_clock=True
+    )
+    analysis = await runner.run(protocol_source)
+
+    return AnalyzeResults.construct(
+        createdAt=datetime.now(tz=timezone.utc),
+        files=[
+            ProtocolFile.construct(name=f.path.name, role=f.role)
+            for f in protocol_source.files
+        ],
+        config=(
+            JsonConfig.construct(schemaVersion=protocol_source.config.schema_version)
+            if isinstance(protocol_source.config, JsonProtocolConfig)
+            else PythonConfig.construct(apiVersion=protocol_source.config.api_version)
+        ),
+        metadata=protocol_source.metadata,
+        robotType=protocol_source.robot_type,
+        commands=analysis.commands,
+        errors=analysis.state_summary.errors,
+        labware=analysis.state_summary.labware,
+        pipettes=analysis.state_summary.pipettes,
+        modules=analysis.state_summary.modules,
+        liquids=analysis.state_summary.liquids,
+    )
+
+
 class ProtocolFile(BaseModel):
     """A file in a protocol analysis."""
 
@@ -151,3 +241,12 @@ class AnalyzeResults(BaseModel):
     modules: List[LoadedModule]
     liquids: List[Liquid]
     errors: List[ErrorOccurrence]
+
+
+class BatchAnalyzeResult(BaseModel):
+    """One protocol's line of output from a batch analysis."""
+
+    source: str
+    analysisSeconds: float
+    results: Optional[AnalyzeResults]
+    error: Optional[str]
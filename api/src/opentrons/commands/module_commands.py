@@ -98,7 +98,7 @@ def thermocycler_execute_profile(
     )
     return {
         "name": command_types.THERMOCYCLER_EXECUTE_PROFILE,
-        "payload": {"text": text, "steps": steps},
+        "payload": {"text": text, "steps": steps, "repetitions": repetitions},
     }
 
 
@@ -268,6 +268,7 @@ class ThermocyclerSetBlockTempCommand(TypedDict):
 
 class ThermocyclerExecuteProfileCommandPayload(TextOnlyPayload):
     steps: List[ThermocyclerStep]
+    repetitions: int
 
 
 class ThermocyclerExecuteProfileCommand(TypedDict):
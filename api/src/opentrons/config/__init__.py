@@ -285,6 +285,13 @@ CONFIG_ELEMENTS = (
         ConfigElementType.DIR,
         "The dir where module calibration is stored",
     ),
+    ConfigElement(
+        "protocol_cache_dir",
+        "Compiled Protocol Cache Directory",
+        Path("protocol_cache"),
+        ConfigElementType.DIR,
+        "The dir where compiled Python protocols are cached",
+    ),
 )
 #: The available configuration file elements to modify. All of these can be
 #: changed by editing opentrons.json, where the keys are the name elements,
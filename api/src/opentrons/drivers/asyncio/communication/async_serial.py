@@ -2,18 +2,39 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import errno
+import os
 from concurrent.futures.thread import ThreadPoolExecutor
 from functools import partial
 from typing import Optional, AsyncGenerator, Union
 from typing_extensions import Literal
 
-from serial import Serial, serial_for_url  # type: ignore[import]
+from serial import (  # type: ignore[import]
+    Serial,
+    SerialException,
+    SerialTimeoutException,
+    serial_for_url,
+)
 
 TimeoutProperties = Union[Literal["write_timeout"], Literal["timeout"]]
 
+# The most bytes to read from the port each time it is readable
+READ_CHUNK_SIZE = 4096
+
+# How often to check whether written data has been transmitted
+DRAIN_POLL_SECONDS = 0.001
+
+_RETRY_ERRNOS = (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR)
+
 
 class AsyncSerial:
-    """Async wrapper around Serial."""
+    """Async wrapper around Serial.
+
+    Where the port has a file descriptor and the event loop can watch it,
+    reads and writes are non-blocking and driven by the event loop itself,
+    so no threads are needed no matter how many ports are open. Otherwise
+    (for example, on Windows) each call is run in a single-thread executor.
+    """
 
     @classmethod
     async def create(
@@ -38,9 +59,8 @@ class AsyncSerial:
              writing to it
         """
         loop = loop or asyncio.get_running_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
         serial = await loop.run_in_executor(
-            executor=executor,
+            executor=None,
             func=partial(
                 serial_for_url,
                 url=port,
@@ -51,7 +71,7 @@ class AsyncSerial:
         )
         return cls(
             serial=serial,
-            executor=executor,
+            executor=None,
             loop=loop,
             reset_buffer_before_write=reset_buffer_before_write,
         )
@@ -59,7 +79,7 @@ class AsyncSerial:
     def __init__(
         self,
         serial: Serial,
-        executor: ThreadPoolExecutor,
+        executor: Optional[ThreadPoolExecutor],
         loop: asyncio.AbstractEventLoop,
         reset_buffer_before_write: bool,
     ) -> None:
@@ -68,13 +88,18 @@ class AsyncSerial:
 
         Args:
             serial: connected Serial object
-            executor: a thread pool executor
+            executor: a thread pool executor to use if the port can't be
+                watched by the event loop. if None, one is created if needed.
             loop: event loop
         """
         self._serial = serial
-        self._executor = executor
         self._loop = loop
         self._reset_buffer_before_write = reset_buffer_before_write
+        self._buffer = bytearray()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        if not _can_watch(serial=serial, loop=loop):
+            self._executor = executor or ThreadPoolExecutor(max_workers=1)
 
     async def read_until(self, match: bytes) -> bytes:
         """
@@ -82,16 +107,75 @@ class AsyncSerial:
 
         Args:
             match: a sequence of bytes to match
-            timeout: optional timeout in seconds. this is a temporary override
-                of parameter supplied to `create`
 
         Returns:
-            read data.
+            read data. If the read times out, this is the data read so far.
         """
-        return await self._loop.run_in_executor(
-            executor=self._executor,
-            func=partial(self._serial.read_until, expected=match),
-        )
+        if self._executor is not None:
+            return await self._loop.run_in_executor(
+                executor=self._executor,
+                func=partial(self._serial.read_until, expected=match),
+            )
+
+        found = self._buffer.find(match)
+        if found < 0:
+            found = await self._wait_for_match(match=match)
+        if found < 0:
+            end = len(self._buffer)
+        else:
+            end = found + len(match)
+
+        response = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return response
+
+    async def _wait_for_match(self, match: bytes) -> int:
+        """Read into the buffer until it contains match, or the read times out.
+
+        Returns:
+            The index of match in the buffer, or -1 on timeout.
+        """
+        fd = self._serial.fileno()
+        matched: "asyncio.Future[int]" = self._loop.create_future()
+
+        self._loop.add_reader(fd, self._on_readable, fd, match, matched)
+        try:
+            return await asyncio.wait_for(matched, timeout=self._serial.timeout)
+        except asyncio.TimeoutError:
+            return -1
+        finally:
+            self._loop.remove_reader(fd)
+
+    def _on_readable(
+        self, fd: int, match: bytes, matched: "asyncio.Future[int]"
+    ) -> None:
+        """Read whatever is available into the buffer, and check for match."""
+        if matched.done():
+            return
+
+        try:
+            data = os.read(fd, READ_CHUNK_SIZE)
+        except OSError as e:
+            if e.errno not in _RETRY_ERRNOS:
+                matched.set_exception(SerialException(f"read failed: {e}"))
+            return
+
+        if not data:
+            matched.set_exception(
+                SerialException(
+                    "device reports readiness to read but returned no data "
+                    "(device disconnected or multiple access on port?)"
+                )
+            )
+            return
+
+        # Only search the new data, and the end of the old data
+        # in case the match straddles two reads.
+        search_start = max(len(self._buffer) - len(match) + 1, 0)
+        self._buffer += data
+        found = self._buffer.find(match, search_start)
+        if found >= 0:
+            matched.set_result(found)
 
     async def write(self, data: bytes) -> None:
         """
@@ -103,10 +187,58 @@ class AsyncSerial:
         Returns:
             None
         """
-        await self._loop.run_in_executor(
-            executor=self._executor,
-            func=lambda: self._sync_write(data=data),
-        )
+        if self._executor is not None:
+            await self._loop.run_in_executor(
+                executor=self._executor,
+                func=lambda: self._sync_write(data=data),
+            )
+            return
+
+        if self._reset_buffer_before_write:
+            self.reset_input_buffer()
+
+        fd = self._serial.fileno()
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(fd, view)
+            except OSError as e:
+                if e.errno not in _RETRY_ERRNOS:
+                    raise SerialException(f"write failed: {e}") from e
+                written = 0
+            view = view[written:]
+            if view:
+                await self._wait_for_writable(fd=fd)
+
+        await self._drain()
+
+    async def _drain(self) -> None:
+        """Wait until the data written to the port has been transmitted.
+
+        This is what Serial.flush() does with tcdrain(), which would block
+        the event loop, so the port's output queue is polled instead. Ports
+        without an output queue, like sockets, have nothing to drain.
+        """
+        if not hasattr(type(self._serial), "out_waiting"):
+            return
+        while self._serial.out_waiting:
+            await asyncio.sleep(DRAIN_POLL_SECONDS)
+
+    async def _wait_for_writable(self, fd: int) -> None:
+        """Wait until the port can accept more data, or the write times out."""
+        writable: "asyncio.Future[None]" = self._loop.create_future()
+
+        def _on_writable() -> None:
+            if not writable.done():
+                writable.set_result(None)
+
+        self._loop.add_writer(fd, _on_writable)
+        try:
+            await asyncio.wait_for(writable, timeout=self._serial.write_timeout)
+        except asyncio.TimeoutError:
+            raise SerialTimeoutException("Write timeout")
+        finally:
+            self._loop.remove_writer(fd)
 
     def _sync_write(self, data: bytes) -> None:
         """
@@ -129,9 +261,12 @@ class AsyncSerial:
 
         Returns: None
         """
-        return await self._loop.run_in_executor(
-            executor=self._executor, func=self._serial.open
-        )
+        if self._executor is not None:
+            return await self._loop.run_in_executor(
+                executor=self._executor, func=self._serial.open
+            )
+        self._buffer.clear()
+        self._serial.open()
 
     async def close(self) -> None:
         """
@@ -139,9 +274,12 @@ class AsyncSerial:
 
         Returns: None
         """
-        return await self._loop.run_in_executor(
-            executor=self._executor, func=self._serial.close
-        )
+        if self._executor is not None:
+            return await self._loop.run_in_executor(
+                executor=self._executor, func=self._serial.close
+            )
+        self._buffer.clear()
+        self._serial.close()
 
     async def is_open(self) -> bool:
         """
@@ -153,6 +291,7 @@ class AsyncSerial:
 
     def reset_input_buffer(self) -> None:
         """Reset the input buffer"""
+        self._buffer.clear()
         self._serial.reset_input_buffer()
 
     @contextlib.asynccontextmanager
@@ -164,16 +303,40 @@ class AsyncSerial:
         override = timeout is not None and default_timeout != timeout
         try:
             if override:
-                await self._loop.run_in_executor(
-                    executor=self._executor,
-                    func=lambda: setattr(self._serial, timeout_property, timeout),
-                )
+                await self._set_timeout(timeout_property, timeout)
             yield
         finally:
             if override:
-                await self._loop.run_in_executor(
-                    executor=self._executor,
-                    func=lambda: setattr(
-                        self._serial, timeout_property, default_timeout
-                    ),
-                )
+                await self._set_timeout(timeout_property, default_timeout)
+
+    async def _set_timeout(
+        self, timeout_property: TimeoutProperties, timeout: Optional[float]
+    ) -> None:
+        if self._executor is not None:
+            await self._loop.run_in_executor(
+                executor=self._executor,
+                func=lambda: setattr(self._serial, timeout_property, timeout),
+            )
+        else:
+            # Non-blocking reads and writes only look at the timeout
+            # when they're called, so there's nothing to reconfigure.
+            setattr(self._serial, timeout_property, timeout)
+
+
+def _can_watch(serial: Serial, loop: asyncio.AbstractEventLoop) -> bool:
+    """Check whether the event loop can wait on the port's file descriptor."""
+    try:
+        fd = serial.fileno()
+    except (AttributeError, NotImplementedError, SerialException):
+        return False
+
+    if not isinstance(fd, int):
+        return False
+
+    # Some event loops, like the Windows proactor, can't watch file descriptors.
+    try:
+        loop.add_reader(fd, lambda: None)
+    except NotImplementedError:
+        return False
+    loop.remove_reader(fd)
+    return True
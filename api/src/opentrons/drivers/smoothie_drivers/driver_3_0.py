@@ -74,7 +74,7 @@ from opentrons.drivers.utils import AxisMoveTimestamp, ParseError, string_to_hex
 from opentrons.drivers.rpi_drivers.gpio_simulator import SimulatingGPIOCharDev
 from opentrons.drivers.rpi_drivers.dev_types import GPIODriverLike
 from opentrons.system import smoothie_update
-from .types import AxisCurrentSettings
+from .types import AxisCurrentSettings, ShadowRegisters, changed_settings
 
 
 log = logging.getLogger(__name__)
@@ -186,6 +186,10 @@ class SmoothieDriver:
         self._acceleration = config.acceleration.copy()
         self._saved_acceleration = config.acceleration.copy()
 
+        # The currents, speeds and accelerations the Smoothie holds, so that
+        # only the settings that change are sent to it
+        self._shadow = ShadowRegisters()
+
         # position after homing
         self._homed_position = HOMED_POSITION.copy()
         self.homed_flags: Dict[str, bool] = {
@@ -549,9 +553,12 @@ class SmoothieDriver:
         """set total axes movement speed in mm/second"""
         if update:
             self._combined_speed = float(value)
+        if self._shadow.speed == float(value):
+            return
         command = self._build_speed_command(float(value))
         log.debug(f"set_speed: {command}")
         await self._send_command(command)
+        self._shadow.speed = float(value)
 
     def push_speed(self) -> None:
         self._saved_axes_speed = float(self._combined_speed)
@@ -584,12 +591,16 @@ class SmoothieDriver:
         if update:
             self._max_speed_settings.update(settings)
 
+        changed = changed_settings(self._shadow.max_speed, settings)
+        if not changed:
+            return
         command = _command_builder().add_gcode(gcode=GCODE.SET_MAX_SPEED)
-        for axis, value in sorted(settings.items()):
+        for axis, value in sorted(changed.items()):
             command = command.add_float(prefix=axis, value=value, precision=None)
 
         log.debug(f"set_axis_max_speed: {command}")
         await self._send_command(command)
+        self._shadow.max_speed.update(changed)
 
     def push_axis_max_speed(self) -> None:
         self._saved_max_speed_settings = self._max_speed_settings.copy()
@@ -607,16 +618,20 @@ class SmoothieDriver:
         """
         self._acceleration.update(settings)
 
+        changed = changed_settings(self._shadow.acceleration, settings)
+        if not changed:
+            return
         command = (
             _command_builder()
             .add_gcode(gcode=GCODE.ACCELERATION)
             .add_int(prefix="S", value=10000)
         )
-        for axis, value in sorted(settings.items()):
+        for axis, value in sorted(changed.items()):
             command.add_float(prefix=axis, value=value, precision=None)
 
         log.debug(f"set_acceleration: {command}")
         await self._send_command(command)
+        self._shadow.acceleration.update(changed)
 
     def push_acceleration(self) -> None:
         self._saved_acceleration = self._acceleration.copy()
@@ -713,23 +728,40 @@ class SmoothieDriver:
         """
         Sends the driver's current settings to the serial port as gcode. Call
         this method to set the axis-current state on the actual Smoothie
-        motor-driver.
+        motor-driver. Nothing is sent if the Smoothie already holds them.
         """
-        await self._send_command(self._generate_current_command())
+        command = self._generate_current_command()
+        if command:
+            await self._send_command(command)
 
     def _generate_current_command(self) -> CommandBuilder:
         """
         Returns a constructed GCode string that contains this driver's
-        axis-current settings, plus a small delay to wait for those settings
-        to take effect.
+        axis-current settings that the Smoothie does not already hold, plus
+        a small delay to wait for those settings to take effect if an active
+        axis' current rises. If nothing changed, the command is empty.
+
+        The Smoothie is assumed to hold the new currents from here on, so the
+        command must be sent before another current command is generated.
         """
-        command = _command_builder().add_gcode(gcode=GCODE.SET_CURRENT)
-        for axis, value in sorted(self.current.items()):
+        command = _command_builder()
+        changed = changed_settings(self._shadow.current, self.current)
+        if not changed:
+            return command
+
+        command.add_gcode(gcode=GCODE.SET_CURRENT)
+        for axis, value in sorted(changed.items()):
             command.add_float(prefix=axis, value=value, precision=None)
 
-        command.add_gcode(gcode=GCODE.DWELL).add_float(
-            prefix="P", value=CURRENT_CHANGE_DELAY, precision=None
-        )
+        if any(
+            self._active_axes.get(axis)
+            and (axis not in self._shadow.current or value > self._shadow.current[axis])
+            for axis, value in changed.items()
+        ):
+            command.add_gcode(gcode=GCODE.DWELL).add_float(
+                prefix="P", value=CURRENT_CHANGE_DELAY, precision=None
+            )
+        self._shadow.current.update(changed)
         log.debug(f"_generate_current_command: {command}")
         return command
 
@@ -900,9 +932,15 @@ class SmoothieDriver:
                 command=wait_command, retries=0, timeout=execute_timeout
             )
         except AlarmResponse as e:
+            self._shadow.forget()
             self._handle_return(ret_code=e.response, is_alarm=True)
         except ErrorResponse as e:
+            self._shadow.forget()
             self._handle_return(ret_code=e.response, is_error=True)
+        except BaseException:
+            # The Smoothie may or may not have taken the command
+            self._shadow.forget()
+            raise
         return command_result
 
     def _handle_return(
@@ -1059,6 +1097,7 @@ class SmoothieDriver:
 
     async def _setup(self) -> None:
         log.debug("_setup")
+        self._shadow.forget()
         try:
             await self._wait_for_ack()
         except NoResponse:
@@ -1322,10 +1361,19 @@ class SmoothieDriver:
         primary_command_string = create_coords_list(moving_target)
         backlash_command_string = create_coords_list(backlash_target)
 
+        for axis in target.keys():
+            self.engaged_axes[axis] = True
+        if home_flagged_axes:
+            # Home before building the current and speed commands, since
+            # they only hold what changed from the settings homing leaves
+            await self.home_flagged_axes("".join(list(target.keys())))
+
         self.dwell_axes("".join(non_moving_axes))
         self.activate_axes("".join(moving_axes))
 
         checked_speed = speed or self._combined_speed
+        # The speed the Smoothie will hold when the primary move starts
+        held_speed = self._shadow.speed
 
         if split_command_string:
             # set fullstepping if necessary
@@ -1349,6 +1397,7 @@ class SmoothieDriver:
             # use the higher current from the split config without changing
             # our global cache
             split_prefix.add_builder(builder=self._build_speed_command(split_speed))
+            held_speed = split_speed
             cached = {}
             for ax in split_target.keys():
                 cached[ax] = self.current[ax]
@@ -1369,7 +1418,7 @@ class SmoothieDriver:
 
         command = _command_builder()
 
-        if split_command_string or (checked_speed != self._combined_speed):
+        if checked_speed != held_speed:
             command.add_builder(builder=self._build_speed_command(checked_speed))
 
         # introduce the standard currents
@@ -1386,11 +1435,6 @@ class SmoothieDriver:
         if checked_speed != self._combined_speed:
             command.add_builder(builder=self._build_speed_command(self._combined_speed))
 
-        for axis in target.keys():
-            self.engaged_axes[axis] = True
-        if home_flagged_axes:
-            await self.home_flagged_axes("".join(list(target.keys())))
-
         async def _do_split() -> None:
             try:
                 for sc in (c for c in (split_prefix, split_command) if c):
@@ -1405,6 +1449,7 @@ class SmoothieDriver:
             # how long the movement is expected to take.
             await _do_split()
             await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            self._shadow.speed = self._combined_speed
         finally:
             # dwell pipette motors because they get hot
             plunger_axis_moved = "".join(set("BC") & set(target.keys()))
@@ -1576,6 +1621,7 @@ class SmoothieDriver:
                 split_currents.add_float(
                     prefix=axis, value=msc.split_current, precision=None
                 )
+                self._shadow.current[axis] = msc.split_current
                 split_moves.add_float(
                     prefix=axis, value=-msc.split_distance, precision=None
                 )
@@ -1613,6 +1659,7 @@ class SmoothieDriver:
                 .add_builder(builder=fullstep_postfix)
                 .add_builder(builder=self._build_speed_command(self._combined_speed))
             )
+            self._shadow.speed = self._combined_speed
 
     async def fast_home(self, axis: str, safety_margin: float) -> Dict[str, float]:
         """home after a controlled motor stall
@@ -1812,6 +1859,7 @@ class SmoothieDriver:
 
     async def _smoothie_reset(self) -> None:
         log.debug(f"Resetting Smoothie (simulating: {self.simulating})")
+        self._shadow.forget()
         if self.simulating:
             pass
         else:
@@ -1839,6 +1887,7 @@ class SmoothieDriver:
     async def hard_halt(self) -> None:
         log.debug(f"Halting Smoothie (simulating: {self.simulating}")
         self._is_hard_halting.set()
+        self._shadow.forget()
         if self.simulating:
             pass
         else:
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Dict, cast
+from dataclasses import dataclass, field
+from typing import Dict, Optional, cast
 
 from opentrons.config.types import AxisDict
 
@@ -14,3 +14,29 @@ class AxisCurrentSettings:
     def __init__(self, val: AxisDict) -> None:
         self.now = cast(AxisSettingType, val.copy())
         self.saved = cast(AxisSettingType, val.copy())
+
+
+@dataclass
+class ShadowRegisters:
+    """The settings the Smoothie holds, as last sent to it.
+
+    An axis missing from one of these, or a speed of None, means the setting
+    on the Smoothie is unknown, and must be sent before it can be relied on.
+    """
+
+    current: AxisSettingType = field(default_factory=dict)
+    max_speed: AxisSettingType = field(default_factory=dict)
+    acceleration: AxisSettingType = field(default_factory=dict)
+    speed: Optional[float] = None
+
+    def forget(self) -> None:
+        """Forget every setting, for when the Smoothie may have lost or ignored them."""
+        self.current.clear()
+        self.max_speed.clear()
+        self.acceleration.clear()
+        self.speed = None
+
+
+def changed_settings(held: AxisSettingType, wanted: AxisSettingType) -> AxisSettingType:
+    """Get the settings that differ from, or are missing in, what is held."""
+    return {axis: value for axis, value in wanted.items() if held.get(axis) != value}
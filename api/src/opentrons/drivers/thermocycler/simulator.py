@@ -3,7 +3,6 @@ from typing import Optional, Dict
 from opentrons.util.async_helpers import ensure_yield
 from opentrons.drivers.thermocycler.abstract import AbstractThermocyclerDriver
 from opentrons.drivers.types import Temperature, PlateTemperature, ThermocyclerLidStatus
-from opentrons.hardware_control.modules.types import ThermocyclerModuleModel
 from opentrons.drivers.asyncio.communication.errors import ErrorResponse
 
 
@@ -44,7 +43,7 @@ class SimulatingDriver(AbstractThermocyclerDriver):
 
     @ensure_yield
     async def lift_plate(self) -> None:
-        if self._model == ThermocyclerModuleModel.THERMOCYCLER_V1.value:
+        if self._model == "thermocyclerModuleV1":
             raise NotImplementedError()
         if self._lid_status != ThermocyclerLidStatus.OPEN:
             raise ErrorResponse(port="sim_port", response="Lid is not open")
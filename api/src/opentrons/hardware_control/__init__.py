@@ -9,30 +9,58 @@ or axis)  to a deck-absolute point (not a Smoothie-coordinate point).
 This module is not for use outside the opentrons api module. Higher-level
 functions are available elsewhere.
 """
-from .adapters import SynchronousAdapter
-from .api import API
-from .pause_manager import PauseManager
-from .backends import Controller, Simulator
-from .types import (
-    CriticalPoint,
-    ExecutionState,
-)
-from .errors import ExecutionCancelledError, NoTipAttachedError, TipAttachedError
-from .constants import DROP_TIP_RELEASE_DISTANCE
-from .thread_manager import ThreadManager
-from .execution_manager import ExecutionManager
-from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
-from .protocols import HardwareControlAPI
-from .instruments import AbstractInstrument, Gripper
-
-# TODO (lc 12-05-2022) We should 1. figure out if we need
-# to globally export a class that is strictly used in the hardware controller
-# and 2. how to properly export an ot2 and ot3 pipette.
-from .instruments.ot2.pipette import Pipette
-
-
-ThreadManagedHardware = ThreadManager[HardwareControlAPI]
-SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .adapters import SynchronousAdapter
+    from .api import API
+    from .pause_manager import PauseManager
+    from .backends import Controller, Simulator
+    from .types import (
+        CriticalPoint,
+        ExecutionState,
+    )
+    from .errors import ExecutionCancelledError, NoTipAttachedError, TipAttachedError
+    from .constants import DROP_TIP_RELEASE_DISTANCE
+    from .thread_manager import ThreadManager
+    from .execution_manager import ExecutionManager
+    from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
+    from .protocols import HardwareControlAPI
+    from .instruments import AbstractInstrument, Gripper
+
+    # TODO (lc 12-05-2022) We should 1. figure out if we need
+    # to globally export a class that is strictly used in the hardware controller
+    # and 2. how to properly export an ot2 and ot3 pipette.
+    from .instruments.ot2.pipette import Pipette
+
+    ThreadManagedHardware = ThreadManager[HardwareControlAPI]
+    SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
+
+# Public names, mapped to the submodules that define them. They are imported
+# on first use, so that importing a light submodule like .types doesn't load
+# the whole hardware controller.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "SynchronousAdapter": ".adapters",
+    "API": ".api",
+    "PauseManager": ".pause_manager",
+    "Controller": ".backends",
+    "Simulator": ".backends",
+    "CriticalPoint": ".types",
+    "ExecutionState": ".types",
+    "ExecutionCancelledError": ".errors",
+    "NoTipAttachedError": ".errors",
+    "TipAttachedError": ".errors",
+    "DROP_TIP_RELEASE_DISTANCE": ".constants",
+    "ThreadManager": ".thread_manager",
+    "ExecutionManager": ".execution_manager",
+    "ThreadedAsyncLock": ".threaded_async_lock",
+    "ThreadedAsyncForbidden": ".threaded_async_lock",
+    "HardwareControlAPI": ".protocols",
+    "AbstractInstrument": ".instruments",
+    "Gripper": ".instruments",
+    "Pipette": ".instruments.ot2.pipette",
+}
 
 __all__ = [
     "API",
@@ -57,3 +85,22 @@ __all__ = [
     "ThreadManagedHardware",
     "SyncHardwareAPI",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ThreadManagedHardware":
+        value: Any = __getattr__("ThreadManager")[__getattr__("HardwareControlAPI")]
+    elif name == "SyncHardwareAPI":
+        value = __getattr__("SynchronousAdapter")[__getattr__("HardwareControlAPI")]
+    else:
+        try:
+            module_name = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
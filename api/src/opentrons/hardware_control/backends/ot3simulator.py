@@ -22,6 +22,7 @@ from opentrons.config.types import OT3Config, GantryLoad
 from opentrons.config import ot3_pipette_config, gripper_config
 from .ot3utils import (
     axis_convert,
+    axis_is_node,
     create_move_group,
     get_current_settings,
     node_to_axis,
@@ -90,11 +91,14 @@ class OT3Simulator:
         config: OT3Config,
         loop: asyncio.AbstractEventLoop,
         strict_attached_instruments: bool = True,
+        zero_cost_motion: bool = False,
     ) -> OT3Simulator:
         """Create the OT3Simulator instance.
 
         Args:
             config: Robot configuration
+            zero_cost_motion: Jump straight to each move's target instead
+                of planning and simulating the move
 
         Returns:
             Instance.
@@ -105,6 +109,7 @@ class OT3Simulator:
             config,
             loop,
             strict_attached_instruments,
+            zero_cost_motion,
         )
 
     def __init__(
@@ -114,16 +119,20 @@ class OT3Simulator:
         config: OT3Config,
         loop: asyncio.AbstractEventLoop,
         strict_attached_instruments: bool = True,
+        zero_cost_motion: bool = False,
     ) -> None:
         """Construct.
 
         Args:
             config: Robot configuration
             driver: The Can Driver
+            zero_cost_motion: Jump straight to each move's target instead
+                of planning and simulating the move
         """
         self._configuration = config
         self._loop = loop
         self._strict_attached = bool(strict_attached_instruments)
+        self._zero_cost_motion = bool(zero_cost_motion)
         self._stubbed_attached_modules = attached_modules
         self._update_required = False
         self._initialized = False
@@ -179,6 +188,16 @@ class OT3Simulator:
     def initialized(self, value: bool) -> None:
         self._initialized = value
 
+    @property
+    def zero_cost_motion(self) -> bool:
+        """True if moves should jump straight to their targets.
+
+        Nothing is timed or stepped in simulation, so planning a move only
+        tells the simulator where it ends up. Analysis only needs that end
+        position, so it can skip the planning with `jump_to`.
+        """
+        return self._zero_cost_motion
+
     @property
     def board_revision(self) -> BoardRevision:
         """Get the board revision"""
@@ -291,6 +310,24 @@ class OT3Simulator:
         self._position.update(final_positions)
         self._encoder_position.update(final_positions)
 
+    @ensure_yield
+    async def jump_to(self, target: OT3AxisMap[float]) -> None:
+        """Move to a position without planning or simulating the move.
+
+        Args:
+            target: Map of axis to machine position.
+
+        Returns:
+            None
+        """
+        final_positions = {
+            axis_to_node(ax): float(pos)
+            for ax, pos in target.items()
+            if axis_is_node(ax)
+        }
+        self._position.update(final_positions)
+        self._encoder_position.update(final_positions)
+
     @ensure_yield
     async def home(self, axes: Optional[List[OT3Axis]] = None) -> OT3AxisMap[float]:
         """Home axes.
@@ -1,5 +1,15 @@
 """Shared utilities for ot3 hardware control."""
-from typing import Dict, Iterable, List, Set, Tuple, TypeVar, Sequence
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+    Sequence,
+)
 from typing_extensions import Literal
 from opentrons.config.types import OT3MotionSettings, OT3CurrentSettings, GantryLoad
 from opentrons.hardware_control.types import (
@@ -49,6 +59,12 @@ from opentrons_hardware.hardware_control.motion import (
 GRIPPER_JAW_HOME_TIME: float = 10
 GRIPPER_JAW_GRIP_TIME: float = 10
 
+# How many sets of moves to keep the steps of, see create_move_group.
+MOVE_GROUP_CACHE_SIZE = 128
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
 PipetteAction = Literal["clamp", "home"]
 
 # TODO: These methods exist to defer uses of NodeId to inside
@@ -220,27 +236,78 @@ def create_move_group(
     present_nodes: Iterable[NodeId],
     stop_condition: MoveStopCondition = MoveStopCondition.none,
 ) -> Tuple[MoveGroup, Dict[NodeId, float]]:
+    """Create a move group from moves, and get where it will end.
+
+    The steps don't depend on the origin, so the steps of recently used moves
+    are reused. The steps are shared, and must not be modified.
+    """
+    steps, step_distances = _create_move_group_steps(
+        tuple(_move_key(move) for move in moves),
+        tuple(present_nodes),
+        stop_condition,
+    )
     pos = _convert_to_node_id_dict(origin)
+    for node_id_distances in step_distances:
+        for ax in pos.keys():
+            pos[ax] += node_id_distances.get(ax, 0)
+    return list(steps), {k: float(v) for k, v in pos.items()}
+
+
+def move_group_cache_info() -> "_CacheInfo":
+    """Get how well create_move_group is reusing steps."""
+    return _create_move_group_steps.cache_info()
+
+
+def move_group_cache_clear() -> None:
+    """Forget the steps create_move_group has kept."""
+    _create_move_group_steps.cache_clear()
+
+
+# The axes of a move, and the bytes of its unit vector and block values.
+_MoveKey = Tuple[Tuple[OT3Axis, ...], bytes]
+
+
+def _move_key(move: Move[OT3Axis]) -> _MoveKey:
+    """Get a key for a move that only matches moves with exactly its values."""
+    values = list(move.unit_vector.values())
+    for block in move.blocks:
+        values.extend(
+            [block.distance, block.initial_speed, block.acceleration, block.time]
+        )
+    return tuple(move.unit_vector.keys()), np.array(values, dtype=np.float64).tobytes()
+
+
+@lru_cache(maxsize=MOVE_GROUP_CACHE_SIZE)
+def _create_move_group_steps(
+    moves: Tuple[_MoveKey, ...],
+    present_nodes: Tuple[NodeId, ...],
+    stop_condition: MoveStopCondition,
+) -> Tuple[MoveGroup, List[NodeIdMotionValues]]:
+    """Create the steps of moves, and the distance each step moves each node."""
     move_group: MoveGroup = []
-    for move in moves:
-        unit_vector = move.unit_vector
-        for block in move.blocks:
-            distances = unit_vector_multiplication(unit_vector, block.distance)
+    step_distances = []
+    for axes, values in moves:
+        move_values = np.frombuffer(  # type: ignore[no-untyped-call]
+            values, dtype=np.float64
+        )
+        unit_vector = dict(zip(axes, move_values[: len(axes)]))
+        blocks = move_values[len(axes) :].reshape(-1, 4)
+        for distance, initial_speed, acceleration, duration in blocks:
+            distances = unit_vector_multiplication(unit_vector, distance)
             node_id_distances = _convert_to_node_id_dict(distances)
-            velocities = unit_vector_multiplication(unit_vector, block.initial_speed)
-            accelerations = unit_vector_multiplication(unit_vector, block.acceleration)
+            velocities = unit_vector_multiplication(unit_vector, initial_speed)
+            accelerations = unit_vector_multiplication(unit_vector, acceleration)
             step = create_step(
                 distance=node_id_distances,
                 velocity=_convert_to_node_id_dict(velocities),
                 acceleration=_convert_to_node_id_dict(accelerations),
-                duration=block.time,
+                duration=duration,
                 present_nodes=present_nodes,
                 stop_condition=stop_condition,
             )
-            for ax in pos.keys():
-                pos[ax] += node_id_distances.get(ax, 0)
+            step_distances.append(node_id_distances)
             move_group.append(step)
-    return move_group, {k: float(v) for k, v in pos.items()}
+    return move_group, step_distances
 
 
 def create_home_group(
@@ -10,6 +10,14 @@ class AbstractEmulator(ABC):
         """Handle a command and return a response."""
         ...
 
+    def get_ack_delay(self) -> float:
+        """Get how many seconds to wait before acknowledging the last line handled.
+
+        An emulator uses this to block the sender like the hardware would,
+        for example while waiting for a move to finish.
+        """
+        return 0.0
+
     @staticmethod
     def get_terminator() -> bytes:
         """Get the command terminator for messages coming from PI."""
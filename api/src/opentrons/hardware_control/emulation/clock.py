@@ -0,0 +1,44 @@
+"""Emulated time, for emulators that model how long things take."""
+import time
+from typing import Callable, Optional
+
+from opentrons.hardware_control.emulation.settings import KinematicSettings
+
+
+class EmulationClock:
+    """A clock that can run faster or slower than real time.
+
+    With a real time factor of 10, a move that would take the robot
+    10 seconds completes in 1 second of real time.
+    """
+
+    def __init__(
+        self,
+        real_time_factor: float = 1.0,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Construct a clock starting at 0.
+
+        Args:
+            real_time_factor: emulated seconds per real second.
+            monotonic: the real time source, in seconds.
+        """
+        assert real_time_factor > 0, "real time factor must be positive"
+        self._real_time_factor = real_time_factor
+        self._monotonic = monotonic
+        self._start = monotonic()
+
+    def now(self) -> float:
+        """Get the emulated time, in seconds."""
+        return (self._monotonic() - self._start) * self._real_time_factor
+
+    def to_real_time(self, seconds: float) -> float:
+        """Convert a duration in emulated seconds to real seconds."""
+        return seconds / self._real_time_factor
+
+
+def build_clock(settings: KinematicSettings) -> Optional[EmulationClock]:
+    """Create a clock for emulators, if kinematic emulation is enabled."""
+    if not settings.enabled:
+        return None
+    return EmulationClock(real_time_factor=settings.real_time_factor)
@@ -26,6 +26,9 @@ class ConnectionHandler:
             logger.debug("%s Received: %s", emulator_name, line)
             try:
                 response = self._emulator.handle(line.decode().strip())
+                delay = self._emulator.get_ack_delay()
+                if delay > 0:
+                    await asyncio.sleep(delay)
                 if response:
                     response = f"{response}\r\n"
                     logger.debug("%s Sending: %s", emulator_name, response)
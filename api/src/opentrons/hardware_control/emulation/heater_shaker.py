@@ -17,6 +17,7 @@ from opentrons.hardware_control.emulation.settings import HeaterShakerSettings
 from . import util
 
 from .abstract_emulator import AbstractEmulator
+from .clock import EmulationClock
 from .simulations import (
     Temperature,
     RPM,
@@ -34,9 +35,15 @@ class HeaterShakerEmulator(AbstractEmulator):
     _rpm: RPM
     _latch_status: HeaterShakerLabwareLatchStatus
 
-    def __init__(self, parser: Parser, settings: HeaterShakerSettings) -> None:
+    def __init__(
+        self,
+        parser: Parser,
+        settings: HeaterShakerSettings,
+        clock: Optional[EmulationClock] = None,
+    ) -> None:
         self._parser = parser
         self._settings = settings
+        self._clock = clock
         self._gcode_to_function_mapping = {
             GCODE.SET_RPM.value: self._set_rpm,
             GCODE.GET_RPM.value: self._get_rpm,
@@ -60,13 +67,21 @@ class HeaterShakerEmulator(AbstractEmulator):
 
     def reset(self) -> None:
 
+        temperature = self._settings.temperature
+        rpm = self._settings.rpm
         self._temperature = Temperature(
-            per_tick=self._settings.temperature.degrees_per_tick,
-            current=self._settings.temperature.starting,
+            per_tick=(
+                temperature.degrees_per_tick
+                if self._clock is None
+                else temperature.degrees_per_second
+            ),
+            current=temperature.starting,
+            clock=self._clock,
         )
         self._rpm = RPM(
-            per_tick=self._settings.rpm.rpm_per_tick,
-            current=self._settings.rpm.starting,
+            per_tick=rpm.rpm_per_tick if self._clock is None else rpm.rpm_per_second,
+            current=rpm.starting,
+            clock=self._clock,
         )
         self._rpm.set_target(0.0)
         self._latch_status = HeaterShakerLabwareLatchStatus.IDLE_OPEN
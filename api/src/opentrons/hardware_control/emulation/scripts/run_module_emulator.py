@@ -6,6 +6,7 @@ from typing import Dict, Callable
 from typing_extensions import Final
 
 from opentrons.hardware_control.emulation.abstract_emulator import AbstractEmulator
+from opentrons.hardware_control.emulation.clock import build_clock
 from opentrons.hardware_control.emulation.heater_shaker import HeaterShakerEmulator
 from opentrons.hardware_control.emulation.types import ModuleType
 from opentrons.hardware_control.emulation.magdeck import MagDeckEmulator
@@ -19,12 +20,14 @@ from opentrons.hardware_control.emulation.settings import Settings, ProxySetting
 
 emulator_builder: Final[Dict[str, Callable[[Settings], AbstractEmulator]]] = {
     ModuleType.Magnetic.value: lambda s: MagDeckEmulator(Parser(), s.magdeck),
-    ModuleType.Temperature.value: lambda s: TempDeckEmulator(Parser(), s.tempdeck),
+    ModuleType.Temperature.value: lambda s: TempDeckEmulator(
+        Parser(), s.tempdeck, build_clock(s.kinematics)
+    ),
     ModuleType.Thermocycler.value: lambda s: ThermocyclerEmulator(
-        Parser(), s.thermocycler
+        Parser(), s.thermocycler, build_clock(s.kinematics)
     ),
     ModuleType.Heatershaker.value: lambda s: HeaterShakerEmulator(
-        Parser(), s.heatershaker
+        Parser(), s.heatershaker, build_clock(s.kinematics)
     ),
 }
 
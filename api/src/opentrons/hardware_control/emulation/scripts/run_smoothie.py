@@ -2,6 +2,7 @@
 import logging
 import asyncio
 
+from opentrons.hardware_control.emulation.clock import build_clock
 from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
 from opentrons.hardware_control.emulation.parser import Parser
 
@@ -19,7 +20,11 @@ async def run(settings: Settings) -> None:
     Returns:
         None
     """
-    smoothie = SmoothieEmulator(parser=Parser(), settings=settings.smoothie)
+    smoothie = SmoothieEmulator(
+        parser=Parser(),
+        settings=settings.smoothie,
+        clock=build_clock(settings.kinematics),
+    )
     await run_emulator_server(
         host=settings.smoothie.host,
         port=settings.smoothie.port,
@@ -26,13 +26,29 @@ class BaseModuleSettings(BaseModel):
     version: str
 
 
+class KinematicSettings(BaseModel):
+    """Settings for emulating how long motion and temperature changes take.
+
+    When disabled, moves complete instantly and temperatures change
+    by a fixed amount each time they are read.
+    """
+
+    enabled: bool = False
+    # Emulated seconds per real second.
+    real_time_factor: float = 1.0
+
+
 class TemperatureModelSettings(BaseModel):
     degrees_per_tick: float = 2.0
+    # Used instead of degrees_per_tick when kinematic emulation is enabled.
+    degrees_per_second: float = 1.0
     starting: float = float(TEMPERATURE_ROOM)
 
 
 class RPMModelSettings(BaseModel):
     rpm_per_tick: float = 100.0
+    # Used instead of rpm_per_tick when kinematic emulation is enabled.
+    rpm_per_second: float = 1000.0
     starting: float = 0.0
 
 
@@ -76,6 +92,7 @@ class Settings(BaseSettings):
         ModuleType.Temperature,
         ModuleType.Thermocycler,
     ]
+    kinematics: KinematicSettings = KinematicSettings()
     smoothie: SmoothieSettings = SmoothieSettings()
     magdeck: MagDeckSettings = MagDeckSettings(
         serial_number="magnetic_emulator", model="mag_deck_v20", version="2.0.0"
@@ -84,21 +101,21 @@ class Settings(BaseSettings):
         serial_number="temperature_emulator",
         model="temp_deck_v20",
         version="v2.0.1",
-        temperature=TemperatureModelSettings(starting=0.0),
+        temperature=TemperatureModelSettings(starting=0.0, degrees_per_second=0.2),
     )
     thermocycler: ThermocyclerSettings = ThermocyclerSettings(
         serial_number="thermocycler_emulator",
         model="v02",
         version="v1.1.0",
-        lid_temperature=TemperatureModelSettings(),
-        plate_temperature=TemperatureModelSettings(),
+        lid_temperature=TemperatureModelSettings(degrees_per_second=0.5),
+        plate_temperature=TemperatureModelSettings(degrees_per_second=2.0),
     )
     heatershaker: HeaterShakerSettings = HeaterShakerSettings(
         serial_number="heater_shaker_emulator",
         model="v01",
         version="v0.0.1",
-        temperature=TemperatureModelSettings(),
-        rpm=RPMModelSettings(),
+        temperature=TemperatureModelSettings(degrees_per_second=0.3),
+        rpm=RPMModelSettings(rpm_per_second=1000.0),
         home_delay_time=0,
     )
 
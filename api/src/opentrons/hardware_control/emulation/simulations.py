@@ -1,50 +1,88 @@
+import math
 from typing import Optional
 
+from opentrons.hardware_control.emulation.clock import EmulationClock
+
 
 class Simulation:
+    """A model that changes over time.
+
+    Without a clock, each tick is one step of the model. With a clock,
+    each tick moves the model forward by the emulated seconds since the last.
+    """
+
+    def __init__(self, clock: Optional[EmulationClock] = None) -> None:
+        self._clock = clock
+        self._last_tick = clock.now() if clock is not None else 0.0
+
     def tick(self) -> None:
+        if self._clock is None:
+            self.advance(1.0)
+        else:
+            now = self._clock.now()
+            self.advance(now - self._last_tick)
+            self._last_tick = now
+
+    def advance(self, elapsed: float) -> None:
+        """Move the model forward by a number of ticks, or seconds with a clock."""
         pass
 
+    def _catch_up(self) -> None:
+        """Bring a clocked model up to the current time."""
+        if self._clock is not None:
+            self.tick()
+
 
 class Temperature(Simulation):
     """A model with a current and target temperature. The current temperature is
     always moving towards the target.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self,
+        per_tick: float,
+        current: float,
+        clock: Optional[EmulationClock] = None,
+    ) -> None:
         """Construct a temperature simulation.
 
         Args:
-            per_tick: amount to move per tick,
+            per_tick: amount to move per tick, or per second if there is a clock
             current: the starting temperature
+            clock: optional clock, to change at a rate rather than per tick
         """
+        super().__init__(clock=clock)
         self._per_tick = per_tick
         self._current = current
         self._target: Optional[float] = None
 
-    def tick(self) -> None:
+    def advance(self, elapsed: float) -> None:
         if self._target is None:
             return
 
         diff = self._target - self._current
+        step = self._per_tick * elapsed
 
-        if abs(diff) < self._per_tick:
+        if abs(diff) < step:
             self._current = self._target
         elif diff > 0:
-            self._current += self._per_tick
+            self._current += step
         else:
-            self._current -= self._per_tick
+            self._current -= step
 
     def deactivate(self, temperature: float) -> None:
         """Deactivate and reset to temperature"""
+        self._catch_up()
         self._target = None
         self._current = temperature
 
     def set_target(self, target: Optional[float]) -> None:
+        self._catch_up()
         self._target = target
 
     @property
     def current(self) -> float:
+        self._catch_up()
         return self._current
 
     @property
@@ -57,18 +95,25 @@ class RPM(Simulation):
     always moving towards the target.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self,
+        per_tick: float,
+        current: float,
+        clock: Optional[EmulationClock] = None,
+    ) -> None:
         """Construct a rpm simulation.
 
         Args:
-            per_tick: amount to move per tick,
+            per_tick: amount to move per tick, or per second if there is a clock
             current: the starting rpm
+            clock: optional clock, to change at a rate rather than per tick
         """
+        super().__init__(clock=clock)
         self._per_tick = per_tick
         self._current = current
         self._target: Optional[float] = None
 
-    def tick(self) -> None:
+    def advance(self, elapsed: float) -> None:
 
         if self._target is None:
             target = 0.0
@@ -76,24 +121,28 @@ class RPM(Simulation):
             target = self._target
 
         diff = target - self._current
+        step = self._per_tick * elapsed
 
-        if abs(diff) < self._per_tick:
+        if abs(diff) < step:
             self._current = target
         elif diff > 0:
-            self._current += self._per_tick
+            self._current += step
         else:
-            self._current -= self._per_tick
+            self._current -= step
 
     def deactivate(self, rpm: float) -> None:
         """Deactivate and reset to rpm"""
+        self._catch_up()
         self._target = None
         self._current = rpm
 
     def set_target(self, target: Optional[float]) -> None:
+        self._catch_up()
         self._target = target
 
     @property
     def current(self) -> float:
+        self._catch_up()
         return self._current
 
     @property
@@ -106,28 +155,71 @@ class TemperatureWithHold(Temperature):
     The current temperature is always moving towards the target.
 
     When the current temperature is within close enough from target the hold time
-    decrements once per tick.
+    decrements once per tick, or by the seconds elapsed if there is a clock.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self,
+        per_tick: float,
+        current: float,
+        clock: Optional[EmulationClock] = None,
+    ) -> None:
         """Construct a temperature with hold simulation."""
-        super().__init__(per_tick=per_tick, current=current)
+        super().__init__(per_tick=per_tick, current=current, clock=clock)
         self._total_hold: Optional[float] = None
         self._hold: Optional[float] = None
 
-    def tick(self) -> None:
-        super().tick()
+    def advance(self, elapsed: float) -> None:
+        if self._clock is None:
+            super().advance(elapsed)
+            if self.target == self._current and self._hold is not None:
+                self._hold = max(0, self._hold - elapsed)
+            return
+
+        # Only count the part of the elapsed time spent at the target.
+        ramp_time = (
+            abs(self._target - self._current) / self._per_tick
+            if self._target is not None
+            else math.inf
+        )
+        super().advance(elapsed)
         if self.target == self._current and self._hold is not None:
-            self._hold = max(0, self._hold - 1)
+            self._hold = max(0, self._hold - max(elapsed - ramp_time, 0))
 
     def set_hold(self, hold: float) -> None:
+        self._catch_up()
         self._total_hold = hold
         self._hold = hold
 
     @property
     def time_remaining(self) -> Optional[float]:
+        self._catch_up()
         return self._hold
 
     @property
     def total_hold(self) -> Optional[float]:
         return self._total_hold
+
+
+def trapezoidal_move_time(distance: float, speed: float, acceleration: float) -> float:
+    """Get how long a move takes, accelerating from and decelerating to a stop.
+
+    Args:
+        distance: the length of the move.
+        speed: the cruising speed, in distance per second.
+        acceleration: the acceleration and deceleration, in distance per second^2.
+
+    Returns:
+        The duration in seconds.
+    """
+    if distance <= 0 or speed <= 0:
+        return 0.0
+    if acceleration <= 0:
+        return distance / speed
+
+    ramp_distance = speed**2 / acceleration
+    if distance >= ramp_distance:
+        # Accelerate to speed, cruise, then decelerate.
+        return distance / speed + speed / acceleration
+    # A triangular profile, which never reaches speed.
+    return 2 * math.sqrt(distance / acceleration)
@@ -2,21 +2,39 @@
 
 The purpose is to provide a fake backend that responds to the GCODE sent by the
 Opentrons smoothie driver.
+
+With a clock, moves take as long as they would on a robot: each move follows
+a trapezoidal velocity profile limited by the feed rate and by the configured
+maximum speed and acceleration of each moving axis, and M400 does not return
+until all queued moves are done.
 """
 import logging
+import math
 import re
-from typing import Optional, Dict
+from typing import Optional, Dict, cast
 
 from opentrons import _find_smoothie_file
+from opentrons.config.defaults_ot2 import DEFAULT_ACCELERATION, DEFAULT_MAX_SPEEDS
 from opentrons.drivers import utils
-from opentrons.drivers.smoothie_drivers.constants import GCODE, HOMED_POSITION
+from opentrons.drivers.smoothie_drivers.constants import (
+    DEFAULT_AXES_SPEED,
+    GCODE,
+    HOMED_POSITION,
+)
 from opentrons.hardware_control.emulation.parser import Command, Parser
 
 from .abstract_emulator import AbstractEmulator
+from .clock import EmulationClock
 from .settings import SmoothieSettings
+from .simulations import trapezoidal_move_time
 
 logger = logging.getLogger(__name__)
 
+SEC_PER_MIN = 60
+
+# Axes whose combined distance the feed rate applies to.
+CARTESIAN_AXES = "XYZ"
+
 
 class SmoothieEmulator(AbstractEmulator):
     """Smoothie emulator"""
@@ -28,18 +46,29 @@ class SmoothieEmulator(AbstractEmulator):
     _pos: Dict[str, float]
     _home_status: Dict[str, bool]
     _speed: float
+    _max_speeds: Dict[str, float]
+    _acceleration: Dict[str, float]
+    _busy_until: float
+    _ack_delay: float
     _pipette_model: Dict[str, str]
     _pipette_id: Dict[str, str]
 
-    def __init__(self, parser: Parser, settings: SmoothieSettings) -> None:
+    def __init__(
+        self,
+        parser: Parser,
+        settings: SmoothieSettings,
+        clock: Optional[EmulationClock] = None,
+    ) -> None:
         """Constructor.
 
         Args:
             parser: GCODE Parser.
             settings: emulator settings.
+            clock: optional clock, to emulate how long moves take.
         """
         self._parser = parser
         self._settings = settings
+        self._clock = clock
         self._gcode_to_function_mapping = {
             GCODE.HOMING_STATUS.value: self._get_homing_status,
             GCODE.CURRENT_POSITION.value: self._get_current_position,
@@ -50,15 +79,30 @@ class SmoothieEmulator(AbstractEmulator):
             GCODE.WRITE_INSTRUMENT_MODEL.value: self._set_pipette_model,
             GCODE.MOVE.value: self._move_gantry,
             GCODE.HOME.value: self._home_gantry,
+            GCODE.SET_MAX_SPEED.value: self._set_max_speed,
+            GCODE.ACCELERATION.value: self._set_acceleration,
+            GCODE.DWELL.value: self._dwell,
+            GCODE.WAIT.value: self._wait,
         }
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
         """Handle a line"""
+        self._ack_delay = 0.0
         results = (self._handle(c) for c in self._parser.parse(line))
         joined = " ".join(r for r in results if r)
         return None if not joined else joined
 
+    def get_ack_delay(self) -> float:
+        """Get how long to wait for moves to finish, if the last line had an M400."""
+        return self._ack_delay
+
+    def get_queued_time(self) -> float:
+        """Get the emulated seconds until all queued moves and dwells are done."""
+        if self._clock is None:
+            return 0.0
+        return max(self._busy_until - self._clock.now(), 0.0)
+
     def reset(self) -> None:
         _, fw_version = _find_smoothie_file()
         self._version_string = (
@@ -76,6 +120,10 @@ class SmoothieEmulator(AbstractEmulator):
             "C": False,
         }
         self._speed = 0.0
+        self._max_speeds = dict(cast(Dict[str, float], DEFAULT_MAX_SPEEDS))
+        self._acceleration = dict(DEFAULT_ACCELERATION)
+        self._busy_until = 0.0
+        self._ack_delay = 0.0
 
         self._pipette_model = {
             "L": utils.string_to_hex(
@@ -143,19 +191,87 @@ class SmoothieEmulator(AbstractEmulator):
 
     def _move_gantry(self, command: Command) -> None:
         """Moves the gantry to the position provided in the command"""
+        target = {}
         for key, value in command.params.items():
             assert isinstance(value, float), f"invalid value '{value}'"
             if "F" == key:
                 self._speed = value
             else:
-                self._pos[key] = value
+                target[key] = value
+        self._queue_move(target)
+        self._pos.update(target)
 
     def _home_gantry(self, command: Command) -> None:
         """Returns gantry to home position"""
+        target = {axis: HOMED_POSITION[axis] for axis in command.params.keys()}
+        self._queue_move(target)
         for axis in command.params.keys():
             self._pos[axis] = HOMED_POSITION[axis]
             self._home_status[axis] = True
 
+    def _set_max_speed(self, command: Command) -> None:
+        """Sets the maximum speed of each axis, in mm/sec"""
+        for axis, value in command.params.items():
+            assert isinstance(value, float), f"invalid value '{value}'"
+            self._max_speeds[axis] = value
+
+    def _set_acceleration(self, command: Command) -> None:
+        """Sets the acceleration of each axis, in mm/sec^2"""
+        for axis, value in command.params.items():
+            assert isinstance(value, float), f"invalid value '{value}'"
+            # S is the default acceleration, for axes without their own.
+            if axis != "S":
+                self._acceleration[axis] = value
+
+    def _dwell(self, command: Command) -> None:
+        """Queues a pause, in seconds"""
+        seconds = command.params.get("P") or 0.0
+        self._queue(seconds)
+
+    def _wait(self, command: Command) -> None:
+        """Waits for all queued moves to finish"""
+        if self._clock is not None:
+            self._ack_delay = self._clock.to_real_time(self.get_queued_time())
+
+    def _queue_move(self, target: Dict[str, float]) -> None:
+        """Queue the time a move to target takes."""
+        if self._clock is not None:
+            self._queue(self._move_time(target))
+
+    def _queue(self, seconds: float) -> None:
+        """Queue an action that takes some time after all queued actions."""
+        if self._clock is not None:
+            self._busy_until = max(self._busy_until, self._clock.now()) + seconds
+
+    def _move_time(self, target: Dict[str, float]) -> float:
+        """Get how long a move from the current position to target takes."""
+        deltas = {
+            axis: abs(value - self._pos[axis])
+            for axis, value in target.items()
+            if value != self._pos[axis]
+        }
+        if not deltas:
+            return 0.0
+
+        cartesian = [d for axis, d in deltas.items() if axis in CARTESIAN_AXES]
+        if cartesian:
+            distance = math.sqrt(sum(d**2 for d in cartesian))
+        else:
+            distance = max(deltas.values())
+
+        # Scale down the move's speed and acceleration so that
+        # no axis exceeds its own limits.
+        speed = self._speed / SEC_PER_MIN if self._speed else DEFAULT_AXES_SPEED
+        acceleration = math.inf
+        for axis, delta in deltas.items():
+            scale = distance / delta
+            speed = min(speed, self._max_speeds.get(axis, math.inf) * scale)
+            acceleration = min(
+                acceleration, self._acceleration.get(axis, math.inf) * scale
+            )
+
+        return trapezoidal_move_time(distance, speed, acceleration)
+
     def _handle(self, command: Command) -> Optional[str]:
         """Handle a command."""
         logger.info(f"Got command {command}")
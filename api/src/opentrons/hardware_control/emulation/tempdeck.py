@@ -12,6 +12,7 @@ from opentrons.hardware_control.emulation.parser import Parser, Command
 from opentrons.hardware_control.emulation.settings import TempDeckSettings
 
 from .abstract_emulator import AbstractEmulator
+from .clock import EmulationClock
 from .simulations import Temperature
 
 
@@ -23,9 +24,15 @@ class TempDeckEmulator(AbstractEmulator):
 
     _temperature: Temperature
 
-    def __init__(self, parser: Parser, settings: TempDeckSettings) -> None:
+    def __init__(
+        self,
+        parser: Parser,
+        settings: TempDeckSettings,
+        clock: Optional[EmulationClock] = None,
+    ) -> None:
         self._settings = settings
         self._parser = parser
+        self._clock = clock
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
@@ -36,8 +43,13 @@ class TempDeckEmulator(AbstractEmulator):
 
     def reset(self) -> None:
         self._temperature = Temperature(
-            per_tick=self._settings.temperature.degrees_per_tick,
+            per_tick=(
+                self._settings.temperature.degrees_per_tick
+                if self._clock is None
+                else self._settings.temperature.degrees_per_second
+            ),
             current=self._settings.temperature.starting,
+            clock=self._clock,
         )
 
     def _handle(self, command: Command) -> Optional[str]:
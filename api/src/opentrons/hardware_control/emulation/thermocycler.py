@@ -11,6 +11,7 @@ from opentrons.hardware_control.emulation.parser import Parser, Command
 from opentrons.hardware_control.emulation.settings import ThermocyclerSettings
 
 from .abstract_emulator import AbstractEmulator
+from .clock import EmulationClock
 from .simulations import Temperature, TemperatureWithHold
 from . import util
 
@@ -26,9 +27,15 @@ class ThermocyclerEmulator(AbstractEmulator):
     plate_volume: util.OptionalValue[float]
     plate_ramp_rate: util.OptionalValue[float]
 
-    def __init__(self, parser: Parser, settings: ThermocyclerSettings) -> None:
+    def __init__(
+        self,
+        parser: Parser,
+        settings: ThermocyclerSettings,
+        clock: Optional[EmulationClock] = None,
+    ) -> None:
         self._parser = parser
         self._settings = settings
+        self._clock = clock
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
@@ -38,13 +45,23 @@ class ThermocyclerEmulator(AbstractEmulator):
         return None if not joined else joined
 
     def reset(self) -> None:
+        lid = self._settings.lid_temperature
+        plate = self._settings.plate_temperature
         self._lid_temperature = Temperature(
-            per_tick=self._settings.lid_temperature.degrees_per_tick,
-            current=self._settings.lid_temperature.starting,
+            per_tick=(
+                lid.degrees_per_tick if self._clock is None else lid.degrees_per_second
+            ),
+            current=lid.starting,
+            clock=self._clock,
         )
         self._plate_temperature = TemperatureWithHold(
-            per_tick=self._settings.plate_temperature.degrees_per_tick,
-            current=self._settings.plate_temperature.starting,
+            per_tick=(
+                plate.degrees_per_tick
+                if self._clock is None
+                else plate.degrees_per_second
+            ),
+            current=plate.starting,
+            clock=self._clock,
         )
         self.lid_status = ThermocyclerLidStatus.OPEN
         self.plate_volume = util.OptionalValue[float]()
@@ -3,7 +3,7 @@ from __future__ import annotations
 """ Classes and functions for gripper state tracking
 """
 import logging
-from typing import Any, Optional, Set
+from typing import TYPE_CHECKING, Any, Optional, Set
 
 from opentrons.types import Point
 from opentrons.config import gripper_config
@@ -20,7 +20,6 @@ from .instrument_calibration import (
     save_gripper_calibration_offset,
 )
 from ..instrument_abc import AbstractInstrument
-from opentrons.hardware_control.dev_types import AttachedGripper, GripperDict
 
 from opentrons_shared_data.gripper import (
     GripperDefinition,
@@ -28,6 +27,9 @@ from opentrons_shared_data.gripper import (
     Geometry,
 )
 
+if TYPE_CHECKING:
+    from opentrons.hardware_control.dev_types import AttachedGripper, GripperDict
+
 RECONFIG_KEYS = {"quirks"}
 
 
@@ -152,6 +154,10 @@ class Gripper(AbstractInstrument[GripperDefinition]):
     def model(self) -> str:
         return repr(self._model)
 
+    @property
+    def calibration_offset(self) -> GripperCalibrationOffset:
+        return self._calibration_offset
+
     @property
     def gripper_id(self) -> str:
         return self._gripper_id
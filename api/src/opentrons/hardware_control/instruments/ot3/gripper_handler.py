@@ -83,6 +83,12 @@ class GripperHandler:
         gripper = self.get_gripper()
         gripper.reset_offset(to_default)
 
+    def get_instrument_offset(self) -> Optional[GripperCalibrationOffset]:
+        """Get the offset of the attached gripper, if any."""
+        if not self._gripper:
+            return None
+        return self._gripper.calibration_offset
+
     def save_instrument_offset(self, delta: Point) -> GripperCalibrationOffset:
         """
         Save a new instrument offset.
@@ -150,6 +150,18 @@ class PipetteHandlerProvider:
         pipette = self.get_pipette(mount)
         pipette.reset_pipette_offset(mount, to_default)
 
+    def get_instrument_offset(
+        self, mount: OT3Mount
+    ) -> Optional[PipetteOffsetByPipetteMount]:
+        """
+        Get the offset of the pipette on a mount, if any.
+        :param mount: The mount to check.
+        """
+        pipette = self._attached_instruments[mount]
+        if not pipette:
+            return None
+        return pipette.pipette_offset
+
     def save_instrument_offset(
         self, mount: OT3Mount, delta: top_types.Point
     ) -> PipetteOffsetByPipetteMount:
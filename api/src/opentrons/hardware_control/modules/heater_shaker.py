@@ -30,6 +30,8 @@ POLL_PERIOD = 1.0
 # to speed up simulation of heater-shaker protocols, but it's pretty silly
 # module simulation in PAPIv2 needs to be seriously rethought
 SIMULATING_POLL_PERIOD = POLL_PERIOD / 20.0
+# How much less often to poll while not heating, shaking, or moving the latch
+IDLE_POLL_FACTOR = 5.0
 
 DFU_PID = "df11"
 
@@ -75,7 +77,12 @@ class HeaterShaker(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIMULATING_POLL_PERIOD
 
         reader = HeaterShakerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=poll_interval_seconds * IDLE_POLL_FACTOR,
+            fast_forward=simulating,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -275,7 +282,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
-        await self._reader.read_temperature()
+        await self._poller.poll_now()
 
     # TODO(mc, 2022-10-10): remove `awaiting_temperature` argument,
     # and instead, wait until status is holding
@@ -291,7 +298,7 @@ class HeaterShaker(mod_abc.AbstractModule):
             return
 
         await self.wait_for_is_running()
-        await self._reader.read_temperature()
+        await self._poller.poll_now()
 
         async def _await_temperature() -> None:
             if self.temperature_status == TemperatureStatus.HEATING:
@@ -318,7 +325,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_rpm(rpm)
-        await self._reader.read_rpm()
+        await self._poller.poll_now()
 
         async def _wait() -> None:
             # Wait until we reach the target speed.
@@ -350,7 +357,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """Stop heating/cooling"""
         await self.wait_for_is_running()
         await self._driver.deactivate_heater()
-        await self._reader.read_temperature()
+        await self._poller.poll_now()
 
     async def deactivate_shaker(self) -> None:
         """Stop shaking and home the plate"""
@@ -397,6 +404,17 @@ class HeaterShakerReader(Reader):
     def on_error(self, exception: Exception) -> None:
         self._set_error(exception)
 
+    def is_active(self) -> bool:
+        return (
+            self.temperature.target is not None
+            or self.rpm.target is not None
+            or self.labware_latch
+            in (
+                HeaterShakerLabwareLatchStatus.OPENING,
+                HeaterShakerLabwareLatchStatus.CLOSING,
+            )
+        )
+
     async def read_temperature(self) -> None:
         self.temperature = await self._driver.get_temperature()
 
@@ -21,6 +21,8 @@ log = logging.getLogger(__name__)
 
 TEMP_POLL_INTERVAL_SECS = 1.0
 SIM_TEMP_POLL_INTERVAL_SECS = TEMP_POLL_INTERVAL_SECS / 20.0
+# How much less often to poll while there is no target temperature
+TEMP_IDLE_POLL_FACTOR = 5.0
 
 
 class TempDeck(mod_abc.AbstractModule):
@@ -64,7 +66,12 @@ class TempDeck(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIM_TEMP_POLL_INTERVAL_SECS
 
         reader = TempDeckReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=poll_interval_seconds * TEMP_IDLE_POLL_FACTOR,
+            fast_forward=simulating,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -136,7 +143,7 @@ class TempDeck(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
-        await self._reader.read()
+        await self._poller.poll_now()
 
     async def await_temperature(self, awaiting_temperature: Optional[float]) -> None:
         """Await a target temperature in degrees Celsius.
@@ -154,7 +161,7 @@ class TempDeck(mod_abc.AbstractModule):
             return
 
         await self.wait_for_is_running()
-        await self._reader.read()
+        await self._poller.poll_now()
 
         async def _await_temperature() -> None:
             if awaiting_temperature is None:
@@ -175,7 +182,7 @@ class TempDeck(mod_abc.AbstractModule):
         """Stop heating/cooling and turn off the fan"""
         await self.wait_for_is_running()
         await self._driver.deactivate()
-        await self._reader.read()
+        await self._poller.poll_now()
 
     @property
     def device_info(self) -> Mapping[str, str]:
@@ -281,3 +288,7 @@ class TempDeckReader(Reader):
     async def read(self) -> None:
         """Read the module's current and target temperatures."""
         self.temperature = await self._driver.get_temperature()
+
+    def is_active(self) -> bool:
+        """Whether the module is heating, cooling, or holding a temperature."""
+        return self.temperature.target is not None
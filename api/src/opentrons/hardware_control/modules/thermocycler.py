@@ -24,6 +24,8 @@ log = logging.getLogger(__name__)
 
 POLLING_FREQUENCY_SEC = 1.0
 SIM_POLLING_FREQUENCY_SEC = POLLING_FREQUENCY_SEC / 50.0
+# How much less often to poll while there are no targets and the lid is still
+IDLE_POLLING_FACTOR = 5.0
 
 V1_MODULE_STRING = "thermocyclerModuleV1"
 V2_MODULE_STRING = "thermocyclerModuleV2"
@@ -88,7 +90,12 @@ class Thermocycler(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIM_POLLING_FREQUENCY_SEC
 
         reader = ThermocyclerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=poll_interval_seconds * IDLE_POLLING_FACTOR,
+            fast_forward=simulating,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -190,21 +197,21 @@ class Thermocycler(mod_abc.AbstractModule):
         """Deactivate the lid heating pad"""
         await self.wait_for_is_running()
         await self._driver.deactivate_lid()
-        await self._reader.read_lid_temperature()
+        await self._poller.poll_now()
 
     async def deactivate_block(self) -> None:
         """Deactivate the block peltiers"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
         await self._driver.deactivate_block()
-        await self._reader.read_block_temperature()
+        await self._poller.poll_now()
 
     async def deactivate(self) -> None:
         """Deactivate the block peltiers and lid heating pad"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
         await self._driver.deactivate_all()
-        await self._reader.read()
+        await self._poller.poll_now()
 
     async def open(self) -> str:
         """Open the lid if it is closed"""
@@ -368,7 +375,7 @@ class Thermocycler(mod_abc.AbstractModule):
             hold_time=hold_time_seconds,
             volume=volume,
         )
-        await self._reader.read_block_temperature()
+        await self._poller.poll_now()
 
     # TODO(mc, 2022-04-26): de-duplicate with `set_lid_temperature`
     async def set_target_lid_temperature(self, celsius: float) -> None:
@@ -381,7 +388,7 @@ class Thermocycler(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_lid_temperature(temp=celsius)
-        await self._reader.read_lid_temperature()
+        await self._poller.poll_now()
 
     async def _wait_for_lid_target(self) -> None:
         """
@@ -389,7 +396,7 @@ class Thermocycler(mod_abc.AbstractModule):
 
         Subject to change without a version bump.
         """
-        await self._reader.read_lid_temperature()
+        await self._poller.poll_now()
 
         while not _temperature_is_holding(self.lid_temp_status):
             await self._poller.wait_next_poll()
@@ -400,7 +407,7 @@ class Thermocycler(mod_abc.AbstractModule):
 
         Subject to change without a version bump.
         """
-        await self._reader.read_block_temperature()
+        await self._poller.poll_now()
 
         while not _temperature_is_holding(self.status):
             await self._poller.wait_next_poll()
@@ -410,7 +417,7 @@ class Thermocycler(mod_abc.AbstractModule):
 
     async def _wait_for_lid_status(self, status: ThermocyclerLidStatus) -> None:
         """Wait for lid status to be status."""
-        await self._reader.read_lid_status()
+        await self._poller.poll_now()
 
         while self.lid_status != status:
             await self._poller.wait_next_poll()
@@ -623,6 +630,14 @@ class ThermocyclerReader(Reader):
     def register_error_handler(self, handle_error: Callable[[Exception], None]) -> None:
         self._handle_error = handle_error
 
+    def is_active(self) -> bool:
+        return (
+            self.block_temperature.target is not None
+            or self.lid_temperature.target is not None
+            or self.lid_status
+            not in (ThermocyclerLidStatus.OPEN, ThermocyclerLidStatus.CLOSED)
+        )
+
     async def read(self) -> None:
         """Poll the thermocycler."""
         await self.read_lid_status()
@@ -2,6 +2,7 @@
 
 from typing import Callable, Dict, Union, overload, TypeVar, Optional, cast
 from collections import OrderedDict
+from numpy.linalg import inv
 from opentrons.types import Mount, Point
 from opentrons.calibration_storage.types import AttitudeMatrix
 from opentrons.util import linal
@@ -357,15 +358,22 @@ def deck_from_machine(
 ) -> Dict[AxisType, float]:
     """Build a deck-abs position store from the machine's position"""
     axis_enum = type(next(iter(machine_pos.keys())))
-    plunger_axes = {k: v for k, v in machine_pos.items() if k not in k.gantry_axes()}
-    mount_axes = {k: v for k, v in machine_pos.items() if k in k.mount_axes()}
+    gantry_axes = axis_enum.gantry_axes()
+    mount_axes = axis_enum.mount_axes()
+    plunger_axes = {k: v for k, v in machine_pos.items() if k not in gantry_axes}
+    # This runs after every move, so invert the attitude once for all mounts
+    # instead of once per mount.
+    reverse = inv(attitude)  # type: ignore[no-untyped-call]
     deck_positions_by_mount = {
-        axis_enum.to_mount(axis): deck_point_from_machine_point(
-            Point(machine_pos[axis_enum.X], machine_pos[axis_enum.Y], value),
-            attitude,
-            offset,
+        axis_enum.to_mount(axis): Point(
+            *linal.apply_transform(
+                reverse,
+                Point(machine_pos[axis_enum.X], machine_pos[axis_enum.Y], value)
+                - offset,
+            )
         )
-        for axis, value in mount_axes.items()
+        for axis, value in machine_pos.items()
+        if axis in mount_axes
     }
     position_for_gantry = next(iter(deck_positions_by_mount.values()))
     deck_pos = {
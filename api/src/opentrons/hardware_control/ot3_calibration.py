@@ -1,11 +1,13 @@
 """Functions and utilites for OT3 calibration."""
 from __future__ import annotations
 from typing_extensions import Final, Literal, TYPE_CHECKING
-from typing import Tuple, List, Dict, Any, Optional, Union
+from typing import AsyncIterator, Tuple, List, Dict, Any, Optional, Union
+from contextlib import asynccontextmanager
 import datetime
+import time
 import numpy as np
 from enum import Enum
-from math import floor, copysign
+from math import floor, copysign, inf
 from logging import getLogger
 from opentrons.util.linal import solve_attitude
 
@@ -20,10 +22,15 @@ from opentrons_shared_data.deck import (
     CALIBRATION_PROBE_RADIUS,
     CALIBRATION_SQUARE_EDGES as SQUARE_EDGES,
 )
-from opentrons.calibration_storage.types import AttitudeMatrix
+from opentrons.calibration_storage.types import AttitudeMatrix, SourceType
 
 if TYPE_CHECKING:
     from .ot3api import OT3API
+    from .instruments.ot3.instrument_calibration import (
+        GripperCalibrationOffset,
+        PipetteOffsetByPipetteMount,
+    )
+    from .modules.module_calibration import ModuleCalibrationOffset
 
 LOG = getLogger(__name__)
 
@@ -32,6 +39,9 @@ LINEAR_TRANSIT_HEIGHT: Final[float] = 1
 SEARCH_TRANSIT_HEIGHT: Final[float] = 5
 GRIPPER_GRIP_FORCE: Final[float] = 20
 BELT_CAL_TRANSIT_HEIGHT: Final[float] = 50
+# The smallest ratio of the slot edges in a sweep to the sweep's noise floor
+# for the edges found from it to be trusted
+NONCONTACT_MIN_SIGNAL_QUALITY: Final[float] = 5
 
 PREP_OFFSET_DEPTH = Point(*Z_PREP_OFFSET)
 EDGES = {
@@ -45,6 +55,8 @@ EDGES = {
 class CalibrationMethod(Enum):
     BINARY_SEARCH = "binary search"
     NONCONTACT_PASS = "noncontact pass"
+    # Sweep for the slot edges, and only binary search if the sweep was unusable
+    NONCONTACT_PASS_WITH_FALLBACK = "noncontact pass with binary search fallback"
 
 
 class CalibrationStructureNotFoundError(RuntimeError):
@@ -74,6 +86,40 @@ class InaccurateNonContactSweepError(RuntimeError):
         )
 
 
+class NoisyNonContactSweepError(InaccurateNonContactSweepError):
+    def __init__(self, signal_quality: float) -> None:
+        RuntimeError.__init__(
+            self,
+            f"Calibration sweep had a signal quality of {signal_quality:.2f}, "
+            f"below the minimum of {NONCONTACT_MIN_SIGNAL_QUALITY}",
+        )
+
+
+@asynccontextmanager
+async def _timed_step(step: str) -> AsyncIterator[None]:
+    """Log how long a calibration step took, whether or not it succeeded."""
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        LOG.info(f"Calibration step {step} took {time.monotonic() - start:.3f}s")
+
+
+def _calibration_prior(
+    offset: Optional[
+        Union[
+            GripperCalibrationOffset,
+            PipetteOffsetByPipetteMount,
+            ModuleCalibrationOffset,
+        ]
+    ]
+) -> Optional[Point]:
+    """Get a stored offset to seed calibration with, if one was ever calibrated."""
+    if offset is None or offset.source == SourceType.default:
+        return None
+    return offset.offset
+
+
 def _deck_hit(
     found_pos: float, expected_pos: float, settings: EdgeSenseSettings
 ) -> bool:
@@ -350,9 +396,14 @@ async def find_axis_center(
 
     await hcapi.move_to(mount, start._replace(z=SEARCH_TRANSIT_HEIGHT))
 
-    data = await hcapi.capacitive_sweep(
-        mount, axis, start, end, edge_settings.pass_settings.speed_mm_per_s
-    )
+    async with _timed_step(f"{axis.name} sweep"):
+        data = await hcapi.capacitive_sweep(
+            mount, axis, start, end, edge_settings.pass_settings.speed_mm_per_s
+        )
+
+    signal_quality = _sweep_signal_quality(data)
+    if signal_quality < NONCONTACT_MIN_SIGNAL_QUALITY:
+        raise NoisyNonContactSweepError(signal_quality)
 
     left_edge, right_edge = _edges_from_data(
         data,
@@ -373,6 +424,56 @@ async def find_axis_center(
     return (left_edge_absolute + right_edge_absolute) / 2
 
 
+def _average_difference_kernel(data_length: int) -> "np.ndarray[Any, Any]":
+    """Build the smoothing and differencing kernel for a sweep of a given length."""
+    # The width of the averaging kernel defines how strong the averaging is - a wider
+    # kernel, or filter, has a lower rolloff frequency and will smooth more. This
+    # calculation sets the width at 5% of the length of the data, and then makes that
+    # value an even number
+    average_width_samples = (int(floor(0.05 * data_length)) // 2) * 2
+    if not average_width_samples:
+        # too little data to smooth or difference
+        return np.zeros(0)
+    # an averaging kernel would be an array of length N with elements each set to 1/N;
+    # when convolved with a data stream, this will (ignoring edge effects) produce
+    # an N-sample rolling average. by inverting the sign of half the kernel, which is
+    # why we need it to be even, we do the same thing but while also taking a finite
+    # difference.
+    return np.concatenate(  # type: ignore
+        (
+            np.full(average_width_samples // 2, 1 / average_width_samples),
+            np.full(average_width_samples // 2, -1 / average_width_samples),
+        )
+    )
+
+
+def _sweep_signal_quality(data: List[float]) -> float:
+    """
+    Estimate how clearly a sweep shows the edges of the calibration slot.
+
+    This is the size of the weaker of the two edges in the differenced data, relative
+    to the median absolute deviation of the differenced data. Most of a sweep is flat,
+    over either the deck or the slot, so the deviation is a measure of the noise. A
+    sweep that crossed both edges has a falling edge followed by a rising edge, both
+    well clear of the noise; one that was too short, missed the slot or picked up
+    interference does not, and scores 0 or close to it.
+    """
+    kernel = _average_difference_kernel(len(data))
+    if len(kernel) < 2:
+        return 0.0
+    differenced = np.convolve(np.array(data), kernel, mode="valid")
+    if np.argmin(differenced) >= np.argmax(differenced):
+        return 0.0
+    edge = min(-float(differenced.min()), float(differenced.max()))
+    if edge <= 0:
+        return 0.0
+    deviation = np.abs(differenced - np.median(differenced))  # type: ignore[no-untyped-call]
+    noise = float(np.median(deviation))  # type: ignore[no-untyped-call]
+    if noise == 0:
+        return inf
+    return float(edge / noise)
+
+
 def _edges_from_data(
     data: List[float], distance: float, log_metadata: Optional[Dict[str, Any]] = None
 ) -> Tuple[float, float]:
@@ -398,22 +499,7 @@ def _edges_from_data(
     """
     now_str = datetime.datetime.now().strftime("%d-%m-%y-%H:%M:%S")
 
-    # The width of the averaging kernel defines how strong the averaging is - a wider
-    # kernel, or filter, has a lower rolloff frequency and will smooth more. This
-    # calculation sets the width at 5% of the length of the data, and then makes that
-    # value an even number
-    average_width_samples = (int(floor(0.05 * len(data))) // 2) * 2
-    # an averaging kernel would be an array of length N with elements each set to 1/N;
-    # when convolved with a data stream, this will (ignoring edge effects) produce
-    # an N-sample rolling average. by inverting the sign of half the kernel, which is
-    # why we need it to be even, we do the same thing but while also taking a finite
-    # difference.
-    average_difference_kernel = np.concatenate(  # type: ignore
-        (
-            np.full(average_width_samples // 2, 1 / average_width_samples),
-            np.full(average_width_samples // 2, -1 / average_width_samples),
-        )
-    )
+    average_difference_kernel = _average_difference_kernel(len(data))
     differenced = np.convolve(np.array(data), average_difference_kernel, mode="valid")
     # These are the indices of the minimum difference (which should be the left edge,
     # where the probe is halfway through moving off the deck, and the slope of the
@@ -486,18 +572,30 @@ async def find_calibration_structure_center(
     hcapi: OT3API,
     mount: OT3Mount,
     nominal_center: Point,
-    method: CalibrationMethod = CalibrationMethod.BINARY_SEARCH,
+    method: CalibrationMethod = CalibrationMethod.NONCONTACT_PASS_WITH_FALLBACK,
     raise_verify_error: bool = False,
 ) -> Point:
 
     # Perform xy offset search
     if method == CalibrationMethod.BINARY_SEARCH:
-        found_center = await find_slot_center_binary(
-            hcapi, mount, nominal_center, raise_verify_error
-        )
+        async with _timed_step("binary search"):
+            found_center = await find_slot_center_binary(
+                hcapi, mount, nominal_center, raise_verify_error
+            )
     elif method == CalibrationMethod.NONCONTACT_PASS:
         # FIXME: use slot to find ideal position
         found_center = await find_slot_center_noncontact(hcapi, mount, nominal_center)
+    elif method == CalibrationMethod.NONCONTACT_PASS_WITH_FALLBACK:
+        try:
+            found_center = await find_slot_center_noncontact(
+                hcapi, mount, nominal_center
+            )
+        except InaccurateNonContactSweepError as e:
+            LOG.warning(f"Falling back to binary search: {e}")
+            async with _timed_step("binary search"):
+                found_center = await find_slot_center_binary(
+                    hcapi, mount, nominal_center, raise_verify_error
+                )
     else:
         raise RuntimeError("Unknown calibration method")
     return found_center
@@ -507,8 +605,9 @@ async def _calibrate_mount(
     hcapi: OT3API,
     mount: OT3Mount,
     slot: int = 5,
-    method: CalibrationMethod = CalibrationMethod.BINARY_SEARCH,
+    method: CalibrationMethod = CalibrationMethod.NONCONTACT_PASS_WITH_FALLBACK,
     raise_verify_error: bool = False,
+    prior_offset: Optional[Point] = None,
 ) -> Point:
     """
     Run automatic calibration for the tool attached to the specified mount.
@@ -527,6 +626,8 @@ async def _calibrate_mount(
     ------
     hcapi: a hardware control api to run commands against
     mount: The mount to calibration
+    prior_offset: The offset this tool was last calibrated to, if any, used to
+        search around where the slot is likely to be rather than its nominal position
 
     Returns
     -------
@@ -538,7 +639,7 @@ async def _calibrate_mount(
     try:
         # find the center of the calibration sqaure
         offset = await find_calibration_structure_position(
-            hcapi, mount, nominal_center, method, raise_verify_error
+            hcapi, mount, nominal_center, method, raise_verify_error, prior_offset
         )
         # update center with values obtained during calibration
         LOG.info(f"Found calibration value {offset} for mount {mount.name}")
@@ -561,13 +662,26 @@ async def find_calibration_structure_position(
     hcapi: OT3API,
     mount: OT3Mount,
     nominal_center: Point,
-    method: CalibrationMethod = CalibrationMethod.BINARY_SEARCH,
+    method: CalibrationMethod = CalibrationMethod.NONCONTACT_PASS_WITH_FALLBACK,
     raise_verify_error: bool = False,
+    prior_offset: Optional[Point] = None,
 ) -> Point:
-    """Find the calibration square offset given an arbitry postition on the deck."""
+    """Find the calibration square offset given an arbitry postition on the deck.
+
+    If a prior offset is given, the square is searched for where that offset
+    says it should be rather than at its nominal position.
+    """
+    estimated_center = nominal_center
+    if prior_offset is not None:
+        estimated_center = nominal_center - prior_offset._replace(z=0)
+        LOG.info(f"Searching from prior offset {prior_offset} at {estimated_center}")
+
     # Find the estimated structure plate height. This will be used to baseline the edge detection points.
-    z_height = await find_calibration_structure_height(hcapi, mount, nominal_center)
-    initial_center = nominal_center._replace(z=z_height)
+    async with _timed_step("structure height"):
+        z_height = await find_calibration_structure_height(
+            hcapi, mount, estimated_center
+        )
+    initial_center = estimated_center._replace(z=z_height)
     LOG.info(f"Found structure plate at {z_height}mm")
 
     # Find the calibration square center using the given method
@@ -666,7 +780,7 @@ async def calibrate_gripper_jaw(
     hcapi: OT3API,
     probe: GripperProbe,
     slot: int = 5,
-    method: CalibrationMethod = CalibrationMethod.BINARY_SEARCH,
+    method: CalibrationMethod = CalibrationMethod.NONCONTACT_PASS_WITH_FALLBACK,
     raise_verify_error: bool = False,
 ) -> Point:
     """
@@ -683,11 +797,12 @@ async def calibrate_gripper_jaw(
     two offsets into the `gripper_pin_offsets_mean` func.
     """
     try:
+        prior_offset = _calibration_prior(hcapi.get_instrument_offset(OT3Mount.GRIPPER))
         await hcapi.reset_instrument_offset(OT3Mount.GRIPPER)
         hcapi.add_gripper_probe(probe)
         await hcapi.grip(GRIPPER_GRIP_FORCE)
         offset = await _calibrate_mount(
-            hcapi, OT3Mount.GRIPPER, slot, method, raise_verify_error
+            hcapi, OT3Mount.GRIPPER, slot, method, raise_verify_error, prior_offset
         )
         LOG.info(f"Gripper {probe.name} probe offset: {offset}")
         return offset
@@ -710,7 +825,7 @@ async def calibrate_pipette(
     hcapi: OT3API,
     mount: Literal[OT3Mount.LEFT, OT3Mount.RIGHT],
     slot: int = 5,
-    method: CalibrationMethod = CalibrationMethod.BINARY_SEARCH,
+    method: CalibrationMethod = CalibrationMethod.NONCONTACT_PASS_WITH_FALLBACK,
     raise_verify_error: bool = False,
 ) -> Point:
     """
@@ -722,9 +837,12 @@ async def calibrate_pipette(
     or the probe has been lowered).
     """
     try:
+        prior_offset = _calibration_prior(hcapi.get_instrument_offset(mount))
         await hcapi.reset_instrument_offset(mount)
         await hcapi.add_tip(mount, hcapi.config.calibration.probe_length)
-        offset = await _calibrate_mount(hcapi, mount, slot, method, raise_verify_error)
+        offset = await _calibrate_mount(
+            hcapi, mount, slot, method, raise_verify_error, prior_offset
+        )
         await hcapi.save_instrument_offset(mount, offset)
         return offset
     finally:
@@ -737,6 +855,7 @@ async def calibrate_module(
     slot: int,
     module_id: str,
     nominal_position: Point,
+    method: CalibrationMethod = CalibrationMethod.NONCONTACT_PASS_WITH_FALLBACK,
 ) -> Point:
     """
     Run automatic calibration for a module.
@@ -762,9 +881,10 @@ async def calibrate_module(
         LOG.info(
             f"Starting module calibration for {module_id} at {nominal_position} using {mount}"
         )
-        # find the offset
+        # find the offset, starting from where the module was last calibrated
+        prior_offset = _calibration_prior(hcapi.get_module_offset(module_id, slot))
         offset = await find_calibration_structure_position(
-            hcapi, mount, nominal_position, method=CalibrationMethod.BINARY_SEARCH
+            hcapi, mount, nominal_position, method, prior_offset=prior_offset
         )
         await hcapi.save_module_offset(module_id, mount, slot, offset)
         return offset
@@ -146,6 +146,9 @@ from .status_bar_state import StatusBarStateController
 
 mod_log = logging.getLogger(__name__)
 
+# Liquid handling repeats the same moves, so recent motion plans are reused.
+MOTION_PLAN_CACHE_SIZE = 128
+
 
 class OT3API(
     ExecutionManagerProvider,
@@ -209,7 +212,8 @@ class OT3API(
         self._move_manager = MoveManager(
             constraints=get_system_constraints(
                 self._config.motion_settings, self._gantry_load
-            )
+            ),
+            plan_cache_size=MOTION_PLAN_CACHE_SIZE,
         )
         self._status_bar_controller = StatusBarStateController(
             self._backend.status_bar_interface()
@@ -325,11 +329,16 @@ class OT3API(
         config: Union[RobotConfig, OT3Config, None] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         strict_attached_instruments: bool = True,
+        zero_cost_motion: bool = False,
     ) -> "OT3API":
         """Build a simulating hardware controller.
 
         This method may be used both on a real robot and on dev machines.
         Multiple simulating hardware controllers may be active at one time.
+
+        If `zero_cost_motion` is set, moves jump straight to their targets
+        without being planned. Positions, tips, and volumes are tracked the
+        same way, so this is meant for analysis, which only needs those.
         """
 
         checked_attached = attached_instruments or {}
@@ -346,6 +355,7 @@ class OT3API(
             checked_config,
             checked_loop,
             strict_attached_instruments,
+            zero_cost_motion,
         )
         api_instance = cls(backend, loop=checked_loop, config=checked_config)
         await api_instance.cache_instruments()
@@ -1108,6 +1118,15 @@ class OT3API(
         }
         check_motion_bounds(to_check, target_position, bounds, check_bounds)
 
+        if isinstance(self._backend, OT3Simulator) and self._backend.zero_cost_motion:
+            async with contextlib.AsyncExitStack() as stack:
+                if acquire_lock:
+                    await stack.enter_async_context(self._motion_lock)
+                await self._backend.jump_to(machine_pos)
+                await self._cache_current_position()
+                await self._cache_encoder_position()
+            return
+
         origin = await self._backend.update_position()
         try:
             moves = self._build_moves(origin, machine_pos, speed)
@@ -1731,6 +1750,16 @@ class OT3API(
         else:
             self._pipette_handler.reset_instrument_offset(checked_mount, to_default)
 
+    def get_instrument_offset(
+        self, mount: Union[top_types.Mount, OT3Mount]
+    ) -> Optional[Union[GripperCalibrationOffset, PipetteOffsetByPipetteMount]]:
+        """Get the offset of the instrument on a mount, if one is attached."""
+        checked_mount = OT3Mount.from_mount(mount)
+        if checked_mount == OT3Mount.GRIPPER:
+            return self._gripper_handler.get_instrument_offset()
+        else:
+            return self._pipette_handler.get_instrument_offset(checked_mount)
+
     async def save_instrument_offset(
         self, mount: Union[top_types.Mount, OT3Mount], delta: top_types.Point
     ) -> Union[GripperCalibrationOffset, PipetteOffsetByPipetteMount]:
@@ -1742,6 +1771,18 @@ class OT3API(
         else:
             return self._pipette_handler.save_instrument_offset(checked_mount, delta)
 
+    def get_module_offset(
+        self, module_id: str, slot: int
+    ) -> Optional[ModuleCalibrationOffset]:
+        """Get the stored offset of a module in a slot."""
+        module = self._backend.module_controls.get_module_by_module_id(module_id)
+        if not module:
+            self._log.warning(f"Could not load calibration: unknown module {module_id}")
+            return None
+        return self._backend.module_controls.load_module_offset(
+            module.MODULE_TYPE, module_id, slot
+        )
+
     async def save_module_offset(
         self, module_id: str, mount: OT3Mount, slot: int, offset: top_types.Point
     ) -> Optional[ModuleCalibrationOffset]:
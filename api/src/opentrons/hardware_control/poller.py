@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import logging
+import math
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, List, Optional
 
@@ -16,23 +17,51 @@ class Reader(ABC):
     def on_error(self, exception: Exception) -> None:
         """Handle an error from calling `read`."""
 
+    def is_active(self) -> bool:
+        """Whether the data being read is expected to change soon.
+
+        For example, a module that is heating towards a target is active.
+        Inactive readers are polled at their poller's idle interval.
+        """
+        return True
+
 
 class Poller:
     """A poller to call a given reader on an interval.
 
+    Polls are scheduled against absolute deadlines, so the time taken
+    by each read does not push back the polls that follow it.
+
     Args:
         reader: An interface to read data.
         interval: The poll interval, in seconds.
+        idle_interval: The poll interval while the reader is inactive
+            and nothing is waiting on a poll. Defaults to `interval`.
+        fast_forward: Poll as soon as anything waits on a poll, rather than
+            at the next deadline. For simulated readers, whose data does
+            not depend on real time passing between reads.
     """
 
     interval: float
-
-    def __init__(self, reader: Reader, interval: float) -> None:
+    idle_interval: float
+    fast_forward: bool
+
+    def __init__(
+        self,
+        reader: Reader,
+        interval: float,
+        idle_interval: Optional[float] = None,
+        fast_forward: bool = False,
+    ) -> None:
         self.interval = interval
+        self.idle_interval = idle_interval if idle_interval is not None else interval
+        self.fast_forward = fast_forward
         self._reader = reader
         self._read_lock: Optional["asyncio.Lock"] = None
         self._poll_waiters: List["asyncio.Future[None]"] = []
         self._poll_forever_task: Optional["asyncio.Task[None]"] = None
+        self._schedule_changed: Optional["asyncio.Event"] = None
+        self._poll_requested = False
 
     async def start(self) -> None:
         assert self._poll_forever_task is None, "Poller already started"
@@ -58,8 +87,37 @@ class Poller:
         """
         poll_future = asyncio.get_running_loop().create_future()
         self._poll_waiters.append(poll_future)
+        # Waiters are polled for at the active interval.
+        self._notify_schedule_changed()
         await poll_future
 
+    async def poll_now(self) -> None:
+        """Poll immediately, rather than at the next scheduled time.
+
+        Use this after sending a command, to see its effects and to
+        pick up the reader's new polling rate without waiting out
+        an idle interval. Wait for the poll to complete, like
+        `wait_next_poll`.
+        """
+        task = self._poll_forever_task
+
+        if task is None or task.done():
+            async with self._use_read_lock():
+                await self._reader.read()
+            return
+
+        self._poll_requested = True
+        await self.wait_next_poll()
+
+    def _notify_schedule_changed(self) -> None:
+        if self._schedule_changed is not None:
+            self._schedule_changed.set()
+
+    def _current_interval(self) -> float:
+        if self._poll_waiters or self._reader.is_active():
+            return self.interval
+        return self.idle_interval
+
     @contextlib.asynccontextmanager
     async def _use_read_lock(self) -> AsyncGenerator[None, None]:
         self._read_lock = self._read_lock or asyncio.Lock()
@@ -69,9 +127,46 @@ class Poller:
 
     async def _poll_forever(self) -> None:
         """Polling loop."""
+        self._schedule_changed = asyncio.Event()
+        deadline = asyncio.get_running_loop().time()
+
         while True:
             await self._poll_once()
-            await asyncio.sleep(self.interval)
+            deadline = await self._wait_for_next_deadline(deadline)
+
+    async def _wait_for_next_deadline(self, previous_deadline: float) -> float:
+        """Sleep until the next poll is due, returning its deadline.
+
+        The interval is re-evaluated whenever the schedule changes,
+        so a new waiter or an immediate poll request cuts an idle sleep short.
+        If a read overruns one or more deadlines, the next poll starts
+        right away and the missed polls are skipped, rather than run back-to-back.
+        """
+        assert self._schedule_changed is not None
+        loop = asyncio.get_running_loop()
+
+        while True:
+            self._schedule_changed.clear()
+            now = loop.time()
+
+            if self._poll_requested or (self.fast_forward and self._poll_waiters):
+                self._poll_requested = False
+                return now
+
+            interval = self._current_interval()
+            deadline = previous_deadline + interval
+
+            if deadline <= now:
+                missed = math.floor((now - previous_deadline) / interval)
+                return previous_deadline + missed * interval
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._schedule_changed.wait(), timeout=deadline - now
+                )
+                continue
+
+            return deadline
 
     async def _poll_once(self) -> None:
         """Trigger a single read, notifying listeners of success or error."""
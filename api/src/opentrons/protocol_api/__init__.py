@@ -4,28 +4,51 @@ This package defines classes and functions for access through a protocol to
 control the OT2.
 
 """
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from opentrons.protocols.api_support.definitions import (
     MAX_SUPPORTED_VERSION,
     MIN_SUPPORTED_VERSION,
 )
 
-from .protocol_context import ProtocolContext
-from .deck import Deck
-from .instrument_context import InstrumentContext
-from .labware import Labware, Well
-from .module_contexts import (
-    ModuleContext,
-    ThermocyclerContext,
-    MagneticModuleContext,
-    TemperatureModuleContext,
-    HeaterShakerContext,
-)
-from ._liquid import Liquid
+if TYPE_CHECKING:
+    from .protocol_context import ProtocolContext
+    from .deck import Deck
+    from .instrument_context import InstrumentContext
+    from .labware import Labware, Well
+    from .module_contexts import (
+        ModuleContext,
+        ThermocyclerContext,
+        MagneticModuleContext,
+        TemperatureModuleContext,
+        HeaterShakerContext,
+    )
+    from ._liquid import Liquid
 
-from .create_protocol_context import (
-    create_protocol_context,
-    ProtocolEngineCoreRequiredError,
-)
+    from .create_protocol_context import (
+        create_protocol_context,
+        ProtocolEngineCoreRequiredError,
+    )
+
+# Public names, mapped to the submodules that define them. Importing a
+# submodule pulls in every context, core, and module class along with the
+# hardware controller, so it waits until one of these names is used.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "ProtocolContext": ".protocol_context",
+    "Deck": ".deck",
+    "InstrumentContext": ".instrument_context",
+    "Labware": ".labware",
+    "Well": ".labware",
+    "ModuleContext": ".module_contexts",
+    "ThermocyclerContext": ".module_contexts",
+    "MagneticModuleContext": ".module_contexts",
+    "TemperatureModuleContext": ".module_contexts",
+    "HeaterShakerContext": ".module_contexts",
+    "Liquid": "._liquid",
+    "create_protocol_context": ".create_protocol_context",
+    "ProtocolEngineCoreRequiredError": ".create_protocol_context",
+}
 
 __all__ = [
     "MAX_SUPPORTED_VERSION",
@@ -45,3 +68,17 @@ __all__ = [
     "create_protocol_context",
     "ProtocolEngineCoreRequiredError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from opentrons.calibration_storage import helpers
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
@@ -9,7 +9,7 @@ from opentrons_shared_data.labware.dev_types import LabwareParameters, LabwareDe
 
 from ..labware import AbstractLabware, LabwareLoadParams
 from .legacy_well_core import LegacyWellCore
-from .well_geometry import WellGeometry
+from .well_geometry import WellGeometry, WellGeometryStore
 
 
 # URIs of labware whose definitions accidentally specify an engage height
@@ -59,28 +59,21 @@ class LegacyLabwareCore(AbstractLabware[LegacyWellCore]):
             z=self._geometry.offset.z,
         )
 
-        # flatten list of list of well names.
-        self._wells_by_name = {
-            well_name: LegacyWellCore(
-                well_geometry=WellGeometry(
-                    well_props=self._well_definition[well_name],
-                    parent_point=self._calibrated_offset,
-                    parent_object=self,
-                ),
-                display_name=f"{well_name} of {self._display_name}",
-                has_tip=self.is_tip_rack(),
-                name=well_name,
+        # Well geometry is stored as arrays, indexed by the well's position
+        # in the flattened list of well names. Well cores are views into it,
+        # created the first time they're needed.
+        self._well_indices = {
+            well_name: index
+            for index, well_name in enumerate(
+                well_name for column in self.get_well_columns() for well_name in column
             )
-            for column in self.get_well_columns()
-            for well_name in column
         }
-
-        self._tip_tracker = TipTracker(
-            columns=[
-                [self._wells_by_name[well_name] for well_name in column]
-                for column in self.get_well_columns()
-            ]
+        self._well_geometry = WellGeometryStore(
+            well_props=[self._well_definition[name] for name in self._well_indices],
+            parent_point=self._calibrated_offset,
         )
+        self._wells_by_name: Dict[str, LegacyWellCore] = {}
+        self._tip_tracker: Optional[TipTracker] = None
 
     def get_uri(self) -> str:
         return helpers.uri_from_definition(self._definition)
@@ -120,13 +113,7 @@ class LegacyLabwareCore(AbstractLabware[LegacyWellCore]):
             z=self._geometry.offset.z + delta.z,
         )
 
-        # Rebuild well geometry with new offset
-        for well_name, well_core in self._wells_by_name.items():
-            well_core.geometry = WellGeometry(
-                well_props=self._well_definition[well_name],
-                parent_point=self._calibrated_offset,
-                parent_object=self,
-            )
+        self._well_geometry.set_parent_point(self._calibrated_offset)
 
     def get_calibrated_offset(self) -> Point:
         return self._calibrated_offset
@@ -146,16 +133,23 @@ class LegacyLabwareCore(AbstractLabware[LegacyWellCore]):
 
     def reset_tips(self) -> None:
         if self.is_tip_rack():
-            for well in self._wells_by_name.values():
-                well.set_has_tip(True)
+            for well_name in self._well_indices:
+                self.get_well_core(well_name).set_has_tip(True)
 
     def get_next_tip(
         self, num_tips: int, starting_tip: Optional[LegacyWellCore]
     ) -> Optional[str]:
-        next_well = self._tip_tracker.next_tip(num_tips, starting_tip)
+        next_well = self.get_tip_tracker().next_tip(num_tips, starting_tip)
         return next_well.get_name() if next_well else None
 
     def get_tip_tracker(self) -> TipTracker:
+        if self._tip_tracker is None:
+            self._tip_tracker = TipTracker(
+                columns=[
+                    [self.get_well_core(well_name) for well_name in column]
+                    for column in self.get_well_columns()
+                ]
+            )
         return self._tip_tracker
 
     def get_well_columns(self) -> List[List[str]]:
@@ -198,7 +192,20 @@ class LegacyLabwareCore(AbstractLabware[LegacyWellCore]):
         return default_engage_height
 
     def get_well_core(self, well_name: str) -> LegacyWellCore:
-        return self._wells_by_name[well_name]
+        well_core = self._wells_by_name.get(well_name)
+        if well_core is None:
+            well_core = LegacyWellCore(
+                well_geometry=WellGeometry.from_store(
+                    store=self._well_geometry,
+                    index=self._well_indices[well_name],
+                    parent_object=self,
+                ),
+                display_name=f"{well_name} of {self._display_name}",
+                has_tip=self.is_tip_rack(),
+                name=well_name,
+            )
+            self._wells_by_name[well_name] = well_core
+        return well_core
 
     def get_deck_slot(self) -> Optional[DeckSlotName]:
         """Get the deck slot the labware is in, if in a deck slot."""
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, cast, TYPE_CHECKING
+from typing import List, Optional, Sequence, cast, TYPE_CHECKING
+
+import numpy as np
 
 from opentrons.types import Point
 from opentrons_shared_data.labware.dev_types import (
@@ -10,10 +12,95 @@ from opentrons_shared_data.labware.dev_types import (
 )
 
 if TYPE_CHECKING:
+    from opentrons.util.linal import DoubleArray
     from .legacy_labware_core import LegacyLabwareCore
 
 
+class WellGeometryStore:
+    """The geometry of every well in a labware, stored as arrays.
+
+    Each array is indexed by the well's position in the list of well
+    definitions it was built from. Dimensions that don't apply to a well's
+    shape, like the diameter of a rectangular well, are stored as NaN.
+
+    The positions of the wells' tops are kept up to date with the labware's
+    position, so moving a labware is a single vector addition rather than
+    a rebuild of every well.
+    """
+
+    def __init__(
+        self, well_props: Sequence[WellDefinition], parent_point: Point
+    ) -> None:
+        """Construct a well geometry store.
+
+        :param well_props: Properties of each well from the labware definition
+        :param parent_point: The coordinate of the parent labware
+        """
+        diameters: List[float] = []
+        lengths: List[float] = []
+        widths: List[float] = []
+        for props in well_props:
+            shape = props["shape"]
+            if shape == "rectangular":
+                rect_props = cast(RectangularWellDefinition, props)
+                diameters.append(np.nan)
+                lengths.append(rect_props["xDimension"])
+                widths.append(rect_props["yDimension"])
+            elif shape == "circular":
+                circular_props = cast(CircularWellDefinition, props)
+                diameters.append(circular_props["diameter"])
+                lengths.append(np.nan)
+                widths.append(np.nan)
+            else:
+                raise ValueError(f'Shape "{shape}" is not a supported well shape')
+
+        self._top_offsets: DoubleArray = np.array(
+            [(p["x"], p["y"], p["z"] + p["depth"]) for p in well_props],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        self._depths: DoubleArray = np.array(
+            [p["depth"] for p in well_props], dtype=np.float64
+        )
+        self._max_volumes: DoubleArray = np.array(
+            [p["totalLiquidVolume"] for p in well_props], dtype=np.float64
+        )
+        self._diameters: DoubleArray = np.array(diameters, dtype=np.float64)
+        self._lengths: DoubleArray = np.array(lengths, dtype=np.float64)
+        self._widths: DoubleArray = np.array(widths, dtype=np.float64)
+        self.set_parent_point(parent_point)
+
+    def set_parent_point(self, parent_point: Point) -> None:
+        """Move every well to follow a new parent labware coordinate."""
+        self._tops: DoubleArray = self._top_offsets + np.array(
+            parent_point, dtype=np.float64
+        )
+
+    def get_top(self, index: int) -> Point:
+        return Point(*self._tops[index].tolist())
+
+    def get_depth(self, index: int) -> float:
+        return cast(float, self._depths[index].item())
+
+    def get_max_volume(self, index: int) -> float:
+        return cast(float, self._max_volumes[index].item())
+
+    def get_diameter(self, index: int) -> Optional[float]:
+        return _nan_to_none(self._diameters[index])
+
+    def get_length(self, index: int) -> Optional[float]:
+        return _nan_to_none(self._lengths[index])
+
+    def get_width(self, index: int) -> Optional[float]:
+        return _nan_to_none(self._widths[index])
+
+
+def _nan_to_none(value: np.float64) -> Optional[float]:
+    return None if np.isnan(value) else value.item()
+
+
 class WellGeometry:
+    """The geometry of a single well, as a view into a :py:class:`WellGeometryStore`."""
+
     def __init__(
         self,
         well_props: WellDefinition,
@@ -27,80 +114,71 @@ class WellGeometry:
         :param parent_point: The coordinate of parent labware
         :param parent_object: The parent labware
         """
-
-        self._position = (
-            Point(
-                well_props["x"], well_props["y"], well_props["z"] + well_props["depth"]
-            )
-            + parent_point
+        self._init_view(
+            store=WellGeometryStore([well_props], parent_point),
+            index=0,
+            parent_object=parent_object,
         )
 
+    @classmethod
+    def from_store(
+        cls, store: WellGeometryStore, index: int, parent_object: LegacyLabwareCore
+    ) -> WellGeometry:
+        """Construct a view of one of the wells in a labware's geometry store."""
+        well_geometry: WellGeometry = cls.__new__(cls)
+        well_geometry._init_view(store=store, index=index, parent_object=parent_object)
+        return well_geometry
+
+    def _init_view(
+        self, store: WellGeometryStore, index: int, parent_object: LegacyLabwareCore
+    ) -> None:
         if not parent_object:
             raise ValueError("Wells must have a parent")
 
+        self._store = store
+        self._index = index
         self._parent = parent_object
 
-        self._length: Optional[float] = None
-        self._width: Optional[float] = None
-        self._diameter: Optional[float] = None
-
-        shape = well_props["shape"]
-        if shape == "rectangular":
-            rect_props = cast(RectangularWellDefinition, well_props)
-            self._length = rect_props["xDimension"]
-            self._width = rect_props["yDimension"]
-            self._x_size = self._length
-            self._y_size = self._width
-        elif shape == "circular":
-            circular_props = cast(CircularWellDefinition, well_props)
-            self._diameter = circular_props["diameter"]
-            self._x_size = self._y_size = self._diameter
-        else:
-            raise ValueError(f'Shape "{shape}" is not a supported well shape')
-
-        self._max_volume = well_props["totalLiquidVolume"]
-        self._depth = well_props["depth"]
-
     @property
     def parent(self) -> LegacyLabwareCore:
         return self._parent
 
     @property
     def position(self) -> Point:
-        return self._position
+        return self._store.get_top(self._index)
 
     @property
     def diameter(self) -> Optional[float]:
-        return self._diameter
+        return self._store.get_diameter(self._index)
 
     @property
     def length(self) -> Optional[float]:
-        return self._length
+        return self._store.get_length(self._index)
 
     @property
     def width(self) -> Optional[float]:
-        return self._width
+        return self._store.get_width(self._index)
 
     @property
     def depth(self) -> float:
-        return self._depth
+        return self._store.get_depth(self._index)
 
     def top(self, z: float = 0.0) -> Point:
-        return self._position + Point(0, 0, z)
+        return self.position + Point(0, 0, z)
 
     def bottom(self, z: float = 0.0) -> Point:
         top = self.top()
-        bottom_z = top.z - self._depth + z
+        bottom_z = top.z - self.depth + z
         return Point(x=top.x, y=top.y, z=bottom_z)
 
     def center(self) -> Point:
         top = self.top()
-        center_z = top.z - (self._depth / 2.0)
+        center_z = top.z - (self.depth / 2.0)
         return Point(x=top.x, y=top.y, z=center_z)
 
     @property
     def max_volume(self) -> float:
-        return self._max_volume
+        return self._store.get_max_volume(self._index)
 
     def from_center_cartesian(self, x: float, y: float, z: float) -> Point:
         """
@@ -137,9 +215,11 @@ class WellGeometry:
         coordinates
         """
         center = self.center()
-        x_size = self._x_size
-        y_size = self._y_size
-        z_size = self._depth
+        diameter = self.diameter
+        x_size = self.length if diameter is None else diameter
+        y_size = self.width if diameter is None else diameter
+        z_size = self.depth
+        assert x_size is not None and y_size is not None
 
         return Point(
             x=center.x + (x * (x_size / 2.0)),
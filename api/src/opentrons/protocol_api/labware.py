@@ -303,13 +303,11 @@ class Labware:
 
         well_columns = core.get_well_columns()
         self._well_grid = well_grid.create(columns=well_columns)
-        self._wells_by_name = {
-            well_name: Well(
-                parent=self, core=core.get_well_core(well_name), api_version=api_version
-            )
-            for column in well_columns
-            for well_name in column
-        }
+        # Wells are created the first time they're accessed,
+        # so loading labware with many wells stays cheap.
+        self._wells_by_name: Dict[str, Optional[Well]] = dict.fromkeys(
+            well_name for column in well_columns for well_name in column
+        )
 
     @property
     def separate_calibration(self) -> bool:
@@ -328,7 +326,22 @@ class Labware:
         return self._api_version
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._get_well(key)
+
+    def _get_well(self, well_name: str) -> Well:
+        """Get a well by name, creating it if it hasn't been accessed yet.
+
+        :raises KeyError: The labware has no well with this name.
+        """
+        well = self._wells_by_name[well_name]
+        if well is None:
+            well = Well(
+                parent=self,
+                core=self._core.get_well_core(well_name),
+                api_version=self._api_version,
+            )
+            self._wells_by_name[well_name] = well
+        return well
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -522,7 +535,7 @@ class Labware:
         :return: Ordered list of all wells in a labware
         """
         if not args:
-            return list(self._wells_by_name.values())
+            return [self._get_well(well_name) for well_name in self._wells_by_name]
 
         elif validation.is_all_integers(args):
             wells = self.wells()
@@ -549,7 +562,9 @@ class Labware:
 
         :return: Dictionary of well objects keyed by well name
         """
-        return dict(self._wells_by_name)
+        return {
+            well_name: self._get_well(well_name) for well_name in self._wells_by_name
+        }
 
     @requires_version(2, 0)
     def wells_by_index(self) -> Dict[str, Well]:
@@ -581,7 +596,7 @@ class Labware:
         """
         if not args:
             return [
-                [self._wells_by_name[well_name] for well_name in row]
+                [self._get_well(well_name) for well_name in row]
                 for row in self._well_grid.rows_by_name.values()
             ]
 
@@ -611,7 +626,7 @@ class Labware:
         :return: Dictionary of Well lists keyed by row name
         """
         return {
-            row_name: [self._wells_by_name[well_name] for well_name in row]
+            row_name: [self._get_well(well_name) for well_name in row]
             for row_name, row in self._well_grid.rows_by_name.items()
         }
 
@@ -644,7 +659,7 @@ class Labware:
         """
         if not args:
             return [
-                [self._wells_by_name[well_name] for well_name in column]
+                [self._get_well(well_name) for well_name in column]
                 for column in self._well_grid.columns_by_name.values()
             ]
 
@@ -675,7 +690,7 @@ class Labware:
         :return: Dictionary of Well lists keyed by column name
         """
         return {
-            column_name: [self._wells_by_name[well_name] for well_name in column]
+            column_name: [self._get_well(well_name) for well_name in column]
             for column_name, column in self._well_grid.columns_by_name.items()
         }
 
@@ -756,7 +771,7 @@ class Labware:
             starting_tip=starting_tip._core if starting_tip else None,
         )
 
-        return self._wells_by_name[well_name] if well_name is not None else None
+        return self._get_well(well_name) if well_name is not None else None
 
     def use_tips(self, start_well: Well, num_channels: int = 1) -> None:
         """
@@ -840,7 +855,7 @@ class Labware:
             .get_tip_tracker()
             .previous_tip(num_tips=num_tips)
         )
-        return self._wells_by_name[well_core.get_name()] if well_core else None
+        return self._get_well(well_core.get_name()) if well_core else None
 
     # TODO(mc, 2022-11-09): implementation detail; deprecate public method
     def return_tips(self, start_well: Well, num_channels: int = 1) -> None:
@@ -320,6 +320,18 @@ class SyncClient:
         result = self._transport.execute_command(request=request)
         return cast(commands.DispenseInPlaceResult, result)
 
+    def pipetting_sequence(
+        self,
+        pipette_id: str,
+        steps: List[commands.PipettingSequenceStep],
+    ) -> commands.PipettingSequenceResult:
+        """Execute a ``PipettingSequence`` command and return the result."""
+        request = commands.PipettingSequenceCreate(
+            params=commands.PipettingSequenceParams(pipetteId=pipette_id, steps=steps)
+        )
+        result = self._transport.execute_command(request=request)
+        return cast(commands.PipettingSequenceResult, result)
+
     def blow_out(
         self,
         pipette_id: str,
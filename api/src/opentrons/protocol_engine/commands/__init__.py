@@ -86,6 +86,16 @@ from .dispense_in_place import (
     DispenseInPlaceCommandType,
 )
 
+from .pipetting_sequence import (
+    PipettingSequence,
+    PipettingSequenceParams,
+    PipettingSequenceCreate,
+    PipettingSequenceResult,
+    PipettingSequenceCommandType,
+    PipettingSequenceStep,
+    PipettingSequenceStepResult,
+)
+
 from .drop_tip import (
     DropTip,
     DropTipParams,
@@ -284,6 +294,14 @@ __all__ = [
     "DispenseInPlaceParams",
     "DispenseInPlaceResult",
     "DispenseInPlaceCommandType",
+    # pipetting sequence command models
+    "PipettingSequence",
+    "PipettingSequenceCreate",
+    "PipettingSequenceParams",
+    "PipettingSequenceResult",
+    "PipettingSequenceCommandType",
+    "PipettingSequenceStep",
+    "PipettingSequenceStepResult",
     # drop tip command models
     "DropTip",
     "DropTipCreate",
@@ -65,6 +65,14 @@ from .dispense_in_place import (
     DispenseInPlaceCommandType,
 )
 
+from .pipetting_sequence import (
+    PipettingSequence,
+    PipettingSequenceParams,
+    PipettingSequenceCreate,
+    PipettingSequenceResult,
+    PipettingSequenceCommandType,
+)
+
 from .drop_tip import (
     DropTip,
     DropTipParams,
@@ -208,6 +216,7 @@ Command = Union[
     Custom,
     Dispense,
     DispenseInPlace,
+    PipettingSequence,
     BlowOut,
     BlowOutInPlace,
     DropTip,
@@ -260,6 +269,7 @@ CommandParams = Union[
     CustomParams,
     DispenseParams,
     DispenseInPlaceParams,
+    PipettingSequenceParams,
     BlowOutParams,
     BlowOutInPlaceParams,
     DropTipParams,
@@ -313,6 +323,7 @@ CommandType = Union[
     CustomCommandType,
     DispenseCommandType,
     DispenseInPlaceCommandType,
+    PipettingSequenceCommandType,
     BlowOutCommandType,
     BlowOutInPlaceCommandType,
     DropTipCommandType,
@@ -365,6 +376,7 @@ CommandCreate = Union[
     CustomCreate,
     DispenseCreate,
     DispenseInPlaceCreate,
+    PipettingSequenceCreate,
     BlowOutCreate,
     BlowOutInPlaceCreate,
     DropTipCreate,
@@ -417,6 +429,7 @@ CommandResult = Union[
     CustomResult,
     DispenseResult,
     DispenseInPlaceResult,
+    PipettingSequenceResult,
     BlowOutResult,
     BlowOutInPlaceResult,
     DropTipResult,
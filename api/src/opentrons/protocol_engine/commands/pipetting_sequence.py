@@ -0,0 +1,213 @@
+"""Pipetting sequence command request, result, and implementation models."""
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Optional, Type
+from typing_extensions import Literal
+
+from pydantic import Field
+
+from ..errors.exceptions import InvalidPipettingVolumeError
+from ..types import CurrentWell, DeckPoint, WellLocation, WellOrigin
+from .pipetting_common import (
+    PipetteIdMixin,
+    VolumeMixin,
+    FlowRateMixin,
+    WellLocationMixin,
+    BaseLiquidHandlingResult,
+    DestinationPositionResult,
+)
+from .command import AbstractCommandImpl, BaseCommand, BaseCommandCreate
+
+if TYPE_CHECKING:
+    from ..execution import MovementHandler, PipettingHandler
+    from ..state import StateView
+
+
+PipettingSequenceCommandType = Literal["pipettingSequence"]
+
+
+class PipettingSequenceStep(VolumeMixin, FlowRateMixin, WellLocationMixin):
+    """A single aspirate or dispense in a pipetting sequence."""
+
+    action: Literal["aspirate", "dispense"] = Field(
+        ...,
+        description="Whether to aspirate from or dispense to the well.",
+    )
+
+
+class PipettingSequenceParams(PipetteIdMixin):
+    """Parameters required to aspirate and dispense across a sequence of wells."""
+
+    steps: List[PipettingSequenceStep] = Field(
+        ...,
+        description=(
+            "The aspirates and dispenses to perform, in order."
+            " Each one moves to its well the same way an `aspirate`"
+            " or `dispense` command would."
+        ),
+        min_items=1,
+    )
+
+
+class PipettingSequenceStepResult(BaseLiquidHandlingResult, DestinationPositionResult):
+    """Result data from a single step of a pipetting sequence."""
+
+    pass
+
+
+class PipettingSequenceResult(DestinationPositionResult):
+    """Result data from execution of a PipettingSequence command.
+
+    The inherited `position` is where the pipette was after the last step.
+    """
+
+    steps: List[PipettingSequenceStepResult] = Field(
+        ...,
+        description="The result of each step, in the same order as the params.",
+    )
+
+
+class PipettingSequenceImplementation(
+    AbstractCommandImpl[PipettingSequenceParams, PipettingSequenceResult]
+):
+    """Pipetting sequence command implementation."""
+
+    def __init__(
+        self,
+        movement: MovementHandler,
+        pipetting: PipettingHandler,
+        state_view: StateView,
+        **kwargs: object,
+    ) -> None:
+        self._movement = movement
+        self._pipetting = pipetting
+        self._state_view = state_view
+
+    async def execute(self, params: PipettingSequenceParams) -> PipettingSequenceResult:
+        """Aspirate from and dispense to each step's well, in order.
+
+        Every step's labware, well and volume are checked before the pipette
+        moves, so a bad step fails the command without doing any of the others.
+
+        Raises:
+            TipNotAttachedError: if no tip is attached to the pipette.
+            LabwareNotLoadedError: if a step's labware has not been loaded.
+            WellDoesNotExistError: if a step's well is not in its labware.
+            InvalidPipettingVolumeError: if a step would aspirate more than
+                the pipette and tip can hold.
+        """
+        pipette_id = params.pipetteId
+        working_volume = self._state_view.pipettes.get_working_volume(
+            pipette_id=pipette_id
+        )
+        initial_volume = self._state_view.pipettes.get_aspirated_volume(
+            pipette_id=pipette_id
+        )
+
+        aspirated_volume = initial_volume or 0
+        for step in params.steps:
+            self._state_view.labware.get_well_definition(
+                labware_id=step.labwareId, well_name=step.wellName
+            )
+            aspirated_volume = _apply_step(aspirated_volume, step)
+            if aspirated_volume > working_volume:
+                raise InvalidPipettingVolumeError(
+                    "Cannot aspirate more than pipette max volume"
+                )
+
+        # Pipette state is only updated once the whole command completes,
+        # so keep track of which well the pipette is in, whether it is ready
+        # to aspirate and how much it holds as we go.
+        current_well: Optional[CurrentWell] = None
+        is_ready_to_aspirate = self._pipetting.get_is_ready_to_aspirate(
+            pipette_id=pipette_id
+        )
+        aspirated_volume = initial_volume or 0
+        step_results: List[PipettingSequenceStepResult] = []
+
+        for step in params.steps:
+            if step.action == "aspirate" and not is_ready_to_aspirate:
+                await self._movement.move_to_well(
+                    pipette_id=pipette_id,
+                    labware_id=step.labwareId,
+                    well_name=step.wellName,
+                    well_location=WellLocation(origin=WellOrigin.TOP),
+                    current_well=current_well,
+                )
+                await self._pipetting.prepare_for_aspirate(pipette_id=pipette_id)
+                is_ready_to_aspirate = True
+                current_well = CurrentWell(
+                    pipette_id=pipette_id,
+                    labware_id=step.labwareId,
+                    well_name=step.wellName,
+                )
+
+            position = await self._movement.move_to_well(
+                pipette_id=pipette_id,
+                labware_id=step.labwareId,
+                well_name=step.wellName,
+                well_location=step.wellLocation,
+                current_well=current_well,
+            )
+            current_well = CurrentWell(
+                pipette_id=pipette_id,
+                labware_id=step.labwareId,
+                well_name=step.wellName,
+            )
+
+            if step.action == "aspirate":
+                volume = await self._pipetting.aspirate_in_place(
+                    pipette_id=pipette_id,
+                    volume=step.volume,
+                    flow_rate=step.flowRate,
+                    aspirated_volume=aspirated_volume,
+                )
+            else:
+                volume = await self._pipetting.dispense_in_place(
+                    pipette_id=pipette_id, volume=step.volume, flow_rate=step.flowRate
+                )
+
+            step_results.append(
+                PipettingSequenceStepResult(
+                    volume=volume,
+                    position=DeckPoint(x=position.x, y=position.y, z=position.z),
+                )
+            )
+
+            aspirated_volume = _apply_step(aspirated_volume, step, volume)
+
+        return PipettingSequenceResult(
+            steps=step_results, position=step_results[-1].position
+        )
+
+
+def _apply_step(
+    aspirated_volume: float,
+    step: PipettingSequenceStep,
+    volume: Optional[float] = None,
+) -> float:
+    """Get the volume in the pipette after a step, like the pipette store does."""
+    volume = step.volume if volume is None else volume
+    if step.action == "aspirate":
+        return aspirated_volume + volume
+    return max(0.0, aspirated_volume - volume)
+
+
+class PipettingSequence(BaseCommand[PipettingSequenceParams, PipettingSequenceResult]):
+    """Pipetting sequence command model."""
+
+    commandType: PipettingSequenceCommandType = "pipettingSequence"
+    params: PipettingSequenceParams
+    result: Optional[PipettingSequenceResult]
+
+    _ImplementationCls: Type[
+        PipettingSequenceImplementation
+    ] = PipettingSequenceImplementation
+
+
+class PipettingSequenceCreate(BaseCommandCreate[PipettingSequenceParams]):
+    """Create pipetting sequence command request model."""
+
+    commandType: PipettingSequenceCommandType = "pipettingSequence"
+    params: PipettingSequenceParams
+
+    _CommandCls: Type[PipettingSequence] = PipettingSequence
@@ -11,7 +11,7 @@ from ..command import AbstractCommandImpl, BaseCommand, BaseCommandCreate
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import EquipmentHandler, RunControlHandler
 
 
 RunProfileCommandType = Literal["thermocycler/runProfile"]
@@ -52,10 +52,12 @@ class RunProfileImpl(AbstractCommandImpl[RunProfileParams, RunProfileResult]):
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(self, params: RunProfileParams) -> RunProfileResult:
         """Run a Thermocycler profile."""
@@ -91,6 +93,10 @@ class RunProfileImpl(AbstractCommandImpl[RunProfileParams, RunProfileResult]):
                 steps=steps, repetitions=1, volume=target_volume
             )
 
+        self._run_control.record_duration(
+            sum(profile_step.holdSeconds for profile_step in params.profile)
+        )
+
         return RunProfileResult()
 
 
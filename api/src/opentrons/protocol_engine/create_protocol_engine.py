@@ -1,21 +1,26 @@
 """Main ProtocolEngine factory."""
+from typing import Optional
+
 from opentrons.hardware_control import HardwareControlAPI
 from opentrons.hardware_control.types import DoorState
 
 from .protocol_engine import ProtocolEngine
-from .resources import DeckDataProvider
+from .resources import DeckDataProvider, VirtualClock
 from .state import Config, StateStore
 
 
 async def create_protocol_engine(
     hardware_api: HardwareControlAPI,
     config: Config,
+    virtual_clock: Optional[VirtualClock] = None,
 ) -> ProtocolEngine:
     """Create a ProtocolEngine instance.
 
     Arguments:
         hardware_api: Hardware control API to pass down to dependencies.
         config: ProtocolEngine configuration.
+        virtual_clock: A simulated clock for the engine to timestamp with.
+            Waits, like delays, advance this clock instead of taking real time.
     """
     deck_data = DeckDataProvider()
     deck_definition = await deck_data.get_deck_definition()
@@ -28,4 +33,8 @@ async def create_protocol_engine(
         is_door_open=hardware_api.door_state is DoorState.OPEN,
     )
 
-    return ProtocolEngine(state_store=state_store, hardware_api=hardware_api)
+    return ProtocolEngine(
+        state_store=state_store,
+        hardware_api=hardware_api,
+        virtual_clock=virtual_clock,
+    )
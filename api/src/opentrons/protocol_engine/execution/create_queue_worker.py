@@ -1,9 +1,12 @@
 """QueueWorker and dependency factory."""
+from typing import Optional
+
 from opentrons.hardware_control import HardwareControlAPI
 from opentrons.protocol_engine.execution.rail_lights import RailLightsHandler
 
 from ..state import StateStore
 from ..actions import ActionDispatcher
+from ..resources import VirtualClock
 from .equipment import EquipmentHandler
 from .movement import MovementHandler
 from .gantry_mover import create_gantry_mover
@@ -19,6 +22,7 @@ def create_queue_worker(
     hardware_api: HardwareControlAPI,
     state_store: StateStore,
     action_dispatcher: ActionDispatcher,
+    virtual_clock: Optional[VirtualClock] = None,
 ) -> QueueWorker:
     """Create a ready-to-use QueueWorker instance.
 
@@ -26,6 +30,7 @@ def create_queue_worker(
         hardware_api: Hardware control API to pass down to dependencies.
         state_store: StateStore to pass down to dependencies.
         action_dispatcher: ActionDispatcher to pass down to dependencies.
+        virtual_clock: Simulated clock to skip waits with, if any.
     """
     gantry_mover = create_gantry_mover(
         hardware_api=hardware_api,
@@ -64,6 +69,7 @@ def create_queue_worker(
     run_control_handler = RunControlHandler(
         state_store=state_store,
         action_dispatcher=action_dispatcher,
+        virtual_clock=virtual_clock,
     )
     rail_lights_handler = RailLightsHandler(
         hardware_api=hardware_api,
@@ -81,6 +87,7 @@ def create_queue_worker(
         tip_handler=tip_handler,
         run_control=run_control_handler,
         rail_lights=rail_lights_handler,
+        model_utils=virtual_clock,
     )
 
     return QueueWorker(
@@ -23,8 +23,17 @@ class PipettingHandler(TypingProtocol):
         pipette_id: str,
         volume: float,
         flow_rate: float,
+        aspirated_volume: Optional[float] = None,
     ) -> float:
-        """Set flow-rate and aspirate."""
+        """Set flow-rate and aspirate.
+
+        Args:
+            pipette_id: The pipette to aspirate with.
+            volume: The volume to aspirate.
+            flow_rate: The flow rate to aspirate at.
+            aspirated_volume: The volume already in the pipette, if it
+                isn't in state yet, like partway through a command.
+        """
 
     async def dispense_in_place(
         self,
@@ -71,6 +80,7 @@ class HardwarePipettingHandler(PipettingHandler):
         pipette_id: str,
         volume: float,
         flow_rate: float,
+        aspirated_volume: Optional[float] = None,
     ) -> float:
         """Set flow-rate and aspirate."""
         # get mount and config data from state and hardware controller
@@ -159,15 +169,19 @@ class VirtualPipettingHandler(PipettingHandler):
         """Get whether a pipette is ready to aspirate."""
         return self._state_view.pipettes.get_aspirated_volume(pipette_id) is not None
 
-    def _validate_aspirated_volume(self, pipette_id: str, volume: float) -> None:
+    def _validate_aspirated_volume(
+        self, pipette_id: str, volume: float, aspirated_volume: Optional[float]
+    ) -> None:
         """Get whether the aspirated volume is valid to aspirate."""
         working_volume = self._state_view.pipettes.get_working_volume(
             pipette_id=pipette_id
         )
 
-        current_volume = (
-            self._state_view.pipettes.get_aspirated_volume(pipette_id=pipette_id) or 0
-        )
+        if aspirated_volume is None:
+            aspirated_volume = self._state_view.pipettes.get_aspirated_volume(
+                pipette_id=pipette_id
+            )
+        current_volume = aspirated_volume or 0
 
         new_volume = current_volume + volume
 
@@ -184,10 +198,13 @@ class VirtualPipettingHandler(PipettingHandler):
         pipette_id: str,
         volume: float,
         flow_rate: float,
+        aspirated_volume: Optional[float] = None,
     ) -> float:
         """Virtually aspirate (no-op)."""
         self._validate_tip_attached(pipette_id=pipette_id, command_name="aspirate")
-        self._validate_aspirated_volume(pipette_id=pipette_id, volume=volume)
+        self._validate_aspirated_volume(
+            pipette_id=pipette_id, volume=volume, aspirated_volume=aspirated_volume
+        )
         return volume
 
     async def dispense_in_place(
@@ -1,8 +1,10 @@
 """Run control command side-effect logic."""
 import asyncio
+from typing import Optional
 
 from ..state import StateStore
 from ..actions import ActionDispatcher, PauseAction, PauseSource
+from ..resources import VirtualClock
 
 
 class RunControlHandler:
@@ -14,10 +16,12 @@ class RunControlHandler:
         self,
         state_store: StateStore,
         action_dispatcher: ActionDispatcher,
+        virtual_clock: Optional[VirtualClock] = None,
     ) -> None:
         """Initialize a RunControlHandler instance."""
         self._state_store = state_store
         self._action_dispatcher = action_dispatcher
+        self._virtual_clock = virtual_clock
 
     async def wait_for_resume(self) -> None:
         """Issue a PauseAction to the store, pausing the run."""
@@ -28,6 +32,20 @@ class RunControlHandler:
             )
 
     async def wait_for_duration(self, seconds: float) -> None:
-        """Delay protocol execution for a duration."""
-        if not self._state_store.config.ignore_pause:
+        """Delay protocol execution for a duration.
+
+        With a virtual clock, the clock is moved forward instead.
+        """
+        if self._virtual_clock is not None:
+            self._virtual_clock.advance(seconds)
+        elif not self._state_store.config.ignore_pause:
             await asyncio.sleep(seconds)
+
+    def record_duration(self, seconds: float) -> None:
+        """Record that something, like a module hold, took a known duration.
+
+        This never waits. It only moves a virtual clock forward, if there is one,
+        since nothing else would have advanced it while the hardware was simulated.
+        """
+        if self._virtual_clock is not None:
+            self._virtual_clock.advance(seconds)
@@ -7,7 +7,7 @@ from opentrons.hardware_control.modules import AbstractModule as HardwareModuleA
 from opentrons.hardware_control.types import PauseType as HardwarePauseType
 
 from . import commands
-from .resources import ModelUtils, ModuleDataProvider
+from .resources import ModelUtils, ModuleDataProvider, VirtualClock
 from .types import (
     LabwareOffset,
     LabwareOffsetCreate,
@@ -62,6 +62,7 @@ class ProtocolEngine:
         hardware_stopper: Optional[HardwareStopper] = None,
         door_watcher: Optional[DoorWatcher] = None,
         module_data_provider: Optional[ModuleDataProvider] = None,
+        virtual_clock: Optional[VirtualClock] = None,
     ) -> None:
         """Initialize a ProtocolEngine instance.
 
@@ -72,7 +73,7 @@ class ProtocolEngine:
         """
         self._hardware_api = hardware_api
         self._state_store = state_store
-        self._model_utils = model_utils or ModelUtils()
+        self._model_utils = model_utils or virtual_clock or ModelUtils()
 
         self._action_dispatcher = action_dispatcher or ActionDispatcher(
             sink=self._state_store
@@ -85,6 +86,7 @@ class ProtocolEngine:
             hardware_api=hardware_api,
             state_store=self._state_store,
             action_dispatcher=self._action_dispatcher,
+            virtual_clock=virtual_clock,
         )
         self._hardware_stopper = hardware_stopper or HardwareStopper(
             hardware_api=hardware_api,
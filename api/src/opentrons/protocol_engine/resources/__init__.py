@@ -1,10 +1,11 @@
 """Interfaces to provide data and other external system resources.
 
-Classes in this module do not maintain state and can be instantiated
-as needed. Some classes may contain solely static methods.
+Classes in this module, other than the VirtualClock, do not maintain
+state and can be instantiated as needed. Some classes may contain solely static methods.
 """
 from . import pipette_data_provider
 from .model_utils import ModelUtils
+from .virtual_clock import VirtualClock
 from .deck_data_provider import DeckDataProvider, DeckFixedLabware
 from .labware_data_provider import LabwareDataProvider
 from .module_data_provider import ModuleDataProvider
@@ -13,6 +14,7 @@ from .ot3_validation import ensure_ot3_hardware
 
 __all__ = [
     "ModelUtils",
+    "VirtualClock",
     "LabwareDataProvider",
     "DeckDataProvider",
     "DeckFixedLabware",
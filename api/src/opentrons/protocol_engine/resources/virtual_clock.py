@@ -0,0 +1,33 @@
+"""Simulated time provider."""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from .model_utils import ModelUtils
+
+
+class VirtualClock(ModelUtils):
+    """Model utilities whose timestamps come from a simulated clock.
+
+    The clock starts at the current time and only moves forward when
+    something that would have waited advances it, instead of waiting.
+    This lets a simulation skip over delays, module holds, and the like,
+    while its timestamps still show how long the real run would have taken.
+    """
+
+    def __init__(self, start: Optional[datetime] = None) -> None:
+        """Initialize the clock, stopped at `start` or the current time."""
+        self._start = start or datetime.now(tz=timezone.utc)
+        self._elapsed_seconds = 0.0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """The total simulated time that has passed, in seconds."""
+        return self._elapsed_seconds
+
+    def get_timestamp(self) -> datetime:  # type: ignore[override]
+        """Get a timestamp of the current simulated time."""
+        return self._start + timedelta(seconds=self._elapsed_seconds)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward, as if `seconds` had just passed."""
+        self._elapsed_seconds += max(seconds, 0.0)
@@ -22,6 +22,7 @@ from ..commands import (
     AspirateResult,
     DispenseResult,
     DispenseInPlaceResult,
+    PipettingSequenceResult,
     MoveLabwareResult,
     MoveToCoordinatesResult,
     MoveToWellResult,
@@ -130,6 +131,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
     def _handle_command(self, command: Command) -> None:
         self._update_current_well(command)
         self._update_deck_point(command)
+        self._update_aspirated_volume(command)
 
         if isinstance(command.result, LoadPipetteResult):
             pipette_id = command.result.pipetteId
@@ -143,19 +145,6 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             self._state.movement_speed_by_id[pipette_id] = None
             self._state.attached_tip_by_id[pipette_id] = None
 
-        elif isinstance(command.result, AspirateResult):
-            pipette_id = command.params.pipetteId
-            previous_volume = self._state.aspirated_volume_by_id[pipette_id] or 0
-            next_volume = previous_volume + command.result.volume
-
-            self._state.aspirated_volume_by_id[pipette_id] = next_volume
-
-        elif isinstance(command.result, (DispenseResult, DispenseInPlaceResult)):
-            pipette_id = command.params.pipetteId
-            previous_volume = self._state.aspirated_volume_by_id[pipette_id] or 0
-            next_volume = max(0.0, previous_volume - command.result.volume)
-            self._state.aspirated_volume_by_id[pipette_id] = next_volume
-
         elif isinstance(command.result, PickUpTipResult):
             pipette_id = command.params.pipetteId
             attached_tip = TipGeometry(
@@ -176,6 +165,34 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             pipette_id = command.params.pipetteId
             self._state.aspirated_volume_by_id[pipette_id] = None
 
+    def _update_aspirated_volume(self, command: Command) -> None:
+        if isinstance(command.result, AspirateResult):
+            pipette_id = command.params.pipetteId
+            previous_volume = self._state.aspirated_volume_by_id[pipette_id] or 0
+            next_volume = previous_volume + command.result.volume
+
+            self._state.aspirated_volume_by_id[pipette_id] = next_volume
+
+        elif isinstance(command.result, (DispenseResult, DispenseInPlaceResult)):
+            pipette_id = command.params.pipetteId
+            previous_volume = self._state.aspirated_volume_by_id[pipette_id] or 0
+            next_volume = max(0.0, previous_volume - command.result.volume)
+            self._state.aspirated_volume_by_id[pipette_id] = next_volume
+
+        # Apply a pipetting sequence's steps in order, as if each
+        # had been its own aspirate or dispense command.
+        elif isinstance(command.result, PipettingSequenceResult):
+            pipette_id = command.params.pipetteId
+            volume = self._state.aspirated_volume_by_id[pipette_id] or 0
+
+            for step, step_result in zip(command.params.steps, command.result.steps):
+                if step.action == "aspirate":
+                    volume = volume + step_result.volume
+                else:
+                    volume = max(0.0, volume - step_result.volume)
+
+            self._state.aspirated_volume_by_id[pipette_id] = volume
+
     def _update_current_well(self, command: Command) -> None:
         # These commands leave the pipette in a new well.
         # Update current_well to reflect that.
@@ -197,6 +214,15 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
                 well_name=command.params.wellName,
             )
 
+        # A pipetting sequence leaves the pipette in its last step's well.
+        elif isinstance(command.result, PipettingSequenceResult):
+            last_step = command.params.steps[-1]
+            self._state.current_well = CurrentWell(
+                pipette_id=command.params.pipetteId,
+                labware_id=last_step.labwareId,
+                well_name=last_step.wellName,
+            )
+
         # These commands leave the pipette in a place that we can't logically associate
         # with a well. Clear current_well to reflect the fact that it's now unknown.
         #
@@ -253,6 +279,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
                 DropTipResult,
                 AspirateResult,
                 DispenseResult,
+                PipettingSequenceResult,
                 BlowOutResult,
                 TouchTipResult,
             ),
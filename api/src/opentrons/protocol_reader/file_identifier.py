@@ -3,13 +3,14 @@
 import ast
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, Sequence, Union
+from typing import Any, Dict, Optional, Sequence, Union
 
 import anyio
 
 from opentrons_shared_data.robot.dev_types import RobotType
 
 from opentrons.protocols.api_support.definitions import MAX_SUPPORTED_VERSION
+from opentrons.protocols.compile_cache import get_default_cache
 from opentrons.protocols.parse import (
     extract_static_python_info,
     version_from_static_python_info,
@@ -211,22 +212,9 @@ def _analyze_json_protocol(
 def _analyze_python_protocol(
     py_file: BufferedFile,
 ) -> IdentifiedPythonMain:
-    try:
-        # todo(mm, 2021-09-13): Investigate whether it's really appropriate to leave
-        # the Python compilation flags at their defaults. For example, we probably
-        # don't truly want the protocol to inherit our own __future__ features.
-        module_ast = ast.parse(source=py_file.contents, filename=py_file.name)
-    except (SyntaxError, ValueError) as e:
-        # ast.parse() raises SyntaxError for most errors,
-        # but ValueError if the source contains null bytes.
-        raise FileIdentificationError(f"Unable to parse {py_file.name}.") from e
-
-    try:
-        static_info = extract_static_python_info(module_ast)
-    except ValueError as e:
-        raise FileIdentificationError(
-            f"Unable to extract metadata from {py_file.name}."
-        ) from e
+    static_info = _get_cached_static_python_info(py_file)
+    if static_info is None:
+        static_info = _extract_static_python_info(py_file)
 
     try:
         api_version = version_from_static_python_info(static_info)
@@ -251,6 +239,38 @@ def _analyze_python_protocol(
     )
 
 
+def _get_cached_static_python_info(py_file: BufferedFile) -> Optional[StaticPythonInfo]:
+    """Get the static info of a protocol that has already been compiled, if any."""
+    cache = get_default_cache()
+    if cache is None:
+        return None
+    try:
+        source = py_file.contents.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    cached = cache.get(source, py_file.name)
+    return cached.static_info if cached is not None else None
+
+
+def _extract_static_python_info(py_file: BufferedFile) -> StaticPythonInfo:
+    try:
+        # todo(mm, 2021-09-13): Investigate whether it's really appropriate to leave
+        # the Python compilation flags at their defaults. For example, we probably
+        # don't truly want the protocol to inherit our own __future__ features.
+        module_ast = ast.parse(source=py_file.contents, filename=py_file.name)
+    except (SyntaxError, ValueError) as e:
+        # ast.parse() raises SyntaxError for most errors,
+        # but ValueError if the source contains null bytes.
+        raise FileIdentificationError(f"Unable to parse {py_file.name}.") from e
+
+    try:
+        return extract_static_python_info(module_ast)
+    except ValueError as e:
+        raise FileIdentificationError(
+            f"Unable to extract metadata from {py_file.name}."
+        ) from e
+
+
 def _robot_type_from_static_python_info(
     static_python_info: StaticPythonInfo,
 ) -> RobotType:
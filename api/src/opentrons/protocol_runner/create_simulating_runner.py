@@ -6,6 +6,7 @@ from opentrons.protocol_engine import (
     Config as ProtocolEngineConfig,
     create_protocol_engine,
 )
+from opentrons.protocol_engine.resources import VirtualClock
 
 from opentrons_shared_data.robot.dev_types import RobotType
 
@@ -13,9 +14,19 @@ from .legacy_wrappers import LegacySimulatingContextCreator
 from .protocol_runner import ProtocolRunner
 
 
-async def create_simulating_runner(robot_type: RobotType) -> ProtocolRunner:
+async def create_simulating_runner(
+    robot_type: RobotType,
+    use_virtual_clock: bool = False,
+) -> ProtocolRunner:
     """Create a ProtocolRunner wired to a simulating HardwareControlAPI.
 
+    Arguments:
+        robot_type: The type of robot to simulate.
+        use_virtual_clock: Timestamp commands with a simulated clock.
+            Delays and module holds move the clock forward instead of
+            being skipped, so the commands' timestamps show how long
+            the protocol's waits would take on a robot.
+
     Example:
         ```python
         from pathlib import Path
@@ -43,6 +54,8 @@ async def create_simulating_runner(robot_type: RobotType) -> ProtocolRunner:
     # TODO(mc, 2021-08-25): move initial home to protocol engine
     await simulating_hardware_api.home()
 
+    virtual_clock = VirtualClock() if use_virtual_clock else None
+
     protocol_engine = await create_protocol_engine(
         hardware_api=simulating_hardware_api,
         config=ProtocolEngineConfig(
@@ -55,6 +68,7 @@ async def create_simulating_runner(robot_type: RobotType) -> ProtocolRunner:
                 and not feature_flags.disable_fast_protocol_upload()
             ),
         ),
+        virtual_clock=virtual_clock,
     )
 
     simulating_legacy_context_creator = LegacySimulatingContextCreator(
@@ -66,6 +80,7 @@ async def create_simulating_runner(robot_type: RobotType) -> ProtocolRunner:
         protocol_engine=protocol_engine,
         hardware_api=simulating_hardware_api,
         legacy_context_creator=simulating_legacy_context_creator,
+        virtual_clock=virtual_clock,
     )
 
 
@@ -78,4 +93,5 @@ async def _build_hardware_simulator_for_robot_type(
         # Inline import because OT3API is not present to import on an OT-2 system.
         from opentrons.hardware_control.ot3api import OT3API
 
-        return await OT3API.build_hardware_simulator()
+        # Nothing here needs the moves themselves, only where they end up.
+        return await OT3API.build_hardware_simulator(zero_cost_motion=True)
@@ -1,4 +1,7 @@
 """JSON file reading."""
+import json
+from pathlib import Path
+from typing import Any, List, Tuple
 
 from opentrons_shared_data.protocol.models.protocol_schema_v6 import ProtocolSchemaV6
 from opentrons.protocol_reader import ProtocolSource
@@ -11,3 +14,20 @@ class JsonFileReader:
     def read(protocol_source: ProtocolSource) -> ProtocolSchemaV6:
         """Read and parse file into a JsonProtocol model."""
         return ProtocolSchemaV6.parse_file(protocol_source.main_file)
+
+    @staticmethod
+    def read_without_commands(
+        protocol_source: ProtocolSource,
+    ) -> Tuple[ProtocolSchemaV6, List[Any]]:
+        """Read and parse a file, except for its commands.
+
+        Parsing every command into a model is most of the work of reading a
+        large protocol, so the commands are returned as plain JSON, to be parsed
+        as they're translated. The returned model has no commands.
+        """
+        document = json.loads(Path(protocol_source.main_file).read_bytes())
+        commands = document.get("commands") if isinstance(document, dict) else None
+        if not isinstance(commands, list):
+            # This isn't a JSON protocol, and parsing it says why.
+            return ProtocolSchemaV6.parse_obj(document), []
+        return ProtocolSchemaV6.parse_obj({**document, "commands": []}), commands
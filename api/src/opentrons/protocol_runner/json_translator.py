@@ -1,6 +1,8 @@
 """Translation of JSON protocol commands into ProtocolEngine commands."""
-from typing import cast, List
-from pydantic import parse_obj_as
+from typing import cast, Any, Collection, Dict, Iterable, Iterator, List, Optional
+from typing_extensions import get_args
+from pydantic import ValidationError, parse_obj_as
+from pydantic.error_wrappers import ErrorWrapper
 
 from opentrons_shared_data.pipette.dev_types import PipetteNameType
 from opentrons_shared_data.protocol.models import ProtocolSchemaV6, protocol_schema_v6
@@ -22,6 +24,73 @@ class CommandTranslatorError(Exception):
     pass
 
 
+def _get_required_params() -> Dict[str, List[str]]:
+    """Get the params that each JSON command type needs to be translated."""
+    json_params = protocol_schema_v6.Params.__fields__.keys()
+    required_params = {}
+    for create_model in get_args(pe_commands.CommandCreate):
+        params_model = create_model.__fields__["params"].type_
+        params = [
+            field.alias for field in params_model.__fields__.values() if field.required
+        ]
+        # JSON commands can only have the params of the JSON schema.
+        if all(param in json_params for param in params):
+            required_params[create_model.__fields__["commandType"].default] = params
+    # These are translated from other params and the protocol's other sections.
+    required_params.update(
+        loadPipette=["pipetteId", "mount"],
+        loadLabware=["labwareId", "location"],
+        loadModule=["moduleId", "location"],
+    )
+    return required_params
+
+
+_REQUIRED_PARAMS = _get_required_params()
+
+
+def _get_command_type(command_type: str, params: Dict[str, Any]) -> str:
+    """Map deprecated `delay` commands to `waitForResume` / `waitForDuration`."""
+    if command_type == "delay":
+        if params.get("waitForResume") is not None:
+            return "waitForResume"
+        else:
+            return "waitForDuration"
+    return command_type
+
+
+def _check_command(
+    command: Any, index: int, ids: Dict[str, Collection[str]]
+) -> Optional[str]:
+    """Get what's wrong with a JSON command that can't be translated, if anything."""
+    if not isinstance(command, dict) or not isinstance(command.get("params"), dict):
+        return f"Command at index {index} needs a commandType and params."
+    command_type = command.get("commandType")
+    params = command["params"]
+    required_params = (
+        _REQUIRED_PARAMS.get(_get_command_type(command_type, params))
+        if isinstance(command_type, str)
+        else None
+    )
+    if required_params is None:
+        return f"Command at index {index} has unknown commandType {command_type!r}."
+
+    missing_params = [param for param in required_params if params.get(param) is None]
+    if missing_params:
+        return (
+            f"{command_type} command at index {index}"
+            f" is missing params {', '.join(missing_params)}."
+        )
+
+    for param, known_ids in ids.items():
+        referenced_id = params.get(param)
+        if referenced_id is not None and str(referenced_id) not in known_ids:
+            return (
+                f"{command_type} command at index {index}"
+                f" references ID {referenced_id}, which doesn't exist."
+            )
+    return None
+
+
 def _translate_labware_command(
     protocol: ProtocolSchemaV6, command: protocol_schema_v6.Command
 ) -> pe_commands.LoadLabwareCreate:
@@ -87,17 +156,26 @@ def _translate_pipette_command(
     return translated_obj
 
 
+def _translate_command(
+    protocol: ProtocolSchemaV6, command: protocol_schema_v6.Command
+) -> pe_commands.CommandCreate:
+    if command.commandType == "loadPipette":
+        return _translate_pipette_command(protocol, command)
+    elif command.commandType == "loadModule":
+        return _translate_module_command(protocol, command)
+    elif command.commandType == "loadLabware":
+        return _translate_labware_command(protocol, command)
+    else:
+        return _translate_simple_command(command)
+
+
 def _translate_simple_command(
     command: protocol_schema_v6.Command,
 ) -> pe_commands.CommandCreate:
     dict_command = command.dict(exclude_none=True)
-
-    # map deprecated `delay` commands to `waitForResume` / `waitForDuration`
-    if dict_command["commandType"] == "delay":
-        if "waitForResume" in dict_command["params"]:
-            dict_command["commandType"] = "waitForResume"
-        else:
-            dict_command["commandType"] = "waitForDuration"
+    dict_command["commandType"] = _get_command_type(
+        dict_command["commandType"], dict_command["params"]
+    )
 
     translated_obj = cast(
         pe_commands.CommandCreate,
@@ -134,15 +212,53 @@ class JsonTranslator:
         protocol: ProtocolSchemaV6,
     ) -> List[pe_commands.CommandCreate]:
         """Takes json protocol v6 and translates commands->protocol engine commands."""
-        commands_list: List[pe_commands.CommandCreate] = []
-        for command in protocol.commands:
-            if command.commandType == "loadPipette":
-                translated_obj = _translate_pipette_command(protocol, command)
-            elif command.commandType == "loadModule":
-                translated_obj = _translate_module_command(protocol, command)
-            elif command.commandType == "loadLabware":
-                translated_obj = _translate_labware_command(protocol, command)
-            else:
-                translated_obj = _translate_simple_command(command)
-            commands_list.append(translated_obj)
-        return commands_list
+        return [_translate_command(protocol, command) for command in protocol.commands]
+
+    def check_commands(self, protocol: ProtocolSchemaV6, commands: List[Any]) -> None:
+        """Check that JSON commands can be translated, without translating them.
+
+        This checks each command's type, that it has the params that its type
+        requires, and that the IDs it references exist in the protocol, but not
+        the values of its params. It's much faster than translating, so it can
+        check a whole protocol before any of it runs.
+
+        Raises:
+            ValidationError: Some of the commands can't be translated.
+        """
+        ids: Dict[str, Collection[str]] = {
+            "pipetteId": protocol.pipettes.keys(),
+            "labwareId": protocol.labware.keys(),
+            "moduleId": (protocol.modules or {}).keys(),
+            "liquidId": (protocol.liquids or {}).keys(),
+        }
+        errors = []
+        for index, command in enumerate(commands):
+            error = _check_command(command, index, ids)
+            if error is not None:
+                errors.append(ErrorWrapper(ValueError(error), loc=("commands", index)))
+        if errors:
+            raise ValidationError(errors, ProtocolSchemaV6)
+
+    def translate_command_chunks(
+        self,
+        protocol: ProtocolSchemaV6,
+        commands: Iterable[Any],
+        chunk_size: int,
+    ) -> Iterator[List[pe_commands.CommandCreate]]:
+        """Parse and translate JSON commands lazily, in lists of up to `chunk_size`.
+
+        Each list is yielded as soon as its commands are translated,
+        so callers can use the first commands before the rest are ready.
+        """
+        chunk: List[pe_commands.CommandCreate] = []
+        for command in commands:
+            chunk.append(
+                _translate_command(
+                    protocol, protocol_schema_v6.Command.parse_obj(command)
+                )
+            )
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
@@ -16,6 +16,7 @@ from opentrons.protocol_engine import (
 from opentrons.protocol_engine.resources import (
     ModelUtils,
     ModuleDataProvider,
+    VirtualClock,
     pipette_data_provider,
 )
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
@@ -72,9 +73,18 @@ class LegacyCommandMapper:
     """
 
     def __init__(
-        self, module_data_provider: Optional[ModuleDataProvider] = None
+        self,
+        module_data_provider: Optional[ModuleDataProvider] = None,
+        virtual_clock: Optional[VirtualClock] = None,
     ) -> None:
-        """Initialize the command mapper."""
+        """Initialize the command mapper.
+
+        Args:
+            module_data_provider: Provider of module definitions.
+            virtual_clock: A simulated clock to timestamp commands with.
+                Each legacy delay or Thermocycler hold moves it forward
+                by the time that the command would have waited.
+        """
         # commands keyed by broker message ID
         self._commands_by_broker_id: Dict[str, pe_commands.Command] = {}
 
@@ -94,6 +104,8 @@ class LegacyCommandMapper:
             pe_types.ModuleModel, pe_types.ModuleDefinition
         ] = {}
         self._module_data_provider = module_data_provider or ModuleDataProvider()
+        self._virtual_clock = virtual_clock
+        self._model_utils = virtual_clock or ModelUtils()
 
     def map_command(  # noqa: C901
         self,
@@ -120,7 +132,11 @@ class LegacyCommandMapper:
         # TODO(mc, 2021-12-08): use message ID as command ID directly once
         # https://github.com/Opentrons/opentrons/issues/8986 is resolved
         broker_id = command["id"]
-        now = ModelUtils.get_timestamp()
+
+        if stage == "after" and self._virtual_clock is not None:
+            self._virtual_clock.advance(_get_wait_duration(command))
+
+        now = self._model_utils.get_timestamp()
 
         results: List[pe_actions.Action] = []
 
@@ -498,7 +514,7 @@ class LegacyCommandMapper:
         self, labware_load_info: LegacyLabwareLoadInfo
     ) -> pe_commands.Command:
         """Map a legacy labware load to a ProtocolEngine command."""
-        now = ModelUtils.get_timestamp()
+        now = self._model_utils.get_timestamp()
         count = self._command_count["LOAD_LABWARE"]
         slot = labware_load_info.deck_slot
         location: pe_types.LabwareLocation
@@ -551,7 +567,7 @@ class LegacyCommandMapper:
         Also creates a `AddPipetteConfigAction`, which is not necessary for the run,
         but is needed for stop so tip geometry is in state for the HardwareStopper.
         """
-        now = ModelUtils.get_timestamp()
+        now = self._model_utils.get_timestamp()
         count = self._command_count["LOAD_PIPETTE"]
         command_id = f"commands.LOAD_PIPETTE-{count}"
         pipette_id = f"pipette-{count}"
@@ -587,7 +603,7 @@ class LegacyCommandMapper:
         self, module_load_info: LegacyModuleLoadInfo
     ) -> pe_commands.Command:
         """Map a legacy module load to a Protocol Engine command."""
-        now = ModelUtils.get_timestamp()
+        now = self._model_utils.get_timestamp()
 
         count = self._command_count["LOAD_MODULE"]
         command_id = f"commands.LOAD_MODULE-{count}"
@@ -629,3 +645,18 @@ class LegacyCommandMapper:
         self._module_id_by_slot[module_load_info.deck_slot] = module_id
         self._module_definition_by_model[loaded_model] = loaded_definition
         return load_module_command
+
+
+def _get_wait_duration(command: legacy_command_types.CommandMessage) -> float:
+    """Get how long, in seconds, a legacy command waits without doing anything."""
+    if command["name"] == legacy_command_types.DELAY:
+        return command["payload"]["minutes"] * 60 + command["payload"]["seconds"]
+    elif command["name"] == legacy_command_types.THERMOCYCLER_SET_BLOCK_TEMP:
+        return command["payload"]["hold_time"] or 0.0
+    elif command["name"] == legacy_command_types.THERMOCYCLER_EXECUTE_PROFILE:
+        cycle_seconds = sum(
+            step.get("hold_time_seconds", 0.0) + step.get("hold_time_minutes", 0.0) * 60
+            for step in command["payload"]["steps"]
+        )
+        return cycle_seconds * command["payload"]["repetitions"]
+    return 0.0
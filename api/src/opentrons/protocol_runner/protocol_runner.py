@@ -1,21 +1,33 @@
 """Protocol run control and management."""
 import asyncio
-from typing import Iterable, List, NamedTuple, Optional
+import threading
+from contextlib import suppress
+from typing import Any, Iterable, List, NamedTuple, Optional
 
 import anyio
 
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+from opentrons_shared_data.protocol.models.protocol_schema_v6 import ProtocolSchemaV6
 
 from opentrons.broker import Broker
 from opentrons.equipment_broker import EquipmentBroker
 from opentrons.hardware_control import HardwareControlAPI
 from opentrons import protocol_reader
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
-from opentrons.protocol_engine import ProtocolEngine, StateSummary, Command
+from opentrons.protocol_engine import (
+    ProtocolEngine,
+    StateSummary,
+    Command,
+    CommandStatus,
+    commands as pe_commands,
+)
+from opentrons.protocol_engine.resources import VirtualClock
 
 from .task_queue import TaskQueue
+from .thread_async_queue import ThreadAsyncQueue, QueueClosed
 from .json_file_reader import JsonFileReader
 from .json_translator import JsonTranslator
+from .legacy_command_mapper import LegacyCommandMapper
 from .legacy_context_plugin import LegacyContextPlugin
 from .legacy_wrappers import (
     LEGACY_PYTHON_API_VERSION_CUTOFF,
@@ -27,6 +39,12 @@ from .legacy_wrappers import (
 )
 
 
+# How many JSON protocol commands to translate before handing them to the engine.
+# Small enough that the first chunk is ready quickly, and large enough that
+# handing chunks between threads is cheap next to translating them.
+JSON_COMMAND_CHUNK_SIZE = 50
+
+
 class ProtocolRunResult(NamedTuple):
     """Result data from a run, pulled from the ProtocolEngine."""
 
@@ -58,8 +76,13 @@ class ProtocolRunner:
         legacy_file_reader: Optional[LegacyFileReader] = None,
         legacy_context_creator: Optional[LegacyContextCreator] = None,
         legacy_executor: Optional[LegacyExecutor] = None,
+        virtual_clock: Optional[VirtualClock] = None,
     ) -> None:
-        """Initialize the ProtocolRunner with its dependencies."""
+        """Initialize the ProtocolRunner with its dependencies.
+
+        If the ProtocolEngine was created with a virtual clock,
+        pass the same clock here, so legacy protocols' commands use it, too.
+        """
         self._protocol_engine = protocol_engine
         self._hardware_api = hardware_api
         self._json_file_reader = json_file_reader or JsonFileReader()
@@ -70,9 +93,13 @@ class ProtocolRunner:
             protocol_engine=protocol_engine,
         )
         self._legacy_executor = legacy_executor or LegacyExecutor()
+        self._virtual_clock = virtual_clock
         # TODO(mc, 2022-01-11): replace task queue with specific implementations
         # of runner interface
         self._task_queue = task_queue or TaskQueue(cleanup_func=protocol_engine.finish)
+        self._json_translation: Optional["asyncio.Task[None]"] = None
+        self._stop_json_translation = threading.Event()
+        self._last_json_command_id: Optional[str] = None
 
     def was_started(self) -> bool:
         """Whether the runner has been started.
@@ -122,6 +149,7 @@ class ProtocolRunner:
                 drop_tips_and_home=False,
                 set_run_status=False,
             )
+            await self._discard_json_commands()
 
     async def run(
         self,
@@ -143,16 +171,11 @@ class ProtocolRunner:
         return ProtocolRunResult(commands=commands, state_summary=run_data)
 
     async def _load_json(self, protocol_source: ProtocolSource) -> None:
-        protocol = await anyio.to_thread.run_sync(
-            self._json_file_reader.read,
+        protocol, json_commands = await anyio.to_thread.run_sync(
+            self._json_file_reader.read_without_commands,
             protocol_source,
         )
 
-        commands = await anyio.to_thread.run_sync(
-            self._json_translator.translate_commands,
-            protocol,
-        )
-
         # Add commands and liquids to the ProtocolEngine.
         #
         # We yield on every iteration so that loading large protocols doesn't block the
@@ -173,11 +196,111 @@ class ProtocolRunner:
                 color=liquid.displayColor,
             )
             await _yield()
-        for command in commands:
-            self._protocol_engine.add_command(request=command)
+
+        # Fail the load, rather than the run, for commands that are plainly wrong.
+        await anyio.to_thread.run_sync(
+            self._json_translator.check_commands, protocol, json_commands
+        )
+
+        # Translating every command takes seconds for large protocols, so a worker
+        # thread translates them a chunk at a time. Only the first chunk, which
+        # normally holds the protocol's setup commands, is added before the run
+        # can start. The rest are added as the run goes.
+        command_chunks = ThreadAsyncQueue[List[pe_commands.CommandCreate]]()
+        self._json_translation = asyncio.create_task(
+            anyio.to_thread.run_sync(
+                self._translate_json_commands,
+                protocol,
+                json_commands,
+                command_chunks,
+            )
+        )
+
+        try:
+            first_chunk = await command_chunks.get_async()
+        except QueueClosed:
+            # Either the protocol has no commands, or translating them failed.
+            await self._json_translation
+        except BaseException:
+            await self._discard_json_commands()
+            raise
+        else:
+            try:
+                await self._add_json_commands(first_chunk)
+            except BaseException:
+                await self._discard_json_commands()
+                raise
+
+        self._task_queue.set_run_func(
+            func=self._add_remaining_json_commands,
+            command_chunks=command_chunks,
+        )
+
+    def _translate_json_commands(
+        self,
+        protocol: ProtocolSchemaV6,
+        json_commands: List[Any],
+        command_chunks: ThreadAsyncQueue[List[pe_commands.CommandCreate]],
+    ) -> None:
+        with command_chunks:
+            for chunk in self._json_translator.translate_command_chunks(
+                protocol, json_commands, chunk_size=JSON_COMMAND_CHUNK_SIZE
+            ):
+                if self._stop_json_translation.is_set():
+                    break
+                command_chunks.put(chunk)
+
+    async def _add_remaining_json_commands(
+        self,
+        command_chunks: ThreadAsyncQueue[List[pe_commands.CommandCreate]],
+    ) -> None:
+        assert self._json_translation is not None
+        try:
+            async for chunk in command_chunks.get_async_until_closed():
+                if not await self._add_json_commands(chunk):
+                    break
+        finally:
+            self._stop_json_translation.set()
+            # Raise any translation error, which fails the run. Once told to
+            # stop, the worker finishes within a chunk.
+            await self._json_translation
+
+        await self._protocol_engine.wait_until_complete()
+
+    async def _add_json_commands(
+        self, requests: Iterable[pe_commands.CommandCreate]
+    ) -> bool:
+        """Add translated JSON protocol commands to the engine, in order.
+
+        Returns:
+            Whether the run can take more of the protocol's commands. It can't
+            once it has been stopped, or once one of its commands has failed,
+            because failing a command clears the engine's queue.
+        """
+        commands_view = self._protocol_engine.state_view.commands
+
+        for request in requests:
+            if commands_view.get_stop_requested() or (
+                self._last_json_command_id is not None
+                and commands_view.get(self._last_json_command_id).status
+                == CommandStatus.FAILED
+            ):
+                return False
+
+            command = self._protocol_engine.add_command(request=request)
+            self._last_json_command_id = command.id
             await _yield()
 
-        self._task_queue.set_run_func(func=self._protocol_engine.wait_until_complete)
+        return True
+
+    async def _discard_json_commands(self) -> None:
+        """Stop translating JSON commands that will never be added."""
+        if self._json_translation is not None:
+            self._stop_json_translation.set()
+            # The run won't take these commands, so their translation errors
+            # don't matter.
+            with suppress(Exception):
+                await self._json_translation
 
     def _load_python_or_legacy_json(
         self,
@@ -195,7 +318,13 @@ class ProtocolRunner:
             equipment_broker = EquipmentBroker[LegacyLoadInfo]()
 
             self._protocol_engine.add_plugin(
-                LegacyContextPlugin(broker=broker, equipment_broker=equipment_broker)
+                LegacyContextPlugin(
+                    broker=broker,
+                    equipment_broker=equipment_broker,
+                    legacy_command_mapper=LegacyCommandMapper(
+                        virtual_clock=self._virtual_clock
+                    ),
+                )
             )
 
         context = self._legacy_context_creator.create(
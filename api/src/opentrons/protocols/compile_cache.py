@@ -0,0 +1,170 @@
+"""
+opentrons.protocols.compile_cache: a persistent cache of compiled Python protocols
+
+Parsing, statically analyzing, and compiling a Python protocol happens every
+time it is analyzed or run. This cache stores the results on disk, keyed by a
+hash of the protocol's source, so that unchanged protocols skip all of that.
+"""
+import hashlib
+import importlib.util
+import logging
+import marshal
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import List, Optional, Tuple
+
+from opentrons import config, __version__
+
+from .api_support.types import APIVersion
+from .types import StaticPythonInfo
+
+MODULE_LOG = logging.getLogger(__name__)
+
+# Bump this when the format of cache entries changes.
+_FORMAT_VERSION = 1
+_SUFFIX = ".protocol"
+
+DEFAULT_MAX_SIZE_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CompiledPythonProtocol:
+    """Everything learned from parsing and compiling a Python protocol's source."""
+
+    code: CodeType
+    static_info: StaticPythonInfo
+    api_version: APIVersion
+
+
+class CompiledProtocolCache:
+    """Compiled Python protocols, stored in a directory.
+
+    Entries are keyed by the protocol's source and filename, as well as by
+    the versions of Python and of this package, so an upgrade never loads a
+    stale entry. When the directory grows past its size limit, the least
+    recently used entries are removed.
+
+    Args:
+        directory: Where to store cache entries. Created if needed.
+        max_size_bytes: The total size of entries to keep.
+    """
+
+    def __init__(
+        self, directory: Path, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES
+    ) -> None:
+        self._directory = directory
+        self._max_size_bytes = max_size_bytes
+
+    def get(self, source: str, filename: str) -> Optional[CompiledPythonProtocol]:
+        """Get a protocol's cached compilation, if there is one."""
+        path = self._entry_path(source, filename)
+        try:
+            contents = path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            entry = _decode(contents)
+        except (EOFError, ValueError, TypeError) as e:
+            MODULE_LOG.warning(f"Ignoring unreadable protocol cache entry {path}: {e}")
+            return None
+
+        try:
+            # Mark the entry as recently used, for eviction.
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry
+
+    def put(self, source: str, filename: str, compiled: CompiledPythonProtocol) -> None:
+        """Store a protocol's compilation.
+
+        Failing to write the entry is logged rather than raised,
+        because the cache is only an optimization.
+        """
+        path = self._entry_path(source, filename)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_encode(compiled))
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            MODULE_LOG.warning(f"Could not write protocol cache entry {path}: {e}")
+            return
+
+        self._evict()
+
+    def _entry_path(self, source: str, filename: str) -> Path:
+        key = hashlib.sha256()
+        for part in (
+            str(_FORMAT_VERSION).encode(),
+            importlib.util.MAGIC_NUMBER,
+            __version__.encode(),
+            filename.encode(),
+        ):
+            key.update(part)
+            key.update(b"\0")
+        key.update(source.encode())
+        return self._directory / f"{key.hexdigest()}{_SUFFIX}"
+
+    def _evict(self) -> None:
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self._directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        # Oldest first.
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+
+
+def get_default_cache() -> Optional[CompiledProtocolCache]:
+    """Get the cache in the robot's persistence directory.
+
+    Off of a robot, protocols are not cached.
+    """
+    if not config.IS_ROBOT:
+        return None
+    return CompiledProtocolCache(config.get_opentrons_path("protocol_cache_dir"))
+
+
+def _encode(compiled: CompiledPythonProtocol) -> bytes:
+    return marshal.dumps(
+        (
+            compiled.api_version.major,
+            compiled.api_version.minor,
+            compiled.static_info.metadata,
+            compiled.static_info.requirements,
+            compiled.code,
+        )
+    )
+
+
+def _decode(contents: bytes) -> CompiledPythonProtocol:
+    major, minor, metadata, requirements, code = marshal.loads(contents)
+    if not isinstance(code, CodeType):
+        raise TypeError(f"Expected a code object, got {type(code)}")
+    return CompiledPythonProtocol(
+        code=code,
+        static_info=StaticPythonInfo(metadata=metadata, requirements=requirements),
+        api_version=APIVersion(major, minor),
+    )
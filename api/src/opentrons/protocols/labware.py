@@ -7,10 +7,9 @@ import os
 from pathlib import Path
 from typing import Any, AnyStr, List, Dict, Optional, Union
 
-import jsonschema  # type: ignore
-
 from opentrons.protocols.api_support.util import ModifiedList
-from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons.protocols.schema_validators import validate_labware
+from opentrons_shared_data import get_shared_data_root
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE,
     CUSTOM_NAMESPACE,
@@ -140,14 +139,11 @@ def verify_definition(
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data("labware/schemas/2.json").decode("utf-8")
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+    validate_labware(to_return)
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
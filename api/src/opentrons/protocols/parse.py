@@ -14,12 +14,6 @@ from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
 import jsonschema  # type: ignore
 
-from opentrons_shared_data.labware import load_schema as load_labware_schema
-from opentrons_shared_data.protocol import (
-    Schema as JSONProtocolSchema,
-    load_schema as load_protocol_schema,
-)
-
 from .api_support.types import APIVersion
 from .types import (
     Protocol,
@@ -32,6 +26,8 @@ from .types import (
     ApiDeprecationError,
 )
 from .bundle import extract_bundle
+from . import schema_validators
+from .compile_cache import CompiledPythonProtocol, get_default_cache
 
 if TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -122,6 +118,33 @@ def _parse_python(
     else:
         ast_filename = filename_checked
 
+    compiled = _compile_python(protocol_contents, ast_filename)
+
+    result = PythonProtocol(
+        text=protocol_contents,
+        filename=getattr(compiled.code, "co_filename", "<protocol>"),
+        contents=compiled.code,
+        metadata=compiled.static_info.metadata,
+        api_level=compiled.api_version,
+        bundled_labware=bundled_labware,
+        bundled_data=bundled_data,
+        bundled_python=bundled_python,
+        extra_labware=extra_labware,
+    )
+
+    return result
+
+
+def _compile_python(
+    protocol_contents: str, ast_filename: str
+) -> CompiledPythonProtocol:
+    """Parse, check, and compile a Python protocol, or get it from the cache."""
+    cache = get_default_cache()
+    if cache is not None:
+        cached = cache.get(protocol_contents, ast_filename)
+        if cached is not None:
+            return cached
+
     parsed = ast.parse(protocol_contents, filename=ast_filename)
 
     static_info = extract_static_python_info(parsed)
@@ -133,19 +156,13 @@ def _parse_python(
     else:
         raise ApiDeprecationError(version)
 
-    result = PythonProtocol(
-        text=protocol_contents,
-        filename=getattr(protocol, "co_filename", "<protocol>"),
-        contents=protocol,
-        metadata=static_info.metadata,
-        api_level=version,
-        bundled_labware=bundled_labware,
-        bundled_data=bundled_data,
-        bundled_python=bundled_python,
-        extra_labware=extra_labware,
+    compiled = CompiledPythonProtocol(
+        code=protocol, static_info=static_info, api_version=version
     )
+    if cache is not None:
+        cache.put(protocol_contents, ast_filename, compiled)
 
-    return result
+    return compiled
 
 
 def _parse_bundle(bundle: ZipFile, filename: Optional[str] = None) -> PythonProtocol:
@@ -431,8 +448,8 @@ def _get_protocol_schema_version(protocol_json: Dict[Any, Any]) -> int:
     )
 
 
-def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
-    """Retrieve the json schema for a protocol schema version"""
+def _validate_protocol_schema(protocol_json: Dict[Any, Any], version_num: int) -> None:
+    """Validate a protocol against the json schema for its schema version"""
     # TODO(IL, 2020/03/05): use $otSharedSchema, but maybe wait until
     # deprecating v1/v2 JSON protocols?
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
@@ -441,7 +458,7 @@ def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
             + "supported in this version of the API"
         )
     try:
-        return load_protocol_schema(version=version_num)
+        schema_validators.validate_protocol(protocol_json, version_num)
     except FileNotFoundError:
         raise RuntimeError(
             'JSON Protocol schema "{}" does not exist'.format(version_num)
@@ -450,19 +467,20 @@ def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
 
 def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"]:
     """Validates a json protocol and returns its schema version"""
-    # Check if this is actually a labware
-    labware_schema_v2 = load_labware_schema()
-    try:
-        jsonschema.validate(protocol_json, labware_schema_v2)
-    except jsonschema.ValidationError:
-        pass
-    else:
-        MODULE_LOG.error("labware uploaded instead of protocol")
-        raise RuntimeError(
-            "The file you are trying to open is a JSON labware definition, "
-            "and therefore can not be opened here. Please try "
-            "uploading a JSON protocol file instead."
-        )
+    # Check if this is actually a labware. Only files with all of labware's
+    # required keys could be one, which rules out protocols without validating.
+    if schema_validators.could_be_labware(protocol_json):
+        try:
+            schema_validators.validate_labware(protocol_json)
+        except jsonschema.ValidationError:
+            pass
+        else:
+            MODULE_LOG.error("labware uploaded instead of protocol")
+            raise RuntimeError(
+                "The file you are trying to open is a JSON labware definition, "
+                "and therefore can not be opened here. Please try "
+                "uploading a JSON protocol file instead."
+            )
 
     # this is now either a protocol or something corrupt
     version_num = _get_protocol_schema_version(protocol_json)
@@ -476,18 +494,10 @@ def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"
         )
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
         raise JSONSchemaVersionTooNewError(attempted_schema_version=version_num)
-    protocol_schema = _get_schema_for_protocol(version_num)
-
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get("$id", ""),
-        protocol_schema,
-        store={"opentronsLabwareSchemaV2": labware_schema_v2},
-    )
 
     # do the validation
     try:
-        jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+        _validate_protocol_schema(protocol_json, version_num)
     except jsonschema.ValidationError:
         MODULE_LOG.exception("JSON protocol validation failed")
         raise RuntimeError(
@@ -0,0 +1,77 @@
+"""
+opentrons.protocols.schema_validators: JSON schema validators for protocols and labware
+
+Loading a schema and checking it against its metaschema is much slower than
+validating a typical document, so each schema is loaded and checked once per
+process. Validators are cheap to create and hold per-validation state in
+their resolvers, so a new one is made for every validation.
+"""
+import functools
+from typing import Any, Dict, Mapping, Tuple
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data.labware import load_schema as load_labware_schema
+from opentrons_shared_data.protocol import load_schema as load_protocol_schema
+
+# The $ref that protocol schemas use for labware schema v2.
+_LABWARE_SCHEMA_V2_REF = "opentronsLabwareSchemaV2"
+
+
+def validate_labware(definition: Mapping[str, Any]) -> None:
+    """Validate a labware definition against labware schema v2.
+
+    :raises jsonschema.ValidationError: If the definition is not valid.
+    """
+    schema, validator_cls = _get_labware_schema()
+    _validate(validator_cls(schema), definition)
+
+
+def validate_protocol(protocol_json: Dict[Any, Any], version: int) -> None:
+    """Validate a JSON protocol against a protocol schema version.
+
+    :raises FileNotFoundError: If there's no schema for the version.
+    :raises jsonschema.ValidationError: If the protocol is not valid.
+    """
+    schema, validator_cls = _get_protocol_schema(version)
+    labware_schema, _ = _get_labware_schema()
+    # instruct schema how to resolve all $ref's used in protocol schemas
+    resolver = jsonschema.RefResolver(
+        schema.get("$id", ""),
+        schema,
+        store={_LABWARE_SCHEMA_V2_REF: labware_schema},
+    )
+    _validate(validator_cls(schema, resolver=resolver), protocol_json)
+
+
+def could_be_labware(json_contents: Dict[Any, Any]) -> bool:
+    """Whether a JSON object has every top-level key that labware requires.
+
+    Anything without them can't be valid labware, so this rules out
+    most files without running full validation.
+    """
+    schema, _ = _get_labware_schema()
+    return all(key in json_contents for key in schema.get("required", []))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_labware_schema() -> Tuple[Dict[str, Any], Any]:
+    return _check_schema(load_labware_schema())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_protocol_schema(version: int) -> Tuple[Dict[str, Any], Any]:
+    return _check_schema(load_protocol_schema(version=version))
+
+
+def _check_schema(schema: Any) -> Tuple[Dict[str, Any], Any]:
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return schema, validator_cls
+
+
+def _validate(validator: Any, instance: Any) -> None:
+    # Raise the same error as jsonschema.validate() would.
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
@@ -38,3 +38,45 @@ def test_analyze(
     assert "labware" in analysis_output_json
     assert "liquids" in analysis_output_json
     assert "modules" in analysis_output_json
+
+
+def test_analyze_batch(tmp_path: Path) -> None:
+    """It should analyze each file or directory as its own protocol."""
+    fixture_paths = sorted(_list_fixtures(6))[:2]
+    invalid_dir = tmp_path / "invalid"
+    invalid_dir.mkdir()
+    (invalid_dir / "not-a-protocol.txt").write_text("hello world")
+    analysis_output_path = tmp_path / "analysis_output.jsonl"
+
+    sources = [str(p.resolve()) for p in fixture_paths] + [str(invalid_dir)]
+    runner = CliRunner()
+    result = runner.invoke(
+        analyze,
+        [
+            *sources,
+            "--batch",
+            "--workers",
+            "2",
+            "--json-output",
+            str(analysis_output_path),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+
+    lines = [json.loads(line) for line in analysis_output_path.read_text().splitlines()]
+    results_by_source = {line["source"]: line for line in lines}
+
+    assert sorted(results_by_source) == sorted(sources)
+    for fixture_path in fixture_paths:
+        fixture_result = results_by_source[str(fixture_path.resolve())]
+        assert fixture_result["analysisSeconds"] > 0
+        assert "error" not in fixture_result
+        assert fixture_result["results"]["files"] == [
+            {"name": fixture_path.name, "role": "main"}
+        ]
+        assert "commands" in fixture_result["results"]
+
+    invalid_result = results_by_source[str(invalid_dir)]
+    assert "results" not in invalid_result
+    assert "not-a-protocol.txt" in invalid_result["error"]
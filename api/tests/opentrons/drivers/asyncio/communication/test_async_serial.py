@@ -1,6 +1,7 @@
 import asyncio
+import os
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional, Tuple
 
 import pytest
 from mock import MagicMock, PropertyMock, call
@@ -136,3 +137,86 @@ def test_reset_input_buffer(mock_serial: MagicMock, subject: AsyncSerial):
     """It should call the underlying serial port's Reset function"""
     subject.reset_input_buffer()
     mock_serial.reset_input_buffer.assert_called_once()
+
+
+@pytest.fixture
+def pty() -> Iterator[Tuple[int, str]]:
+    """A pseudo-terminal, as the file descriptor of its controlling end
+    and the port name of its serial end."""
+    controller, port = os.openpty()
+    yield controller, os.ttyname(port)
+    os.close(controller)
+    os.close(port)
+
+
+@pytest.fixture
+async def pty_subject(pty: Tuple[int, str]) -> AsyncIterator[AsyncSerial]:
+    """A subject connected to a pseudo-terminal."""
+    _, port = pty
+    subject = await AsyncSerial.create(port=port, baud_rate=115200, timeout=0.5)
+    yield subject
+    await subject.close()
+
+
+async def test_pty_read_until(pty: Tuple[int, str], pty_subject: AsyncSerial) -> None:
+    """It should assemble a response from several reads, up to the match."""
+    controller, _ = pty
+
+    read = asyncio.get_running_loop().create_task(pty_subject.read_until(b" OK\n"))
+    os.write(controller, b"M105 T:25")
+    await asyncio.sleep(0.05)
+    assert not read.done()
+
+    os.write(controller, b" O")
+    await asyncio.sleep(0.05)
+    os.write(controller, b"K\nM119 Lid:open OK\n")
+
+    assert await read == b"M105 T:25 OK\n"
+    # Data after the match is kept for the next read.
+    assert await pty_subject.read_until(b" OK\n") == b"M119 Lid:open OK\n"
+
+
+async def test_pty_read_timeout(pty: Tuple[int, str], pty_subject: AsyncSerial) -> None:
+    """It should return the data read so far if the match never arrives."""
+    controller, _ = pty
+    os.write(controller, b"partial")
+
+    async with pty_subject.timeout_override("timeout", 0.1):
+        assert await pty_subject.read_until(b" OK\n") == b"partial"
+
+
+async def test_pty_write(pty: Tuple[int, str], pty_subject: AsyncSerial) -> None:
+    """It should write all the data to the port."""
+    controller, _ = pty
+    await pty_subject.write(b"M105\r\n")
+    await asyncio.sleep(0.05)
+    assert os.read(controller, 100) == b"M105\r\n"
+
+
+async def test_pty_reset_input_buffer(
+    pty: Tuple[int, str], pty_subject: AsyncSerial
+) -> None:
+    """It should drop data that was read past a match."""
+    controller, _ = pty
+    os.write(controller, b"first OK\nstale OK\n")
+    assert await pty_subject.read_until(b" OK\n") == b"first OK\n"
+
+    pty_subject.reset_input_buffer()
+    os.write(controller, b"fresh OK\n")
+    assert await pty_subject.read_until(b" OK\n") == b"fresh OK\n"
+
+
+async def test_pty_write_drains(
+    pty: Tuple[int, str],
+    pty_subject: AsyncSerial,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should wait for the written data to be transmitted, like flush()."""
+    controller, _ = pty
+    out_waiting = [6, 3, 0]
+    monkeypatch.setattr(Serial, "out_waiting", property(lambda _: out_waiting.pop(0)))
+
+    await pty_subject.write(b"M105\r\n")
+
+    assert out_waiting == []
+    assert os.read(controller, 100) == b"M105\r\n"
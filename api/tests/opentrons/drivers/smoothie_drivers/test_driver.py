@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Dict, cast
+from typing import Dict, List, cast
 
 from opentrons.drivers import utils
 from opentrons.drivers.asyncio.communication import AlarmResponse
@@ -201,23 +201,21 @@ async def test_clear_limit_switch(
 
     assert [c.strip() for c in cmd_list] == [
         # attempt to move and fail
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 C100.3 G0 C100",
+        "G0 F24000 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 C100.3 G0 C100",
         # recover from failure
         "M999",
         "M400",
         "G28.6",
         "M400",
-        # set current for homing the failed axis (C)
+        # set current for homing the failed axis (C), which is no longer known
+        # after the failure
         "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G28.2 C",
         "M400",
-        # set current back to idling after home
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
-        "M400",
+        # the idling current after home is the same as the active current,
+        # so it is not set again
         # update position
         "M114.2",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
-        "M400",
     ]
 
 
@@ -242,9 +240,8 @@ async def test_unstick_axes(
         "M400",
         "M119",
         "M400",
-        "M907 A0.5 B0.05 C0.05 X1.25 Y1.25 Z0.5 G4 P0.005 G0 A-2 B-2 C-2 X-2 Y-2 Z-2",
-        "M400",
-        "M907 A0.5 B0.05 C0.05 X1.25 Y1.25 Z0.5 G4 P0.005",
+        "G0 F24000 M907 A0.5 B0.05 C0.05 X1.25 Y1.25 Z0.5 G4 P0.005 "
+        "G0 A-2 B-2 C-2 X-2 Y-2 Z-2",
         "M400",
         "M203.1 A125 B40 C40 X600 Y400 Z125",
         "M400",
@@ -464,3 +461,83 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+def _sent_commands(mock_connection: AsyncMock) -> List[str]:
+    return [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+        if c.kwargs["command"].build().strip() != "M400"
+    ]
+
+
+async def test_settings_only_sent_when_changed(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should only send the settings the Smoothie doesn't already hold."""
+    await smoothie.set_speed(1)
+    await smoothie.set_speed(1)
+    await smoothie.set_axis_max_speed({"A": 22, "B": 322})
+    await smoothie.set_axis_max_speed({"A": 22, "B": 300})
+    await smoothie.set_acceleration({"X": 100, "Y": 200})
+    await smoothie.set_acceleration({"X": 100, "Y": 200})
+
+    assert _sent_commands(mock_connection) == [
+        "G0 F60",
+        "M203.1 A22 B322",
+        "M203.1 B300",
+        "M204 S10000 X100 Y200",
+    ]
+
+
+async def test_current_only_sent_when_changed(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should only send changed currents, and only wait for rising ones."""
+    await smoothie._set_saved_current()
+    mock_connection.send_command.reset_mock()
+
+    # Nothing changed
+    await smoothie._set_saved_current()
+    # A dwelling axis is raised
+    smoothie.set_dwelling_current({"C": 0.2})
+    await smoothie._set_saved_current()
+    # An active axis is raised, then lowered
+    smoothie.activate_axes("C")
+    smoothie.set_active_current({"C": 0.8})
+    await smoothie._set_saved_current()
+    smoothie.set_active_current({"C": 0.5})
+    await smoothie._set_saved_current()
+
+    assert _sent_commands(mock_connection) == [
+        "M907 C0.2",
+        "M907 C0.8 G4 P0.005",
+        "M907 C0.5",
+    ]
+
+
+async def test_settings_resent_after_error(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should send every setting again after a command fails."""
+    await smoothie.set_speed(1)
+    await smoothie._set_saved_current()
+    mock_connection.send_command.side_effect = [
+        AlarmResponse(port="", response="ALARM: Hard limit +C"),
+        "ok",
+        "ok",
+        "ok X:1 Y:1 Z:1 A:1 B:1 C:1",
+        "ok",
+    ]
+    with pytest.raises(SmoothieError):
+        await smoothie.set_axis_max_speed({"A": 22})
+    mock_connection.send_command.side_effect = None
+    mock_connection.send_command.reset_mock()
+
+    await smoothie.set_speed(1)
+    await smoothie._set_saved_current()
+
+    assert _sent_commands(mock_connection) == [
+        "G0 F60",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1",
+    ]
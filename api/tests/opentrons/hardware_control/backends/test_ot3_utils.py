@@ -1,5 +1,13 @@
-from opentrons_hardware.hardware_control.motion_planning import Move
+import pytest
+from opentrons_hardware.hardware_control.motion_planning import (
+    Move,
+    MoveManager,
+    MoveTarget,
+)
+from opentrons.config.robot_configs import build_config_ot3
+from opentrons.config.types import GantryLoad
 from opentrons.hardware_control.backends import ot3utils
+from opentrons.hardware_control.backends.ot3utils import get_system_constraints
 from opentrons_hardware.firmware_bindings.constants import NodeId
 from opentrons.hardware_control.types import OT3Axis
 
@@ -25,3 +33,31 @@ def test_create_step():
     assert len(move_group) == 3
     for step in move_group:
         assert set(present_nodes) == set(step.keys())
+
+
+def test_create_move_group_reuses_steps():
+    manager = MoveManager(
+        get_system_constraints(
+            build_config_ot3({}).motion_settings, GantryLoad.LOW_THROUGHPUT
+        )
+    )
+    present_nodes = [NodeId.gantry_x, NodeId.gantry_y, NodeId.head_l]
+    ot3utils.move_group_cache_clear()
+
+    results = []
+    for x in [0, 100]:
+        origin = {OT3Axis.X: x, OT3Axis.Y: 0, OT3Axis.Z_L: 0}
+        target = {OT3Axis.X: x + 10, OT3Axis.Y: 20, OT3Axis.Z_L: 0}
+        _, moves = manager.plan_motion(origin, [MoveTarget.build(target, 100)])
+        results.append(ot3utils.create_move_group(origin, moves[0], present_nodes))
+    assert ot3utils.move_group_cache_info().hits == 1
+
+    (first_group, first_pos), (second_group, second_pos) = results
+    assert first_group == second_group
+    assert first_pos[NodeId.gantry_x] == pytest.approx(10)
+    assert second_pos[NodeId.gantry_x] == pytest.approx(110)
+    assert second_pos[NodeId.gantry_y] == pytest.approx(20)
+
+    # Reused steps should be the same as new ones
+    ot3utils.move_group_cache_clear()
+    assert ot3utils.create_move_group(origin, moves[0], present_nodes) == results[-1]
@@ -0,0 +1,136 @@
+"""Tests for emulating how long motion and temperature changes take."""
+from typing import List
+
+import pytest
+
+from opentrons.hardware_control.emulation.clock import EmulationClock
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import SmoothieSettings
+from opentrons.hardware_control.emulation.simulations import (
+    Temperature,
+    TemperatureWithHold,
+    trapezoidal_move_time,
+)
+from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
+
+
+@pytest.fixture
+def real_time() -> List[float]:
+    """The fake real time, in seconds, as a mutable cell."""
+    return [100.0]
+
+
+@pytest.fixture
+def clock(real_time: List[float]) -> EmulationClock:
+    """A clock running twice as fast as the fake real time."""
+    return EmulationClock(real_time_factor=2.0, monotonic=lambda: real_time[0])
+
+
+def test_clock(clock: EmulationClock, real_time: List[float]) -> None:
+    """It should scale real time by the real time factor."""
+    assert clock.now() == 0.0
+    real_time[0] += 1.5
+    assert clock.now() == 3.0
+    assert clock.to_real_time(3.0) == 1.5
+
+
+@pytest.mark.parametrize(
+    argnames=["distance", "speed", "acceleration", "expected"],
+    argvalues=[
+        # Reaches speed: 0.5s accelerating, 0.5s cruising, 0.5s decelerating.
+        [100, 100, 200, 1.5],
+        # Never reaches speed: 0.5s accelerating, 0.5s decelerating.
+        [50, 100, 200, 1.0],
+        [0, 100, 200, 0.0],
+    ],
+)
+def test_trapezoidal_move_time(
+    distance: float, speed: float, acceleration: float, expected: float
+) -> None:
+    """It should time a move with a trapezoidal velocity profile."""
+    assert trapezoidal_move_time(distance, speed, acceleration) == pytest.approx(
+        expected
+    )
+
+
+def test_temperature_ramps_over_time(
+    clock: EmulationClock, real_time: List[float]
+) -> None:
+    """It should move towards the target at a rate per emulated second."""
+    subject = Temperature(per_tick=2.0, current=20.0, clock=clock)
+
+    subject.set_target(30.0)
+    # Reading without time passing doesn't move the temperature.
+    subject.tick()
+    assert subject.current == 20.0
+
+    real_time[0] += 1.0
+    assert subject.current == 24.0
+
+    real_time[0] += 10.0
+    assert subject.current == 30.0
+
+
+def test_hold_counts_down_at_target(
+    clock: EmulationClock, real_time: List[float]
+) -> None:
+    """It should only count down the hold time once at the target."""
+    subject = TemperatureWithHold(per_tick=1.0, current=20.0, clock=clock)
+    subject.set_target(24.0)
+    subject.set_hold(10.0)
+
+    # 4 emulated seconds ramping, then 2 holding.
+    real_time[0] += 3.0
+    assert subject.current == 24.0
+    assert subject.time_remaining == pytest.approx(8.0)
+
+    real_time[0] += 10.0
+    assert subject.time_remaining == 0
+
+
+def test_smoothie_wait_blocks_until_moves_finish(
+    clock: EmulationClock, real_time: List[float]
+) -> None:
+    """It should delay the M400 ack until queued moves would be done."""
+    subject = SmoothieEmulator(
+        parser=Parser(), settings=SmoothieSettings(), clock=clock
+    )
+    subject.handle("M203.1 X600 Y400")
+    subject.handle("M204 S10000 X3000 Y2000")
+
+    # 60mm along X at 100mm/s with 3000mm/s^2 takes 0.6333s.
+    subject.handle("G0 F6000 X60")
+    assert subject.get_ack_delay() == 0.0
+    assert subject.get_queued_time() == pytest.approx(0.6333, abs=1e-3)
+
+    subject.handle("M400")
+    assert subject.get_ack_delay() == pytest.approx(0.6333 / 2, abs=1e-3)
+
+    # Once the move is done, there's nothing to wait for.
+    real_time[0] += 1.0
+    subject.handle("M400")
+    assert subject.get_ack_delay() == 0.0
+
+
+def test_smoothie_limits_move_by_axis(clock: EmulationClock) -> None:
+    """It should slow a move down to its slowest axis' max speed."""
+    subject = SmoothieEmulator(
+        parser=Parser(), settings=SmoothieSettings(), clock=clock
+    )
+    subject.handle("M203.1 Z10")
+    subject.handle("M204 S10000 Z1000000")
+
+    subject.handle("G0 F6000 Z10 M400")
+
+    # 10mm at the Z max speed of 10mm/s.
+    assert subject.get_ack_delay() == pytest.approx(1.0 / 2, abs=1e-3)
+
+
+def test_smoothie_without_clock() -> None:
+    """It should not delay anything without a clock."""
+    subject = SmoothieEmulator(parser=Parser(), settings=SmoothieSettings())
+
+    subject.handle("G0 F6000 X400 M400")
+
+    assert subject.get_ack_delay() == 0.0
+    assert subject.get_current_position()["X"] == 400
@@ -45,15 +45,18 @@ async def test_dwell_and_activate_axes(subject: SmoothieDriver, spy: MagicMock):
     subject.dwell_axes("BCY")
     await subject._set_saved_current()
     expected = [
+        # Nothing is known about the currents until they are first sent
         "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        # Only changed currents are sent, and lowering them needs no wait
+        "M907 X0.3",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005",
+        # B and C have the same active and dwelling currents
+        "M907 X1.25 Y1.25 G4 P0.005",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y1.25 Z0.1 G4 P0.005",
+        "M907 X0.3",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M907 Y0.3",
         "M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
@@ -82,23 +85,23 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
     expected = [
         "M907 A0.8 B0.05 C0.05 X0.3 Y0.3 Z0.8 G4 P0.005 G28.2 ABCZ",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M907 A0.1 Z0.1",
         "M400",
         "M203.1 Y50",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.8 Z0.1 G4 P0.005 G91 G0 Y-28 G0 Y10 G90",
+        "M907 Y0.8 G4 P0.005 G91 G0 Y-28 G0 Y10 G90",
         "M400",
         "M203.1 X80",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G28.2 X",
+        "M907 X1.25 Y0.3 G4 P0.005 G28.2 X",
         "M400",
-        "M203.1 A125 B40 C40 X600 Y400 Z125",
+        "M203.1 X600 Y400",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M907 X0.3",
         "M400",
         "M203.1 Y80",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y1.25 Z0.1 G4 P0.005 G28.2 Y",
+        "M907 Y1.25 G4 P0.005 G28.2 Y",
         "M400",
         "M203.1 Y8",
         "M400",
@@ -108,9 +111,9 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
         "M400",
         "G91 G0 Y-3 G90",
         "M400",
-        "M203.1 A125 B40 C40 X600 Y400 Z125",
+        "M203.1 Y400",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M907 Y0.3",
         "M400",
         "M114.2",
         "M400",
@@ -122,7 +125,7 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
 
     await subject.move({"X": 0, "Y": 1.123456, "Z": 2, "A": 3})
     expected = [
-        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 A3 X0 Y1.123 Z2",
+        "M907 A0.8 X1.25 Y1.25 Z0.8 G4 P0.005 G0 A3 X0 Y1.123 Z2",
         "M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
@@ -132,9 +135,9 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
 
     await subject.move({"B": 2})
     expected = [
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
-        "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        # The plunger's active and dwelling currents are the same, so they
+        # are not set around its move
+        "M907 A0.1 X0.3 Y0.3 Z0.1 G0 B2",
         "M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
@@ -147,12 +150,9 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
     )
     expected = [
         # Set active axes high
-        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005"
+        "M907 A0.8 X1.25 Y1.25 Z0.8 G4 P0.005"
         " G0 A3.5 B4.55 C5.55 X10.988 Y2.123 Z2.5 G0 B4.25",
         "M400",
-        # Set plunger current low
-        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005",
-        "M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == expected
@@ -184,16 +184,13 @@ async def test_move_with_split(subject: SmoothieDriver, spy: MagicMock):
 
     await subject.move({"X": 0, "Y": 1.123456, "Z": 2, "C": 3})
     expected = [
-        "M55 M92 C0.03125 G4 P0.01 G0 F60 M907 A0.1 B0.05 C1.75 X1.25 Y1.25"
-        " Z0.8 G4 P0.005",
+        "M55 M92 C0.03125 G4 P0.01 G0 F60 M907 C1.75 X1.25 Y1.25 Z0.8 G4 P0.005",
         "M400",
         "G0 C18.0",
         "M400",
         "M54 M92 C1.0 G4 P0.01",
         "M400",
-        "G0 F24000 M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 C3 X0 Y1.123 Z2",
-        "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005",
+        "G0 F24000 M907 C0.05 G0 C3 X0 Y1.123 Z2",
         "M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
@@ -203,16 +200,13 @@ async def test_move_with_split(subject: SmoothieDriver, spy: MagicMock):
 
     await subject.move({"B": 2})
     expected = [
-        "M53 M92 B0.03125 G4 P0.01 G0 F60 M907 A0.1 B1.75 C0.05 X0.3 Y0.3 Z0.1"
-        " G4 P0.005",
+        "M53 M92 B0.03125 G4 P0.01 G0 F60 M907 B1.75 X0.3 Y0.3 Z0.1 G4 P0.005",
         "M400",
         "G0 B18.0",
         "M400",
         "M52 M92 B1.0 G4 P0.01",
         "M400",
-        "G0 F24000 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
-        "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "G0 F24000 M907 B0.05 G0 B2",
         "M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
@@ -234,16 +228,16 @@ async def test_set_active_current(subject: SmoothieDriver, spy: MagicMock):
         # move all
         "M907 A2 B2 C2 X2 Y2 Z2 G4 P0.005 G0 A0 B0 C0 X0 Y0 Z0",
         "M400",
-        "M907 A2 B0 C0 X2 Y2 Z2 G4 P0.005",  # disable BC axes
+        "M907 B0 C0",  # disable BC axes
         "M400",
         # move BC
         "M907 A0 B2 C2 X0 Y0 Z0 G4 P0.005 G0 B1.3 C1.3 G0 B1 C1",
         "M400",
-        "M907 A0 B0 C0 X0 Y0 Z0 G4 P0.005",  # disable BC axes
+        "M907 B0 C0",  # disable BC axes
         "M400",
-        "M907 A0 B0.42 C0.42 X0 Y0 Z0 G4 P0.005 G28.2 BC",  # home BC
+        "M907 B0.42 C0.42 G4 P0.005 G28.2 BC",  # home BC
         "M400",
-        "M907 A0 B0 C0 X0 Y0 Z0 G4 P0.005",  # dwell all axes after home
+        "M907 B0 C0",  # dwell BC axes after home
         "M400",
         "M114.2",  # update the position
         "M400",
@@ -301,8 +295,7 @@ async def test_set_acceleration(subject: SmoothieDriver, spy: MagicMock):
     expected = [
         "M204 S10000 A4 B5 C6 X1 Y2 Z3",
         "M400",
-        "M204 S10000 A4 B5 C6 X1 Y2 Z3",
-        "M400",
+        # Popping the same accelerations doesn't send them again
         "M204 S10000 A40 B50 C60 X10 Y20 Z30",
         "M400",
         "M204 S10000 A4 B5 C6 X1 Y2 Z3",
@@ -333,15 +326,16 @@ async def test_fast_home(subject: SmoothieDriver, spy: MagicMock):
         "M400",
         "M203.1 Y50",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y0.8 Z0.1 G4 P0.005 G91 G0 Y-28 G0 Y10 G90",
+        "M907 Y0.8 G4 P0.005 G91 G0 Y-28 G0 Y10 G90",
         "M400",
         "M203.1 X80",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G28.2 X",
+        # X is still active from the move
+        "M907 Y0.3 G28.2 X",
         "M400",
-        "M203.1 A125 B40 C40 X600 Y400 Z125",
+        "M203.1 X600 Y400",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M907 X0.3",
         "M400",
         "M114.2",
         "M400",
@@ -359,19 +353,20 @@ async def test_fast_home_two_axes_plus_two_invalid_axes(
         "M400",
         "M203.1 Y50",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y0.8 Z0.1 G4 P0.005 G91 G0 Y-28 G0 Y10 G90",
+        # Y is active from the move, so backing off lowers its current
+        "M907 Y0.8 G91 G0 Y-28 G0 Y10 G90",
         "M400",
         "M203.1 X80",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G28.2 X",
+        "M907 Y0.3 G28.2 X",
         "M400",
-        "M203.1 A125 B40 C40 X600 Y400 Z125",
+        "M203.1 X600 Y400",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M907 X0.3",
         "M400",
         "M203.1 Y80",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y1.25 Z0.1 G4 P0.005 G28.2 Y",
+        "M907 Y1.25 G4 P0.005 G28.2 Y",
         "M400",
         "M203.1 Y8",
         "M400",
@@ -381,9 +376,9 @@ async def test_fast_home_two_axes_plus_two_invalid_axes(
         "M400",
         "G91 G0 Y-3 G90",
         "M400",
-        "M203.1 A125 B40 C40 X600 Y400 Z125",
+        "M203.1 Y400",
         "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M907 Y0.3",
         "M400",
         "M114.2",
         "M400",
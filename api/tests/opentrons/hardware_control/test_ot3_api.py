@@ -1210,3 +1210,71 @@ async def test_light_settings(
     check = await ot3_hardware.get_lights()
     assert check["rails"] != setting
     assert not check["button"]
+
+
+async def _run_liquid_handling(
+    hardware: OT3API,
+) -> List[Tuple[Dict[OT3Axis, float], Dict[OT3Axis, float], bool, float]]:
+    """Pick up a tip, move some liquid, and note the state after each step."""
+    states = []
+
+    async def _note_state() -> None:
+        pipette = hardware.hardware_instruments[Mount.LEFT]
+        assert pipette is not None
+        states.append(
+            (
+                await hardware.current_position_ot3(OT3Mount.LEFT),
+                await hardware.encoder_current_position_ot3(OT3Mount.LEFT),
+                pipette.has_tip,
+                pipette.current_volume,
+            )
+        )
+
+    await hardware.home()
+    await _note_state()
+    await hardware.move_to(Mount.LEFT, Point(100, 200, 150))
+    await hardware.pick_up_tip(Mount.LEFT, tip_length=85)
+    await _note_state()
+    await hardware.prepare_for_aspirate(Mount.LEFT)
+    await hardware.move_rel(Mount.LEFT, Point(10, -20, -30))
+    await hardware.aspirate(Mount.LEFT, 100)
+    await _note_state()
+    await hardware.move_to(Mount.LEFT, Point(300, 100, 120), speed=50)
+    await hardware.dispense(Mount.LEFT, 60)
+    await _note_state()
+    await hardware.blow_out(Mount.LEFT)
+    await hardware.drop_tip(Mount.LEFT)
+    await _note_state()
+    return states
+
+
+async def test_zero_cost_motion_matches_simulator() -> None:
+    """It should end up in the same state as planned moves, without planning."""
+    attached = {
+        Mount.LEFT: {
+            "model": "p1000_single_v3.3",
+            "id": "P1KSV33hello",
+            "name": "p1000_single_gen3",
+        }
+    }
+    simulator = await OT3API.build_hardware_simulator(attached_instruments=attached)
+    zero_cost = await OT3API.build_hardware_simulator(
+        attached_instruments=attached, zero_cost_motion=True
+    )
+    expected = await _run_liquid_handling(simulator)
+
+    with patch.object(zero_cost._move_manager, "plan_motion") as mock_plan_motion:
+        result = await _run_liquid_handling(zero_cost)
+
+    mock_plan_motion.assert_not_called()
+    assert len(result) == len(expected)
+    for (position, encoder, has_tip, volume), (
+        expected_position,
+        expected_encoder,
+        expected_has_tip,
+        expected_volume,
+    ) in zip(result, expected):
+        assert position == pytest.approx(expected_position)
+        assert encoder == pytest.approx(expected_encoder)
+        assert has_tip == expected_has_tip
+        assert volume == pytest.approx(expected_volume)
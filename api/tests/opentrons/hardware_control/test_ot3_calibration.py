@@ -4,7 +4,7 @@ from dataclasses import replace
 import pytest
 import json
 from math import isclose
-from typing import Iterator, Tuple
+from typing import Iterator, List, Tuple
 from typing_extensions import Literal
 from mock import patch, AsyncMock, Mock, call as mock_call
 from opentrons.hardware_control import ThreadManager
@@ -18,12 +18,15 @@ from opentrons.hardware_control.ot3_calibration import (
     find_calibration_structure_height,
     find_slot_center_binary,
     find_slot_center_noncontact,
+    find_calibration_structure_position,
     calibrate_pipette,
     CalibrationMethod,
     _edges_from_data,
+    _sweep_signal_quality,
     _probe_deck_at,
     _verify_edge_pos,
     InaccurateNonContactSweepError,
+    NoisyNonContactSweepError,
     CalibrationStructureNotFoundError,
     EdgeNotFoundError,
     PREP_OFFSET_DEPTH,
@@ -134,6 +137,15 @@ async def override_cal_config(ot3_hardware: ThreadManager[OT3API]) -> Iterator[N
         await ot3_hardware.update_config(calibration=old_calibration)
 
 
+def _sweep_data(noise: float = 0.01) -> List[float]:
+    """Capacitance from a sweep over the deck, across the slot and back."""
+    deck = [1.0] * 50
+    slot = [0.0] * 100
+    return [
+        value + noise * (-1) ** index for index, value in enumerate(deck + slot + deck)
+    ]
+
+
 def _other_axis_val(point: Tuple[float, float, float], main_axis: OT3Axis) -> float:
     if main_axis == OT3Axis.X:
         return point[1]
@@ -375,6 +387,7 @@ async def test_noncontact_sanity(
     mock_capacitive_sweep: AsyncMock,
     mock_data_analysis: Mock,
 ) -> None:
+    mock_capacitive_sweep.return_value = _sweep_data()
     mock_data_analysis.return_value = (-1000, 1000)
     await ot3_hardware.home()
     center = Point(*get_calibration_square_position_in_slot(5))
@@ -386,3 +399,113 @@ async def test_noncontact_sanity(
             center + EDGES["right"],
             OT3Axis.X,
         )
+
+
+@pytest.mark.parametrize(
+    argnames=["data", "is_usable"],
+    argvalues=[
+        [_sweep_data(), True],
+        # Too short to find edges in
+        [[], False],
+        [[1.0, 0.0, 1.0], False],
+        # All noise
+        [_sweep_data(noise=1.0), False],
+        # The probe never left the deck
+        [[1.0] * 200, False],
+        # Onto the deck and back off it is not the slot
+        [[1 - d for d in _sweep_data()], False],
+    ],
+)
+def test_sweep_signal_quality(data: List[float], is_usable: bool) -> None:
+    assert (_sweep_signal_quality(data) >= 5) == is_usable
+
+
+async def test_noisy_sweep(
+    ot3_hardware: ThreadManager[OT3API],
+    override_cal_config: None,
+    mock_capacitive_sweep: AsyncMock,
+    mock_data_analysis: Mock,
+) -> None:
+    mock_capacitive_sweep.return_value = _sweep_data(noise=1.0)
+    await ot3_hardware.home()
+    center = Point(*get_calibration_square_position_in_slot(5))
+    with pytest.raises(NoisyNonContactSweepError):
+        await find_axis_center(
+            ot3_hardware,
+            OT3Mount.RIGHT,
+            center + EDGES["left"],
+            center + EDGES["right"],
+            OT3Axis.X,
+        )
+    mock_data_analysis.assert_not_called()
+
+
+async def test_noncontact_falls_back_to_binary(
+    ot3_hardware: ThreadManager[OT3API],
+) -> None:
+    with patch(
+        "opentrons.hardware_control.ot3_calibration.find_slot_center_binary",
+        AsyncMock(spec=find_slot_center_binary),
+    ) as binary, patch(
+        "opentrons.hardware_control.ot3_calibration.find_slot_center_noncontact",
+        AsyncMock(spec=find_slot_center_noncontact),
+    ) as noncontact, patch(
+        "opentrons.hardware_control.ot3_calibration.find_calibration_structure_height",
+        AsyncMock(spec=find_calibration_structure_height),
+    ) as find_deck:
+        find_deck.return_value = 10
+        binary.return_value = Point(1.0, 2.0, 3.0)
+        noncontact.side_effect = NoisyNonContactSweepError(0)
+
+        offset = await find_calibration_structure_position(
+            ot3_hardware, OT3Mount.RIGHT, Point(0.0, 0.0, 0.0)
+        )
+
+        noncontact.assert_called_once()
+        binary.assert_called_once()
+        assert offset == Point(-1.0, -2.0, -3.0)
+
+        binary.reset_mock()
+        noncontact.reset_mock()
+        noncontact.side_effect = None
+        noncontact.return_value = Point(3.0, 4.0, 5.0)
+
+        offset = await find_calibration_structure_position(
+            ot3_hardware, OT3Mount.RIGHT, Point(0.0, 0.0, 0.0)
+        )
+
+        binary.assert_not_called()
+        assert offset == Point(-3.0, -4.0, -5.0)
+
+
+async def test_prior_offset_seeds_search(
+    ot3_hardware: ThreadManager[OT3API],
+) -> None:
+    with patch(
+        "opentrons.hardware_control.ot3_calibration.find_slot_center_noncontact",
+        AsyncMock(spec=find_slot_center_noncontact),
+    ) as noncontact, patch(
+        "opentrons.hardware_control.ot3_calibration.find_calibration_structure_height",
+        AsyncMock(spec=find_calibration_structure_height),
+    ) as find_deck:
+        find_deck.return_value = 10
+        noncontact.return_value = Point(99.0, 198.0, 10.0)
+        nominal = Point(100.0, 200.0, 0.0)
+
+        offset = await find_calibration_structure_position(
+            ot3_hardware,
+            OT3Mount.RIGHT,
+            nominal,
+            prior_offset=Point(1.0, 2.0, 3.0),
+        )
+
+        # The search starts where the prior offset puts the square, at the
+        # nominal height
+        find_deck.assert_called_once_with(
+            ot3_hardware, OT3Mount.RIGHT, Point(99.0, 198.0, 0.0)
+        )
+        noncontact.assert_called_once_with(
+            ot3_hardware, OT3Mount.RIGHT, Point(99.0, 198.0, 10.0)
+        )
+        # The offset is still relative to the nominal position
+        assert offset == Point(1.0, 2.0, -10.0)
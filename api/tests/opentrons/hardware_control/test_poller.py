@@ -1,5 +1,5 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List
 
 import pytest
 from decoy import Decoy, matchers
@@ -150,3 +150,118 @@ async def test_poller_wait_next_poll_error(
         mock_reader.on_error(matchers.ErrorMatching(RuntimeError, match="oh no")),
         times=1,
     )
+
+
+async def test_poller_schedule_does_not_drift(
+    decoy: Decoy, mock_reader: Reader
+) -> None:
+    """It should start polls on a fixed schedule, regardless of read time."""
+    loop = asyncio.get_running_loop()
+    read_times: List[float] = []
+
+    async def _slow_read() -> None:
+        read_times.append(loop.time())
+        await asyncio.sleep(POLLING_INTERVAL / 2)
+
+    decoy.when(await mock_reader.read()).then_do(_slow_read)
+    subject = Poller(reader=mock_reader, interval=POLLING_INTERVAL)
+
+    await subject.start()
+    for _ in range(4):
+        await subject.wait_next_poll()
+    await subject.stop()
+
+    elapsed = read_times[-1] - read_times[0]
+    assert elapsed == pytest.approx(
+        (len(read_times) - 1) * POLLING_INTERVAL, abs=POLLING_INTERVAL / 2
+    )
+
+
+async def test_poller_skips_missed_polls(decoy: Decoy, mock_reader: Reader) -> None:
+    """It should not poll back-to-back to catch up after a long read."""
+    loop = asyncio.get_running_loop()
+    read_times: List[float] = []
+
+    async def _read() -> None:
+        read_times.append(loop.time())
+        if len(read_times) == 2:
+            await asyncio.sleep(2.5 * POLLING_INTERVAL)
+
+    decoy.when(await mock_reader.read()).then_do(_read)
+    subject = Poller(reader=mock_reader, interval=POLLING_INTERVAL)
+
+    await subject.start()
+    await subject.wait_next_poll()
+    await subject.wait_next_poll()
+    await subject.wait_next_poll()
+    await subject.stop()
+
+    # The third poll starts as soon as the long read finishes,
+    # then the fourth poll is back on schedule.
+    assert read_times[3] - read_times[2] == pytest.approx(
+        0.5 * POLLING_INTERVAL, abs=0.3 * POLLING_INTERVAL
+    )
+
+
+async def test_poller_idle_interval(decoy: Decoy, mock_reader: Reader) -> None:
+    """It should poll an inactive reader at the idle interval."""
+    read_count = 0
+
+    async def _read() -> None:
+        nonlocal read_count
+        read_count += 1
+
+    decoy.when(await mock_reader.read()).then_do(_read)
+    decoy.when(mock_reader.is_active()).then_return(False)
+    subject = Poller(reader=mock_reader, interval=POLLING_INTERVAL, idle_interval=100.0)
+
+    await subject.start()
+    await asyncio.sleep(4 * POLLING_INTERVAL)
+    assert read_count == 1
+
+    decoy.when(mock_reader.is_active()).then_return(True)
+    # Waiting on a poll is polled for at the active interval.
+    await asyncio.wait_for(subject.wait_next_poll(), timeout=4 * POLLING_INTERVAL)
+    assert read_count == 2
+
+    await asyncio.sleep(4 * POLLING_INTERVAL)
+    assert read_count > 3
+
+    await subject.stop()
+
+
+async def test_poller_poll_now(decoy: Decoy, mock_reader: Reader) -> None:
+    """It should poll immediately when asked to."""
+    decoy.when(mock_reader.is_active()).then_return(False)
+    subject = Poller(reader=mock_reader, interval=100.0)
+
+    await subject.start()
+    decoy.verify(await mock_reader.read(), times=1)
+
+    await asyncio.wait_for(subject.poll_now(), timeout=1.0)
+    decoy.verify(await mock_reader.read(), times=2)
+
+    await subject.stop()
+
+    # After stopping, it reads directly.
+    await subject.poll_now()
+    decoy.verify(await mock_reader.read(), times=3)
+
+
+async def test_poller_fast_forward(decoy: Decoy, mock_reader: Reader) -> None:
+    """It should poll right away for waiters when fast-forwarding."""
+    decoy.when(mock_reader.is_active()).then_return(True)
+    subject = Poller(reader=mock_reader, interval=100.0, fast_forward=True)
+
+    await subject.start()
+    decoy.verify(await mock_reader.read(), times=1)
+
+    for _ in range(10):
+        await asyncio.wait_for(subject.wait_next_poll(), timeout=1.0)
+    decoy.verify(await mock_reader.read(), times=11)
+
+    # Without waiters, it goes back to polling on schedule.
+    await asyncio.sleep(4 * POLLING_INTERVAL)
+    decoy.verify(await mock_reader.read(), times=11)
+
+    await subject.stop()
@@ -384,7 +384,8 @@ def test_execute_profile(
                                     "hold_time_minutes": 12.3,
                                     "hold_time_seconds": 45.6,
                                 }
-                            ]
+                            ],
+                            "repetitions": 123,
                         }
                     ),
                 }
@@ -413,7 +414,8 @@ def test_execute_profile(
                                     "hold_time_minutes": 12.3,
                                     "hold_time_seconds": 45.6,
                                 }
-                            ]
+                            ],
+                            "repetitions": 123,
                         }
                     ),
                 }
@@ -9,8 +9,8 @@ def test_wells_accessor(min_lw, min_lw_impl, minimal_labware_def):
     offset = min_lw_impl.get_geometry()._offset
     a1 = Point(x=offset[0], y=offset[1], z=offset[2] + depth1)
     a2 = Point(x=offset[0] + x, y=offset[1] + y, z=offset[2] + depth2)
-    assert min_lw.wells()[0].geometry._position == a1
-    assert min_lw.wells()[1].geometry._position == a2
+    assert min_lw.wells()[0].geometry.position == a1
+    assert min_lw.wells()[1].geometry.position == a2
 
 
 def test_wells_name_accessor(min_lw, min_lw_impl, minimal_labware_def):
@@ -21,8 +21,8 @@ def test_wells_name_accessor(min_lw, min_lw_impl, minimal_labware_def):
     offset = min_lw_impl.get_geometry().offset
     a1 = Point(x=offset[0], y=offset[1], z=offset[2] + depth1)
     a2 = Point(x=offset[0] + x, y=offset[1] + y, z=offset[2] + depth2)
-    assert min_lw.wells_by_name()["A1"].geometry._position == a1
-    assert min_lw.wells_by_name()["A2"].geometry._position == a2
+    assert min_lw.wells_by_name()["A1"].geometry.position == a1
+    assert min_lw.wells_by_name()["A2"].geometry.position == a2
 
 
 def test_deprecated_index_accessors(min_lw):
@@ -39,8 +39,8 @@ def test_dict_accessor(min_lw, min_lw_impl, minimal_labware_def):
     offset = min_lw_impl.get_geometry().offset
     a1 = Point(x=offset[0], y=offset[1], z=offset[2] + depth1)
     a2 = Point(x=offset[0] + x, y=offset[1] + y, z=offset[2] + depth2)
-    assert min_lw["A1"].geometry._position == a1
-    assert min_lw["A2"].geometry._position == a2
+    assert min_lw["A1"].geometry.position == a1
+    assert min_lw["A2"].geometry.position == a2
 
 
 def test_rows_accessor(min_lw2_impl, min_lw2, minimal_labware_def2):
@@ -53,8 +53,8 @@ def test_rows_accessor(min_lw2_impl, min_lw2, minimal_labware_def2):
     offset = min_lw2_impl.get_geometry().offset
     a1 = Point(x=offset[0] + x1, y=offset[1] + y1, z=offset[2] + depth1)
     b2 = Point(x=offset[0] + x2, y=offset[1] + y2, z=offset[2] + depth2)
-    assert min_lw2.rows()[0][0].geometry._position == a1
-    assert min_lw2.rows()[1][1].geometry._position == b2
+    assert min_lw2.rows()[0][0].geometry.position == a1
+    assert min_lw2.rows()[1][1].geometry.position == b2
 
 
 def test_row_name_accessor(min_lw2_impl, min_lw2, minimal_labware_def2):
@@ -67,8 +67,8 @@ def test_row_name_accessor(min_lw2_impl, min_lw2, minimal_labware_def2):
     offset = min_lw2_impl.get_geometry().offset
     a1 = Point(x=offset[0] + x1, y=offset[1] + y1, z=offset[2] + depth1)
     b2 = Point(x=offset[0] + x2, y=offset[1] + y2, z=offset[2] + depth2)
-    assert min_lw2.rows_by_name()["A"][0].geometry._position == a1
-    assert min_lw2.rows_by_name()["B"][1].geometry._position == b2
+    assert min_lw2.rows_by_name()["A"][0].geometry.position == a1
+    assert min_lw2.rows_by_name()["B"][1].geometry.position == b2
 
 
 def test_cols_accessor(min_lw_impl, min_lw, minimal_labware_def):
@@ -79,8 +79,8 @@ def test_cols_accessor(min_lw_impl, min_lw, minimal_labware_def):
     offset = min_lw_impl.get_geometry().offset
     a1 = Point(x=offset[0], y=offset[1], z=offset[2] + depth1)
     a2 = Point(x=offset[0] + x, y=offset[1] + y, z=offset[2] + depth2)
-    assert min_lw.columns()[0][0].geometry._position == a1
-    assert min_lw.columns()[1][0].geometry._position == a2
+    assert min_lw.columns()[0][0].geometry.position == a1
+    assert min_lw.columns()[1][0].geometry.position == a2
 
 
 def test_col_name_accessor(min_lw, min_lw_impl, minimal_labware_def):
@@ -91,5 +91,5 @@ def test_col_name_accessor(min_lw, min_lw_impl, minimal_labware_def):
     offset = min_lw_impl.get_geometry().offset
     a1 = Point(x=offset[0], y=offset[1], z=offset[2] + depth1)
     a2 = Point(x=offset[0] + x, y=offset[1] + y, z=offset[2] + depth2)
-    assert min_lw.columns_by_name()["1"][0].geometry._position == a1
-    assert min_lw.columns_by_name()["2"][0].geometry._position == a2
+    assert min_lw.columns_by_name()["1"][0].geometry.position == a1
+    assert min_lw.columns_by_name()["2"][0].geometry.position == a2
@@ -65,8 +65,8 @@ def test_well_init() -> None:
         api_version=APIVersion(2, 13),
     )
     assert well1.geometry.diameter == test_data[well_name]["diameter"]  # type: ignore[typeddict-item]
-    assert well1.geometry._length is None
-    assert well1.geometry._width is None
+    assert well1.geometry.length is None
+    assert well1.geometry.width is None
 
     well2_name = "rectangular_well_json"
     well2 = labware.Well(
@@ -84,8 +84,8 @@ def test_well_init() -> None:
         api_version=APIVersion(2, 13),
     )
     assert well2.geometry.diameter is None
-    assert well2.geometry._length == test_data[well2_name]["xDimension"]  # type: ignore[typeddict-item]
-    assert well2.geometry._width == test_data[well2_name]["yDimension"]  # type: ignore[typeddict-item]
+    assert well2.geometry.length == test_data[well2_name]["xDimension"]  # type: ignore[typeddict-item]
+    assert well2.geometry.width == test_data[well2_name]["yDimension"]  # type: ignore[typeddict-item]
 
 
 def test_top() -> None:
@@ -319,6 +319,36 @@ def test_well_parent(corning_96_wellplate_360ul_flat) -> None:
     assert well.center().labware.parent.object == lw
 
 
+def test_wells_created_once(corning_96_wellplate_360ul_flat) -> None:
+    lw = corning_96_wellplate_360ul_flat
+
+    a1 = lw["A1"]
+
+    assert lw.wells()[0] is a1
+    assert lw.wells_by_name()["A1"] is a1
+    assert lw.rows()[0][0] is a1
+    assert lw.columns_by_name()["1"][0] is a1
+    assert a1._core is lw._core.get_well_core("A1")
+
+    with pytest.raises(KeyError):
+        lw["Z99"]
+
+
+def test_set_calibration_moves_wells(corning_96_wellplate_360ul_flat) -> None:
+    lw = corning_96_wellplate_360ul_flat
+    a1 = lw["A1"]
+    a1_top = a1.top().point
+    h12_top = lw.wells_by_name()["H12"].top().point
+
+    lw.set_calibration(Point(1, 2, 3))
+
+    # Wells accessed before and after the calibration see the new offset
+    assert a1.top().point == a1_top + Point(1, 2, 3)
+    assert lw["H12"].top().point == h12_top + Point(1, 2, 3)
+    assert lw["H12"].geometry.diameter == 6.86
+    assert lw["H12"].geometry.length is None
+
+
 def test_tip_tracking_init(
     corning_96_wellplate_360ul_flat, opentrons_96_tiprack_300ul
 ) -> None:
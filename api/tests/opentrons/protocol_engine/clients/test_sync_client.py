@@ -430,6 +430,50 @@ def test_dispense(
     assert result == response
 
 
+def test_pipetting_sequence(
+    decoy: Decoy,
+    transport: AbstractSyncTransport,
+    subject: SyncClient,
+) -> None:
+    """It should execute a PipettingSequence command."""
+    steps = [
+        commands.PipettingSequenceStep(
+            action="aspirate",
+            labwareId="456",
+            wellName="A1",
+            volume=20,
+            flowRate=2.0,
+        ),
+        commands.PipettingSequenceStep(
+            action="dispense",
+            labwareId="789",
+            wellName="B1",
+            volume=20,
+            flowRate=3.0,
+        ),
+    ]
+    request = commands.PipettingSequenceCreate(
+        params=commands.PipettingSequenceParams(pipetteId="123", steps=steps)
+    )
+    response = commands.PipettingSequenceResult(
+        steps=[
+            commands.PipettingSequenceStepResult(
+                volume=20, position=DeckPoint(x=1, y=2, z=3)
+            ),
+            commands.PipettingSequenceStepResult(
+                volume=20, position=DeckPoint(x=4, y=5, z=6)
+            ),
+        ],
+        position=DeckPoint(x=4, y=5, z=6),
+    )
+
+    decoy.when(transport.execute_command(request=request)).then_return(response)
+
+    result = subject.pipetting_sequence(pipette_id="123", steps=steps)
+
+    assert result == response
+
+
 def test_dispense_in_place(
     decoy: Decoy,
     transport: AbstractSyncTransport,
@@ -0,0 +1,324 @@
+"""Test pipetting sequence commands."""
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.types import Point
+from opentrons.protocol_engine import WellLocation, WellOrigin, WellOffset, DeckPoint
+from opentrons.protocol_engine.errors import WellDoesNotExistError
+from opentrons.protocol_engine.errors.exceptions import InvalidPipettingVolumeError
+from opentrons.protocol_engine.execution import MovementHandler, PipettingHandler
+from opentrons.protocol_engine.state import StateView
+from opentrons.protocol_engine.types import CurrentWell
+
+from opentrons.protocol_engine.commands.pipetting_sequence import (
+    PipettingSequenceParams,
+    PipettingSequenceResult,
+    PipettingSequenceStep,
+    PipettingSequenceStepResult,
+    PipettingSequenceImplementation,
+)
+
+
+@pytest.fixture
+def subject(
+    state_view: StateView,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+) -> PipettingSequenceImplementation:
+    """Get the implementation subject."""
+    return PipettingSequenceImplementation(
+        movement=movement,
+        pipetting=pipetting,
+        state_view=state_view,
+    )
+
+
+@pytest.fixture(autouse=True)
+def stub_pipette_volumes(decoy: Decoy, state_view: StateView) -> None:
+    """Stub an empty pipette with a 300 uL tip."""
+    decoy.when(state_view.pipettes.get_working_volume(pipette_id="abc")).then_return(
+        300
+    )
+    decoy.when(state_view.pipettes.get_aspirated_volume(pipette_id="abc")).then_return(
+        None
+    )
+
+
+def _step(
+    action: str, volume: float, labware_id: str = "source"
+) -> PipettingSequenceStep:
+    return PipettingSequenceStep(
+        action=action,  # type: ignore[arg-type]
+        labwareId=labware_id,
+        wellName="A1",
+        volume=volume,
+        flowRate=1.23,
+    )
+
+
+async def _stub_steps(
+    decoy: Decoy,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    aspirated_volume: float,
+) -> None:
+    """Stub every move, and aspirates or dispenses of 100 uL.
+
+    Aspirates only succeed with the given volume already in the pipette.
+    """
+    for current_well in [None, matchers.Anything()]:
+        decoy.when(
+            await movement.move_to_well(
+                pipette_id="abc",
+                labware_id="source",
+                well_name="A1",
+                well_location=matchers.Anything(),
+                current_well=current_well,
+            )
+        ).then_return(Point(x=1, y=2, z=3))
+    decoy.when(
+        await pipetting.aspirate_in_place(
+            pipette_id="abc",
+            volume=100,
+            flow_rate=1.23,
+            aspirated_volume=aspirated_volume,
+        )
+    ).then_return(100)
+    decoy.when(
+        await pipetting.dispense_in_place(pipette_id="abc", volume=100, flow_rate=1.23)
+    ).then_return(100)
+
+
+async def test_pipetting_sequence_implementation(
+    decoy: Decoy,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    subject: PipettingSequenceImplementation,
+) -> None:
+    """It should aspirate and dispense at each step's well, in order."""
+    location = WellLocation(origin=WellOrigin.BOTTOM, offset=WellOffset(x=0, y=0, z=1))
+    source_well = CurrentWell(pipette_id="abc", labware_id="source", well_name="A1")
+    dest_well = CurrentWell(pipette_id="abc", labware_id="dest", well_name="B1")
+
+    params = PipettingSequenceParams(
+        pipetteId="abc",
+        steps=[
+            PipettingSequenceStep(
+                action="aspirate",
+                labwareId="source",
+                wellName="A1",
+                wellLocation=location,
+                volume=50,
+                flowRate=1.23,
+            ),
+            PipettingSequenceStep(
+                action="dispense",
+                labwareId="dest",
+                wellName="B1",
+                wellLocation=location,
+                volume=40,
+                flowRate=4.56,
+            ),
+            PipettingSequenceStep(
+                action="aspirate",
+                labwareId="source",
+                wellName="A1",
+                wellLocation=location,
+                volume=10,
+                flowRate=1.23,
+            ),
+        ],
+    )
+
+    decoy.when(pipetting.get_is_ready_to_aspirate(pipette_id="abc")).then_return(False)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="source",
+            well_name="A1",
+            well_location=location,
+            current_well=source_well,
+        )
+    ).then_return(Point(x=1, y=2, z=3))
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="dest",
+            well_name="B1",
+            well_location=location,
+            current_well=source_well,
+        )
+    ).then_return(Point(x=4, y=5, z=6))
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="source",
+            well_name="A1",
+            well_location=location,
+            current_well=dest_well,
+        )
+    ).then_return(Point(x=7, y=8, z=9))
+    decoy.when(
+        await pipetting.aspirate_in_place(
+            pipette_id="abc", volume=50, flow_rate=1.23, aspirated_volume=0
+        )
+    ).then_return(50)
+    decoy.when(
+        await pipetting.dispense_in_place(pipette_id="abc", volume=40, flow_rate=4.56)
+    ).then_return(40)
+    decoy.when(
+        await pipetting.aspirate_in_place(
+            pipette_id="abc", volume=10, flow_rate=1.23, aspirated_volume=10
+        )
+    ).then_return(10)
+
+    result = await subject.execute(params)
+
+    assert result == PipettingSequenceResult(
+        steps=[
+            PipettingSequenceStepResult(volume=50, position=DeckPoint(x=1, y=2, z=3)),
+            PipettingSequenceStepResult(volume=40, position=DeckPoint(x=4, y=5, z=6)),
+            PipettingSequenceStepResult(volume=10, position=DeckPoint(x=7, y=8, z=9)),
+        ],
+        position=DeckPoint(x=7, y=8, z=9),
+    )
+    decoy.verify(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="source",
+            well_name="A1",
+            well_location=WellLocation(origin=WellOrigin.TOP),
+            current_well=None,
+        ),
+        await pipetting.prepare_for_aspirate(pipette_id="abc"),
+    )
+    decoy.verify(await pipetting.prepare_for_aspirate(pipette_id="abc"), times=1)
+
+
+async def test_pipetting_sequence_checks_wells_first(
+    decoy: Decoy,
+    state_view: StateView,
+    movement: MovementHandler,
+    subject: PipettingSequenceImplementation,
+) -> None:
+    """It should not move at all if any step's well does not exist."""
+    params = PipettingSequenceParams(
+        pipetteId="abc",
+        steps=[
+            PipettingSequenceStep(
+                action="aspirate",
+                labwareId="source",
+                wellName="A1",
+                volume=50,
+                flowRate=1.23,
+            ),
+            PipettingSequenceStep(
+                action="dispense",
+                labwareId="dest",
+                wellName="Z99",
+                volume=50,
+                flowRate=1.23,
+            ),
+        ],
+    )
+
+    decoy.when(
+        state_view.labware.get_well_definition(labware_id="dest", well_name="Z99")
+    ).then_raise(WellDoesNotExistError("oh no"))
+
+    with pytest.raises(WellDoesNotExistError):
+        await subject.execute(params)
+
+    decoy.verify(
+        await movement.move_to_well(
+            pipette_id=matchers.Anything(),
+            labware_id=matchers.Anything(),
+            well_name=matchers.Anything(),
+        ),
+        ignore_extra_args=True,
+        times=0,
+    )
+
+
+async def test_pipetting_sequence_prepares_once(
+    decoy: Decoy,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    subject: PipettingSequenceImplementation,
+) -> None:
+    """It should only prepare to aspirate before the first aspirate."""
+    params = PipettingSequenceParams(
+        pipetteId="abc",
+        steps=[_step("aspirate", 100), _step("dispense", 100), _step("aspirate", 100)],
+    )
+
+    decoy.when(pipetting.get_is_ready_to_aspirate(pipette_id="abc")).then_return(False)
+    await _stub_steps(decoy, movement, pipetting, aspirated_volume=0)
+
+    await subject.execute(params)
+
+    decoy.verify(await pipetting.prepare_for_aspirate(pipette_id="abc"), times=1)
+
+
+async def test_pipetting_sequence_checks_volumes_first(
+    decoy: Decoy,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    subject: PipettingSequenceImplementation,
+) -> None:
+    """It should not move at all if the steps would aspirate too much in total."""
+    params = PipettingSequenceParams(
+        pipetteId="abc",
+        steps=[_step("aspirate", 200), _step("aspirate", 200)],
+    )
+
+    with pytest.raises(InvalidPipettingVolumeError):
+        await subject.execute(params)
+
+    decoy.verify(
+        await movement.move_to_well(
+            pipette_id=matchers.Anything(),
+            labware_id=matchers.Anything(),
+            well_name=matchers.Anything(),
+        ),
+        ignore_extra_args=True,
+        times=0,
+    )
+    decoy.verify(
+        await pipetting.aspirate_in_place(
+            pipette_id=matchers.Anything(),
+            volume=matchers.Anything(),
+            flow_rate=matchers.Anything(),
+        ),
+        ignore_extra_args=True,
+        times=0,
+    )
+
+
+async def test_pipetting_sequence_counts_already_aspirated_volume(
+    decoy: Decoy,
+    state_view: StateView,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    subject: PipettingSequenceImplementation,
+) -> None:
+    """It should count what the pipette already holds against its working volume."""
+    decoy.when(state_view.pipettes.get_aspirated_volume(pipette_id="abc")).then_return(
+        250
+    )
+    decoy.when(pipetting.get_is_ready_to_aspirate(pipette_id="abc")).then_return(True)
+    await _stub_steps(decoy, movement, pipetting, aspirated_volume=150)
+
+    params = PipettingSequenceParams(
+        pipetteId="abc",
+        steps=[_step("dispense", 100), _step("aspirate", 100)],
+    )
+    result = await subject.execute(params)
+    assert [step.volume for step in result.steps] == [100, 100]
+
+    params = PipettingSequenceParams(
+        pipetteId="abc",
+        steps=[_step("aspirate", 100), _step("dispense", 100)],
+    )
+    with pytest.raises(InvalidPipettingVolumeError):
+        await subject.execute(params)
@@ -8,7 +8,7 @@ from opentrons.protocol_engine.state.module_substates import (
     ThermocyclerModuleSubState,
     ThermocyclerModuleId,
 )
-from opentrons.protocol_engine.execution import EquipmentHandler
+from opentrons.protocol_engine.execution import EquipmentHandler, RunControlHandler
 from opentrons.protocol_engine.commands import thermocycler as tc_commands
 from opentrons.protocol_engine.commands.thermocycler.run_profile import (
     RunProfileImpl,
@@ -19,9 +19,12 @@ async def test_run_profile(
     decoy: Decoy,
     state_view: StateView,
     equipment: EquipmentHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to execute the specified module's profile run."""
-    subject = RunProfileImpl(state_view=state_view, equipment=equipment)
+    subject = RunProfileImpl(
+        state_view=state_view, equipment=equipment, run_control=run_control
+    )
 
     step_data = [
         tc_commands.RunProfileStepParams(celsius=12.3, holdSeconds=45),
@@ -72,6 +75,6 @@ async def test_run_profile(
             repetitions=1,
             volume=76.5,
         ),
-        times=1,
+        run_control.record_duration(45 + 78),
     )
     assert result == expected_result
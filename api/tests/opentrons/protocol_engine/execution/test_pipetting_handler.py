@@ -236,6 +236,32 @@ async def test_virtual_validate_aspirated_volume_raises(
         await subject.aspirate_in_place(pipette_id="pipette-id", volume=4, flow_rate=1)
 
 
+async def test_virtual_validate_given_aspirated_volume(
+    decoy: Decoy,
+    mock_state_view: StateView,
+) -> None:
+    """Should validate against a given aspirated volume instead of the state's."""
+    decoy.when(mock_state_view.pipettes.get_attached_tip("pipette-id")).then_return(
+        TipGeometry(length=1, diameter=2, volume=3)
+    )
+    decoy.when(mock_state_view.pipettes.get_working_volume("pipette-id")).then_return(3)
+    decoy.when(mock_state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(
+        2
+    )
+
+    subject = VirtualPipettingHandler(state_view=mock_state_view)
+
+    result = await subject.aspirate_in_place(
+        pipette_id="pipette-id", volume=3, flow_rate=1, aspirated_volume=0
+    )
+    assert result == 3
+
+    with pytest.raises(InvalidPipettingVolumeError):
+        await subject.aspirate_in_place(
+            pipette_id="pipette-id", volume=2, flow_rate=1, aspirated_volume=2.5
+        )
+
+
 async def test_blow_out_in_place(
     decoy: Decoy,
     mock_state_view: StateView,
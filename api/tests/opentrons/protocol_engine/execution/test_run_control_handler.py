@@ -7,6 +7,7 @@ from decoy import Decoy, matchers
 from opentrons.protocol_engine.state import StateStore
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
+from opentrons.protocol_engine.resources import VirtualClock
 from opentrons.protocol_engine.state import Config
 
 
@@ -116,3 +117,48 @@ async def test_wait_for_duration_ignore_pause(
     # NOTE: margin of error selected empirically
     # this is flakey test risk in CI
     assert end - start <= 0.1
+
+
+async def test_wait_for_duration_virtual_clock(
+    decoy: Decoy,
+    mock_state_store: StateStore,
+    mock_action_dispatcher: ActionDispatcher,
+) -> None:
+    """It should advance a virtual clock instead of waiting."""
+    virtual_clock = decoy.mock(cls=VirtualClock)
+    subject = RunControlHandler(
+        state_store=mock_state_store,
+        action_dispatcher=mock_action_dispatcher,
+        virtual_clock=virtual_clock,
+    )
+    decoy.when(mock_state_store.config).then_return(_make_config(ignore_pause=False))
+
+    start = time_monotonic()
+    await subject.wait_for_duration(seconds=60 * 60)
+    end = time_monotonic()
+
+    assert end - start <= 0.1
+    decoy.verify(virtual_clock.advance(60 * 60), times=1)
+
+
+def test_record_duration(
+    decoy: Decoy,
+    mock_state_store: StateStore,
+    mock_action_dispatcher: ActionDispatcher,
+) -> None:
+    """It should only advance a virtual clock when recording a duration."""
+    virtual_clock = decoy.mock(cls=VirtualClock)
+    subject = RunControlHandler(
+        state_store=mock_state_store,
+        action_dispatcher=mock_action_dispatcher,
+        virtual_clock=virtual_clock,
+    )
+
+    subject.record_duration(123.4)
+
+    decoy.verify(virtual_clock.advance(123.4), times=1)
+
+
+def test_record_duration_no_virtual_clock(subject: RunControlHandler) -> None:
+    """It should do nothing when recording a duration without a virtual clock."""
+    subject.record_duration(123.4)
@@ -0,0 +1,35 @@
+"""Simple functional tests for the VirtualClock provider."""
+from datetime import datetime, timedelta, timezone
+
+from opentrons.protocol_engine.resources import VirtualClock
+
+
+def test_virtual_clock_only_moves_when_advanced() -> None:
+    """It should keep its time until it's advanced."""
+    start = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
+    subject = VirtualClock(start=start)
+
+    assert subject.get_timestamp() == start
+    assert subject.get_timestamp() == start
+    assert subject.elapsed_seconds == 0
+
+    subject.advance(60)
+    subject.advance(0.5)
+
+    assert subject.get_timestamp() == start + timedelta(seconds=60.5)
+    assert subject.elapsed_seconds == 60.5
+
+
+def test_virtual_clock_never_goes_backwards() -> None:
+    """It should ignore negative durations."""
+    subject = VirtualClock()
+    start = subject.get_timestamp()
+
+    subject.advance(-10)
+
+    assert subject.get_timestamp() == start
+
+
+def test_virtual_clock_generates_id() -> None:
+    """It should still generate IDs like ModelUtils."""
+    assert VirtualClock().generate_id(prefix="my-prefix-").startswith("my-prefix-")
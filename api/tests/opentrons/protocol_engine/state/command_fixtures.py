@@ -1,7 +1,7 @@
 """Command factories to use in tests as data fixtures."""
 from datetime import datetime
 from pydantic import BaseModel
-from typing import Optional, cast
+from typing import List, Optional, cast
 
 from opentrons_shared_data.pipette.dev_types import PipetteNameType
 from opentrons.types import MountType
@@ -219,6 +219,33 @@ def create_dispense_command(
     )
 
 
+def create_pipetting_sequence_command(
+    pipette_id: str,
+    steps: List[cmd.PipettingSequenceStep],
+    destinations: Optional[List[DeckPoint]] = None,
+) -> cmd.PipettingSequence:
+    """Get a completed PipettingSequence command."""
+    params = cmd.PipettingSequenceParams(pipetteId=pipette_id, steps=steps)
+    step_results = [
+        cmd.PipettingSequenceStepResult(volume=step.volume, position=destination)
+        for step, destination in zip(
+            steps, destinations or [DeckPoint(x=0, y=0, z=0)] * len(steps)
+        )
+    ]
+    result = cmd.PipettingSequenceResult(
+        steps=step_results, position=step_results[-1].position
+    )
+
+    return cmd.PipettingSequence(
+        id="command-id",
+        key="command-key",
+        status=cmd.CommandStatus.SUCCEEDED,
+        createdAt=datetime.now(),
+        params=params,
+        result=result,
+    )
+
+
 def create_dispense_in_place_command(
     pipette_id: str,
     volume: float,
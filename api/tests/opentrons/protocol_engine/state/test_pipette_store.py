@@ -37,6 +37,7 @@ from .command_fixtures import (
     create_aspirate_command,
     create_dispense_command,
     create_dispense_in_place_command,
+    create_pipetting_sequence_command,
     create_pick_up_tip_command,
     create_drop_tip_command,
     create_touch_tip_command,
@@ -206,6 +207,66 @@ def test_pipette_volume_subtracts_dispense(
     assert subject.state.aspirated_volume_by_id["pipette-id"] == 0
 
 
+def test_handles_pipetting_sequence(subject: PipetteStore) -> None:
+    """It should apply each step of a pipetting sequence in order."""
+    load_command = create_load_pipette_command(
+        pipette_id="pipette-id",
+        pipette_name=PipetteNameType.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+    sequence_command = create_pipetting_sequence_command(
+        pipette_id="pipette-id",
+        steps=[
+            cmd.PipettingSequenceStep(
+                action="aspirate",
+                labwareId="source-id",
+                wellName="A1",
+                volume=30,
+                flowRate=1.23,
+            ),
+            cmd.PipettingSequenceStep(
+                action="dispense",
+                labwareId="dest-id",
+                wellName="A1",
+                volume=50,
+                flowRate=1.23,
+            ),
+            cmd.PipettingSequenceStep(
+                action="aspirate",
+                labwareId="source-id",
+                wellName="A2",
+                volume=20,
+                flowRate=1.23,
+            ),
+            cmd.PipettingSequenceStep(
+                action="dispense",
+                labwareId="dest-id",
+                wellName="A2",
+                volume=5,
+                flowRate=1.23,
+            ),
+        ],
+        destinations=[
+            DeckPoint(x=1, y=1, z=1),
+            DeckPoint(x=2, y=2, z=2),
+            DeckPoint(x=3, y=3, z=3),
+            DeckPoint(x=4, y=4, z=4),
+        ],
+    )
+
+    subject.handle_action(UpdateCommandAction(command=load_command))
+    subject.handle_action(UpdateCommandAction(command=sequence_command))
+
+    # The 50 uL dispense empties the pipette, like a dispense command would.
+    assert subject.state.aspirated_volume_by_id["pipette-id"] == 15
+    assert subject.state.current_well == CurrentWell(
+        pipette_id="pipette-id", labware_id="dest-id", well_name="A2"
+    )
+    assert subject.state.current_deck_point == CurrentDeckPoint(
+        mount=MountType.LEFT, deck_point=DeckPoint(x=4, y=4, z=4)
+    )
+
+
 @pytest.mark.parametrize(
     ("command", "expected_location"),
     (
@@ -8,16 +8,29 @@ disk into the runner, and the protocols are run to completion. From
 there, the ProtocolEngine state is inspected to check that
 everything was loaded and run as expected.
 """
+import asyncio
+import json
+import textwrap
+import threading
+import time
+
 import pytest
 
 from datetime import datetime
 from decoy import matchers
 from pathlib import Path
+from pydantic import ValidationError
+from typing import Any, Iterable, Iterator, List
 
 from opentrons_shared_data.pipette.dev_types import PipetteNameType
+from opentrons_shared_data.protocol.models.protocol_schema_v6 import ProtocolSchemaV6
 
 from opentrons.types import MountType, DeckSlotName
+from opentrons.hardware_control import API as HardwareAPI
 from opentrons.protocol_engine import (
+    Config as ProtocolEngineConfig,
+    EngineStatus,
+    create_protocol_engine,
     DeckSlotLocation,
     LoadedLabware,
     LoadedModule,
@@ -27,8 +40,11 @@ from opentrons.protocol_engine import (
     commands,
     DeckPoint,
 )
+from opentrons.protocol_engine.commands import CommandCreate
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
+from opentrons.protocol_runner import ProtocolRunner, create_simulating_runner
+from opentrons.protocol_runner.json_translator import JsonTranslator
+from opentrons.protocol_runner.protocol_runner import JSON_COMMAND_CHUNK_SIZE
 
 
 # TODO (tz, 6-17-22): API version 3.x in-development.
@@ -162,6 +178,140 @@ async def test_runner_with_json(json_protocol_file: Path) -> None:
     assert expected_command in commands_result
 
 
+class _GatedJsonTranslator(JsonTranslator):
+    """A JsonTranslator that holds back all but the first chunk until opened."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+
+    def translate_command_chunks(
+        self,
+        protocol: ProtocolSchemaV6,
+        commands: Iterable[Any],
+        chunk_size: int,
+    ) -> Iterator[List[CommandCreate]]:
+        chunks = super().translate_command_chunks(protocol, commands, chunk_size)
+        yield next(chunks)
+        self.gate.wait()
+        yield from chunks
+
+
+async def test_runner_with_json_streams_commands(json_protocol_file: Path) -> None:
+    """It should start running a JSON protocol before translating all of it."""
+    protocol = json.loads(json_protocol_file.read_text())
+    protocol["commands"] += [{"commandType": "home", "params": {}}] * (
+        JSON_COMMAND_CHUNK_SIZE
+    )
+    json_protocol_file.write_text(json.dumps(protocol))
+    command_count = len(protocol["commands"])
+
+    protocol_reader = ProtocolReader()
+    protocol_source = await protocol_reader.read_saved(
+        files=[json_protocol_file],
+        directory=None,
+    )
+
+    hardware_api = await HardwareAPI.build_hardware_simulator()
+    protocol_engine = await create_protocol_engine(
+        hardware_api=hardware_api,
+        config=ProtocolEngineConfig(
+            robot_type="OT-2 Standard",
+            ignore_pause=True,
+            use_virtual_modules=True,
+            use_virtual_pipettes=True,
+        ),
+    )
+    json_translator = _GatedJsonTranslator()
+    subject = ProtocolRunner(
+        protocol_engine=protocol_engine,
+        hardware_api=hardware_api,
+        json_translator=json_translator,
+    )
+    commands_view = protocol_engine.state_view.commands
+
+    try:
+        # Loading must not wait for chunks after the first.
+        await asyncio.wait_for(subject.load(protocol_source), timeout=10)
+        run = asyncio.create_task(subject.run())
+
+        while commands_view.get_all()[0].status != commands.CommandStatus.SUCCEEDED:
+            assert not run.done()
+            await asyncio.sleep(0.01)
+
+        # The first command has run while the last chunk is still untranslated.
+        assert len(commands_view.get_all()) == JSON_COMMAND_CHUNK_SIZE
+    finally:
+        json_translator.gate.set()
+
+    result = await run
+
+    assert result.state_summary.status == EngineStatus.SUCCEEDED
+    assert len(result.commands) == command_count
+    assert all(
+        command.status == commands.CommandStatus.SUCCEEDED
+        for command in result.commands
+    )
+
+
+async def test_runner_with_json_bad_late_command(json_protocol_file: Path) -> None:
+    """It should fail to load a JSON protocol before running any of it.
+
+    The bad command comes after more than a chunk of good ones, so the load
+    checks every command, not just the ones it adds before the run starts.
+    """
+    protocol = json.loads(json_protocol_file.read_text())
+    protocol["commands"] += [
+        {"commandType": "home", "params": {}}
+    ] * JSON_COMMAND_CHUNK_SIZE + [{"commandType": "notACommand", "params": {}}]
+    json_protocol_file.write_text(json.dumps(protocol))
+
+    protocol_reader = ProtocolReader()
+    protocol_source = await protocol_reader.read_saved(
+        files=[json_protocol_file],
+        directory=None,
+    )
+
+    subject = await create_simulating_runner(robot_type="OT-2 Standard")
+    with pytest.raises(ValidationError):
+        await subject.load(protocol_source)
+
+    assert not subject.was_started()
+    await subject.stop()
+
+
+async def test_runner_with_json_bad_late_param(json_protocol_file: Path) -> None:
+    """It should fail the run on a late command whose params can't be translated."""
+    protocol = json.loads(json_protocol_file.read_text())
+    protocol["commands"] += [{"commandType": "home", "params": {}}] * (
+        JSON_COMMAND_CHUNK_SIZE
+    ) + [
+        {
+            "commandType": "aspirate",
+            "params": {
+                "pipetteId": "pipette-id",
+                "labwareId": "labware-id",
+                "wellName": "A1",
+                "wellLocation": {"origin": "middle"},
+                "flowRate": 10,
+                "volume": 50,
+            },
+        }
+    ]
+    json_protocol_file.write_text(json.dumps(protocol))
+
+    protocol_reader = ProtocolReader()
+    protocol_source = await protocol_reader.read_saved(
+        files=[json_protocol_file],
+        directory=None,
+    )
+
+    subject = await create_simulating_runner(robot_type="OT-2 Standard")
+    result = await subject.run(protocol_source)
+
+    assert result.state_summary.status == EngineStatus.FAILED
+    assert len(result.state_summary.errors) == 1
+
+
 async def test_runner_with_legacy_python(legacy_python_protocol_file: Path) -> None:
     """It should run a Python protocol on the ProtocolRunner."""
     protocol_reader = ProtocolReader()
@@ -275,3 +425,38 @@ async def test_runner_with_legacy_json(legacy_json_protocol_file: Path) -> None:
     )
 
     assert expected_command in commands_result
+
+
+@pytest.mark.parametrize("api_level", ["2.13", "2.14"])
+async def test_runner_with_virtual_clock(tmp_path: Path, api_level: str) -> None:
+    """It should skip waits, but record how long they would have taken."""
+    path = tmp_path / "protocol-name.py"
+    path.write_text(
+        textwrap.dedent(
+            f"""
+            metadata = {{"apiLevel": "{api_level}"}}
+            def run(ctx):
+                ctx.delay(minutes=90)
+                ctx.delay(seconds=30)
+            """
+        )
+    )
+    protocol_source = await ProtocolReader().read_saved(files=[path], directory=None)
+
+    subject = await create_simulating_runner(
+        robot_type="OT-2 Standard", use_virtual_clock=True
+    )
+    start = time.monotonic()
+    result = await subject.run(protocol_source)
+    end = time.monotonic()
+
+    assert end - start < 60
+    assert result.state_summary.errors == []
+
+    delays = [c for c in result.commands if c.commandType != "home"]
+    durations = [
+        (c.completedAt - c.startedAt).total_seconds()  # type: ignore[operator]
+        for c in delays
+    ]
+    assert durations == [90 * 60, 30]
+    assert delays[1].startedAt == delays[0].completedAt
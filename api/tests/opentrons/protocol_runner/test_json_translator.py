@@ -1,6 +1,7 @@
 """Tests for the JSON JsonTranslator interface."""
 import pytest
-from typing import Dict, List
+from pydantic import ValidationError
+from typing import Any, Dict, List
 
 from opentrons_shared_data.labware.labware_definition import (
     LabwareDefinition,
@@ -450,6 +451,83 @@ def test_load_command(
     assert output == [expected_output]
 
 
+def test_translate_command_chunks(subject: JsonTranslator) -> None:
+    """It should translate commands lazily, in lists of up to the chunk size."""
+    test_inputs = [test_input for test_input, _ in VALID_TEST_PARAMS]
+    expected_outputs = [expected_output for _, expected_output in VALID_TEST_PARAMS]
+    protocol = _make_json_protocol()
+    json_commands = [test_input.dict(exclude_none=True) for test_input in test_inputs]
+
+    chunks = list(
+        subject.translate_command_chunks(protocol, json_commands, chunk_size=3)
+    )
+
+    assert [len(chunk) for chunk in chunks[:-1]] == [3] * (len(chunks) - 1)
+    assert 0 < len(chunks[-1]) <= 3
+    assert [command for chunk in chunks for command in chunk] == expected_outputs
+
+
+def test_check_commands(subject: JsonTranslator) -> None:
+    """It should pass commands that can be translated."""
+    json_commands = [
+        test_input.dict(exclude_none=True) for test_input, _ in VALID_TEST_PARAMS
+    ]
+
+    subject.check_commands(_make_json_protocol(), json_commands)
+
+
+@pytest.mark.parametrize(
+    ("json_command", "message"),
+    [
+        (
+            {"commandType": "home"},
+            "Command at index 1 needs a commandType and params.",
+        ),
+        (
+            {"commandType": "notACommand", "params": {}},
+            "Command at index 1 has unknown commandType 'notACommand'.",
+        ),
+        (
+            {"commandType": "aspirate", "params": {"pipetteId": "pipette-id-1"}},
+            "aspirate command at index 1 is missing params"
+            " labwareId, wellName, flowRate, volume.",
+        ),
+        (
+            {"commandType": "loadPipette", "params": {"pipetteId": "pipette-id-1"}},
+            "loadPipette command at index 1 is missing params mount.",
+        ),
+        (
+            {"commandType": "delay", "params": {"message": "hello"}},
+            "delay command at index 1 is missing params seconds.",
+        ),
+        (
+            {
+                "commandType": "pickUpTip",
+                "params": {
+                    "pipetteId": "pipette-id-1",
+                    "labwareId": "labware-id-3",
+                    "wellName": "A1",
+                },
+            },
+            "pickUpTip command at index 1 references ID labware-id-3,"
+            " which doesn't exist.",
+        ),
+    ],
+)
+def test_check_commands_invalid(
+    subject: JsonTranslator, json_command: Dict[str, Any], message: str
+) -> None:
+    """It should raise a ValidationError for commands that can't be translated."""
+    json_commands = [{"commandType": "home", "params": {}}, json_command]
+
+    with pytest.raises(ValidationError) as exc_info:
+        subject.check_commands(_make_json_protocol(), json_commands)
+
+    assert exc_info.value.errors() == [
+        {"loc": ("commands", 1), "msg": message, "type": "value_error"}
+    ]
+
+
 def test_load_liquid(
     subject: JsonTranslator,
 ) -> None:
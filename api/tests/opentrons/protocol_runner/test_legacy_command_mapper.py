@@ -1,7 +1,7 @@
 """Tests for the ProtocolRunner's LegacyContextPlugin."""
 import inspect
-from datetime import datetime
-from typing import cast
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, cast
 
 import pytest
 from decoy import matchers, Decoy
@@ -18,6 +18,7 @@ from opentrons.protocol_engine import (
 )
 from opentrons.protocol_engine.resources import (
     ModuleDataProvider,
+    VirtualClock,
     pipette_data_provider,
 )
 from opentrons.protocol_engine.resources.pipette_data_provider import (
@@ -501,3 +502,65 @@ def test_filter_higher_order_commands(command_type: str) -> None:
     ]
 
     assert result == []
+
+
+@pytest.mark.parametrize(
+    ("command_type", "payload", "expected_seconds"),
+    [
+        ("command.DELAY", {"minutes": 2, "seconds": 3.5}, 123.5),
+        ("command.THERMOCYCLER_SET_BLOCK_TEMP", {"hold_time": 60}, 60),
+        ("command.THERMOCYCLER_SET_BLOCK_TEMP", {"hold_time": None}, 0),
+        (
+            "command.THERMOCYCLER_EXECUTE_PROFILE",
+            {
+                "steps": [
+                    {"temperature": 95, "hold_time_seconds": 30},
+                    {"temperature": 60, "hold_time_minutes": 1},
+                ],
+                "repetitions": 3,
+            },
+            270,
+        ),
+        ("command.COMMENT", {}, 0),
+    ],
+)
+def test_map_command_virtual_clock(
+    command_type: str, payload: Dict[str, Any], expected_seconds: float
+) -> None:
+    """It should advance a virtual clock by how long each command waits."""
+    start = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
+    virtual_clock = VirtualClock(start=start)
+    legacy_command_start = cast(
+        CommandMessage,
+        {
+            "$": "before",
+            "id": "message-id",
+            "name": command_type,
+            "payload": {"text": "hello world", **payload},
+            "error": None,
+        },
+    )
+    legacy_command_end = cast(
+        CommandMessage,
+        {
+            "$": "after",
+            "id": "message-id",
+            "name": command_type,
+            "payload": {"text": "hello world", **payload},
+            "error": None,
+        },
+    )
+
+    subject = LegacyCommandMapper(virtual_clock=virtual_clock)
+    running_result = subject.map_command(legacy_command_start)
+    completed_result = subject.map_command(legacy_command_end)
+
+    assert isinstance(running_result[0], pe_actions.UpdateCommandAction)
+    assert isinstance(completed_result[0], pe_actions.UpdateCommandAction)
+    assert running_result[0].command.createdAt == start
+    assert running_result[0].command.startedAt == start
+    assert completed_result[0].command.startedAt == start
+    assert completed_result[0].command.completedAt == start + timedelta(
+        seconds=expected_seconds
+    )
+    assert virtual_clock.elapsed_seconds == expected_seconds
@@ -1,8 +1,12 @@
 """Tests for the ProtocolRunner class."""
+import asyncio
+import time
 import pytest
 from decoy import Decoy, matchers
+from functools import partial
 from pathlib import Path
-from typing import List, cast
+from pydantic import ValidationError
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, cast
 
 from opentrons_shared_data.protocol.dev_types import (
     JsonProtocol as LegacyJsonProtocolDict,
@@ -13,7 +17,12 @@ from opentrons.hardware_control import API as HardwareAPI
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons_shared_data.protocol.models.protocol_schema_v6 import ProtocolSchemaV6
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
-from opentrons.protocol_engine import ProtocolEngine, Liquid, commands as pe_commands
+from opentrons.protocol_engine import (
+    ProtocolEngine,
+    Liquid,
+    CommandStatus,
+    commands as pe_commands,
+)
 from opentrons import protocol_reader
 from opentrons.protocol_reader import (
     ProtocolSource,
@@ -21,9 +30,13 @@ from opentrons.protocol_reader import (
     PythonProtocolConfig,
 )
 from opentrons.protocol_runner import ProtocolRunner
+from opentrons.protocol_runner.protocol_runner import JSON_COMMAND_CHUNK_SIZE
 from opentrons.protocol_runner.task_queue import TaskQueue
 from opentrons.protocol_runner.json_file_reader import JsonFileReader
-from opentrons.protocol_runner.json_translator import JsonTranslator
+from opentrons.protocol_runner.json_translator import (
+    JsonTranslator,
+    CommandTranslatorError,
+)
 from opentrons.protocol_runner.legacy_context_plugin import LegacyContextPlugin
 from opentrons.protocol_runner.legacy_wrappers import (
     LegacyFileReader,
@@ -199,18 +212,10 @@ async def test_run(
     )
 
 
-async def test_load_json(
-    decoy: Decoy,
-    json_file_reader: JsonFileReader,
-    json_translator: JsonTranslator,
-    protocol_engine: ProtocolEngine,
-    task_queue: TaskQueue,
-    subject: ProtocolRunner,
-) -> None:
-    """It should load a JSON protocol file."""
-    labware_definition = LabwareDefinition.construct()  # type: ignore[call-arg]
-
-    json_protocol_source = ProtocolSource(
+@pytest.fixture
+def json_protocol_source() -> ProtocolSource:
+    """Get a JSON protocol source."""
+    return ProtocolSource(
         directory=Path("/dev/null"),
         main_file=Path("/dev/null/abc.json"),
         files=[],
@@ -220,56 +225,116 @@ async def test_load_json(
         content_hash="abc123",
     )
 
+
+def _capture_run_func(
+    decoy: Decoy, task_queue: TaskQueue
+) -> List[Callable[[], Awaitable[Any]]]:
+    run_funcs: List[Callable[[], Awaitable[Any]]] = []
+    decoy.when(
+        task_queue.set_run_func(func=matchers.Anything()), ignore_extra_args=True
+    ).then_do(lambda func, **kwargs: run_funcs.append(partial(func, **kwargs)))
+    return run_funcs
+
+
+def _wait_for_resume(message: str) -> pe_commands.WaitForResumeCreate:
+    return pe_commands.WaitForResumeCreate(
+        params=pe_commands.WaitForResumeParams(message=message)
+    )
+
+
+def _queued_command(
+    decoy: Decoy,
+    protocol_engine: ProtocolEngine,
+    added_requests: List[pe_commands.CommandCreate],
+    request: pe_commands.CommandCreate,
+    command_id: str,
+    status: CommandStatus = CommandStatus.QUEUED,
+) -> None:
+    """Stub adding a request to the engine, recording it in `added_requests`."""
+    command = pe_commands.WaitForResume.construct(  # type: ignore[call-arg]
+        id=command_id, status=status
+    )
+
+    def _add_command(request: pe_commands.CommandCreate) -> pe_commands.Command:
+        added_requests.append(request)
+        return command
+
+    decoy.when(protocol_engine.add_command(request=request)).then_do(_add_command)
+    decoy.when(protocol_engine.state_view.commands.get(command_id)).then_return(command)
+
+
+def _read_json(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    json_protocol_source: ProtocolSource,
+    command_chunks: Iterator[List[pe_commands.CommandCreate]],
+) -> ProtocolSchemaV6:
+    """Stub reading a JSON protocol whose commands translate to `command_chunks`."""
     json_protocol = ProtocolSchemaV6.construct()  # type: ignore[call-arg]
+    json_commands: List[Dict[str, Any]] = [{"commandType": "home", "params": {}}]
 
-    commands: List[pe_commands.CommandCreate] = [
-        pe_commands.WaitForResumeCreate(
-            params=pe_commands.WaitForResumeParams(message="hello")
-        ),
-        pe_commands.WaitForResumeCreate(
-            params=pe_commands.WaitForResumeParams(message="goodbye")
-        ),
-        pe_commands.LoadLiquidCreate(
-            params=pe_commands.LoadLiquidParams(
-                liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
-            )
-        ),
-    ]
+    decoy.when(
+        json_file_reader.read_without_commands(json_protocol_source)
+    ).then_return((json_protocol, json_commands))
+    decoy.when(
+        json_translator.translate_command_chunks(
+            json_protocol, json_commands, chunk_size=JSON_COMMAND_CHUNK_SIZE
+        )
+    ).then_return(command_chunks)
+    return json_protocol
 
-    liquids: List[Liquid] = [
-        Liquid(id="water-id", displayName="water", description=" water desc")
-    ]
+
+async def test_load_json(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    protocol_engine: ProtocolEngine,
+    task_queue: TaskQueue,
+    json_protocol_source: ProtocolSource,
+    subject: ProtocolRunner,
+) -> None:
+    """It should load a JSON protocol file.
+
+    It should add the first chunk of translated commands while loading,
+    and the rest while running.
+    """
+    labware_definition = LabwareDefinition.construct()  # type: ignore[call-arg]
+    added_requests: List[pe_commands.CommandCreate] = []
+
+    load_liquid = pe_commands.LoadLiquidCreate(
+        params=pe_commands.LoadLiquidParams(
+            liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
+        )
+    )
+    hello = _wait_for_resume("hello")
+    goodbye = _wait_for_resume("goodbye")
 
     decoy.when(
         await protocol_reader.extract_labware_definitions(json_protocol_source)
     ).then_return([labware_definition])
-    decoy.when(json_file_reader.read(json_protocol_source)).then_return(json_protocol)
-    decoy.when(json_translator.translate_commands(json_protocol)).then_return(commands)
-    decoy.when(json_translator.translate_liquids(json_protocol)).then_return(liquids)
+    json_protocol = _read_json(
+        decoy,
+        json_file_reader,
+        json_translator,
+        json_protocol_source,
+        iter([[load_liquid, hello], [goodbye]]),
+    )
+    decoy.when(json_translator.translate_liquids(json_protocol)).then_return([])
+    _queued_command(decoy, protocol_engine, added_requests, load_liquid, "command-1")
+    _queued_command(decoy, protocol_engine, added_requests, hello, "command-2")
+    _queued_command(decoy, protocol_engine, added_requests, goodbye, "command-3")
+    run_funcs = _capture_run_func(decoy, task_queue)
 
     await subject.load(json_protocol_source)
 
-    decoy.verify(
-        protocol_engine.add_labware_definition(labware_definition),
-        protocol_engine.add_command(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="hello")
-            )
-        ),
-        protocol_engine.add_command(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="goodbye")
-            )
-        ),
-        protocol_engine.add_command(
-            request=pe_commands.LoadLiquidCreate(
-                params=pe_commands.LoadLiquidParams(
-                    liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
-                )
-            ),
-        ),
-        task_queue.set_run_func(func=protocol_engine.wait_until_complete),
-    )
+    decoy.verify(protocol_engine.add_labware_definition(labware_definition))
+    assert added_requests == [load_liquid, hello]
+
+    await run_funcs[0]()
+
+    assert added_requests == [load_liquid, hello, goodbye]
+    decoy.verify(await protocol_engine.wait_until_complete(), times=1)
 
 
 async def test_load_json_liquids_ff_on(
@@ -278,31 +343,19 @@ async def test_load_json_liquids_ff_on(
     json_translator: JsonTranslator,
     protocol_engine: ProtocolEngine,
     task_queue: TaskQueue,
+    json_protocol_source: ProtocolSource,
     subject: ProtocolRunner,
 ) -> None:
     """It should load a JSON protocol file."""
     labware_definition = LabwareDefinition.construct()  # type: ignore[call-arg]
+    added_requests: List[pe_commands.CommandCreate] = []
 
-    json_protocol_source = ProtocolSource(
-        directory=Path("/dev/null"),
-        main_file=Path("/dev/null/abc.json"),
-        files=[],
-        metadata={},
-        robot_type="OT-2 Standard",
-        config=JsonProtocolConfig(schema_version=6),
-        content_hash="abc123",
+    load_liquid = pe_commands.LoadLiquidCreate(
+        params=pe_commands.LoadLiquidParams(
+            liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
+        )
     )
 
-    json_protocol = ProtocolSchemaV6.construct()  # type: ignore[call-arg]
-
-    commands: List[pe_commands.CommandCreate] = [
-        pe_commands.LoadLiquidCreate(
-            params=pe_commands.LoadLiquidParams(
-                liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
-            )
-        ),
-    ]
-
     liquids: List[Liquid] = [
         Liquid(id="water-id", displayName="water", description="water desc")
     ]
@@ -310,9 +363,15 @@ async def test_load_json_liquids_ff_on(
     decoy.when(
         await protocol_reader.extract_labware_definitions(json_protocol_source)
     ).then_return([labware_definition])
-    decoy.when(json_file_reader.read(json_protocol_source)).then_return(json_protocol)
-    decoy.when(json_translator.translate_commands(json_protocol)).then_return(commands)
+    json_protocol = _read_json(
+        decoy,
+        json_file_reader,
+        json_translator,
+        json_protocol_source,
+        iter([[load_liquid]]),
+    )
     decoy.when(json_translator.translate_liquids(json_protocol)).then_return(liquids)
+    _queued_command(decoy, protocol_engine, added_requests, load_liquid, "command-1")
 
     await subject.load(json_protocol_source)
 
@@ -321,15 +380,207 @@ async def test_load_json_liquids_ff_on(
         protocol_engine.add_liquid(
             id="water-id", name="water", description="water desc", color=None
         ),
-        protocol_engine.add_command(
-            request=pe_commands.LoadLiquidCreate(
-                params=pe_commands.LoadLiquidParams(
-                    liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
-                )
-            ),
+    )
+    assert added_requests == [load_liquid]
+
+
+async def test_load_json_invalid_commands(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    protocol_engine: ProtocolEngine,
+    task_queue: TaskQueue,
+    json_protocol_source: ProtocolSource,
+    subject: ProtocolRunner,
+) -> None:
+    """It should fail the load, before adding any command, if commands are invalid."""
+    json_protocol = ProtocolSchemaV6.construct()  # type: ignore[call-arg]
+    json_commands: List[Dict[str, Any]] = [{"commandType": "notACommand"}]
+    error = ValidationError([], ProtocolSchemaV6)
+
+    decoy.when(
+        await protocol_reader.extract_labware_definitions(json_protocol_source)
+    ).then_return([])
+    decoy.when(
+        json_file_reader.read_without_commands(json_protocol_source)
+    ).then_return((json_protocol, json_commands))
+    decoy.when(json_translator.translate_liquids(json_protocol)).then_return([])
+    decoy.when(json_translator.check_commands(json_protocol, json_commands)).then_raise(
+        error
+    )
+
+    with pytest.raises(ValidationError):
+        await subject.load(json_protocol_source)
+
+    decoy.verify(
+        json_translator.translate_command_chunks(
+            matchers.Anything(), matchers.Anything(), chunk_size=matchers.Anything()
         ),
-        task_queue.set_run_func(func=protocol_engine.wait_until_complete),
+        times=0,
+    )
+    decoy.verify(protocol_engine.add_command(request=matchers.Anything()), times=0)
+    decoy.verify(task_queue.set_run_func(func=matchers.Anything()), times=0)
+
+
+async def test_load_json_translation_error(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    protocol_engine: ProtocolEngine,
+    task_queue: TaskQueue,
+    json_protocol_source: ProtocolSource,
+    subject: ProtocolRunner,
+) -> None:
+    """It should fail the run if a command after the first chunk can't be translated."""
+    added_requests: List[pe_commands.CommandCreate] = []
+    hello = _wait_for_resume("hello")
+
+    def _translate_chunks() -> Iterator[List[pe_commands.CommandCreate]]:
+        yield [hello]
+        raise CommandTranslatorError("oh no")
+
+    decoy.when(
+        await protocol_reader.extract_labware_definitions(json_protocol_source)
+    ).then_return([])
+    json_protocol = _read_json(
+        decoy,
+        json_file_reader,
+        json_translator,
+        json_protocol_source,
+        _translate_chunks(),
+    )
+    decoy.when(json_translator.translate_liquids(json_protocol)).then_return([])
+    _queued_command(decoy, protocol_engine, added_requests, hello, "command-1")
+    run_funcs = _capture_run_func(decoy, task_queue)
+
+    await subject.load(json_protocol_source)
+
+    with pytest.raises(CommandTranslatorError, match="oh no"):
+        await run_funcs[0]()
+
+    assert added_requests == [hello]
+    decoy.verify(await protocol_engine.wait_until_complete(), times=0)
+
+
+async def test_load_json_first_chunk_translation_error(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    protocol_engine: ProtocolEngine,
+    task_queue: TaskQueue,
+    json_protocol_source: ProtocolSource,
+    subject: ProtocolRunner,
+) -> None:
+    """It should fail the load if a command in the first chunk can't be translated."""
+
+    def _translate_chunks() -> Iterator[List[pe_commands.CommandCreate]]:
+        raise CommandTranslatorError("oh no")
+        yield []
+
+    decoy.when(
+        await protocol_reader.extract_labware_definitions(json_protocol_source)
+    ).then_return([])
+    json_protocol = _read_json(
+        decoy,
+        json_file_reader,
+        json_translator,
+        json_protocol_source,
+        _translate_chunks(),
+    )
+    decoy.when(json_translator.translate_liquids(json_protocol)).then_return([])
+
+    with pytest.raises(CommandTranslatorError, match="oh no"):
+        await subject.load(json_protocol_source)
+
+    decoy.verify(task_queue.set_run_func(func=matchers.Anything()), times=0)
+    # The translation worker was awaited, rather than left running.
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.parametrize("stop_requested", [True, False])
+async def test_load_json_stops_adding_commands(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    protocol_engine: ProtocolEngine,
+    task_queue: TaskQueue,
+    json_protocol_source: ProtocolSource,
+    subject: ProtocolRunner,
+    stop_requested: bool,
+) -> None:
+    """It should stop adding commands once the run is stopped or has failed."""
+    added_requests: List[pe_commands.CommandCreate] = []
+    hello = _wait_for_resume("hello")
+    goodbye = _wait_for_resume("goodbye")
+
+    decoy.when(
+        await protocol_reader.extract_labware_definitions(json_protocol_source)
+    ).then_return([])
+    json_protocol = _read_json(
+        decoy,
+        json_file_reader,
+        json_translator,
+        json_protocol_source,
+        iter([[hello], [goodbye]]),
+    )
+    decoy.when(json_translator.translate_liquids(json_protocol)).then_return([])
+    _queued_command(
+        decoy,
+        protocol_engine,
+        added_requests,
+        hello,
+        "command-1",
+        status=CommandStatus.QUEUED if stop_requested else CommandStatus.FAILED,
     )
+    run_funcs = _capture_run_func(decoy, task_queue)
+
+    await subject.load(json_protocol_source)
+    decoy.when(protocol_engine.state_view.commands.get_stop_requested()).then_return(
+        stop_requested
+    )
+    await run_funcs[0]()
+
+    assert added_requests == [hello]
+    decoy.verify(await protocol_engine.wait_until_complete(), times=1)
+
+
+async def test_load_json_stop_never_started(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    protocol_engine: ProtocolEngine,
+    json_protocol_source: ProtocolSource,
+    subject: ProtocolRunner,
+) -> None:
+    """It should stop translating commands if stopped before it was started."""
+    added_requests: List[pe_commands.CommandCreate] = []
+    hello = _wait_for_resume("hello")
+
+    def _translate_chunks() -> Iterator[List[pe_commands.CommandCreate]]:
+        while True:
+            yield [hello]
+            time.sleep(0.001)
+
+    decoy.when(
+        await protocol_reader.extract_labware_definitions(json_protocol_source)
+    ).then_return([])
+    json_protocol = _read_json(
+        decoy,
+        json_file_reader,
+        json_translator,
+        json_protocol_source,
+        _translate_chunks(),
+    )
+    decoy.when(json_translator.translate_liquids(json_protocol)).then_return([])
+    _queued_command(decoy, protocol_engine, added_requests, hello, "command-1")
+    decoy.when(protocol_engine.state_view.commands.has_been_played()).then_return(False)
+
+    await subject.load(json_protocol_source)
+    await subject.stop()
+
+    assert added_requests == [hello]
+    # The translation worker was awaited, rather than left running.
+    assert asyncio.all_tasks() == {asyncio.current_task()}
 
 
 async def test_load_legacy_python(
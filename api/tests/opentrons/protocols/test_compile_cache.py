@@ -0,0 +1,128 @@
+"""Tests for opentrons.protocols.compile_cache."""
+import os
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from opentrons import config
+from opentrons.protocols import compile_cache
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.compile_cache import (
+    CompiledProtocolCache,
+    CompiledPythonProtocol,
+)
+from opentrons.protocols.parse import parse
+from opentrons.protocols.types import PythonProtocol, StaticPythonInfo
+
+
+PROTOCOL = dedent(
+    """
+    metadata = {"apiLevel": "2.13", "protocolName": "Cached"}
+
+    def run(ctx):
+        ctx.comment("hello")
+    """
+)
+
+
+@pytest.fixture
+def compiled() -> CompiledPythonProtocol:
+    return CompiledPythonProtocol(
+        code=compile(PROTOCOL, "protocol.py", "exec"),
+        static_info=StaticPythonInfo(
+            metadata={"apiLevel": "2.13", "protocolName": "Cached"},
+            requirements=None,
+        ),
+        api_version=APIVersion(2, 13),
+    )
+
+
+@pytest.fixture
+def subject(tmp_path: Path) -> CompiledProtocolCache:
+    return CompiledProtocolCache(directory=tmp_path / "cache")
+
+
+def test_round_trip(
+    subject: CompiledProtocolCache, compiled: CompiledPythonProtocol
+) -> None:
+    """It should load what it stored, for the same source and filename only."""
+    assert subject.get(PROTOCOL, "protocol.py") is None
+
+    subject.put(PROTOCOL, "protocol.py", compiled)
+
+    assert subject.get(PROTOCOL, "protocol.py") == compiled
+    assert subject.get(PROTOCOL, "other.py") is None
+    assert subject.get(PROTOCOL + "\n", "protocol.py") is None
+
+
+def test_corrupt_entry(
+    tmp_path: Path, subject: CompiledProtocolCache, compiled: CompiledPythonProtocol
+) -> None:
+    """It should treat an unreadable entry as a miss."""
+    subject.put(PROTOCOL, "protocol.py", compiled)
+    (entry,) = (tmp_path / "cache").iterdir()
+    entry.write_bytes(entry.read_bytes()[:10])
+
+    assert subject.get(PROTOCOL, "protocol.py") is None
+
+
+def test_unwritable_directory(tmp_path: Path, compiled: CompiledPythonProtocol) -> None:
+    """It should carry on without caching if it can't write."""
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    subject = CompiledProtocolCache(directory=not_a_dir)
+
+    subject.put(PROTOCOL, "protocol.py", compiled)
+
+    assert subject.get(PROTOCOL, "protocol.py") is None
+
+
+def test_evicts_least_recently_used(
+    tmp_path: Path, compiled: CompiledPythonProtocol
+) -> None:
+    """It should remove the least recently used entries past its size limit."""
+    subject = CompiledProtocolCache(directory=tmp_path / "cache")
+    subject.put(PROTOCOL, "a.py", compiled)
+    (entry,) = (tmp_path / "cache").iterdir()
+    entry_size = entry.stat().st_size
+    subject = CompiledProtocolCache(
+        directory=tmp_path / "cache", max_size_bytes=2 * entry_size
+    )
+
+    subject.put(PROTOCOL, "b.py", compiled)
+    for i, path in enumerate(sorted((tmp_path / "cache").iterdir())):
+        os.utime(path, (i, i))
+    # Using an entry makes it the most recently used.
+    assert subject.get(PROTOCOL, "a.py") is not None
+    subject.put(PROTOCOL, "c.py", compiled)
+
+    assert subject.get(PROTOCOL, "a.py") is not None
+    assert subject.get(PROTOCOL, "b.py") is None
+    assert subject.get(PROTOCOL, "c.py") is not None
+
+
+def test_default_cache_off_robot() -> None:
+    """It should not cache protocols off of a robot."""
+    assert compile_cache.get_default_cache() is None
+
+
+def test_parse_uses_cache(
+    monkeypatch: pytest.MonkeyPatch, ot_config_tempdir: Path, is_robot: None
+) -> None:
+    """It should skip parsing and compiling a protocol it has already compiled."""
+    first = parse(PROTOCOL, "protocol.py")
+    assert list((ot_config_tempdir / "protocol_cache").iterdir())
+
+    def _fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("Should not parse a cached protocol")
+
+    monkeypatch.setattr("opentrons.protocols.parse.ast.parse", _fail)
+    second = parse(PROTOCOL, "protocol.py")
+
+    assert isinstance(first, PythonProtocol)
+    assert isinstance(second, PythonProtocol)
+    assert second.contents == first.contents
+    assert second.metadata == first.metadata
+    assert second.api_level == first.api_level
+    assert config.get_opentrons_path("protocol_cache_dir").is_dir()
@@ -0,0 +1,71 @@
+"""Tests for opentrons.protocols.schema_validators."""
+from typing import Any, Callable, Dict
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+from opentrons_shared_data.protocol import load_schema as load_protocol_schema
+
+from opentrons.protocols import schema_validators
+
+
+def test_validate_labware(
+    get_labware_fixture: Callable[[str], LabwareDefinition]
+) -> None:
+    """It should validate labware definitions against labware schema v2."""
+    labware = get_labware_fixture("fixture_12_trough_v2")
+    schema_validators.validate_labware(labware)
+
+    with pytest.raises(jsonschema.ValidationError):
+        schema_validators.validate_labware({**labware, "ordering": "A1"})
+
+
+def test_validate_protocol(
+    get_json_protocol_fixture: Callable[[str, str], Dict[str, Any]]
+) -> None:
+    """It should validate protocols, resolving references to labware schema v2."""
+    protocol = get_json_protocol_fixture("4", "testModulesProtocol")
+    schema_validators.validate_protocol(protocol, 4)
+
+    with pytest.raises(jsonschema.ValidationError):
+        schema_validators.validate_protocol(
+            {k: v for k, v in protocol.items() if k != "commands"}, 4
+        )
+    with pytest.raises(FileNotFoundError):
+        schema_validators.validate_protocol(protocol, 1000)
+
+
+def test_could_be_labware(
+    get_labware_fixture: Callable[[str], LabwareDefinition],
+    get_json_protocol_fixture: Callable[[str, str], Dict[str, Any]],
+) -> None:
+    """It should rule out anything missing labware's required keys."""
+    assert schema_validators.could_be_labware(
+        get_labware_fixture("fixture_12_trough_v2")  # type: ignore[arg-type]
+    )
+    assert not schema_validators.could_be_labware(
+        get_json_protocol_fixture("3", "testAllAtomicSingleV3")
+    )
+    assert not schema_validators.could_be_labware({})
+
+
+def test_schemas_loaded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It should only load and check each schema once."""
+    schema_validators._get_protocol_schema.cache_clear()
+    loaded = []
+
+    def _load(version: int) -> Any:
+        loaded.append(version)
+        return load_protocol_schema(version=version)
+
+    monkeypatch.setattr(
+        "opentrons.protocols.schema_validators.load_protocol_schema", _load
+    )
+
+    for _ in range(3):
+        with pytest.raises(jsonschema.ValidationError):
+            schema_validators.validate_protocol({}, 3)
+
+    assert loaded == [3]
+    schema_validators._get_protocol_schema.cache_clear()
@@ -0,0 +1,83 @@
+"""Tests for how much importing the top-level packages loads."""
+import json
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+# Importing these is what made `import opentrons.protocol_api` slow.
+HEAVY_MODULES = [
+    "opentrons.protocol_engine",
+    "opentrons.protocol_api.protocol_context",
+    "opentrons.protocol_api.core.engine",
+    "opentrons.hardware_control.api",
+    "opentrons.drivers.serial_communication",
+]
+
+# These statements load about 25 opentrons modules, mostly config and types.
+# Leave some room for small, cheap modules to come and go.
+MAX_OPENTRONS_MODULES = 35
+
+
+def _get_loaded_modules(statement: str) -> List[str]:
+    # Run in a fresh interpreter, since this one has imported everything.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys; {statement}; print(json.dumps(list(sys.modules)))",
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+    )
+    modules: List[str] = json.loads(result.stdout.splitlines()[-1])
+    return modules
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import opentrons",
+        "import opentrons.protocol_api",
+        "from opentrons.protocol_api import MAX_SUPPORTED_VERSION",
+    ],
+)
+def test_import_is_light(statement: str) -> None:
+    """It should not load the protocol API, engine or hardware until they're used."""
+    modules = _get_loaded_modules(statement)
+    opentrons_modules = [m for m in modules if m.split(".")[0] == "opentrons"]
+
+    assert [m for m in HEAVY_MODULES if m in modules] == []
+    assert len(opentrons_modules) <= MAX_OPENTRONS_MODULES, opentrons_modules
+
+
+def test_lazy_attributes() -> None:
+    """It should still provide every public protocol API name on access."""
+    from opentrons import protocol_api
+    from opentrons.protocol_api.protocol_context import ProtocolContext
+
+    assert protocol_api.ProtocolContext is ProtocolContext
+    for name in protocol_api.__all__:
+        assert getattr(protocol_api, name) is not None
+        assert name in dir(protocol_api)
+
+    with pytest.raises(AttributeError):
+        protocol_api.NotAThing
+
+
+def test_lazy_hardware_control_attributes() -> None:
+    """It should still provide every public hardware control name on access."""
+    from opentrons import hardware_control
+    from opentrons.hardware_control.api import API
+    from opentrons.hardware_control.protocols import HardwareControlAPI
+    from opentrons.hardware_control.thread_manager import ThreadManager
+
+    assert hardware_control.API is API
+    assert hardware_control.ThreadManagedHardware == ThreadManager[HardwareControlAPI]
+    for name in hardware_control.__all__:
+        assert getattr(hardware_control, name) is not None
+        assert name in dir(hardware_control)
+
+    with pytest.raises(AttributeError):
+        hardware_control.NotAThing
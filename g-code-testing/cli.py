@@ -21,6 +21,7 @@ from typing import (
 from opentrons import APIVersion
 
 from g_code_parsing.errors import UnparsableCLICommandError
+from g_code_parsing.g_code_benchmark import compare_to_baseline
 from g_code_parsing.g_code_differ import GCodeDiffer
 from g_code_test_data.g_code_configuration import (
     HTTPGCodeConfirmConfig,
@@ -67,6 +68,12 @@ class GCodeCLI:
     UPDATE_COMPARISON_COMMAND = "update-comparison"
     CHECK_MISSING_COMP_FILES = "check-for-missing-comparison-files"
 
+    BENCHMARK_COMMAND = "benchmark"
+    UPDATE_BENCHMARK_COMMAND = "update-benchmark"
+    ERROR_ON_REGRESSION = "error_on_regression"
+    ALL_CONFIGURATIONS = "all"
+    WALL_CLOCK = "wall_clock"
+
     API_VERSION_REGEX = re.compile(r"\/(\d+\.\d+)$")
 
     @classmethod
@@ -106,6 +113,8 @@ class GCodeCLI:
             self.UPDATE_COMPARISON_COMMAND: self._update_comparison,
             self.CONFIGURATION_COMMAND: self._configurations,
             self.CHECK_MISSING_COMP_FILES: self._check_for_missing_comparison_files,
+            self.BENCHMARK_COMMAND: self._benchmark,
+            self.UPDATE_BENCHMARK_COMMAND: self._update_benchmark,
         }
         return self
 
@@ -178,6 +187,50 @@ class GCodeCLI:
             else await configuration.update_comparison()
         )
 
+    async def _benchmark(self, run_config: RunnableConfiguration) -> str:
+        """Measure G-Code Configuration performance against its stored baseline."""
+        configuration = run_config.configuration
+        version = run_config.version
+        able_to_respond_with_error_code = self.args[self.ERROR_ON_REGRESSION]
+
+        if not isinstance(configuration, ProtocolGCodeConfirmConfig):
+            return f"Benchmarks are only supported for protocols: {configuration.name}"
+
+        config_path = configuration.get_configuration_paths(version)
+        metrics = await configuration.benchmark(version)
+
+        if not configuration.benchmark_baseline_exists(version):
+            if able_to_respond_with_error_code:
+                self.respond_with_error_code = True
+            lines = [f"  {name}: {value:.3f}" for name, value in metrics.dict().items()]
+            return "\n".join([f"{config_path}: no stored baseline", *lines])
+
+        comparisons = compare_to_baseline(
+            metrics, configuration.get_benchmark_baseline(version)
+        )
+        regressed = any(comparison.is_regression for comparison in comparisons)
+
+        if regressed and able_to_respond_with_error_code:
+            self.respond_with_error_code = True
+
+        status = "performance regressed" if regressed else "no regressions"
+        lines = [f"  {comparison}" for comparison in comparisons]
+        return "\n".join([f"{config_path}: {status}", *lines])
+
+    async def _update_benchmark(self, run_config: RunnableConfiguration) -> str:
+        """Create/Override benchmark baseline with metrics of execution."""
+        configuration = run_config.configuration
+        version = run_config.version
+
+        if not isinstance(configuration, ProtocolGCodeConfirmConfig):
+            return f"Benchmarks are only supported for protocols: {configuration.name}"
+
+        config_path = configuration.get_configuration_paths(version)
+        result = await configuration.update_benchmark(
+            version, include_wall_clock=self.args[self.WALL_CLOCK]
+        )
+        return f"{config_path}: {result}"
+
     def _check_for_missing_comparison_files(self) -> str:
         able_to_respond_with_error_code = self.args[self.ERROR_ON_MISSING_FILES]
         missing_files = set()
@@ -281,10 +334,19 @@ class GCodeCLI:
         elif passed_command_name == self.CHECK_MISSING_COMP_FILES:
             return [self._check_for_missing_comparison_files]
 
-        config_name = self.args[self.CONFIGURATION_NAME]
-        runnable_configurations = self._parse_runnable_configs(
-            self._get_config_matches(config_name)
-        )
+        # Benchmark commands can run every configuration that supports them,
+        # which is every protocol configuration
+        if self.args.get(self.ALL_CONFIGURATIONS):
+            config_strings = sorted(
+                config_path
+                for config_path, configuration in self.configurations.items()
+                if isinstance(configuration, ProtocolGCodeConfirmConfig)
+            )
+        else:
+            config_strings = self._get_config_matches(
+                self.args[self.CONFIGURATION_NAME]
+            )
+        runnable_configurations = self._parse_runnable_configs(config_strings)
 
         def async_partial(f: callable, *args: Any) -> callable:
             """Make the partial async."""
@@ -332,7 +394,9 @@ class GCodeCLI:
             f"{cls.CONFIGURATION_COMMAND} | "
             f"{cls.LOAD_COMPARISON_COMMAND} | "
             f"{cls.UPDATE_COMPARISON_COMMAND} | "
-            f"{cls.CHECK_MISSING_COMP_FILES}",
+            f"{cls.CHECK_MISSING_COMP_FILES} | "
+            f"{cls.BENCHMARK_COMMAND} | "
+            f"{cls.UPDATE_BENCHMARK_COMMAND}",
         )
 
         run_parser = subparsers.add_parser(
@@ -396,8 +460,59 @@ class GCodeCLI:
             help="Name of configuration you want to push",
         )
 
+        benchmark_parser = subparsers.add_parser(
+            cls.BENCHMARK_COMMAND,
+            help="Measure performance and compare it to the stored baseline",
+            formatter_class=argparse.RawTextHelpFormatter,
+        )
+        benchmark_parser.add_argument(
+            f"--{cls.ERROR_ON_REGRESSION}",
+            help="If set, return code 1 when a metric exceeds its threshold "
+            "or a configuration has no stored baseline",
+            action="store_true",
+            default=False,
+        )
+        cls._add_benchmark_configuration_arguments(
+            benchmark_parser, "Name of configuration you want to benchmark"
+        )
+
+        update_benchmark_parser = subparsers.add_parser(
+            cls.UPDATE_BENCHMARK_COMMAND,
+            help="Update benchmark baseline",
+            formatter_class=argparse.RawTextHelpFormatter,
+        )
+        update_benchmark_parser.add_argument(
+            f"--{cls.WALL_CLOCK}",
+            help="If set, also record wall-clock times, which depend on the machine",
+            action="store_true",
+            default=False,
+        )
+        cls._add_benchmark_configuration_arguments(
+            update_benchmark_parser,
+            "Name of configuration you want to record a baseline for",
+        )
+
         return parser
 
+    @classmethod
+    def _add_benchmark_configuration_arguments(
+        cls, parser: argparse.ArgumentParser, configuration_help: str
+    ) -> None:
+        """Take either a configuration name or --all."""
+        configuration_group = parser.add_mutually_exclusive_group(required=True)
+        configuration_group.add_argument(
+            "configuration_name",
+            type=str,
+            nargs="?",
+            help=configuration_help,
+        )
+        configuration_group.add_argument(
+            f"--{cls.ALL_CONFIGURATIONS}",
+            help="Use every protocol configuration",
+            action="store_true",
+            default=False,
+        )
+
     @property
     def respond_with_error(self) -> bool:
         """Whether ot not CLI should respond with error code on internal error."""
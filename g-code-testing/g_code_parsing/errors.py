@@ -50,3 +50,14 @@ class ConfigurationNotFoundError(ValueError):
 
         super().__init__(f'Configuration "{configuration_name}" not found')
         self.configuration_name = configuration_name
+
+
+class UnsupportedBaselineError(ValueError):
+    def __init__(self, baseline_path: str, format_version) -> None:
+
+        super().__init__(
+            f'Benchmark baseline "{baseline_path}" has unsupported format version '
+            f"{format_version}. Update it with the update-benchmark command."
+        )
+        self.baseline_path = baseline_path
+        self.format_version = format_version
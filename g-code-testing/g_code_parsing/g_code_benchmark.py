@@ -0,0 +1,224 @@
+"""Performance benchmarks for G-Code configurations.
+
+A benchmark records how long a protocol takes to analyze and run against the
+emulator, how much serial traffic it sends, and how long its moves would take
+on a robot. Results are stored as baselines, and a later run of the same
+configuration is a regression if any metric grows past its threshold.
+
+The wall-clock times depend on the machine, so checked-in baselines leave
+them out and only the deterministic metrics are compared.
+"""
+from __future__ import annotations
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from opentrons.drivers.smoothie_drivers.constants import GCODE as SMOOTHIE_G_CODE
+from opentrons.hardware_control.emulation.clock import EmulationClock
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import SmoothieSettings
+from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
+from pydantic import BaseModel, Field
+
+from g_code_parsing.errors import UnsupportedBaselineError
+from g_code_parsing.g_code import GCode
+from g_code_parsing.g_code_engine import RunTimes
+from g_code_parsing.g_code_watcher import WatcherData
+
+# Bump this when the baseline format changes incompatibly.
+BASELINE_FORMAT_VERSION = 1
+
+# Metrics that depend on the machine running the benchmark.
+WALL_CLOCK_METRICS = ("analysis_seconds", "run_seconds")
+
+
+class BenchmarkMetrics(BaseModel):
+    """Everything measured about one run of a configuration."""
+
+    analysis_seconds: float
+    run_seconds: float
+    serial_command_count: int
+    m400_count: int
+    emulated_motion_seconds: float
+
+
+class BaselineMetrics(BaseModel):
+    """The metrics stored in a baseline.
+
+    Wall-clock times are only stored for baselines recorded on the machine
+    that checks them.
+    """
+
+    analysis_seconds: Optional[float] = None
+    run_seconds: Optional[float] = None
+    serial_command_count: int
+    m400_count: int
+    emulated_motion_seconds: float
+
+
+class MetricThreshold(BaseModel):
+    """How far a metric may grow past its baseline before it is a regression."""
+
+    relative: float = 0.0
+    absolute: float = 0.0
+
+    def limit(self, baseline: float) -> float:
+        """Get the largest value that is not a regression."""
+        return baseline * (1 + self.relative) + self.absolute
+
+
+def default_thresholds() -> Dict[str, MetricThreshold]:
+    """Get the thresholds for a new baseline."""
+    return {
+        # Wall-clock times depend on the machine and its load,
+        # so only large slowdowns are flagged.
+        "analysis_seconds": MetricThreshold(relative=0.5, absolute=0.5),
+        "run_seconds": MetricThreshold(relative=0.5, absolute=1.0),
+        # The rest are deterministic.
+        "serial_command_count": MetricThreshold(),
+        "m400_count": MetricThreshold(),
+        "emulated_motion_seconds": MetricThreshold(relative=0.01, absolute=0.01),
+    }
+
+
+class BenchmarkBaseline(BaseModel):
+    """The stored metrics of a configuration, and the thresholds to check them."""
+
+    format_version: int = BASELINE_FORMAT_VERSION
+    metrics: BaselineMetrics
+    thresholds: Dict[str, MetricThreshold] = Field(default_factory=default_thresholds)
+
+    @staticmethod
+    def get_metrics(
+        metrics: BenchmarkMetrics, include_wall_clock: bool = False
+    ) -> BaselineMetrics:
+        """Get the metrics of a run to store as a baseline."""
+        exclude = None if include_wall_clock else set(WALL_CLOCK_METRICS)
+        return BaselineMetrics.parse_obj(metrics.dict(exclude=exclude))
+
+    @classmethod
+    def from_file(cls, path: Path) -> BenchmarkBaseline:
+        """Load a baseline file.
+
+        :raises UnsupportedBaselineError: If the file is from another format version
+        """
+        contents = json.loads(path.read_text())
+        format_version = contents.get("format_version")
+        if format_version != BASELINE_FORMAT_VERSION:
+            raise UnsupportedBaselineError(str(path), format_version)
+        return cls.parse_obj(contents)
+
+    def to_file(self, path: Path) -> None:
+        """Save the baseline, creating its directory if needed."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.json(indent=2, exclude_none=True) + "\n")
+
+
+@dataclass(frozen=True)
+class MetricComparison:
+    """A metric from a run compared against its baseline."""
+
+    name: str
+    baseline: float
+    actual: float
+    limit: float
+
+    @property
+    def is_regression(self) -> bool:
+        """Whether the metric grew past its threshold."""
+        return self.actual > self.limit
+
+    def __str__(self) -> str:
+        """Describe the comparison on one line."""
+        if self.baseline:
+            change = f"{(self.actual - self.baseline) / self.baseline:+.1%}"
+        else:
+            change = "n/a"
+        status = "REGRESSION" if self.is_regression else "ok"
+        return (
+            f"{self.name}: {self.actual:.3f} "
+            f"(baseline {self.baseline:.3f}, {change}, limit {self.limit:.3f}) "
+            f"{status}"
+        )
+
+
+def compare_to_baseline(
+    metrics: BenchmarkMetrics, baseline: BenchmarkBaseline
+) -> List[MetricComparison]:
+    """Compare each metric of a run against the baseline.
+
+    Metrics the baseline doesn't store are not compared.
+    """
+    thresholds = {**default_thresholds(), **baseline.thresholds}
+    baseline_values = baseline.metrics.dict()
+    return [
+        MetricComparison(
+            name=name,
+            baseline=baseline_values[name],
+            actual=actual,
+            limit=thresholds[name].limit(baseline_values[name]),
+        )
+        for name, actual in metrics.dict().items()
+        if baseline_values[name] is not None
+    ]
+
+
+def collect_metrics(
+    commands: Sequence[WatcherData],
+    run_times: RunTimes,
+    smoothie_settings: SmoothieSettings,
+) -> BenchmarkMetrics:
+    """Measure a run from the serial commands it sent.
+
+    :param commands: Every command sent, as recorded by GCodeWatcher
+    :param run_times: How long the run took
+    :param smoothie_settings: The settings the Smoothie was emulated with
+    :return: The run's metrics
+    """
+    serial_command_count = 0
+    m400_count = 0
+    for command in commands:
+        g_codes = GCode.from_raw_code(
+            command.raw_g_code, command.device, command.response
+        )
+        # Polling depends on how long the run took, not on what it did.
+        if all(g_code.is_polling_command() for g_code in g_codes):
+            continue
+        serial_command_count += 1
+        if command.device == GCode.SMOOTHIE_IDENT:
+            m400_count += sum(
+                1 for g_code in g_codes if g_code.g_code == SMOOTHIE_G_CODE.WAIT.value
+            )
+
+    return BenchmarkMetrics(
+        analysis_seconds=run_times.analysis_seconds,
+        run_seconds=run_times.run_seconds,
+        serial_command_count=serial_command_count,
+        m400_count=m400_count,
+        emulated_motion_seconds=get_emulated_motion_time(commands, smoothie_settings),
+    )
+
+
+def get_emulated_motion_time(
+    commands: Sequence[WatcherData], smoothie_settings: SmoothieSettings
+) -> float:
+    """Get how long the Smoothie commands' moves and dwells would take on a robot.
+
+    The commands are replayed through a kinematic Smoothie emulator whose clock
+    never moves, so the time it has queued is the total time of every move.
+    Moves are measured from the homed position, where a protocol run starts.
+    """
+    emulator = SmoothieEmulator(
+        parser=Parser(),
+        settings=smoothie_settings,
+        clock=EmulationClock(monotonic=lambda: 0.0),
+    )
+    emulator.handle(f"{SMOOTHIE_G_CODE.HOME.value} XYZABC")
+    homed = emulator.get_queued_time()
+
+    for command in commands:
+        if command.device == GCode.SMOOTHIE_IDENT:
+            emulator.handle(command.raw_g_code)
+
+    return emulator.get_queued_time() - homed
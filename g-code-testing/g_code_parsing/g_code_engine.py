@@ -2,8 +2,9 @@ import asyncio
 from pathlib import Path
 import time
 from multiprocessing import Process
-from typing import AsyncGenerator, Callable, Iterator, Union
+from typing import AsyncGenerator, Callable, Iterator, Optional, Union
 from collections import namedtuple
+from dataclasses import dataclass
 
 from opentrons import APIVersion
 from opentrons.hardware_control.emulation.settings import Settings
@@ -37,6 +38,14 @@ from opentrons_shared_data.robot.dev_types import RobotType
 Protocol = namedtuple("Protocol", ["text", "filename", "filelike"])
 
 
+@dataclass
+class RunTimes:
+    """Wall-clock seconds spent loading and running a protocol."""
+
+    analysis_seconds: float = 0.0
+    run_seconds: float = 0.0
+
+
 class GCodeEngine:
     """
     Class for running a thing against the emulator.
@@ -119,17 +128,40 @@ class GCodeEngine:
 
     @asynccontextmanager
     async def run_protocol(
-        self, path: str, version: Union[APIVersion, int]
+        self,
+        path: str,
+        version: Union[APIVersion, int],
+        run_times: Optional[RunTimes] = None,
     ) -> AsyncGenerator:
         """
         Runs passed protocol file and collects all G-Code I/O from it.
         Will cleanup emulation after execution
         :param path: Path to file
         :param version: API version to use
+        :param run_times: Optional RunTimes to record how long each phase took
         :return: GCodeProgram with all the parsed data
         """
+        async with self.watch_protocol(path, version, run_times) as watcher:
+            yield GCodeProgram.from_g_code_watcher(watcher)
+
+    @asynccontextmanager
+    async def watch_protocol(
+        self,
+        path: str,
+        version: Union[APIVersion, int],
+        run_times: Optional[RunTimes] = None,
+    ) -> AsyncGenerator:
+        """
+        Runs passed protocol file and collects all the serial I/O from it,
+        including polling. Will cleanup emulation after execution
+        :param path: Path to file
+        :param version: API version to use
+        :param run_times: Optional RunTimes to record how long each phase took
+        :return: GCodeWatcher with every command sent
+        """
         file_path = Path(get_configuration_dir(), path)
         robot_type: RobotType = "OT-2 Standard"
+        run_times = run_times if run_times is not None else RunTimes()
 
         with self._emulate() as hardware:
             if (isinstance(version, APIVersion) and version >= APIVersion(2, 14)) or (
@@ -164,18 +196,27 @@ class GCodeEngine:
                     hardware_api=hardware,  # type: ignore
                 )
                 with GCodeWatcher(emulator_settings=self._config) as watcher:
-                    await protocol_runner.run(protocol_source=protocol_source)
-                    yield GCodeProgram.from_g_code_watcher(watcher)
+                    start = time.perf_counter()
+                    await protocol_runner.load(protocol_source)
+                    loaded = time.perf_counter()
+                    await protocol_runner.run()
+                    run_times.analysis_seconds = loaded - start
+                    run_times.run_seconds = time.perf_counter() - loaded
+                    yield watcher
             elif isinstance(version, APIVersion) and version < APIVersion(2, 14):
                 protocol = self._get_protocol(file_path)
                 context = create_protocol_context(
                     api_version=version,
                     hardware_api=hardware,
                 )
+                start = time.perf_counter()
                 parsed_protocol = parse(protocol.text, protocol.filename)
+                parsed = time.perf_counter()
                 with GCodeWatcher(emulator_settings=self._config) as watcher:
                     execute.run_protocol(parsed_protocol, context=context)
-                yield GCodeProgram.from_g_code_watcher(watcher)
+                run_times.analysis_seconds = parsed - start
+                run_times.run_seconds = time.perf_counter() - parsed
+                yield watcher
             else:
                 raise ValueError(f"APIVersion is {version}")
 
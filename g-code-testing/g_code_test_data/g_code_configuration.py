@@ -16,7 +16,13 @@ from typing_extensions import (
 
 import pytest
 from _pytest.mark.structures import Mark
-from g_code_parsing.g_code_engine import GCodeEngine
+from g_code_parsing.g_code_benchmark import (
+    BenchmarkBaseline,
+    BenchmarkMetrics,
+    collect_metrics,
+)
+from g_code_parsing.errors import UnsupportedBaselineError
+from g_code_parsing.g_code_engine import GCodeEngine, RunTimes
 from g_code_parsing.g_code_program.supported_text_modes import SupportedTextModes
 from opentrons.hardware_control.emulation.settings import Settings, SmoothieSettings
 from opentrons.protocols.api_support.types import APIVersion
@@ -30,6 +36,7 @@ from pydantic import (
 
 BUCKET_NAME = "g-code-comparison"
 COMPARISON_FILES_FOLDER_PATH = os.path.join(os.path.dirname(__file__), 'comparison_files')
+BENCHMARK_BASELINES_FOLDER_PATH = os.path.join(os.path.dirname(__file__), 'benchmark_baselines')
 
 
 class SharedFunctionsMixin:
@@ -90,6 +97,42 @@ class ProtocolGCodeConfirmConfig(BaseModel, SharedFunctionsMixin):
         async with GCodeEngine(self.settings).run_protocol(self.path, version) as program:
             return program.get_text_explanation(SupportedTextModes.CONCISE)
 
+    def get_benchmark_file_path(self, version: APIVersion) -> str:
+        """Get the path of the benchmark baseline file."""
+        return os.path.join(self.results_dir, version.__str__(), f"{self.name}.json")
+
+    def _get_full_benchmark_path(self, version: APIVersion) -> Path:
+        return Path(BENCHMARK_BASELINES_FOLDER_PATH, self.get_benchmark_file_path(version))
+
+    def benchmark_baseline_exists(self, version: APIVersion) -> bool:
+        return self._get_full_benchmark_path(version).exists()
+
+    def get_benchmark_baseline(self, version: APIVersion) -> BenchmarkBaseline:
+        """Load the benchmark baseline."""
+        return BenchmarkBaseline.from_file(self._get_full_benchmark_path(version))
+
+    async def benchmark(self, version: APIVersion) -> BenchmarkMetrics:
+        """Run config and measure its performance."""
+        run_times = RunTimes()
+        engine = GCodeEngine(self.settings)
+        async with engine.watch_protocol(self.path, version, run_times) as watcher:
+            commands = watcher.get_command_list()
+        return collect_metrics(commands, run_times, self.settings.smoothie)
+
+    async def update_benchmark(self, version: APIVersion, include_wall_clock: bool = False) -> str:
+        """Run config and override the benchmark baseline with its metrics.
+
+        Wall-clock times are only stored if include_wall_clock is set.
+        The thresholds of an existing baseline are kept.
+        """
+        metrics = BenchmarkBaseline.get_metrics(await self.benchmark(version), include_wall_clock)
+        try:
+            baseline = self.get_benchmark_baseline(version).copy(update={'metrics': metrics})
+        except (FileNotFoundError, UnsupportedBaselineError):
+            baseline = BenchmarkBaseline(metrics=metrics)
+        baseline.to_file(self._get_full_benchmark_path(version))
+        return "Baseline updated successfully"
+
 
 class HTTPGCodeConfirmConfig(BaseModel, SharedFunctionsMixin):
     name: constr(regex=r'^[a-z0-9_]*$')
@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+
+import pytest
+from opentrons.hardware_control.emulation.settings import SmoothieSettings
+
+from g_code_parsing.errors import UnsupportedBaselineError
+from g_code_parsing.g_code_benchmark import (
+    BaselineMetrics,
+    BenchmarkBaseline,
+    BenchmarkMetrics,
+    MetricThreshold,
+    collect_metrics,
+    compare_to_baseline,
+)
+from g_code_parsing.g_code_engine import RunTimes
+from g_code_parsing.g_code_watcher import WatcherData
+
+
+@pytest.fixture
+def metrics() -> BenchmarkMetrics:
+    return BenchmarkMetrics(
+        analysis_seconds=1.0,
+        run_seconds=10.0,
+        serial_command_count=100,
+        m400_count=20,
+        emulated_motion_seconds=30.0,
+    )
+
+
+def _all_metrics(metrics: BenchmarkMetrics) -> BaselineMetrics:
+    return BenchmarkBaseline.get_metrics(metrics, include_wall_clock=True)
+
+
+def test_collect_metrics() -> None:
+    commands = [
+        WatcherData("M203.1 X600 Y400", "smoothie", "ok\r\nok\r\n"),
+        WatcherData("M204 S10000 X3000 Y2000", "smoothie", "ok\r\nok\r\n"),
+        WatcherData("G0 F6000 X358 M400", "smoothie", "ok\r\nok\r\n"),
+        WatcherData("M105", "tempdeck", "T:86.500 C:66.223\r\nok\r\nok\r\n"),
+        WatcherData("M105", "tempdeck", "T:86.500 C:66.223\r\nok\r\nok\r\n"),
+        WatcherData("G4 P0.5 M400", "smoothie", "ok\r\nok\r\n"),
+        WatcherData("M104 S86", "tempdeck", "ok\r\nok\r\n"),
+    ]
+
+    result = collect_metrics(
+        commands,
+        RunTimes(analysis_seconds=1.5, run_seconds=2.5),
+        SmoothieSettings(),
+    )
+
+    assert result.analysis_seconds == 1.5
+    assert result.run_seconds == 2.5
+    # Tempdeck polling is not counted
+    assert result.serial_command_count == 5
+    assert result.m400_count == 2
+    # The move is 60mm from the homed X position, at 100mm/s with 3000mm/s^2,
+    # then a 0.5s dwell
+    assert result.emulated_motion_seconds == pytest.approx(0.6333 + 0.5, abs=1e-3)
+
+
+def test_no_regression(metrics: BenchmarkMetrics) -> None:
+    baseline = BenchmarkBaseline(metrics=_all_metrics(metrics))
+
+    result = compare_to_baseline(metrics, baseline)
+
+    assert [comparison.name for comparison in result] == list(metrics.dict().keys())
+    assert not any(comparison.is_regression for comparison in result)
+
+
+def test_regression(metrics: BenchmarkMetrics) -> None:
+    baseline = BenchmarkBaseline(metrics=_all_metrics(metrics))
+    actual = metrics.copy(
+        update={
+            # Within the wall-clock threshold
+            "run_seconds": 15.0,
+            # Any extra command is a regression
+            "serial_command_count": 101,
+            # Fewer M400s is an improvement
+            "m400_count": 10,
+        }
+    )
+
+    result = {c.name: c for c in compare_to_baseline(actual, baseline)}
+
+    assert not result["run_seconds"].is_regression
+    assert result["serial_command_count"].is_regression
+    assert not result["m400_count"].is_regression
+    assert "REGRESSION" in str(result["serial_command_count"])
+
+
+def test_custom_threshold(metrics: BenchmarkMetrics) -> None:
+    baseline = BenchmarkBaseline(
+        metrics=_all_metrics(metrics),
+        thresholds={"serial_command_count": MetricThreshold(absolute=5)},
+    )
+    actual = metrics.copy(update={"serial_command_count": 105})
+
+    result = {c.name: c for c in compare_to_baseline(actual, baseline)}
+
+    assert not result["serial_command_count"].is_regression
+    # Metrics without a stored threshold use the default
+    assert result["m400_count"].limit == 20
+
+
+def test_baseline_without_wall_clock(tmp_path: Path, metrics: BenchmarkMetrics) -> None:
+    path = tmp_path / "baseline.json"
+    BenchmarkBaseline(metrics=BenchmarkBaseline.get_metrics(metrics)).to_file(path)
+    actual = metrics.copy(update={"analysis_seconds": 100.0, "run_seconds": 100.0})
+
+    result = compare_to_baseline(actual, BenchmarkBaseline.from_file(path))
+
+    assert json.loads(path.read_text())["metrics"].keys() == {
+        "serial_command_count",
+        "m400_count",
+        "emulated_motion_seconds",
+    }
+    # Wall-clock times are not compared
+    assert [comparison.name for comparison in result] == [
+        "serial_command_count",
+        "m400_count",
+        "emulated_motion_seconds",
+    ]
+    assert not any(comparison.is_regression for comparison in result)
+
+
+def test_baseline_round_trip(tmp_path: Path, metrics: BenchmarkMetrics) -> None:
+    path = tmp_path / "protocols" / "2.13" / "basic_smoothie.json"
+    baseline = BenchmarkBaseline(metrics=_all_metrics(metrics))
+
+    baseline.to_file(path)
+
+    assert BenchmarkBaseline.from_file(path) == baseline
+
+
+def test_baseline_format_version(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    path.write_text('{"format_version": 0, "metrics": {}}')
+
+    with pytest.raises(UnsupportedBaselineError):
+        BenchmarkBaseline.from_file(path)
@@ -117,3 +117,23 @@ async def test_glob(config: DataForTest):
         arg_list.extend(command.args)
 
     assert set(arg_list) == config.expected_configurations
+
+
+@pytest.mark.parametrize("command", ["benchmark", "update-benchmark"])
+async def test_benchmark_all(command: str):
+    sys.argv = ["cli.py", command, "--all"]
+    cli = await GCodeCLI.create()
+    cli.configurations = MOCK_CONFIGURATIONS_DICT
+    arg_list = []
+    for runnable_command in cli.get_runnable_commands(is_async=False):
+        arg_list.extend(runnable_command.args)
+
+    # Every protocol configuration, and none of the HTTP ones
+    assert set(arg_list) == {
+        BASIC_SMOOTHIE_212,
+        BASIC_SMOOTHIE_213,
+        TWO_MODULES_212,
+        TWO_MODULES_213,
+        TWO_SINGLE_CHANNEL_212,
+        TWO_SINGLE_CHANNEL_213,
+    }
@@ -196,10 +196,12 @@ class CanMessenger:
             )
         )
         data = message.payload.serialize()
-        log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
-        )
+        # Formatting the payload costs more than sending it.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
+                f"payload: {message.payload}"
+            )
         await self._drive.send(
             message=CanMessage(arbitration_id=arbitration_id, data=data)
         )
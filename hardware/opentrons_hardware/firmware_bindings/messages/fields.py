@@ -1,7 +1,7 @@
 """Custom payload fields."""
 from __future__ import annotations
 
-from typing import Iterable, List, Iterator, Optional, Tuple
+from typing import Iterable, List, Iterator, Optional, Tuple, Union
 
 import binascii
 import enum
@@ -196,8 +196,12 @@ class ToolField(utils.UInt8Field):
         return f"{self.__class__.__name__}(value={tool_val})"
 
 
-class FirmwareUpdateDataField(utils.BinaryFieldBase[bytes]):
-    """The data field of FirmwareUpdateData."""
+class FirmwareUpdateDataField(utils.BinaryFieldBase[Union[bytes, memoryview]]):
+    """The data field of FirmwareUpdateData.
+
+    The data may be a memoryview of a firmware image, so that building a
+    message doesn't copy it.
+    """
 
     # this needs to be a multiple of 8
     NUM_BYTES = 48
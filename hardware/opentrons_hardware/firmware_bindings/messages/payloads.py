@@ -2,9 +2,10 @@
 # TODO (amit, 2022-01-26): Figure out why using annotations import ruins
 #  dataclass fields interpretation.
 #  from __future__ import annotations
+import struct
 from dataclasses import dataclass, field, asdict
 from . import message_definitions
-from typing import Iterator
+from typing import Iterator, Union
 
 from .fields import (
     FirmwareShortSHADataField,
@@ -29,6 +30,7 @@ from .fields import (
     OptionalRevisionField,
 )
 from .. import utils
+from ..utils.binary_serializable import SerializationException
 
 
 @dataclass(eq=False)
@@ -323,9 +325,42 @@ class FirmwareUpdateData(FirmwareUpdateWithAddress):
                 f" {FirmwareUpdateDataField.NUM_BYTES} bytes got {data_length}."
             )
 
+    def serialize(self) -> bytes:
+        """Serialize into a byte buffer.
+
+        `struct` can't pack a memoryview, so the data is joined in between
+        the packed fields around it, instead of first being copied into bytes.
+        """
+        data = self.data.value
+        if isinstance(data, bytes):
+            return super().serialize()
+        try:
+            return b"".join(
+                (
+                    struct.pack(
+                        f"{self.ENDIAN}{utils.UInt32Field.FORMAT * 2}"
+                        f"{utils.UInt8Field.FORMAT * 2}",
+                        self.message_index.value,
+                        self.address.value,
+                        self.num_bytes.value,
+                        self.reserved.value,
+                    ),
+                    data,
+                    bytes(FirmwareUpdateDataField.NUM_BYTES - len(data)),
+                    struct.pack(
+                        f"{self.ENDIAN}{utils.UInt16Field.FORMAT}", self.checksum.value
+                    ),
+                )
+            )
+        except struct.error as e:
+            raise SerializationException(str(e))
+
     @classmethod
     def create(
-        cls, address: int, data: bytes, message_index: int = None  # type: ignore[assignment]
+        cls,
+        address: int,
+        data: Union[bytes, memoryview],
+        message_index: int = None,  # type: ignore[assignment]
     ) -> "FirmwareUpdateData":
         """Create a firmware update data payload."""
         # this is a special case, we normally instansiate message_index
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
+from dataclasses import dataclass, fields
 from typing import TypeVar, Generic, Type
 
 
@@ -158,7 +158,8 @@ class BinarySerializable:
             Byte buffer
         """
         string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        # Not dataclasses.astuple, which deep copies every field.
+        vals = [getattr(self, f.name).value for f in fields(self)]
         try:
             return struct.pack(string, *vals)
         except struct.error as e:
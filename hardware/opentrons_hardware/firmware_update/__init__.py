@@ -5,6 +5,7 @@ from .initiator import (
 )
 from .downloader import FirmwareUpdateDownloader
 from .hex_file import from_hex_file_path, from_hex_file, HexRecordProcessor
+from .firmware_image import FirmwareImage, load_firmware_image
 from .eraser import FirmwareUpdateEraser
 from .run import RunUpdate
 from .utils import check_firmware_updates
@@ -16,6 +17,8 @@ __all__ = [
     "from_hex_file_path",
     "from_hex_file",
     "HexRecordProcessor",
+    "FirmwareImage",
+    "load_firmware_image",
     "RunUpdate",
     "check_firmware_updates",
 ]
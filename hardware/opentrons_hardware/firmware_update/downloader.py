@@ -1,7 +1,10 @@
 """Firmware download."""
 import asyncio
 import binascii
+import bisect
 import logging
+from collections import deque
+from dataclasses import dataclass
 
 from opentrons_hardware.firmware_bindings import NodeId
 from opentrons_hardware.firmware_bindings.constants import ErrorCode
@@ -12,16 +15,106 @@ from opentrons_hardware.drivers.can_bus.can_messenger import (
     WaitableCallback,
 )
 from opentrons_hardware.firmware_update.errors import ErrorResponse, TimeoutResponse
+from opentrons_hardware.firmware_update.firmware_image import FirmwareImage
 from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor
 from opentrons_hardware.firmware_bindings.messages import (
     message_definitions,
     payloads,
     fields,
 )
-from typing import AsyncIterator
+from typing import AsyncIterator, Deque, Dict, List, NamedTuple, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Number of data messages sent ahead of their acknowledgements.
+DEFAULT_WINDOW_SIZE = 8
+
+# Number of times a data message is resent after its ack times out.
+DEFAULT_MAX_RETRIES = 2
+
+# Shortest time to wait for an ack, even if its deadline has already passed,
+# so that an ack that has already arrived is still read.
+_MIN_ACK_WAIT_SECONDS = 0.01
+
+
+class DownloadProgress(NamedTuple):
+    """Progress of a firmware download."""
+
+    progress: float
+    """Fraction of data messages acknowledged, from 0 to 1."""
+
+    bytes_per_second: float
+    """Average rate of acknowledged data since the download started."""
+
+
+@dataclass
+class _InFlight:
+    """A data message waiting for its acknowledgement."""
+
+    index: int
+    sent_at: float
+
+
+class _SlidingWindow:
+    """Bookkeeping for which data messages to send, resend, and wait on."""
+
+    def __init__(self, num_messages: int, size: int) -> None:
+        self.size = size
+        self.num_acked = 0
+        self._unsent: Deque[int] = deque(range(num_messages))
+        self._to_resend: List[int] = []
+        self._in_flight: Dict[int, _InFlight] = {}
+        self._attempts = [0] * num_messages
+        self._acked = [False] * num_messages
+
+    @property
+    def num_in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def done(self) -> bool:
+        return self.num_acked == len(self._acked)
+
+    def next_to_send(self) -> Optional[int]:
+        """Get the next message to send, if there's room in the window.
+
+        Messages to resend go first, in order.
+        """
+        while len(self._in_flight) < self.size:
+            if self._to_resend:
+                index = self._to_resend.pop(0)
+            elif self._unsent:
+                index = self._unsent.popleft()
+            else:
+                return None
+            if not self._acked[index]:
+                return index
+        return None
+
+    def mark_sent(self, index: int, sent_at: float) -> None:
+        """Record a message as in flight."""
+        self._attempts[index] += 1
+        self._in_flight[index] = _InFlight(index=index, sent_at=sent_at)
+
+    def oldest(self) -> _InFlight:
+        return min(self._in_flight.values(), key=lambda f: f.sent_at)
+
+    def attempts(self, index: int) -> int:
+        return self._attempts[index]
+
+    def ack(self, index: int) -> bool:
+        """Mark a message as acknowledged, returning False if it already was."""
+        if self._acked[index]:
+            return False
+        self._acked[index] = True
+        self._in_flight.pop(index, None)
+        self.num_acked += 1
+        return True
+
+    def resend(self, index: int) -> None:
+        """Queue a message in flight to be sent again."""
+        self._in_flight.pop(index, None)
+        bisect.insort(self._to_resend, index)
+
 
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
@@ -33,52 +126,95 @@ class FirmwareUpdateDownloader:
     async def run(
         self,
         node_id: NodeId,
-        hex_processor: HexRecordProcessor,
+        hex_processor: Union[HexRecordProcessor, FirmwareImage],
         ack_wait_seconds: float,
-    ) -> AsyncIterator[float]:
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncIterator[DownloadProgress]:
         """Download hex record chunks to node.
 
+        Up to `window_size` data messages are kept in flight, so throughput
+        isn't limited by the round trip to the node. Acks are matched to
+        messages by address. If an ack times out, only that message is
+        resent; messages still within their own ack deadline are not. If that
+        happens with more than one message in flight, the node is assumed to
+        be a bootloader that can only handle one message at a time, and the
+        rest of the download uses a window of 1.
+
+        A message is only resent if the node never acknowledged it. If the
+        node did get it and only its ack was lost, the node gets that
+        message twice.
+
         Args:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK.
+            window_size: Maximum number of unacknowledged data messages.
+            max_retries: Number of times to resend a data message.
 
         Returns:
             None
         """
         chunks = list(hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES))
         total_chunks = len(chunks)
-        with WaitableCallback(self._messenger) as reader:
-            num_messages = 0
-            crc32 = 0
-            for chunk in chunks:
-                logger.debug(
-                    f"Sending chunk {num_messages} to address {chunk.address:x}."
+        # A FirmwareImage's chunks are memoryviews of the image, and are sent
+        # without being copied. A HexRecordProcessor's are lists of ints.
+        chunk_data = [
+            chunk.data if isinstance(chunk.data, memoryview) else bytes(chunk.data)
+            for chunk in chunks
+        ]
+        data_messages = [
+            message_definitions.FirmwareUpdateData(
+                payload=payloads.FirmwareUpdateData.create(
+                    address=chunk.address, data=data
                 )
-                # Create and send message from this chunk
-                data = bytes(chunk.data)
-                data_message = message_definitions.FirmwareUpdateData(
-                    payload=payloads.FirmwareUpdateData.create(
-                        address=chunk.address, data=data
-                    )
-                )
-                await self._messenger.send(node_id=node_id, message=data_message)
+            )
+            for chunk, data in zip(chunks, chunk_data)
+        ]
+        index_by_address = {chunk.address: i for i, chunk in enumerate(chunks)}
+
+        crc32 = 0
+        for data in chunk_data:
+            crc32 = binascii.crc32(data, crc32)
+
+        with WaitableCallback(self._messenger) as reader:
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            window = _SlidingWindow(num_messages=total_chunks, size=window_size)
+            acked_bytes = 0
+
+            while not window.done():
+                await self._fill_window(node_id, window, data_messages)
+                oldest = window.oldest()
                 try:
                     # Wait for ack.
-                    await asyncio.wait_for(
-                        self._wait_data_message_ack(node_id, reader), ack_wait_seconds
+                    ack = await asyncio.wait_for(
+                        self._wait_data_message_ack(node_id, reader),
+                        max(
+                            oldest.sent_at + ack_wait_seconds - loop.time(),
+                            _MIN_ACK_WAIT_SECONDS,
+                        ),
                     )
                 except asyncio.TimeoutError:
-                    raise TimeoutResponse(data_message)
+                    if window.attempts(oldest.index) > max_retries:
+                        raise TimeoutResponse(data_messages[oldest.index])
+                    self._handle_ack_timeout(node_id, window, oldest.index)
+                    continue
 
-                crc32 = binascii.crc32(data, crc32)
-                num_messages += 1
-                yield num_messages / total_chunks
+                index = index_by_address.get(ack.payload.address.value, -1)
+                # Ignore late acks for messages that have since been resent.
+                if index >= 0 and window.ack(index):
+                    acked_bytes += len(chunks[index].data)
+                    elapsed = loop.time() - start_time
+                    yield DownloadProgress(
+                        progress=window.num_acked / total_chunks,
+                        bytes_per_second=acked_bytes / elapsed if elapsed else 0.0,
+                    )
 
             # Create and send firmware update complete message.
             complete_message = message_definitions.FirmwareUpdateComplete(
                 payload=payloads.FirmwareUpdateComplete(
-                    num_messages=UInt32Field(num_messages), crc32=UInt32Field(crc32)
+                    num_messages=UInt32Field(total_chunks), crc32=UInt32Field(crc32)
                 )
             )
             await self._messenger.send(node_id=node_id, message=complete_message)
@@ -90,17 +226,52 @@ class FirmwareUpdateDownloader:
             except asyncio.TimeoutError:
                 raise TimeoutResponse(complete_message)
 
+    async def _fill_window(
+        self,
+        node_id: NodeId,
+        window: _SlidingWindow,
+        data_messages: List[message_definitions.FirmwareUpdateData],
+    ) -> None:
+        """Send data messages until the window is full."""
+        loop = asyncio.get_running_loop()
+        index = window.next_to_send()
+        while index is not None:
+            message = data_messages[index]
+            logger.debug(
+                f"Sending chunk {index} to address {message.payload.address.value:x}."
+            )
+            await self._messenger.send(node_id=node_id, message=message)
+            window.mark_sent(index, sent_at=loop.time())
+            index = window.next_to_send()
+
     @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
+    def _handle_ack_timeout(
+        node_id: NodeId, window: _SlidingWindow, index: int
+    ) -> None:
+        """Shrink the window to 1 and resend the message whose ack timed out."""
+        if window.size > 1:
+            logger.warning(
+                f"Timed out waiting for ack from {node_id.name} with "
+                f"{window.num_in_flight} chunks in flight, "
+                "continuing one chunk at a time."
+            )
+            window.size = 1
+        window.resend(index)
+
+    @staticmethod
+    async def _wait_data_message_ack(
+        node_id: NodeId, reader: WaitableCallback
+    ) -> message_definitions.FirmwareUpdateDataAcknowledge:
         """Wait for response to data."""
-        async for response, arbitration_id in reader:
+        while True:
+            response, arbitration_id = await reader.read()
             if arbitration_id.parts.originating_node_id == node_id:
                 if isinstance(
                     response, message_definitions.FirmwareUpdateDataAcknowledge
                 ):
                     if response.payload.error_code.value != ErrorCode.ok:
                         raise ErrorResponse(response)
-                    break
+                    return response
 
     @staticmethod
     async def _wait_update_complete_ack(
@@ -0,0 +1,256 @@
+"""Pre-parsed firmware images, cached next to their hex files."""
+from __future__ import annotations
+import binascii
+import hashlib
+import io
+import logging
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Generator, Iterable, List, Optional
+
+from typing_extensions import Final
+
+from .hex_file import (
+    BadChunkSizeException,
+    Chunk,
+    HexFileException,
+    HexRecord,
+    HexRecordProcessor,
+    from_hex_file,
+)
+
+log = logging.getLogger(__name__)
+
+_MAGIC: Final = b"OTFWIMG1"
+# magic, start address, crc32, segment count, data length
+_HEADER: Final = struct.Struct("<8sLLLL")
+# address, offset into data, length
+_SEGMENT: Final = struct.Struct("<LLL")
+
+# Images loaded by this process, keyed by the hex file's content hash.
+_loaded: Dict[str, FirmwareImage] = {}
+
+
+class CorruptImageException(HexFileException):
+    """A cached firmware image doesn't match its own header."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A contiguous run of memory in a firmware image."""
+
+    address: int
+    offset: int
+    length: int
+
+
+class FirmwareImage:
+    """The data of a hex file as a single binary image.
+
+    Contiguous data records are packed together, and a list of segments
+    maps the packed data back to device addresses. Chunks are served as
+    memoryview slices of the image, without copying.
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        segments: List[Segment],
+        start_address: int,
+        content_hash: str,
+    ) -> None:
+        """Constructor."""
+        self._data = data
+        self._segments = segments
+        self._start_address = start_address
+        self._content_hash = content_hash
+        self._crc32 = binascii.crc32(data)
+
+    @classmethod
+    def from_hex_records(
+        cls, records: Iterable[HexRecord], content_hash: str
+    ) -> FirmwareImage:
+        """Build an image from parsed hex records."""
+        processor = HexRecordProcessor(records)
+        data = bytearray()
+        segments: List[Segment] = []
+        # Chunks are bounded by discontinuities in the hex file, so the
+        # largest chunk size yields one chunk per contiguous segment.
+        for chunk in processor.process(chunk_size=2**32):
+            segments.append(
+                Segment(address=chunk.address, offset=len(data), length=len(chunk.data))
+            )
+            data += bytes(chunk.data)
+        return cls(
+            data=bytes(data),
+            segments=segments,
+            start_address=processor.start_address,
+            content_hash=content_hash,
+        )
+
+    @classmethod
+    def from_bytes(cls, serialized: bytes, content_hash: str) -> FirmwareImage:
+        """Load an image saved with `to_bytes`."""
+        try:
+            (
+                magic,
+                start_address,
+                crc32,
+                num_segments,
+                data_length,
+            ) = _HEADER.unpack_from(serialized)
+        except struct.error as e:
+            raise CorruptImageException("Image header is truncated.") from e
+        if magic != _MAGIC:
+            raise CorruptImageException(f"Unknown image format {magic!r}.")
+
+        segments_end = _HEADER.size + num_segments * _SEGMENT.size
+        if len(serialized) != segments_end + data_length:
+            raise CorruptImageException("Image size does not match its header.")
+
+        segments = [
+            Segment(*_SEGMENT.unpack_from(serialized, _HEADER.size + i * _SEGMENT.size))
+            for i in range(num_segments)
+        ]
+        image = cls(
+            data=serialized[segments_end:],
+            segments=segments,
+            start_address=start_address,
+            content_hash=content_hash,
+        )
+        if image.crc32 != crc32:
+            raise CorruptImageException("Image data does not match its CRC.")
+        return image
+
+    def to_bytes(self) -> bytes:
+        """Serialize the image."""
+        header = _HEADER.pack(
+            _MAGIC,
+            self._start_address,
+            self._crc32,
+            len(self._segments),
+            len(self._data),
+        )
+        segments = b"".join(
+            _SEGMENT.pack(s.address, s.offset, s.length) for s in self._segments
+        )
+        return header + segments + self._data
+
+    @property
+    def start_address(self) -> int:
+        """Get the start address."""
+        return self._start_address
+
+    @property
+    def content_hash(self) -> str:
+        """Get the hash of the hex file this image was built from."""
+        return self._content_hash
+
+    @property
+    def crc32(self) -> int:
+        """Get the CRC32 of all the image's data, in address order."""
+        return self._crc32
+
+    @property
+    def segments(self) -> List[Segment]:
+        """Get the image's contiguous segments."""
+        return list(self._segments)
+
+    def __len__(self) -> int:
+        """Get the number of data bytes in the image."""
+        return len(self._data)
+
+    def process(self, chunk_size: int) -> Generator[Chunk, None, None]:
+        """Split the image into chunks.
+
+        This produces the same chunks as `HexRecordProcessor.process`,
+        except that each chunk's data is a memoryview into the image.
+
+        Args:
+            chunk_size: The number of bytes in each chunk.
+
+        Returns:
+            Generates chunks.
+        """
+        if chunk_size <= 0:
+            raise BadChunkSizeException("chunk size must be greater than 0.")
+
+        view = memoryview(self._data)
+        for segment in self._segments:
+            for start in range(0, segment.length, chunk_size):
+                length = min(chunk_size, segment.length - start)
+                offset = segment.offset + start
+                yield Chunk(
+                    address=segment.address + start,
+                    data=view[offset : offset + length],
+                )
+
+
+def cache_path_for(hex_path: Path, content_hash: str) -> Path:
+    """Get where the image for a hex file with this content is cached."""
+    return hex_path.with_name(f".{hex_path.name}.{content_hash[:16]}.fwimage")
+
+
+def load_firmware_image(hex_path: Path) -> FirmwareImage:
+    """Get the firmware image for a hex file, parsing it only if needed.
+
+    Images are cached in memory and in a file next to the hex file,
+    both keyed by the hash of the hex file's contents, so a hex file
+    is parsed once no matter how many times it is flashed. If the cache
+    file can't be written, for example on a read-only filesystem, only
+    the in-memory cache is used.
+    """
+    hex_contents = hex_path.read_bytes()
+    content_hash = hashlib.sha256(hex_contents).hexdigest()
+
+    image = _loaded.get(content_hash)
+    if image is not None:
+        return image
+
+    cache_path = cache_path_for(hex_path, content_hash)
+    image = _read_cached_image(cache_path, content_hash)
+    if image is None:
+        log.info(f"Parsing firmware image from {hex_path}.")
+        image = FirmwareImage.from_hex_records(
+            from_hex_file(io.StringIO(hex_contents.decode("ascii"))),
+            content_hash=content_hash,
+        )
+        _write_cached_image(cache_path, image)
+
+    _loaded[content_hash] = image
+    return image
+
+
+def _read_cached_image(cache_path: Path, content_hash: str) -> Optional[FirmwareImage]:
+    try:
+        return FirmwareImage.from_bytes(cache_path.read_bytes(), content_hash)
+    except FileNotFoundError:
+        return None
+    except (OSError, CorruptImageException) as e:
+        log.warning(f"Ignoring unusable firmware image cache {cache_path}: {e}")
+        return None
+
+
+def _write_cached_image(cache_path: Path, image: FirmwareImage) -> None:
+    # Write to a temporary file and rename, so a reader never sees
+    # a partially-written image.
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=".fwimage-")
+    except OSError as e:
+        log.debug(f"Not caching firmware image at {cache_path}: {e}")
+        return
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(image.to_bytes())
+        os.replace(temp_name, cache_path)
+    except OSError as e:
+        log.debug(f"Not caching firmware image at {cache_path}: {e}")
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, List, Generator, TextIO
+from typing import Iterable, List, Generator, Sequence, TextIO
 import binascii
 import struct
 import logging
@@ -132,7 +132,7 @@ class Chunk:
     """A chunk of memory."""
 
     address: int
-    data: List[int]
+    data: Sequence[int]
 
 
 class HexRecordProcessor:
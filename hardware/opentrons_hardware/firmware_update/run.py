@@ -2,6 +2,7 @@
 import logging
 import asyncio
 import os
+from pathlib import Path
 from typing import Optional, Dict, Tuple, AsyncIterator, Any
 from .types import FirmwareUpdateStatus, StatusElement
 
@@ -22,7 +23,7 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateInitiator,
     FirmwareUpdateDownloader,
     FirmwareUpdateEraser,
-    HexRecordProcessor,
+    load_firmware_image,
 )
 from opentrons_hardware.firmware_update.errors import BootloaderNotReady
 from opentrons_hardware.firmware_update.target import Target
@@ -164,6 +165,12 @@ class RunUpdate:
         self._status_queue: "asyncio.Queue[Tuple[FirmwareTarget,StatusElement]]" = (
             asyncio.Queue()
         )
+        self._download_rates: Dict[FirmwareTarget, float] = {}
+
+    @property
+    def download_rates(self) -> Dict[FirmwareTarget, float]:
+        """The latest download rate of each CAN target, in bytes per second."""
+        return dict(self._download_rates)
 
     async def _reconnect(self, vid: int, pid: int, baudrate: int, timeout: int) -> bool:
         if self._usb_messenger is None:
@@ -298,23 +305,27 @@ class RunUpdate:
             logger.info("Skipping erase step.")
 
         logger.info(f"Downloading {filepath} to {target.bootloader_node}.")
-        with open(filepath) as f:
-            hex_processor = HexRecordProcessor.from_file(f)
-            async for download_progress in downloader.run(
-                node_id=target.bootloader_node,
-                hex_processor=hex_processor,
-                ack_wait_seconds=timeout_seconds,
-            ):
-                await self._status_queue.put(
+        firmware_image = load_firmware_image(Path(filepath))
+        async for download_progress, bytes_per_second in downloader.run(
+            node_id=target.bootloader_node,
+            hex_processor=firmware_image,
+            ack_wait_seconds=timeout_seconds,
+        ):
+            self._download_rates[node_id] = bytes_per_second
+            await self._status_queue.put(
+                (
+                    node_id,
                     (
-                        node_id,
-                        (
-                            FirmwareUpdateStatus.updating,
-                            download_start_progress
-                            + (0.9 - download_start_progress) * download_progress,
-                        ),
-                    )
+                        FirmwareUpdateStatus.updating,
+                        download_start_progress
+                        + (0.9 - download_start_progress) * download_progress,
+                    ),
                 )
+            )
+        logger.info(
+            f"Downloaded to {target.bootloader_node} at "
+            f"{self._download_rates.get(node_id, 0):.0f} bytes/s."
+        )
 
         logger.info(f"Restarting FW on {target.system_node}.")
         await messenger.send(
@@ -1,6 +1,6 @@
 """Motion planning package."""
 
-from .move_manager import MoveManager
+from .move_manager import MoveManager, PlanCacheInfo
 from .types import (
     Coordinates,
     Block,
@@ -15,6 +15,7 @@ from .move_utils import unit_vector_multiplication
 
 __all__ = [
     "MoveManager",
+    "PlanCacheInfo",
     "Coordinates",
     "Block",
     "Move",
@@ -1,6 +1,8 @@
 """Move manager."""
 import logging
-from typing import List, Tuple, Generic
+from collections import OrderedDict
+from typing import Hashable, List, NamedTuple, Tuple, Generic
+
 from opentrons_hardware.hardware_control.motion_planning import move_utils
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
@@ -13,22 +15,59 @@ from opentrons_hardware.hardware_control.motion_planning.types import (
 
 log = logging.getLogger(__name__)
 
+MovePlan = Tuple[bool, List[List[Move[AxisKey]]]]
+
+# Planning moves as arrays has a fixed cost that takes a few moves to pay off.
+MIN_MOVES_TO_PLAN_AS_ARRAYS = 3
+
+
+class PlanCacheInfo(NamedTuple):
+    """Statistics of a MoveManager's plan cache, like functools' cache_info."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of plans that came from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
 
 class MoveManager(Generic[AxisKey]):
     """A manager that handles a list of moves for the hardware control system."""
 
-    def __init__(self, constraints: SystemConstraints[AxisKey]) -> None:
+    def __init__(
+        self, constraints: SystemConstraints[AxisKey], plan_cache_size: int = 0
+    ) -> None:
         """Constructor.
 
         Args:
             constraints: system contraints
+            plan_cache_size: how many plans to keep for reuse, 0 to disable
         """
         self._constraints = constraints
         self._blend_log: List[List[Move[AxisKey]]] = []
+        self._plan_cache: "OrderedDict[Hashable, MovePlan[AxisKey]]" = OrderedDict()
+        self._plan_cache_size = plan_cache_size
+        self._plan_cache_hits = 0
+        self._plan_cache_misses = 0
 
     def update_constraints(self, constraints: SystemConstraints[AxisKey]) -> None:
         """Update system constraints when instruments are changed."""
         self._constraints = constraints
+        self._plan_cache.clear()
+
+    def plan_cache_info(self) -> PlanCacheInfo:
+        """Get how well the plan cache is doing."""
+        return PlanCacheInfo(
+            hits=self._plan_cache_hits,
+            misses=self._plan_cache_misses,
+            maxsize=self._plan_cache_size,
+            currsize=len(self._plan_cache),
+        )
 
     def _clear_blend_log(self) -> None:
         """Empty the blend log."""
@@ -40,10 +79,7 @@ class MoveManager(Generic[AxisKey]):
         target_list: List[MoveTarget[AxisKey]],
     ) -> List[Move[AxisKey]]:
         """Create a list of moves from the target list for blending."""
-        initial_moves = list(
-            move_utils.targets_to_moves(origin, target_list, self._constraints)
-        )
-        return self._add_dummy_start_end_to_moves(initial_moves)
+        return list(move_utils.targets_to_moves(origin, target_list, self._constraints))
 
     def _add_dummy_start_end_to_moves(
         self, move_list: List[Move[AxisKey]]
@@ -59,10 +95,54 @@ class MoveManager(Generic[AxisKey]):
         target_list: List[MoveTarget[AxisKey]],
         iteration_limit: int = 10,
     ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
-        """Create and blend moves from targets."""
+        """Create and blend moves from targets.
+
+        A plan only depends on the unit vector, distance and speed of each
+        move, so with a plan cache, repeating the same moves from anywhere
+        reuses the first plan. Its Move objects are shared, and must not be
+        modified.
+        """
         self._clear_blend_log()
-        to_blend = self._get_initial_moves_from_targets(origin, target_list)
-        assert to_blend, "Check target list"
+        initial_moves = self._get_initial_moves_from_targets(origin, target_list)
+        assert initial_moves, "Check target list"
+        if not self._plan_cache_size:
+            return self._plan_motion(initial_moves, iteration_limit)
+
+        # The key is the exact values the moves are planned from, so a cached
+        # plan is identical to planning again.
+        key = (
+            tuple(
+                (tuple(move.unit_vector.items()), move.distance, move.max_speed)
+                for move in initial_moves
+            ),
+            iteration_limit,
+        )
+        cached = self._plan_cache.get(key)
+        if cached is None:
+            self._plan_cache_misses += 1
+            success, blend_log = self._plan_motion(initial_moves, iteration_limit)
+            self._plan_cache[key] = (success, [list(moves) for moves in blend_log])
+            if len(self._plan_cache) > self._plan_cache_size:
+                self._plan_cache.popitem(last=False)
+        else:
+            self._plan_cache_hits += 1
+            self._plan_cache.move_to_end(key)
+            log.debug("reused cached plan")
+            success, blend_log = cached
+            self._blend_log = [list(moves) for moves in blend_log]
+        return success, self._blend_log
+
+    def _plan_motion(
+        self, initial_moves: List[Move[AxisKey]], iteration_limit: int
+    ) -> MovePlan[AxisKey]:
+        """Blend moves until they all meet the constraints.
+
+        Longer move lists are planned as arrays, which builds exactly the
+        same moves as planning one move at a time.
+        """
+        if len(initial_moves) >= MIN_MOVES_TO_PLAN_AS_ARRAYS:
+            return self._plan_motion_as_arrays(initial_moves, iteration_limit)
+        to_blend = self._add_dummy_start_end_to_moves(initial_moves)
         for i in range(iteration_limit):
             log.debug(f"Motion blending iteration: {i}")
             blend_log = []
@@ -82,11 +162,7 @@ class MoveManager(Generic[AxisKey]):
                         self._blend_log.append(blend_log)
                     break
             if move_utils.all_blended(self._constraints, self._blend_log[i]):
-                log.info(
-                    f"built {len(self._blend_log[i])} moves with "
-                    f"{sum(list(m.nonzero_blocks for m in self._blend_log[i]))} "
-                    f"non-zero blocks after {i+1} iteration(s)"
-                )
+                self._log_blended(i)
                 return True, self._blend_log
             else:
                 self._blend_log[i] = self._add_dummy_start_end_to_moves(
@@ -95,3 +171,36 @@ class MoveManager(Generic[AxisKey]):
                 to_blend = self._blend_log[-1]
         log.error("Could not converge!")
         return False, self._blend_log
+
+    def _plan_motion_as_arrays(
+        self, initial_moves: List[Move[AxisKey]], iteration_limit: int
+    ) -> MovePlan[AxisKey]:
+        """Blend moves, planning all of them at once in every iteration."""
+        constraints = move_utils.ConstraintArrays.build(
+            list(initial_moves[0].unit_vector.keys()), self._constraints
+        )
+        to_blend = move_utils.MoveArrays.from_moves(
+            initial_moves, self._constraints
+        ).with_dummy_start_end()
+        for i in range(iteration_limit):
+            log.debug(f"Motion blending iteration: {i}")
+            blended = move_utils.build_move_arrays(to_blend, constraints)
+            self._blend_log.append(blended.to_moves(initial_moves))
+            if move_utils.all_blended_arrays(blended, constraints):
+                self._log_blended(i)
+                return True, self._blend_log
+            else:
+                self._blend_log[i] = self._add_dummy_start_end_to_moves(
+                    self._blend_log[i]
+                )
+                to_blend = blended.with_dummy_start_end()
+        log.error("Could not converge!")
+        return False, self._blend_log
+
+    def _log_blended(self, iteration: int) -> None:
+        """Log the moves of a blended plan."""
+        log.info(
+            f"built {len(self._blend_log[iteration])} moves with "
+            f"{sum(list(m.nonzero_blocks for m in self._blend_log[iteration]))} "
+            f"non-zero blocks after {iteration+1} iteration(s)"
+        )
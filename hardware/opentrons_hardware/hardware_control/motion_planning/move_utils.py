@@ -1,7 +1,8 @@
 """Utils for motion planning."""
+import dataclasses
 import numpy as np
 import logging
-from typing import Iterator, List, Tuple, Set, TYPE_CHECKING, cast
+from typing import Generic, Iterator, List, Sequence, Tuple, Set, TYPE_CHECKING, cast
 
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Block,
@@ -312,6 +313,26 @@ def achievable_final(
     return final_speed
 
 
+def get_max_acceleration(
+    unit_vector: Coordinates[AxisKey, np.float64],
+    constraints: SystemConstraints[AxisKey],
+) -> np.float64:
+    """Get the largest acceleration along a unit vector that no axis exceeds."""
+    max_acc = np.array(
+        [
+            constraints[axis].max_acceleration if unit_vector[axis] else 0.0
+            for axis in unit_vector.keys()
+        ]
+    )
+    max_acc_magnitude = np.linalg.norm(max_acc)  # type: ignore[no-untyped-call]
+    acc_v = max_acc_magnitude * vectorize(unit_vector)
+
+    for a_i, max_acc_i in zip(acc_v, max_acc):
+        if abs(a_i) > max_acc_i:
+            acc_v *= max_acc_i / a_i
+    return cast(np.float64, np.linalg.norm(acc_v))  # type: ignore[no-untyped-call]
+
+
 def build_blocks(
     unit_vector: Coordinates[AxisKey, np.float64],
     initial_speed: np.float64,
@@ -337,19 +358,7 @@ def build_blocks(
         abs(final_speed), max_speed
     ), f"final speed {final_speed} exceeds max speed {max_speed}"
 
-    max_acc = np.array(
-        [
-            constraints[axis].max_acceleration if unit_vector[axis] else 0.0
-            for axis in unit_vector.keys()
-        ]
-    )
-    max_acc_magnitude = np.linalg.norm(max_acc)  # type: ignore[no-untyped-call]
-    acc_v = max_acc_magnitude * vectorize(unit_vector)
-
-    for a_i, max_acc_i in zip(acc_v, max_acc):
-        if abs(a_i) > max_acc_i:
-            acc_v *= max_acc_i / a_i
-    max_acceleration = np.linalg.norm(acc_v)  # type: ignore[no-untyped-call]
+    max_acceleration = get_max_acceleration(unit_vector, constraints)
 
     initial_speed_sq = initial_speed**2
     final_speed_sq = final_speed**2
@@ -527,3 +536,494 @@ def unit_vector_multiplication(
     """Multiply coordinates type by a float value."""
     targets: "NDArray[np.float64]" = vectorize(unit_vector) * value
     return {k: v for k, v in zip(unit_vector.keys(), targets)}
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstraintArrays(Generic[AxisKey]):
+    """System constraints as arrays in the order of a move's axes.
+
+    Axes without constraints are NaN, and only allowed where nothing moves.
+    """
+
+    axes: Tuple[AxisKey, ...]
+    constrained: "NDArray[np.bool_]"
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls, axes: Sequence[AxisKey], constraints: SystemConstraints[AxisKey]
+    ) -> "ConstraintArrays[AxisKey]":
+        """Build the constraint arrays for these axes."""
+
+        def _values(name: str) -> "NDArray[np.float64]":
+            return np.array(
+                [
+                    getattr(constraints[axis], name) if axis in constraints else np.nan
+                    for axis in axes
+                ],
+                dtype=np.float64,
+            )
+
+        return cls(
+            axes=tuple(axes),
+            constrained=np.array([axis in constraints for axis in axes], dtype=bool),
+            max_acceleration=_values("max_acceleration"),
+            max_speed_discont=_values("max_speed_discont"),
+            max_direction_change_speed_discont=_values(
+                "max_direction_change_speed_discont"
+            ),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class MoveArrays:
+    """A list of moves as arrays, one row per move.
+
+    The block arrays hold every Block field as build_blocks leaves it,
+    including the speeds and times it does not update when it trims the
+    top speed of a move.
+    """
+
+    unit_vectors: "NDArray[np.float64]"
+    distances: "NDArray[np.float64]"
+    max_speeds: "NDArray[np.float64]"
+    max_accelerations: "NDArray[np.float64]"
+    block_distances: "NDArray[np.float64]"
+    block_initial_speeds: "NDArray[np.float64]"
+    block_accelerations: "NDArray[np.float64]"
+    block_final_speeds: "NDArray[np.float64]"
+    block_times: "NDArray[np.float64]"
+
+    @classmethod
+    def from_moves(
+        cls, moves: Sequence[Move[AxisKey]], constraints: SystemConstraints[AxisKey]
+    ) -> "MoveArrays":
+        """Build the arrays of moves that all have the same axes."""
+        axes = list(moves[0].unit_vector.keys())
+
+        def _blocks(name: str) -> "NDArray[np.float64]":
+            return np.array(
+                [[getattr(block, name) for block in move.blocks] for move in moves],
+                dtype=np.float64,
+            )
+
+        return cls(
+            unit_vectors=np.array(
+                [[move.unit_vector[axis] for axis in axes] for move in moves],
+                dtype=np.float64,
+            ),
+            distances=np.array([move.distance for move in moves], dtype=np.float64),
+            max_speeds=np.array([move.max_speed for move in moves], dtype=np.float64),
+            max_accelerations=np.array(
+                [get_max_acceleration(move.unit_vector, constraints) for move in moves],
+                dtype=np.float64,
+            ),
+            block_distances=_blocks("distance"),
+            block_initial_speeds=_blocks("initial_speed"),
+            block_accelerations=_blocks("acceleration"),
+            block_final_speeds=_blocks("final_speed"),
+            block_times=_blocks("time"),
+        )
+
+    @property
+    def initial_speeds(self) -> "NDArray[np.float64]":
+        """The initial speed of each move, like Move.initial_speed."""
+        speeds = np.zeros_like(self.distances)
+        for i in reversed(range(3)):
+            speeds = np.where(
+                self.block_distances[:, i] != 0, self.block_initial_speeds[:, i], speeds
+            )
+        return speeds
+
+    @property
+    def final_speeds(self) -> "NDArray[np.float64]":
+        """The final speed of each move, like Move.final_speed."""
+        speeds = np.zeros_like(self.distances)
+        for i in range(3):
+            speeds = np.where(
+                self.block_distances[:, i] != 0, self.block_final_speeds[:, i], speeds
+            )
+        return speeds
+
+    def with_dummy_start_end(self) -> "MoveArrays":
+        """Add a dummy move like Move.build_dummy before and after the moves."""
+        dummy_unit_vector = np.zeros((1, self.unit_vectors.shape[1]))
+        dummy_unit_vector[0, 0] = 1.0
+        zero = np.zeros(1)
+        zero_blocks = np.zeros((1, 3))
+
+        def _pad(
+            values: "NDArray[np.float64]", dummy: "NDArray[np.float64]"
+        ) -> "NDArray[np.float64]":
+            padded: "NDArray[np.float64]" = np.concatenate(  # type: ignore[no-untyped-call]
+                [dummy, values, dummy]
+            )
+            return padded
+
+        return MoveArrays(
+            unit_vectors=_pad(self.unit_vectors, dummy_unit_vector),
+            distances=_pad(self.distances, zero),
+            max_speeds=_pad(self.max_speeds, zero),
+            max_accelerations=_pad(self.max_accelerations, zero),
+            block_distances=_pad(self.block_distances, zero_blocks),
+            block_initial_speeds=_pad(self.block_initial_speeds, zero_blocks),
+            block_accelerations=_pad(self.block_accelerations, zero_blocks),
+            block_final_speeds=_pad(self.block_final_speeds, zero_blocks),
+            block_times=_pad(self.block_times, zero_blocks),
+        )
+
+    def _block(self, row: int, index: int) -> Block:
+        block: Block = Block.__new__(Block)
+        block.distance = self.block_distances[row, index]
+        block.initial_speed = self.block_initial_speeds[row, index]
+        block.acceleration = self.block_accelerations[row, index]
+        block.final_speed = self.block_final_speeds[row, index]
+        block.time = self.block_times[row, index]
+        return block
+
+    def to_moves(self, moves: Sequence[Move[AxisKey]]) -> List[Move[AxisKey]]:
+        """Get the Moves of these rows, for the moves they were planned from."""
+        return [
+            Move(
+                unit_vector=move.unit_vector,
+                distance=move.distance,
+                max_speed=move.max_speed,
+                blocks=(self._block(row, 0), self._block(row, 1), self._block(row, 2)),
+            )
+            for row, move in enumerate(moves)
+        ]
+
+
+def _squared(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Square values the way np.float64 does.
+
+    ``array**2`` squares by multiplying, but ``np.float64(x)**2`` calls
+    pow, and they do not always round the same.
+    """
+    return cast("NDArray[np.float64]", np.power(values, 2))
+
+
+def _isclose(
+    values: "NDArray[np.float64]", others: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    """np.isclose with its default tolerances, without its overhead."""
+    return cast(
+        "NDArray[np.bool_]",
+        np.where(
+            np.isfinite(values) & np.isfinite(others),
+            np.abs(values - others) <= 1e-08 + 1e-05 * np.abs(others),
+            values == others,
+        ),
+    )
+
+
+def _junction_speed_limits(
+    unit_vectors: "NDArray[np.float64]",
+    other_unit_vectors: "NDArray[np.float64]",
+    other_speeds: "NDArray[np.float64]",
+    constraints: ConstraintArrays[AxisKey],
+) -> Tuple["NDArray[np.float64]", "NDArray[np.bool_]"]:
+    """Get the junction speed limit of each move on each axis.
+
+    This is initial_speed_limit_from_axis and final_speed_limit_from_axis
+    for every move and axis at once. It also returns where they would fail.
+    """
+    other_speeds = other_speeds[:, np.newaxis]
+    from_stop = (other_unit_vectors == 0) | (other_speeds == 0)
+    same_direction = other_unit_vectors * unit_vectors > 0
+    changing_direction = other_unit_vectors * unit_vectors < 0
+    limits = np.where(
+        from_stop,
+        np.abs(constraints.max_speed_discont / unit_vectors),
+        np.where(
+            same_direction,
+            np.abs(
+                np.maximum(
+                    np.abs(other_speeds * other_unit_vectors),
+                    constraints.max_speed_discont,
+                )
+                / unit_vectors
+            ),
+            np.abs(constraints.max_direction_change_speed_discont / unit_vectors),
+        ),
+    )
+    return limits, ~(from_stop | same_direction | changing_direction)
+
+
+def _limit_junction_speeds(
+    speeds: "NDArray[np.float64]",
+    unit_vectors: "NDArray[np.float64]",
+    limits: "NDArray[np.float64]",
+    unplannable: "NDArray[np.bool_]",
+) -> Tuple["NDArray[np.float64]", "NDArray[np.bool_]"]:
+    """Limit junction speeds axis by axis, like find_initial_speed.
+
+    Axes that a move is barely moving at the speed so far are skipped.
+    Returns the speeds and which moves fail to plan.
+    """
+    failed = np.zeros_like(speeds, dtype=bool)
+    for axis in range(unit_vectors.shape[1]):
+        moving = ~(np.abs(unit_vectors[:, axis] * speeds) < FLOAT_THRESHOLD)
+        failed |= moving & unplannable[:, axis]
+        speeds = np.where(moving, np.minimum(limits[:, axis], speeds), speeds)
+    return speeds, failed
+
+
+def _block_final_speeds(
+    initial_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get the final speed of blocks, like Block does."""
+    speeds_squared: "NDArray[np.float64]" = (
+        _squared(initial_speeds) + accelerations * distances * 2
+    )
+    if np.any(speeds_squared < 0):
+        log.warning(
+            f"Block encountered negative value in final_speed ({speeds_squared}). "
+            f"Setting Block.final_speed to 0.0 instead."
+        )
+    return cast(
+        "NDArray[np.float64]",
+        np.where(speeds_squared < 0, 0.0, np.sqrt(speeds_squared)),
+    )
+
+
+def _block_times(
+    initial_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get the time of blocks, like Block does."""
+    return cast(
+        "NDArray[np.float64]",
+        np.where(
+            accelerations != 0,
+            (final_speeds - initial_speeds) / accelerations,
+            np.where(initial_speeds == 0, 0.0, distances / initial_speeds),
+        ),
+    )
+
+
+def build_move_arrays(
+    to_blend: MoveArrays, constraints: ConstraintArrays[AxisKey]
+) -> MoveArrays:
+    """Build all moves between the first and last row at once.
+
+    Each row is exactly what build_move would make of that move and its
+    neighbors, and the first move that build_move would fail on raises
+    the same error.
+    """
+    unit_vectors = to_blend.unit_vectors[1:-1]
+    distances = to_blend.distances[1:-1]
+    max_speeds = to_blend.max_speeds[1:-1]
+    max_accelerations = to_blend.max_accelerations[1:-1]
+    prev_unit_vectors = np.where(
+        (to_blend.distances[:-2] > FLOAT_THRESHOLD)[:, np.newaxis],
+        to_blend.unit_vectors[:-2],
+        0.0,
+    )
+    next_unit_vectors = np.where(
+        (to_blend.distances[2:] > FLOAT_THRESHOLD)[:, np.newaxis],
+        to_blend.unit_vectors[2:],
+        0.0,
+    )
+    all_initial_speeds = to_blend.initial_speeds
+    all_final_speeds = to_blend.final_speeds
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        initial_speeds, initial_failed = _limit_junction_speeds(
+            all_initial_speeds[1:-1],
+            unit_vectors,
+            *_junction_speed_limits(
+                unit_vectors, prev_unit_vectors, all_final_speeds[:-2], constraints
+            ),
+        )
+        final_speeds, final_failed = _limit_junction_speeds(
+            all_final_speeds[1:-1],
+            unit_vectors,
+            *_junction_speed_limits(
+                unit_vectors, next_unit_vectors, all_initial_speeds[2:], constraints
+            ),
+        )
+
+        # make sure the final speeds are achievable, like achievable_final
+        for axis in range(len(constraints.axes)):
+            components = unit_vectors[:, axis]
+            max_final_speeds_sq = (
+                _squared(initial_speeds * components)
+                + 2 * constraints.max_acceleration[axis] * distances
+            )
+            max_final_speeds = (
+                np.copysign(
+                    np.sqrt(max_final_speeds_sq) / components,
+                    final_speeds - initial_speeds,
+                )
+                + initial_speeds
+            )
+            final_speeds = np.where(
+                components != 0,
+                np.copysign(
+                    np.minimum(np.abs(max_final_speeds), np.abs(final_speeds)),
+                    final_speeds,
+                ),
+                final_speeds,
+            )
+
+        initial_too_fast = ~(
+            (np.abs(initial_speeds) <= max_speeds)
+            | _isclose(np.abs(initial_speeds), max_speeds)
+        )
+        final_too_fast = ~(
+            (np.abs(final_speeds) <= max_speeds)
+            | _isclose(np.abs(final_speeds), max_speeds)
+        )
+        move_failed = initial_failed | final_failed | initial_too_fast | final_too_fast
+        if np.any(move_failed):
+            row = int(np.argmax(move_failed))
+            assert not initial_failed[row], "planning initial speed failed"
+            assert not final_failed[row], "planning final speed failed"
+            assert not initial_too_fast[row], (
+                f"initial speed {initial_speeds[row]} exceeds max speed "
+                f"{max_speeds[row]}"
+            )
+            assert not final_too_fast[row], (
+                f"final speed {final_speeds[row]} exceeds max speed "
+                f"{max_speeds[row]}"
+            )
+
+        # the blocks, like build_blocks
+        initial_speeds_sq = _squared(initial_speeds)
+        final_speeds_sq = _squared(final_speeds)
+        max_achievable_speeds = np.sqrt(
+            0.5
+            * (2 * max_accelerations * distances + initial_speeds_sq + final_speeds_sq)
+        )
+        top_speeds_sq = _squared(np.minimum(max_achievable_speeds, max_speeds))
+
+        first_distances = np.abs(top_speeds_sq - initial_speeds_sq) / (
+            2 * max_accelerations
+        )
+        first_final_speeds = _block_final_speeds(
+            initial_speeds, max_accelerations, first_distances
+        )
+        first_times = _block_times(
+            initial_speeds, max_accelerations, first_distances, first_final_speeds
+        )
+        final_distances = np.abs(top_speeds_sq - final_speeds_sq) / (
+            2 * max_accelerations
+        )
+        final_final_speeds = _block_final_speeds(
+            first_final_speeds, -max_accelerations, final_distances
+        )
+        final_times = _block_times(
+            first_final_speeds, -max_accelerations, final_distances, final_final_speeds
+        )
+
+        # build_blocks trims the top speed of these moves by changing only
+        # the distances of their blocks
+        trimmed = first_distances + final_distances > distances + FLOAT_THRESHOLD
+        trimmed_speeds_sq = np.maximum(initial_speeds_sq, final_speeds_sq)
+        first_distances = np.where(
+            trimmed,
+            np.abs(trimmed_speeds_sq - initial_speeds_sq) / (2 * max_accelerations),
+            first_distances,
+        )
+        final_distances = np.where(
+            trimmed,
+            np.abs(trimmed_speeds_sq - final_speeds_sq) / (2 * max_accelerations),
+            final_distances,
+        )
+
+        coasting = first_distances + final_distances < distances - FLOAT_THRESHOLD
+        zeros = np.zeros_like(distances)
+        coast_distances = np.where(
+            coasting, distances - first_distances - final_distances, 0.0
+        )
+        coast_initial_speeds = np.where(coasting, first_final_speeds, 0.0)
+        coast_final_speeds = _block_final_speeds(
+            coast_initial_speeds, zeros, coast_distances
+        )
+        coast_times = _block_times(
+            coast_initial_speeds, zeros, coast_distances, coast_final_speeds
+        )
+
+    return MoveArrays(
+        unit_vectors=unit_vectors,
+        distances=distances,
+        max_speeds=max_speeds,
+        max_accelerations=max_accelerations,
+        block_distances=np.stack(
+            [first_distances, coast_distances, final_distances], axis=1
+        ),
+        block_initial_speeds=np.stack(
+            [initial_speeds, coast_initial_speeds, first_final_speeds], axis=1
+        ),
+        block_accelerations=np.stack(
+            [max_accelerations, zeros, -max_accelerations], axis=1
+        ),
+        block_final_speeds=np.stack(
+            [first_final_speeds, coast_final_speeds, final_final_speeds], axis=1
+        ),
+        block_times=np.stack([first_times, coast_times, final_times], axis=1),
+    )
+
+
+def all_blended_arrays(
+    moves: MoveArrays, constraints: ConstraintArrays[AxisKey]
+) -> bool:
+    """Check if the moves are all blended, like all_blended."""
+    if len(moves.distances) < 2:
+        return True
+    distance_sums = (
+        moves.block_distances[:, 0]
+        + moves.block_distances[:, 1]
+        + moves.block_distances[:, 2]
+    )
+
+    first_unit_vectors = moves.unit_vectors[:-1]
+    second_unit_vectors = moves.unit_vectors[1:]
+    final_speeds = moves.block_final_speeds[:-1, -1:] * first_unit_vectors
+    initial_speeds = moves.block_initial_speeds[1:, :1] * second_unit_vectors
+
+    def _less_or_close(
+        constraint: "NDArray[np.float64]", speeds: "NDArray[np.float64]"
+    ) -> "NDArray[np.bool_]":
+        less: "NDArray[np.bool_]" = np.abs(speeds) <= constraint
+        return less | _isclose(speeds, constraint)
+
+    with np.errstate(invalid="ignore"):
+        distances_match = ~(
+            (np.abs(distance_sums - moves.distances) > FLOAT_THRESHOLD)
+            | ~_isclose(distance_sums, moves.distances)
+        )
+        pairs_match = distances_match[:-1] & distances_match[1:]
+        same_direction = first_unit_vectors * second_unit_vectors > 0
+        within_discont = (
+            (np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+            | _less_or_close(constraints.max_speed_discont, final_speeds)
+            | _less_or_close(constraints.max_speed_discont, initial_speeds)
+        )
+        within_change_discont: "NDArray[np.bool_]" = _less_or_close(
+            constraints.max_direction_change_speed_discont, final_speeds
+        ) | _less_or_close(
+            constraints.max_direction_change_speed_discont, initial_speeds
+        )
+    junctions_match = (
+        np.where(same_direction, within_discont, within_change_discont)
+        & constraints.constrained
+    )
+
+    pairs_failed = ~pairs_match | ~np.all(junctions_match, axis=1)
+    if not np.any(pairs_failed):
+        return True
+    pair = int(np.argmax(pairs_failed))
+    if pairs_match[pair]:
+        axis = int(np.argmax(~junctions_match[pair]))
+        if not constraints.constrained[axis]:
+            # blended looks up the constraints of every axis
+            raise KeyError(constraints.axes[axis])
+    return False
@@ -77,7 +77,11 @@ async def run(args: argparse.Namespace) -> None:
             erase=erase,
         )
         async for progress in updater.run_updates():
-            logger.info(f"{progress[0]} is {progress[1][0]} and {progress[1][1]} done")
+            rate = updater.download_rates.get(progress[0], 0)
+            logger.info(
+                f"{progress[0]} is {progress[1][0]} and {progress[1][1]} done"
+                f" ({rate:.0f} bytes/s)"
+            )
 
     logger.info("Done")
 
@@ -28,6 +28,28 @@ def test_create_firmware_updata_data(
     )
 
 
+@pytest.mark.parametrize(
+    argnames=["address", "data"],
+    argvalues=[
+        [0xF0F0F0F0, bytes(range(48))],
+        [0x0, b""],
+        [0x12345678, b"\x05\x06\x07"],
+    ],
+)
+def test_firmware_update_data_from_memoryview(address: int, data: bytes) -> None:
+    """It should serialize a memoryview of data the same as bytes, without copying."""
+    image = memoryview(b"\xff" * 8 + data + b"\xff" * 8)
+    view = image[8 : 8 + len(data)]
+
+    obj = payloads.FirmwareUpdateData.create(address, view, 0)
+
+    assert obj.data.value is view
+    assert (
+        obj.serialize()
+        == payloads.FirmwareUpdateData.create(address, data, 0).serialize()
+    )
+
+
 @pytest.mark.parametrize(
     argnames=["value_str", "expected"],
     argvalues=[
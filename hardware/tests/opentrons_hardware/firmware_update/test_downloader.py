@@ -1,6 +1,7 @@
 """Tests for the firmware downloader."""
+import asyncio
 import binascii
-from typing import List
+from typing import Any, Awaitable, List
 
 import pytest
 from mock import AsyncMock, MagicMock, call
@@ -299,3 +300,211 @@ async def test_messaging_complete_no_response(
             NodeId.gantry_y_bootloader, mock_hex_processor, 0.5
         ):
             pass
+
+
+def _notify_data_ack(
+    can_message_notifier: MockCanMessageNotifier,
+    node_id: NodeId,
+    message: FirmwareUpdateData,
+) -> None:
+    can_message_notifier.notify(
+        FirmwareUpdateDataAcknowledge(
+            payload=payloads.FirmwareUpdateDataAcknowledge(
+                address=message.payload.address,
+                error_code=ErrorCodeField(ErrorCode.ok),
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateDataAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+def _notify_complete_ack(
+    can_message_notifier: MockCanMessageNotifier, node_id: NodeId
+) -> None:
+    can_message_notifier.notify(
+        FirmwareUpdateCompleteAcknowledge(
+            payload=payloads.FirmwareUpdateAcknowledge(
+                error_code=ErrorCodeField(ErrorCode.ok)
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateCompleteAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+async def test_messaging_pipelined(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should send a window of chunks ahead of acks, in any order."""
+    unacked: List[FirmwareUpdateData] = []
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Only ack once every chunk is in flight, last chunk first."""
+        if isinstance(message, FirmwareUpdateData):
+            unacked.append(message)
+            if len(unacked) == len(chunks):
+                for m in reversed(unacked):
+                    _notify_data_ack(can_message_notifier, node_id, m)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _notify_complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    progress = [
+        p
+        async for p in subject.run(
+            NodeId.gantry_y_bootloader, mock_hex_processor, 10, window_size=3
+        )
+    ]
+
+    assert [p.progress for p in progress] == [1 / 3, 2 / 3, 1]
+    assert all(p.bytes_per_second > 0 for p in progress)
+    assert mock_messenger.send.call_count == len(chunks) + 1
+
+
+async def test_messaging_falls_back_to_one_in_flight(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should resend unacked chunks one at a time after an ack times out."""
+    seen_addresses: List[int] = []
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Drop chunks that arrive while the first one is being handled."""
+        if isinstance(message, FirmwareUpdateData):
+            address = message.payload.address.value
+            if address in seen_addresses or not seen_addresses:
+                _notify_data_ack(can_message_notifier, node_id, message)
+            seen_addresses.append(address)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _notify_complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    async for progress in subject.run(
+        NodeId.gantry_y_bootloader, mock_hex_processor, 0.1, window_size=3
+    ):
+        pass
+
+    assert seen_addresses == [0x000, 0x100, 0x200, 0x100, 0x200]
+
+
+def test_window_resends_only_timed_out_message() -> None:
+    """It should only resend the message whose ack timed out."""
+    window = downloader._SlidingWindow(num_messages=4, size=3)
+    for index in range(3):
+        assert window.next_to_send() == index
+        window.mark_sent(index, sent_at=0)
+
+    window.resend(1)
+
+    assert window.num_in_flight == 2
+    assert window.next_to_send() == 1
+    window.mark_sent(1, sent_at=1)
+    assert window.next_to_send() is None
+
+    window.ack(0)
+    window.ack(2)
+    assert window.next_to_send() == 3
+    assert window.attempts(1) == 2
+    assert window.attempts(2) == 1
+
+
+async def test_messaging_waits_a_positive_time(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should still wait for acks whose deadline has already passed."""
+    timeouts: List[float] = []
+    wait_for = asyncio.wait_for
+
+    async def _wait_for(aw: Awaitable[Any], timeout: float) -> Any:
+        timeouts.append(timeout)
+        return await wait_for(aw, timeout)
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Only ack the first chunk the first time it's sent."""
+        if isinstance(message, FirmwareUpdateData):
+            if message.payload.address.value == 0 or len(timeouts) > 1:
+                _notify_data_ack(can_message_notifier, node_id, message)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _notify_complete_ack(can_message_notifier, node_id)
+
+    monkeypatch.setattr(asyncio, "wait_for", _wait_for)
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    async for progress in subject.run(
+        NodeId.gantry_y_bootloader, mock_hex_processor, 0.1, window_size=3
+    ):
+        pass
+
+    assert min(timeouts) > 0
+
+
+async def test_messaging_sends_memoryviews_without_copying(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+    crc32: int,
+) -> None:
+    """It should send chunks that are memoryviews of an image as they are."""
+    image = memoryview(b"".join(bytes(c.data) for c in chunks))
+    views = []
+    offset = 0
+    for c in chunks:
+        views.append(image[offset : offset + len(c.data)])
+        offset += len(c.data)
+    sent: List[MessageDefinition] = []
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        sent.append(message)
+        if isinstance(message, FirmwareUpdateData):
+            _notify_data_ack(can_message_notifier, node_id, message)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _notify_complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(
+        Chunk(address=c.address, data=view) for c, view in zip(chunks, views)
+    )
+
+    async for progress in subject.run(
+        NodeId.gantry_y_bootloader, mock_hex_processor, 10
+    ):
+        pass
+
+    data_messages = [m for m in sent if isinstance(m, FirmwareUpdateData)]
+    assert [m.payload.data.value for m in data_messages] == views
+    assert all(m.payload.data.value is v for m, v in zip(data_messages, views))
+    complete = sent[-1]
+    assert isinstance(complete, FirmwareUpdateComplete)
+    assert complete.payload.crc32.value == crc32
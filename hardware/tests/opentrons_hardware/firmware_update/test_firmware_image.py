@@ -0,0 +1,176 @@
+"""Tests for pre-parsed firmware images."""
+import binascii
+from pathlib import Path
+from typing import Callable, Iterator
+
+import mock
+import pytest
+
+from opentrons_hardware.firmware_update import firmware_image
+from opentrons_hardware.firmware_update.firmware_image import (
+    CorruptImageException,
+    FirmwareImage,
+    cache_path_for,
+    load_firmware_image,
+)
+from opentrons_hardware.firmware_update.hex_file import (
+    BadChunkSizeException,
+    HexRecordProcessor,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_loaded_images() -> Iterator[None]:
+    """Start each test with an empty in-memory image cache."""
+    with mock.patch.object(firmware_image, "_loaded", {}):
+        yield
+
+
+def _record(address: int, record_type: int, data: bytes) -> str:
+    body = bytes([len(data), address >> 8, address & 0xFF, record_type]) + data
+    checksum = 0xFF & (~sum(body) + 1)
+    return ":" + (body + bytes([checksum])).hex().upper() + "\n"
+
+
+@pytest.fixture
+def hex_file_path(tmp_path: Path) -> Path:
+    """A hex file with two discontiguous regions."""
+    lines = [
+        # Extended linear address 0x0800_0000
+        _record(0, 4, b"\x08\x00"),
+        *[_record(i * 16, 0, bytes(range(i, i + 16))) for i in range(20)],
+        # A gap, then a short record.
+        _record(0x1000, 0, b"\xAA\xBB\xCC"),
+        *[_record(0x1003 + i * 16, 0, bytes([i] * 16)) for i in range(5)],
+        # Start linear address
+        _record(0, 5, b"\x08\x00\x45\x99"),
+        _record(0, 1, b""),
+    ]
+    path = tmp_path / "firmware.hex"
+    path.write_text("".join(lines))
+    return path
+
+
+@pytest.mark.parametrize(argnames=["chunk_size"], argvalues=[[1], [7], [56], [4096]])
+def test_same_chunks_as_hex_processor(hex_file_path: Path, chunk_size: int) -> None:
+    """It should produce the same chunks as parsing the hex file directly."""
+    subject = load_firmware_image(hex_file_path)
+    with open(hex_file_path) as f:
+        expected = list(HexRecordProcessor.from_file(f).process(chunk_size))
+
+    result = list(subject.process(chunk_size))
+
+    assert [(c.address, bytes(c.data)) for c in result] == [
+        (c.address, bytes(c.data)) for c in expected
+    ]
+
+
+def test_image_properties(hex_file_path: Path) -> None:
+    """It should know its start address, size, and CRC."""
+    with open(hex_file_path) as f:
+        processor = HexRecordProcessor.from_file(f)
+        chunks = list(processor.process(56))
+    crc32 = 0
+    for chunk in chunks:
+        crc32 = binascii.crc32(bytes(chunk.data), crc32)
+
+    subject = load_firmware_image(hex_file_path)
+
+    assert subject.start_address == processor.start_address
+    assert subject.crc32 == crc32
+    assert len(subject) == sum(len(c.data) for c in chunks)
+
+
+def test_bad_chunk_size(hex_file_path: Path) -> None:
+    """It should reject chunk sizes that are not positive."""
+    subject = load_firmware_image(hex_file_path)
+    with pytest.raises(BadChunkSizeException):
+        list(subject.process(0))
+
+
+def test_serialization_round_trip(hex_file_path: Path) -> None:
+    """It should load an image from its serialized form."""
+    image = load_firmware_image(hex_file_path)
+
+    result = FirmwareImage.from_bytes(image.to_bytes(), image.content_hash)
+
+    assert result.segments == image.segments
+    assert result.start_address == image.start_address
+    assert result.crc32 == image.crc32
+
+
+@pytest.mark.parametrize(
+    argnames=["corrupt"],
+    argvalues=[
+        [lambda b: b[:10]],
+        [lambda b: b"NOTANIMG" + b[8:]],
+        [lambda b: b[:-1] + bytes([b[-1] ^ 0xFF])],
+        [lambda b: b + b"\x00"],
+    ],
+)
+def test_from_bytes_rejects_corruption(
+    hex_file_path: Path, corrupt: Callable[[bytes], bytes]
+) -> None:
+    """It should raise if the serialized image is damaged."""
+    image = load_firmware_image(hex_file_path)
+    with pytest.raises(CorruptImageException):
+        FirmwareImage.from_bytes(corrupt(image.to_bytes()), image.content_hash)
+
+
+def test_caches_image_next_to_hex_file(hex_file_path: Path) -> None:
+    """It should only parse a hex file once, even across processes."""
+    first = load_firmware_image(hex_file_path)
+    assert cache_path_for(hex_file_path, first.content_hash).exists()
+
+    # Same process.
+    with mock.patch.object(
+        FirmwareImage, "from_hex_records", side_effect=AssertionError("parsed")
+    ):
+        assert load_firmware_image(hex_file_path) is first
+
+    # New process, with only the cache file.
+    with mock.patch.object(firmware_image, "_loaded", {}), mock.patch.object(
+        FirmwareImage, "from_hex_records", side_effect=AssertionError("parsed")
+    ):
+        result = load_firmware_image(hex_file_path)
+
+    assert result.crc32 == first.crc32
+    assert result.segments == first.segments
+
+
+def test_cache_keyed_by_content(hex_file_path: Path) -> None:
+    """It should parse again if the hex file's contents change."""
+    first = load_firmware_image(hex_file_path)
+
+    lines = hex_file_path.read_text().splitlines(keepends=True)
+    # Drop a data record from the middle of the file.
+    hex_file_path.write_text("".join(lines[:5] + lines[6:]))
+    second = load_firmware_image(hex_file_path)
+
+    assert second.content_hash != first.content_hash
+    assert len(second) < len(first)
+
+
+def test_corrupt_cache_is_replaced(hex_file_path: Path) -> None:
+    """It should ignore and rewrite an unusable cache file."""
+    image = load_firmware_image(hex_file_path)
+    cache_path = cache_path_for(hex_file_path, image.content_hash)
+    cache_path.write_bytes(b"garbage")
+
+    with mock.patch.object(firmware_image, "_loaded", {}):
+        result = load_firmware_image(hex_file_path)
+
+    assert result.crc32 == image.crc32
+    assert cache_path.read_bytes() == image.to_bytes()
+
+
+def test_unwritable_directory(hex_file_path: Path) -> None:
+    """It should still load the image if the cache can't be written."""
+    with mock.patch(
+        "opentrons_hardware.firmware_update.firmware_image.tempfile.mkstemp",
+        side_effect=PermissionError("read-only"),
+    ):
+        result = load_firmware_image(hex_file_path)
+
+    assert not cache_path_for(hex_file_path, result.content_hash).exists()
+    assert len(result) > 0
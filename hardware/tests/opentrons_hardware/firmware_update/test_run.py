@@ -15,7 +15,6 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateInitiator,
     FirmwareUpdateDownloader,
     FirmwareUpdateEraser,
-    HexRecordProcessor,
     RunUpdate,
 )
 from opentrons_hardware.firmware_update.target import Target
@@ -52,8 +51,8 @@ def mock_eraser_run() -> Iterator[AsyncMock]:
 
 @pytest.fixture
 def mock_hex_record_builder() -> Iterator[MagicMock]:
-    """Mock builder function."""
-    with mock.patch.object(HexRecordProcessor, "from_file") as p:
+    """Mock firmware image loader."""
+    with mock.patch("opentrons_hardware.firmware_update.run.load_firmware_image") as p:
         yield p
 
 
@@ -94,7 +93,7 @@ async def test_run_update(
         erase=should_erase,
     )
 
-    with mock.patch("os.path.exists"), mock.patch("builtins.open"):
+    with mock.patch("os.path.exists"):
         await updater._run_can_update(
             messenger=mock_can_messenger,
             node_id=target.system_node,
@@ -143,7 +142,7 @@ async def test_run_updates(
         target_1.system_node: hex_file_1,
         target_2.system_node: hex_file_2,
     }
-    with mock.patch("os.path.exists"), mock.patch("builtins.open"):
+    with mock.patch("os.path.exists"):
         updater = RunUpdate(
             can_messenger=mock_can_messenger,
             usb_messenger=mock_usb_messenger,
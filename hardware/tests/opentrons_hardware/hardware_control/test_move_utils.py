@@ -1,15 +1,18 @@
 """Tests for move util functions."""
+import re
 import pytest
 import numpy as np
-from typing import Iterator, List, Union
+from typing import Iterator, List, Tuple, Union
 from hypothesis import given, strategies as st, assume
 
+from opentrons_hardware.hardware_control.motion_planning import move_manager
 from opentrons_hardware.hardware_control.motion_planning.move_manager import MoveManager
 from opentrons_hardware.hardware_control.motion_planning.move_utils import (
     find_initial_speed,
     find_final_speed,
     targets_to_moves,
     all_blended,
+    build_move,
     get_unit_vector,
     FLOAT_THRESHOLD,
     limit_max_speed,
@@ -537,6 +540,166 @@ def test_blend_motion() -> None:
     assert all_blended(CONSTRAINTS, blend_log[-1])
 
 
+def test_plan_cache_matches_planning() -> None:
+    """Cached plans should be identical to planning again, from any origin."""
+    cached = MoveManager(CONSTRAINTS, plan_cache_size=2)
+    uncached = MoveManager(CONSTRAINTS)
+
+    for x in [0.0, 0.5, 0.0, 100.0]:
+        origin = dict.fromkeys(SIXAXES, np.float64(0))
+        origin["X"] = np.float64(x)
+        target_list = [
+            MoveTarget.build(dict(origin, Z=np.float64(10)), np.float64(10)),
+        ]
+        assert cached.plan_motion(origin, target_list) == uncached.plan_motion(
+            origin, target_list
+        )
+
+    info = cached.plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+    assert info.hit_rate == 0.75
+
+    cached.update_constraints(CONSTRAINTS)
+    assert cached.plan_cache_info().currsize == 0
+
+
+def test_plan_cache_matches_random_plans() -> None:
+    """Cached plans should match planning again for random target lists."""
+    rng = np.random.default_rng(37)
+    cached = MoveManager(CONSTRAINTS, plan_cache_size=32)
+    uncached = MoveManager(CONSTRAINTS)
+    plans = []
+    for _ in range(20):
+        origin = {
+            axis: np.float64(v) for axis, v in zip(SIXAXES, rng.uniform(0, 100, 6))
+        }
+        target_list = [
+            MoveTarget.build(
+                {
+                    axis: np.float64(v)
+                    for axis, v in zip(SIXAXES, rng.uniform(0, 100, 6))
+                },
+                np.float64(rng.uniform(1, 100)),
+            )
+            for _ in range(rng.integers(1, 5))
+        ]
+        plans.append((origin, target_list))
+
+    def _plan(
+        manager: MoveManager[str],
+        origin: Coordinates[str, np.float64],
+        target_list: List[MoveTarget[str]],
+    ) -> object:
+        # Some random plans fail the planner's own assertions, and should
+        # fail the same way from the cache.
+        try:
+            return manager.plan_motion(origin, target_list, iteration_limit=20)
+        except AssertionError as e:
+            return str(e)
+
+    for _ in range(3):
+        for origin, target_list in plans:
+            assert _plan(cached, origin, target_list) == _plan(
+                uncached, origin, target_list
+            )
+
+    info = cached.plan_cache_info()
+    assert info.hits > 0
+    assert info.hits + info.misses == 3 * len(plans)
+
+
+def _random_constraints(rng: np.random.Generator) -> SystemConstraints[str]:
+    return {
+        axis: AxisConstraints.build(
+            max_acceleration=np.float64(rng.uniform(10, 2000)),
+            max_speed_discont=np.float64(rng.uniform(1, 100)),
+            max_direction_change_speed_discont=np.float64(rng.uniform(1, 500)),
+            max_speed=np.float64(rng.uniform(10, 1000)),
+        )
+        for axis in AXES
+    }
+
+
+def _random_targets(
+    rng: np.random.Generator, origin: Coordinates[str, np.float64]
+) -> List[MoveTarget[str]]:
+    position = dict(origin)
+    targets = []
+    for _ in range(rng.integers(1, 12)):
+        scale = rng.choice([0.01, 1, 10, 100])
+        for axis in rng.choice(AXES, size=rng.integers(1, 5), replace=False):
+            position[axis] += np.float64(rng.normal(0, scale))
+        targets.append(
+            MoveTarget.build(dict(position), np.float64(rng.uniform(0.1, 1000)))
+        )
+    return targets
+
+
+def _plan_each_move(
+    constraints: SystemConstraints[str],
+    origin: Coordinates[str, np.float64],
+    target_list: List[MoveTarget[str]],
+) -> Union[Tuple[bool, List[List[Move[str]]]], str]:
+    """Plan like MoveManager, with build_move. Assertions give their message."""
+    try:
+        moves = list(targets_to_moves(origin, target_list, constraints))
+        dummy = Move.build_dummy(moves[0].unit_vector.keys())
+        blend_log: List[List[Move[str]]] = []
+        for _ in range(20):
+            to_blend = [dummy, *moves, dummy]
+            moves = [
+                build_move(move, prev_move, next_move, constraints)
+                for prev_move, move, next_move in zip(
+                    to_blend, to_blend[1:], to_blend[2:]
+                )
+            ]
+            if all_blended(constraints, moves):
+                return True, blend_log + [moves]
+            blend_log.append([dummy, *moves, dummy])
+        return False, blend_log
+    except AssertionError as e:
+        return str(e)
+
+
+def test_plan_as_arrays_matches_build_move(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Planning moves as arrays should build exactly what build_move does."""
+    monkeypatch.setattr(move_manager, "MIN_MOVES_TO_PLAN_AS_ARRAYS", 1)
+    rng = np.random.default_rng(37)
+    outcomes = set()
+    for _ in range(150):
+        constraints = _random_constraints(rng)
+        origin = {axis: np.float64(v) for axis, v in zip(AXES, rng.uniform(0, 100, 4))}
+        target_list = _random_targets(rng, origin)
+        expected = _plan_each_move(constraints, origin, target_list)
+        manager = MoveManager(constraints)
+        if isinstance(expected, str):
+            # some random plans fail the planner's own assertions
+            with pytest.raises(AssertionError, match=re.escape(expected)):
+                manager.plan_motion(origin, target_list, iteration_limit=20)
+            outcomes.add("failed")
+        else:
+            assert manager.plan_motion(origin, target_list, iteration_limit=20) == (
+                expected
+            )
+            outcomes.add("blended" if expected[0] else "not blended")
+
+    assert outcomes == {"blended", "not blended", "failed"}
+
+
+def test_plan_cache_evicts_least_recent() -> None:
+    """The plan cache should only keep its most recently used plans."""
+    manager = MoveManager(CONSTRAINTS, plan_cache_size=2)
+    origin = dict.fromkeys(SIXAXES, np.float64(0))
+
+    for z in [10, 20, 10, 30, 10, 20]:
+        manager.plan_motion(
+            origin, [MoveTarget.build(dict(origin, Z=np.float64(z)), np.float64(10))]
+        )
+
+    info = manager.plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+
 coords = st.lists(st.floats(min_value=0, max_value=1e64), min_size=4, max_size=4)
 
 
@@ -0,0 +1,6 @@
+"""In-process topic broker package."""
+
+from .broker import Broker, BrokerStats
+from .subscription import Subscription
+
+__all__ = ["Broker", "BrokerStats", "Subscription"]
@@ -0,0 +1,73 @@
+"""A topic broker fanning messages out to subscriber queues."""
+from __future__ import annotations
+
+import logging
+from typing import Generic, Hashable, List, Optional, Sequence
+
+from .subscription import BrokerStats, MessageT, Subscription, DEFAULT_MAX_SIZE
+
+log = logging.getLogger(__name__)
+
+
+class Broker(Generic[MessageT]):
+    """Fan published messages out to every matching subscription.
+
+    Messages are passed to subscribers as-is, so anything expensive, like
+    serialization, is done once by the publisher regardless of how many
+    subscribers there are. Each subscriber has its own bounded queue, so a
+    slow subscriber neither stalls the others nor grows memory without bound.
+    """
+
+    def __init__(self) -> None:
+        """Construct a broker with no subscribers."""
+        self._subscriptions: List[Subscription[MessageT]] = []
+        self._stats = BrokerStats()
+
+    @property
+    def stats(self) -> BrokerStats:
+        """Get the counters of messages flowing through this broker."""
+        return self._stats
+
+    def subscribe(
+        self, topics: Sequence[str], max_size: int = DEFAULT_MAX_SIZE
+    ) -> Subscription[MessageT]:
+        """Create a subscription to topics.
+
+        :param topics: Topic prefixes to receive. An empty string matches
+            every topic.
+        :param max_size: The most messages the subscription holds before
+            dropping the oldest.
+        """
+        subscription = Subscription[MessageT](
+            topics=topics, stats=self._stats, max_size=max_size
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[MessageT]) -> None:
+        """Close a subscription and stop delivering to it."""
+        subscription.close()
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def publish(
+        self, topic: str, message: MessageT, key: Optional[Hashable] = None
+    ) -> None:
+        """Publish a message to a topic.
+
+        :param topic: The topic.
+        :param message: The message. It is shared by all subscribers.
+        :param key: If not None, a pending message with the same key is
+            superseded by this one.
+        """
+        self._stats.published += 1
+        for subscription in self._subscriptions:
+            if subscription.matches(topic):
+                subscription.put(message, key)
+
+    def close(self) -> None:
+        """Close all subscriptions."""
+        for subscription in self._subscriptions:
+            subscription.close()
+        self._subscriptions = []
+        log.info("Broker closed: %s", self._stats)
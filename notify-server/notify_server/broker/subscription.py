@@ -0,0 +1,112 @@
+"""A bounded, coalescing subscriber queue."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, List, Optional, Sequence, TypeVar
+
+log = logging.getLogger(__name__)
+
+MessageT = TypeVar("MessageT")
+
+DEFAULT_MAX_SIZE = 1000
+"""Default number of messages a subscription holds before dropping the oldest."""
+
+
+@dataclass
+class BrokerStats:
+    """Counters of messages flowing through a broker."""
+
+    published: int = 0
+    """Messages published to the broker."""
+
+    delivered: int = 0
+    """Messages taken by subscribers."""
+
+    coalesced: int = 0
+    """Messages replaced by a newer message with the same key before delivery."""
+
+    dropped: int = 0
+    """Messages discarded because a subscriber's queue was full."""
+
+
+class Subscription(Generic[MessageT]):
+    """A subscriber's queue of messages waiting to be taken.
+
+    Messages published with a coalescing key replace any pending message with
+    the same key, so a subscriber that falls behind only receives the latest
+    value of state-style topics. The queue is bounded; once full, the oldest
+    pending message is dropped.
+    """
+
+    def __init__(
+        self,
+        topics: Sequence[str],
+        stats: Optional[BrokerStats] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """Construct an empty subscription.
+
+        :param topics: Topic prefixes to receive, as in a zmq SUB socket.
+            An empty string matches every topic.
+        :param stats: Counters to update.
+        :param max_size: The most messages to hold before dropping.
+        """
+        self._topics = tuple(topics)
+        self._stats = stats or BrokerStats()
+        self._max_size = max_size
+        self._pending: "OrderedDict[Hashable, MessageT]" = OrderedDict()
+        self._unique_keys = itertools.count()
+        self._changed = asyncio.Event()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription has been closed."""
+        return self._closed
+
+    def matches(self, topic: str) -> bool:
+        """Check whether a topic is subscribed to."""
+        return any(topic.startswith(t) for t in self._topics)
+
+    def put(self, message: MessageT, key: Optional[Hashable] = None) -> None:
+        """Add a message, replacing any pending message with the same key."""
+        if self._closed:
+            return
+
+        if key is None:
+            key = ("unique", next(self._unique_keys))
+        elif key in self._pending:
+            del self._pending[key]
+            self._stats.coalesced += 1
+
+        self._pending[key] = message
+
+        if len(self._pending) > self._max_size:
+            self._pending.popitem(last=False)
+            self._stats.dropped += 1
+            log.debug("Subscriber queue full, dropped oldest message.")
+
+        self._changed.set()
+
+    def close(self) -> None:
+        """Stop accepting messages and wake any waiting taker."""
+        self._closed = True
+        self._changed.set()
+
+    async def take_all(self) -> List[MessageT]:
+        """Wait for messages and take every pending one, oldest first.
+
+        Returns an empty list once closed and drained.
+        """
+        while not self._pending and not self._closed:
+            self._changed.clear()
+            await self._changed.wait()
+
+        messages = list(self._pending.values())
+        self._pending.clear()
+        self._stats.delivered += len(messages)
+        return messages
@@ -0,0 +1,33 @@
+"""Latest-value coalescing of state-style events."""
+from typing import Hashable, Optional
+
+from notify_server.models.event import Event
+from notify_server.models.hardware_event import DoorStatePayload
+from notify_server.models.run_event import (
+    RunStatusPayload,
+    CurrentCommandPayload,
+    CommandStatusPayload,
+)
+
+
+def get_coalescing_key(topic: str, event: Event) -> Optional[Hashable]:
+    """Get the key under which an event supersedes earlier events.
+
+    State-style events (door state, run status, current command, command
+    status) only matter in their latest value, so a consumer that falls
+    behind may drop any queued event that shares a key with a newer one.
+
+    :param topic: The topic the event was published to.
+    :param event: The event.
+    :return: A hashable key, or None if the event must never be dropped.
+    """
+    data = event.data
+
+    if isinstance(data, DoorStatePayload):
+        return topic, data.event
+    if isinstance(data, (RunStatusPayload, CurrentCommandPayload)):
+        return topic, data.event, data.runId
+    if isinstance(data, CommandStatusPayload):
+        return topic, data.event, data.runId, data.commandId
+
+    return None
@@ -5,6 +5,7 @@ from typing_extensions import Literal
 from pydantic import BaseModel
 
 from notify_server.models.hardware_event import HardwareEventPayload
+from notify_server.models.run_event import RunEventPayload
 
 
 class UserData(BaseModel):
@@ -17,4 +18,5 @@ class UserData(BaseModel):
 PayloadType = Union[
     UserData,
     HardwareEventPayload,
+    RunEventPayload,
 ]
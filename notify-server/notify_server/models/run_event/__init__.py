@@ -0,0 +1,18 @@
+"""Definitions of run event payloads."""
+from typing import Union
+
+from .names import RunEventName
+from .run_status import RunStatusPayload
+from .current_command import CurrentCommandPayload
+from .command_status import CommandStatusPayload
+
+
+RunEventPayload = Union[RunStatusPayload, CurrentCommandPayload, CommandStatusPayload]
+
+__all__ = [
+    "RunEventName",
+    "RunEventPayload",
+    "RunStatusPayload",
+    "CurrentCommandPayload",
+    "CommandStatusPayload",
+]
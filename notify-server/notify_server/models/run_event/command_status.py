@@ -0,0 +1,17 @@
+"""Model the command status event."""
+from opentrons.protocol_engine import CommandStatus
+from typing_extensions import Literal
+
+from pydantic import BaseModel
+
+from notify_server.models.run_event.names import RunEventName
+
+
+class CommandStatusPayload(BaseModel):
+    """The payload in a "command_status" event."""
+
+    event: Literal[RunEventName.COMMAND_STATUS] = RunEventName.COMMAND_STATUS
+    runId: str
+    commandId: str
+    commandKey: str
+    status: CommandStatus
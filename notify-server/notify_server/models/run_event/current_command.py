@@ -0,0 +1,16 @@
+"""Model the current command event."""
+from typing_extensions import Literal
+
+from pydantic import BaseModel
+
+from notify_server.models.run_event.names import RunEventName
+
+
+class CurrentCommandPayload(BaseModel):
+    """The payload in a "current_command" event."""
+
+    event: Literal[RunEventName.CURRENT_COMMAND] = RunEventName.CURRENT_COMMAND
+    runId: str
+    commandId: str
+    commandKey: str
+    index: int
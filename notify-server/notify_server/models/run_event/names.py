@@ -0,0 +1,10 @@
+"""The run event names."""
+from enum import Enum
+
+
+class RunEventName(str, Enum):
+    """The run event name enumeration."""
+
+    RUN_STATUS = "run_status"
+    CURRENT_COMMAND = "current_command"
+    COMMAND_STATUS = "command_status"
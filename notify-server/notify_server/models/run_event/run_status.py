@@ -0,0 +1,15 @@
+"""Model the run status event."""
+from opentrons.protocol_engine import EngineStatus
+from typing_extensions import Literal
+
+from pydantic import BaseModel
+
+from notify_server.models.run_event.names import RunEventName
+
+
+class RunStatusPayload(BaseModel):
+    """The payload in a "run_status" event."""
+
+    event: Literal[RunEventName.RUN_STATUS] = RunEventName.RUN_STATUS
+    runId: str
+    status: EngineStatus
@@ -2,49 +2,67 @@
 
 import logging
 import asyncio
-from asyncio import Queue
+from typing import Hashable, List, Optional
 
+from notify_server.broker import Broker, Subscription
+from notify_server.clients.serdes import MalformedFrames, from_frames
+from notify_server.models.coalescing import get_coalescing_key
 from notify_server.network.connection import create_publisher, create_pull, Connection
 from notify_server.settings import Settings
 
 log = logging.getLogger(__name__)
 
 
-async def _publisher_server_task(connection: Connection, queue: Queue) -> None:
+def _get_frames_key(frames: List[bytes]) -> Optional[Hashable]:
+    """Get the coalescing key of a multipart message, if it has one."""
+    try:
+        topic_event = from_frames(frames)
+    except MalformedFrames:
+        log.warning("Relaying malformed frames without coalescing.")
+        return None
+    return get_coalescing_key(topic_event.topic, topic_event.event)
+
+
+async def _publisher_server_task(
+    connection: Connection, broker: Broker[List[bytes]]
+) -> None:
     """
     Run a task that reads multipart messages: topic, data.
 
     This is the publisher server. Clients connect using zmq.PUSH pattern and
-    send messages to topics. Each topic, data pair is enqueued in queue.
+    send messages to topics. Each topic, data pair is published to the broker
+    as received, without being re-serialized.
 
     :param connection: The network connection.
-    :param queue: Queue for received messages.
+    :param broker: Broker for received messages.
     :return: None
     """
     try:
         while True:
             m = await connection.recv_multipart()
             log.debug("Event: %s", m)
-            await queue.put(m)
+            broker.publish(m[0].decode("utf-8"), m, _get_frames_key(m))
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
         connection.close()
 
 
-async def _subscriber_server_task(connection: Connection, queue: Queue) -> None:
+async def _subscriber_server_task(
+    connection: Connection, subscription: Subscription[List[bytes]]
+) -> None:
     """
     Run a task that publishes messages to subscribers.
 
     :param connection: The network connection.
-    :param queue: The queue of multipart messages to send
+    :param subscription: The broker subscription of multipart messages to send
     :return: None
     """
     try:
         while True:
-            s = await queue.get()
-            log.debug("Publishing: %s", s)
-            await connection.send_multipart(s)
+            for s in await subscription.take_all():
+                log.debug("Publishing: %s", s)
+                await connection.send_multipart(s)
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
@@ -53,16 +71,20 @@ async def _subscriber_server_task(connection: Connection, queue: Queue) -> None:
 
 async def run(settings: Settings) -> None:
     """Run the server tasks. Will not return."""
-    queue: Queue = Queue()
+    broker: Broker[List[bytes]] = Broker()
 
     subtask = asyncio.create_task(
         _subscriber_server_task(
-            create_publisher(settings.subscriber_address.connection_string()), queue
+            create_publisher(settings.subscriber_address.connection_string()),
+            broker.subscribe(topics=[""]),
         )
     )
     pubtask = asyncio.create_task(
         _publisher_server_task(
-            create_pull(settings.publisher_address.connection_string()), queue
+            create_pull(settings.publisher_address.connection_string()), broker
         )
     )
-    await asyncio.gather(subtask, pubtask)
+    try:
+        await asyncio.gather(subtask, pubtask)
+    finally:
+        broker.close()
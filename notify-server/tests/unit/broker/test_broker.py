@@ -0,0 +1,70 @@
+"""Unit tests for the broker module."""
+import pytest
+
+from notify_server.broker import Broker, Subscription
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_publish_to_matching_topics() -> None:
+    """Test that messages are delivered to subscribers of matching topics."""
+    subject: Broker[str] = Broker()
+    first = subject.subscribe(["topic1"])
+    all_topics = subject.subscribe([""])
+
+    subject.publish("topic1", "message1")
+    subject.publish("topic2", "message2")
+
+    assert await first.take_all() == ["message1"]
+    assert await all_topics.take_all() == ["message1", "message2"]
+    assert subject.stats.published == 2
+    assert subject.stats.delivered == 3
+
+
+async def test_coalesce_keyed_messages() -> None:
+    """Test that only the latest message with a key is delivered."""
+    subject: Broker[str] = Broker()
+    subscription = subject.subscribe(["topic"])
+
+    subject.publish("topic", "open", key="door")
+    subject.publish("topic", "unkeyed")
+    subject.publish("topic", "unkeyed")
+    subject.publish("topic", "closed", key="door")
+
+    assert await subscription.take_all() == ["unkeyed", "unkeyed", "closed"]
+    assert subject.stats.coalesced == 1
+
+
+async def test_drop_oldest_when_full() -> None:
+    """Test that a full subscription drops its oldest message."""
+    subject: Broker[str] = Broker()
+    subscription = subject.subscribe(["topic"], max_size=2)
+
+    subject.publish("topic", "message1")
+    subject.publish("topic", "message2")
+    subject.publish("topic", "message3")
+
+    assert await subscription.take_all() == ["message2", "message3"]
+    assert subject.stats.dropped == 1
+
+
+async def test_unsubscribe() -> None:
+    """Test that an unsubscribed subscription is closed and no longer fed."""
+    subject: Broker[str] = Broker()
+    subscription = subject.subscribe(["topic"])
+
+    subject.unsubscribe(subscription)
+    subject.publish("topic", "message")
+
+    assert subscription.closed
+    assert await subscription.take_all() == []
+
+
+async def test_take_all_drains_before_close() -> None:
+    """Test that pending messages are still taken after close."""
+    subscription = Subscription[str](topics=["topic"])
+    subscription.put("message")
+    subscription.close()
+
+    assert await subscription.take_all() == ["message"]
+    assert await subscription.take_all() == []
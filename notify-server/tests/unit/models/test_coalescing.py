@@ -0,0 +1,42 @@
+"""Unit tests for the coalescing module."""
+from datetime import datetime
+from typing import Hashable, Optional
+
+import pytest
+from opentrons.hardware_control.types import DoorState
+from opentrons.protocol_engine import CommandStatus, EngineStatus
+
+from notify_server.models.coalescing import get_coalescing_key
+from notify_server.models.event import Event
+from notify_server.models.hardware_event import DoorStatePayload
+from notify_server.models.payload_type import PayloadType, UserData
+from notify_server.models.run_event import (
+    RunStatusPayload,
+    CommandStatusPayload,
+)
+
+
+@pytest.mark.parametrize(
+    argnames=["data", "expected"],
+    argvalues=[
+        [UserData(data={"val1": 1}), None],
+        [DoorStatePayload(state=DoorState.OPEN), ("topic", "door_state")],
+        [
+            RunStatusPayload(runId="run-id", status=EngineStatus.RUNNING),
+            ("topic", "run_status", "run-id"),
+        ],
+        [
+            CommandStatusPayload(
+                runId="run-id",
+                commandId="command-id",
+                commandKey="command-key",
+                status=CommandStatus.SUCCEEDED,
+            ),
+            ("topic", "command_status", "run-id", "command-id"),
+        ],
+    ],
+)
+def test_get_coalescing_key(data: PayloadType, expected: Optional[Hashable]) -> None:
+    """Test that state-style events are keyed and other events are not."""
+    event = Event(createdOn=datetime(2020, 1, 1), publisher="pub", data=data)
+    assert get_coalescing_key("topic", event) == expected
@@ -3,9 +3,11 @@ from datetime import datetime
 from typing import Dict, Any
 
 import pytest
+from opentrons.protocol_engine import EngineStatus
 
 from notify_server.models.event import Event
 from notify_server.models.payload_type import UserData
+from notify_server.models.run_event import RunStatusPayload
 
 
 @pytest.mark.parametrize(
@@ -35,6 +37,10 @@ def test_bad_data_attribute(data: Dict[str, Any]) -> None:
             {"type": "UserData", "data": {"val1": 123, "val2": "egg"}},
             UserData(data={"val1": 123, "val2": "egg"}),
         ],
+        [
+            {"event": "run_status", "runId": "run-id", "status": "running"},
+            RunStatusPayload(runId="run-id", status=EngineStatus.RUNNING),
+        ],
     ],
 )
 def test_good_data(data: Dict[str, Any], expected: Event) -> None:
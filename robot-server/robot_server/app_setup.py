@@ -11,6 +11,7 @@ from .hardware import start_initializing_hardware, clean_up_hardware
 from .persistence import start_initializing_persistence, clean_up_persistence
 from .router import router
 from .service import initialize_logging
+from .service.notifications.relay import clean_up_notification_relay
 from .service.task_runner import (
     initialize_task_runner,
     clean_up_task_runner,
@@ -71,6 +72,7 @@ async def on_shutdown() -> None:
         clean_up_hardware(app.state),
         clean_up_persistence(app.state),
         clean_up_task_runner(app.state),
+        clean_up_notification_relay(app.state),
         return_exceptions=True,
     )
 
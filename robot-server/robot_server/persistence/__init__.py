@@ -1,7 +1,7 @@
 """Data access initialization and management."""
 
 
-from ._database import create_sql_engine, sqlite_rowid
+from ._database import create_sql_engine, read_only_transaction, sqlite_rowid
 from ._fastapi_dependencies import (
     start_initializing_persistence,
     clean_up_persistence,
@@ -10,6 +10,7 @@ from ._fastapi_dependencies import (
     get_persistence_resetter,
 )
 from ._persistence_directory import PersistenceResetter
+from ._store_cache import StoreCache, CacheStats
 from ._tables import (
     migration_table,
     protocol_table,
@@ -22,7 +23,10 @@ from ._tables import (
 __all__ = [
     # database utilities and helpers
     "create_sql_engine",
+    "read_only_transaction",
     "sqlite_rowid",
+    "StoreCache",
+    "CacheStats",
     # database tables
     "migration_table",
     "protocol_table",
@@ -1,7 +1,10 @@
 """SQLite database initialization and utilities."""
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Iterator
 
 import sqlalchemy
+from typing_extensions import Final
 
 from ._tables import add_tables_to_db
 from ._migrations import migrate
@@ -22,6 +25,28 @@ from ._migrations import migrate
 sqlite_rowid = sqlalchemy.column("_ROWID_")
 
 
+# How many connections to keep open to the database file.
+# SQLAlchemy defaults to opening a new connection for every transaction
+# on file-backed SQLite databases, which throws away SQLite's page cache
+# and prepared statements each time.
+_POOL_SIZE: Final = 5
+
+# How many extra connections to open temporarily when the pool is exhausted.
+_POOL_MAX_OVERFLOW: Final = 5
+
+# How many compiled statements each connection keeps for reuse.
+_STATEMENT_CACHE_SIZE: Final = 128
+
+# Page cache per connection, in KiB.
+_CACHE_SIZE_KIB: Final = 8 * 1024
+
+# How long a connection waits for another connection's write lock, in milliseconds.
+_BUSY_TIMEOUT_MS: Final = 5000
+
+# Flag in a DBAPI connection's `info` that its next transaction is read-only.
+_READ_ONLY_INFO_KEY: Final = "robot_server_read_only"
+
+
 def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     """Create a SQL engine with tables and migrations.
 
@@ -41,23 +66,99 @@ def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     return sql_engine
 
 
+@contextmanager
+def read_only_transaction(
+    sql_engine: sqlalchemy.engine.Engine,
+) -> Iterator[sqlalchemy.engine.Connection]:
+    """Open a read-only transaction, for use in place of `sql_engine.begin()`.
+
+    All reads in the transaction see a consistent snapshot of the database.
+    Because the database is in WAL mode, the snapshot is not blocked by,
+    and does not block, any concurrent write transaction.
+
+    Attempting to write in this transaction raises an `OperationalError`.
+    """
+    with sql_engine.connect() as connection:
+        info = connection.info
+        info[_READ_ONLY_INFO_KEY] = True
+        connection.exec_driver_sql("PRAGMA query_only=ON")
+        try:
+            with connection.begin():
+                yield connection
+        finally:
+            info[_READ_ONLY_INFO_KEY] = False
+            connection.exec_driver_sql("PRAGMA query_only=OFF")
+
+
+def optimize_db(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """Perform routine database maintenance.
+
+    This checkpoints the write-ahead log back into the main database file,
+    so the log doesn't grow without bound, and lets SQLite refresh
+    the statistics its query planner uses.
+
+    This does blocking I/O. If calling this from an async function,
+    offload this to a thread to avoid blocking the event loop.
+    """
+    with sql_engine.connect() as connection:
+        # PASSIVE so that this never waits on, or interrupts, readers and writers.
+        # Anything it can't checkpoint now will be caught by the next call.
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(PASSIVE)")
+        connection.exec_driver_sql("PRAGMA optimize")
+
+
 def _open_db_no_cleanup(db_file_path: Path) -> sqlalchemy.engine.Engine:
     """Create a database engine for performing transactions."""
     engine = sqlalchemy.create_engine(
         # sqlite://<hostname>/<path>
         # where <hostname> is empty.
         f"sqlite:///{db_file_path}",
+        poolclass=sqlalchemy.pool.QueuePool,
+        pool_size=_POOL_SIZE,
+        max_overflow=_POOL_MAX_OVERFLOW,
+        connect_args={
+            # Pooled connections may be used from worker threads,
+            # one thread at a time.
+            "check_same_thread": False,
+            "cached_statements": _STATEMENT_CACHE_SIZE,
+        },
     )
 
-    # Enable foreign key support in sqlite
-    # https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#foreign-key-support
     @sqlalchemy.event.listens_for(engine, "connect")  # type: ignore[misc]
     def _set_sqlite_pragma(
-        dbapi_connection: sqlalchemy.engine.CursorResult,
-        connection_record: sqlalchemy.engine.CursorResult,
+        dbapi_connection: Any,
+        connection_record: Any,
     ) -> None:
+        # Stop pysqlite from managing transactions itself, so that we can emit
+        # our own BEGIN statements, below. Otherwise, pysqlite would defer
+        # BEGIN until the first write, and a multi-statement read would not
+        # see a consistent snapshot.
+        # https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#serializable-isolation-savepoints-transactional-ddl
+        dbapi_connection.isolation_level = None
+
         cursor = dbapi_connection.cursor()
+        # Enable foreign key support in sqlite
+        # https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#foreign-key-support
         cursor.execute("PRAGMA foreign_keys=ON;")
+        # Let readers and a writer proceed concurrently.
+        # This is persistent in the database file, but setting it is cheap.
+        # https://www.sqlite.org/wal.html
+        cursor.execute("PRAGMA journal_mode=WAL;")
+        # In WAL mode, NORMAL is still safe from corruption, and only risks
+        # losing the most recent transactions on power loss.
+        cursor.execute("PRAGMA synchronous=NORMAL;")
+        # A negative number means KiB, rather than a number of pages.
+        cursor.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB};")
+        cursor.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS};")
         cursor.close()
 
+    @sqlalchemy.event.listens_for(engine, "begin")  # type: ignore[misc]
+    def _begin(connection: sqlalchemy.engine.Connection) -> None:
+        if connection.info.get(_READ_ONLY_INFO_KEY, False):
+            connection.exec_driver_sql("BEGIN")
+        else:
+            # Take the write lock up front, so a transaction that reads, then writes
+            # can't fail partway through because another connection wrote first.
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
     return engine
@@ -16,7 +16,7 @@ from server_utils.fastapi_utils.app_state import (
 )
 from robot_server.errors import ErrorDetails
 
-from ._database import create_sql_engine
+from ._database import create_sql_engine, optimize_db
 from ._persistence_directory import (
     PersistenceResetter,
     prepare as prepare_persistence_directory,
@@ -25,6 +25,9 @@ from ._persistence_directory import (
 
 _DATABASE_FILE: Final = "robot_server.db"
 
+# How often to checkpoint and optimize the database, in seconds.
+_MAINTENANCE_INTERVAL: Final = 5 * 60
+
 
 _log = logging.getLogger(__name__)
 
@@ -35,6 +38,9 @@ _directory_init_task_accessor = AppStateAccessor["asyncio.Task[Path]"](
 _sql_engine_init_task_accessor = AppStateAccessor["asyncio.Task[SQLEngine]"](
     "persistence_sql_engine_init_task"
 )
+_maintenance_task_accessor = AppStateAccessor["asyncio.Task[None]"](
+    "persistence_maintenance_task"
+)
 
 
 class DatabaseNotYetInitialized(ErrorDetails):
@@ -106,16 +112,45 @@ def start_initializing_persistence(
         app_state=app_state, value=sql_engine_init_task
     )
 
+    maintenance_task = asyncio.create_task(_maintain_periodically(sql_engine_init_task))
+    _maintenance_task_accessor.set_on(app_state=app_state, value=maintenance_task)
+
+
+async def _maintain_periodically(
+    sql_engine_init_task: "asyncio.Task[SQLEngine]",
+) -> None:
+    try:
+        sql_engine = await sql_engine_init_task
+    except Exception:
+        # Already logged by the initialization task.
+        return
+
+    while True:
+        await asyncio.sleep(_MAINTENANCE_INTERVAL)
+        try:
+            await to_thread.run_sync(optimize_db, sql_engine)
+        except Exception:
+            _log.exception("Exception performing database maintenance.")
+
 
 async def clean_up_persistence(app_state: AppState) -> None:
     """Clean up the persistence layer.
 
     This should be called exactly once at server shutdown.
     """
+    maintenance_task = _maintenance_task_accessor.get_from(app_state=app_state)
     sql_engine_init_task = _sql_engine_init_task_accessor.get_from(app_state=app_state)
     directory_init_task = _directory_init_task_accessor.get_from(app_state=app_state)
+    if maintenance_task is not None:
+        maintenance_task.cancel()
+        try:
+            await maintenance_task
+        except asyncio.CancelledError:
+            pass
     if sql_engine_init_task is not None:
         sql_engine = await sql_engine_init_task
+        # Leave the WAL checkpointed, so the database file is complete on its own.
+        await to_thread.run_sync(optimize_db, sql_engine)
         sql_engine.dispose()
     if directory_init_task is not None:
         await directory_init_task
@@ -0,0 +1,220 @@
+"""An in-memory, read-through cache for SQL-backed stores."""
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+
+_ValueT = TypeVar("_ValueT")
+
+# Containers with more items than this have their size estimated from a sample.
+_MAX_SAMPLED_ITEMS = 32
+
+
+@dataclass
+class CacheStats:
+    """Counters describing a `StoreCache`'s effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    tags: Tuple[Hashable, ...]
+    size_bytes: int
+
+
+class StoreCache:
+    """A least-recently-used cache of a store's read results.
+
+    Each entry is tagged with the resources it was computed from,
+    for example a run ID. When a resource changes, the store invalidates
+    its tag, which drops only the entries computed from that resource,
+    instead of the whole cache.
+
+    The cache is limited by the estimated in-memory size of its values,
+    rather than by the number of entries, since a single run's
+    commands may be orders of magnitude larger than another run's.
+
+    The cache is safe to use from multiple threads. Loads run outside of
+    its lock, so concurrent misses may load the same value more than once.
+    A value whose load overlapped an invalidation is returned but not
+    cached, since it may have been read from before the write.
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int,
+        size_of: Optional[Callable[[object], int]] = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Params:
+            max_size_bytes: The total estimated size of cached values above which
+                least-recently-used entries are evicted.
+            size_of: A function to estimate a value's size in bytes.
+                Defaults to `estimate_size()`.
+        """
+        self._max_size_bytes = max_size_bytes
+        self._size_of = size_of or estimate_size
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._keys_by_tag: Dict[Hashable, Set[Hashable]] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        # Incremented by every invalidation, to detect ones that overlap a load.
+        self._generation = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache's counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+                size_bytes=self._stats.size_bytes,
+            )
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], _ValueT],
+        tags: Iterable[Hashable] = (),
+    ) -> _ValueT:
+        """Return the cached value for `key`, loading and caching it if necessary.
+
+        Params:
+            key: A unique key for the value, including the name of the read
+                and all of its arguments.
+            load: A function to compute the value on a miss.
+                If it raises, nothing is cached.
+            tags: The resources the value was computed from.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry.value  # type: ignore[no-any-return]
+
+            self._stats.misses += 1
+            generation = self._generation
+
+        value = load()
+        size_bytes = self._size_of(value)
+
+        with self._lock:
+            # A value that can never fit would only flush everything else.
+            if generation == self._generation and size_bytes <= self._max_size_bytes:
+                self._add(
+                    key, _Entry(value=value, tags=tuple(tags), size_bytes=size_bytes)
+                )
+
+        return value
+
+    def invalidate(self, *tags: Hashable) -> None:
+        """Drop all entries computed from any of the given resources."""
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in self._keys_by_tag.pop(tag, set()):
+                    if key in self._entries:
+                        self._remove(key)
+                        self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._stats.size_bytes = 0
+
+    def _add(self, key: Hashable, entry: _Entry) -> None:
+        if key in self._entries:
+            # Another thread loaded the same key while this one was loading.
+            self._remove(key)
+        self._entries[key] = entry
+        self._stats.size_bytes += entry.size_bytes
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while self._stats.size_bytes > self._max_size_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._stats.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._stats.size_bytes -= entry.size_bytes
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+def estimate_size(value: object) -> int:
+    """Estimate the memory used by a value and everything it refers to, in bytes.
+
+    This walks containers, dataclasses, and Pydantic models,
+    counting each distinct object once. It's approximate, but proportional
+    enough to the true size for the purpose of bounding a cache.
+
+    A container with many items, like a run's list of commands, is estimated
+    from an evenly spaced sample of its items, so the cost of an estimate
+    doesn't grow with the length of the container.
+    """
+    return _estimate_size(value, set())
+
+
+def _estimate_size(obj: object, seen: Set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    items: Sequence[object]
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, Enum, type)):
+        return size
+    elif isinstance(obj, dict):
+        items = [*obj.keys(), *obj.values()]
+    elif isinstance(obj, (list, tuple)):
+        items = obj
+    elif isinstance(obj, (set, frozenset)):
+        items = list(obj)
+    elif hasattr(obj, "__dict__"):
+        items = [vars(obj)]
+    else:
+        return size
+
+    if len(items) <= _MAX_SAMPLED_ITEMS:
+        return size + sum(_estimate_size(item, seen) for item in items)
+
+    step = len(items) / _MAX_SAMPLED_ITEMS
+    sample = [items[int(i * step)] for i in range(_MAX_SAMPLED_ITEMS)]
+    sample_size = sum(_estimate_size(item, seen) for item in sample)
+    return size + sample_size * len(items) // _MAX_SAMPLED_ITEMS
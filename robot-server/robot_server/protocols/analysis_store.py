@@ -17,7 +17,11 @@ from opentrons.protocol_engine import (
     Liquid,
 )
 
-from robot_server.persistence import analysis_table, sqlite_rowid
+from robot_server.persistence import (
+    analysis_table,
+    read_only_transaction,
+    sqlite_rowid,
+)
 from robot_server.persistence import legacy_pickle
 
 from .analysis_models import (
@@ -67,7 +71,7 @@ class AnalysisNotFoundError(ValueError):
 # TODO(mm, 2022-05-19): Unlike ProtocolStore and RunStore, this class doesn't
 # have an in-memory cache. This is because of implementation difficulties:
 # this class is currently the only one of the three to have any async methods,
-# which functools.lru_cache() doesn't support.
+# which StoreCache.get_or_load() doesn't support.
 #
 # We should have a consistent strategy across all stores.
 # Either figure out an in-memory cache that supports async methods,
@@ -371,7 +375,7 @@ class _CompletedAnalysisStore:
         statement = sqlalchemy.select(analysis_table).where(
             analysis_table.c.id == analysis_id
         )
-        with self._sql_engine.begin() as transaction:
+        with read_only_transaction(self._sql_engine) as transaction:
             try:
                 result = transaction.execute(statement).one()
             except sqlalchemy.exc.NoResultFound:
@@ -391,7 +395,7 @@ class _CompletedAnalysisStore:
             .where(analysis_table.c.protocol_id == protocol_id)
             .order_by(sqlite_rowid)
         )
-        with self._sql_engine.begin() as transaction:
+        with read_only_transaction(self._sql_engine) as transaction:
             results = transaction.execute(statement).all()
         return [await _CompletedAnalysisResource.from_sql_row(r) for r in results]
 
@@ -402,7 +406,7 @@ class _CompletedAnalysisStore:
             .where(analysis_table.c.protocol_id == protocol_id)
             .order_by(sqlite_rowid)
         )
-        with self._sql_engine.begin() as transaction:
+        with read_only_transaction(self._sql_engine) as transaction:
             results = transaction.execute(statement).all()
 
         result_ids: List[str] = []
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
 from typing import Dict, List, Optional, Set
@@ -13,14 +12,20 @@ import sqlalchemy
 
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 from robot_server.persistence import (
+    CacheStats,
+    StoreCache,
     analysis_table,
     protocol_table,
     run_table,
+    read_only_transaction,
     sqlite_rowid,
 )
 
 
-_CACHE_ENTRIES = 32
+_CACHE_MAX_SIZE_BYTES = 4 * 1024 * 1024
+
+# Cache tag for reads that depend on every protocol.
+_ALL_PROTOCOLS = object()
 
 
 _log = getLogger(__name__)
@@ -95,6 +100,12 @@ class ProtocolStore:
         """
         self._sql_engine = _sql_engine
         self._sources_by_id = _sources_by_id
+        self._cache = StoreCache(max_size_bytes=_CACHE_MAX_SIZE_BYTES)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Get hit, miss, and size counters for this store's in-memory cache."""
+        return self._cache.stats
 
     @classmethod
     def create_empty(
@@ -168,15 +179,44 @@ class ProtocolStore:
             )
         )
         self._sources_by_id[resource.protocol_id] = resource.source
-        self._clear_caches()
+        self._cache.invalidate(resource.protocol_id, _ALL_PROTOCOLS)
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get(self, protocol_id: str) -> ProtocolResource:
         """Get a single protocol by ID.
 
         Raises:
             ProtocolNotFoundError
         """
+        return self._cache.get_or_load(
+            key=("get", protocol_id),
+            load=lambda: self._get(protocol_id),
+            tags=(protocol_id,),
+        )
+
+    def get_all(self) -> List[ProtocolResource]:
+        """Get all protocols currently saved in this store."""
+        return self._cache.get_or_load(
+            key=("get_all",),
+            load=self._get_all,
+            tags=(_ALL_PROTOCOLS,),
+        )
+
+    def get_id_by_hash(self, hash: str) -> Optional[str]:
+        """Get all protocol hashes keyed by protocol id."""
+        for p in self.get_all():
+            if p.source.content_hash == hash:
+                return p.protocol_id
+        return None
+
+    def has(self, protocol_id: str) -> bool:
+        """Check for the presence of a protocol ID in the store."""
+        return self._cache.get_or_load(
+            key=("has", protocol_id),
+            load=lambda: self._sql_has(protocol_id),
+            tags=(protocol_id,),
+        )
+
+    def _get(self, protocol_id: str) -> ProtocolResource:
         sql_resource = self._sql_get(protocol_id=protocol_id)
         return ProtocolResource(
             protocol_id=sql_resource.protocol_id,
@@ -185,9 +225,7 @@ class ProtocolStore:
             source=self._sources_by_id[sql_resource.protocol_id],
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get_all(self) -> List[ProtocolResource]:
-        """Get all protocols currently saved in this store."""
+    def _get_all(self) -> List[ProtocolResource]:
         all_sql_resources = self._sql_get_all()
         return [
             ProtocolResource(
@@ -199,25 +237,6 @@ class ProtocolStore:
             for r in all_sql_resources
         ]
 
-    def get_id_by_hash(self, hash: str) -> Optional[str]:
-        """Get all protocol hashes keyed by protocol id."""
-        for p in self.get_all():
-            if p.source.content_hash == hash:
-                return p.protocol_id
-        return None
-
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def has(self, protocol_id: str) -> bool:
-        """Check for the presence of a protocol ID in the store."""
-        statement = sqlalchemy.select(protocol_table).where(
-            protocol_table.c.id == protocol_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            result = transaction.execute(statement).one_or_none()
-
-        return result is not None
-
     def remove(self, protocol_id: str) -> None:
         """Remove a `ProtocolResource` from the store.
 
@@ -243,7 +262,7 @@ class ProtocolStore:
         if protocol_dir:
             protocol_dir.rmdir()
 
-        self._clear_caches()
+        self._cache.invalidate(protocol_id, _ALL_PROTOCOLS)
 
     # Note that this is NOT cached like the other getters because we would need
     # to invalidate the cache whenever the runs table changes, which is not something
@@ -262,7 +281,7 @@ class ProtocolStore:
             run_table.c.protocol_id.is_not(None)
         )
 
-        with self._sql_engine.begin() as transaction:
+        with read_only_transaction(self._sql_engine) as transaction:
             all_protocol_ids: List[str] = (
                 transaction.execute(select_all_protocol_ids).scalars().all()
             )
@@ -294,12 +313,22 @@ class ProtocolStore:
             run_table.c.protocol_id == protocol_id
         )
 
-        with self._sql_engine.begin() as transaction:
+        with read_only_transaction(self._sql_engine) as transaction:
             referencing_run_ids = (
                 transaction.execute(select_referencing_run_ids).scalars().all()
             )
         return referencing_run_ids
 
+    def _sql_has(self, protocol_id: str) -> bool:
+        statement = sqlalchemy.select(protocol_table).where(
+            protocol_table.c.id == protocol_id
+        )
+
+        with read_only_transaction(self._sql_engine) as transaction:
+            result = transaction.execute(statement).one_or_none()
+
+        return result is not None
+
     def _sql_insert(self, resource: _DBProtocolResource) -> None:
         statement = sqlalchemy.insert(protocol_table).values(
             _convert_dataclass_to_sql_values(resource=resource)
@@ -311,7 +340,7 @@ class ProtocolStore:
         statement = sqlalchemy.select(protocol_table).where(
             protocol_table.c.id == protocol_id
         )
-        with self._sql_engine.begin() as transaction:
+        with read_only_transaction(self._sql_engine) as transaction:
             try:
                 matching_row = transaction.execute(statement).one()
             except sqlalchemy.exc.NoResultFound as e:
@@ -326,7 +355,7 @@ class ProtocolStore:
         sql_engine: sqlalchemy.engine.Engine,
     ) -> List[_DBProtocolResource]:
         statement = sqlalchemy.select(protocol_table)
-        with sql_engine.begin() as transaction:
+        with read_only_transaction(sql_engine) as transaction:
             all_rows = transaction.execute(statement).all()
         return [_convert_sql_row_to_dataclass(sql_row=row) for row in all_rows]
 
@@ -357,11 +386,6 @@ class ProtocolStore:
         if result.rowcount < 1:
             raise ProtocolNotFoundError(protocol_id=protocol_id)
 
-    def _clear_caches(self) -> None:
-        self.get.cache_clear()
-        self.get_all.cache_clear()
-        self.has.cache_clear()
-
 
 # TODO(mm, 2022-04-18):
 # Restructure to degrade gracefully in the face of ProtocolReader failures.
@@ -6,6 +6,8 @@ from opentrons_shared_data.robot.dev_types import RobotType
 
 from opentrons.hardware_control import HardwareControlAPI
 
+from notify_server.clients.publisher import Publisher
+
 from server_utils.fastapi_utils.app_state import (
     AppState,
     AppStateAccessor,
@@ -13,6 +15,7 @@ from server_utils.fastapi_utils.app_state import (
 )
 from robot_server.hardware import get_hardware, get_robot_type
 from robot_server.persistence import get_sql_engine
+from robot_server.service.notifications.publisher import get_notify_publisher
 from robot_server.service.task_runner import get_task_runner, TaskRunner
 from robot_server.settings import get_settings
 from robot_server.deletion_planner import RunDeletionPlanner
@@ -44,12 +47,17 @@ async def get_engine_store(
     app_state: AppState = Depends(get_app_state),
     hardware_api: HardwareControlAPI = Depends(get_hardware),
     robot_type: RobotType = Depends(get_robot_type),
+    notify_publisher: Publisher = Depends(get_notify_publisher),
 ) -> EngineStore:
     """Get a singleton EngineStore to keep track of created engines / runners."""
     engine_store = _engine_store_accessor.get_from(app_state)
 
     if engine_store is None:
-        engine_store = EngineStore(hardware_api=hardware_api, robot_type=robot_type)
+        engine_store = EngineStore(
+            hardware_api=hardware_api,
+            robot_type=robot_type,
+            notify_publisher=notify_publisher,
+        )
         _engine_store_accessor.set_on(app_state, engine_store)
 
     return engine_store
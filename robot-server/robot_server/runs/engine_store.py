@@ -14,9 +14,12 @@ from opentrons.protocol_engine import (
     create_protocol_engine,
 )
 
+from notify_server.clients.publisher import Publisher
 
 from robot_server.protocols import ProtocolResource
 
+from .run_event_publisher import RunEventPublisher
+
 
 class EngineConflictError(RuntimeError):
     """An error raised if an active engine is already initialized.
@@ -41,6 +44,7 @@ class EngineStore:
         self,
         hardware_api: HardwareControlAPI,
         robot_type: RobotType,
+        notify_publisher: Optional[Publisher] = None,
     ) -> None:
         """Initialize an engine storage interface.
 
@@ -48,9 +52,12 @@ class EngineStore:
             hardware_api: Hardware control API instance used for ProtocolEngine
                 construction.
             robot_type: Passed along to `opentrons.protocol_engine.Config`.
+            notify_publisher: If given, run and command changes of each run's
+                engine are published to the notification server through it.
         """
         self._hardware_api = hardware_api
         self._robot_type = robot_type
+        self._notify_publisher = notify_publisher
         self._default_engine: Optional[ProtocolEngine] = None
         self._runner_engine_pair: Optional[RunnerEnginePair] = None
 
@@ -137,6 +144,11 @@ class EngineStore:
         if self._runner_engine_pair is not None:
             raise EngineConflictError("Another run is currently active.")
 
+        if self._notify_publisher is not None:
+            engine.add_plugin(
+                RunEventPublisher(run_id=run_id, publisher=self._notify_publisher)
+            )
+
         if protocol is not None:
             # FIXME(mm, 2022-12-21): This `await` introduces a concurrency hazard. If
             # two requests simultaneously call this method, they will both "succeed"
@@ -165,7 +177,11 @@ class EngineStore:
         state_view = engine.state_view
 
         if state_view.commands.get_is_okay_to_clear():
-            await engine.finish(drop_tips_and_home=False, set_run_status=False)
+            if self.runner.was_started():
+                await engine.finish(drop_tips_and_home=False, set_run_status=False)
+            else:
+                # Also stops the runner from preparing protocol commands.
+                await self.runner.stop()
         else:
             raise EngineConflictError("Current run is not idle or stopped.")
 
@@ -0,0 +1,141 @@
+"""Publish ProtocolEngine run and command changes to the notification server."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from opentrons.util.helpers import utc_now
+from opentrons.protocol_engine import (
+    AbstractPlugin,
+    EngineStatus,
+    actions as pe_actions,
+)
+from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
+
+from notify_server.clients.publisher import Publisher
+from notify_server.models.event import Event
+from notify_server.models.topics import RobotEventTopics
+from notify_server.models.run_event import (
+    RunEventPayload,
+    RunStatusPayload,
+    CurrentCommandPayload,
+    CommandStatusPayload,
+)
+
+log = logging.getLogger(__name__)
+
+
+class RunEventPublisher(AbstractPlugin):
+    """A ProtocolEngine plugin that pushes run changes to subscribers.
+
+    Instead of clients polling `GET /runs/{id}` to watch a run's progress,
+    this plugin publishes an event to the `run_events` notification topic
+    whenever the run status, the current command, or a command's status
+    changes.
+
+    Actions only mark what may have changed. The actual events are computed
+    from engine state by a background task, once per event loop wake-up,
+    so a burst of actions results in a single round of publishing, with
+    each command and the run reported at most once, in its latest state.
+    Newly queued commands are not published; commands are reported once
+    they leave the queue.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        publisher: Publisher,
+        change_notifier: Optional[ChangeNotifier] = None,
+    ) -> None:
+        """Initialize the plugin with its dependencies."""
+        self._run_id = run_id
+        self._publisher = publisher
+        self._change_notifier = change_notifier or ChangeNotifier()
+        self._publishing_task: Optional[asyncio.Task[None]] = None
+
+        # Ordered so commands are published in the order they changed.
+        # The values are unused.
+        self._changed_command_ids: Dict[str, None] = {}
+        self._last_status: Optional[EngineStatus] = None
+        self._last_current_command_id: Optional[str] = None
+
+    def setup(self) -> None:
+        """Kick off a background task to publish changes as they happen."""
+        self._publishing_task = asyncio.create_task(self._publish_forever())
+
+    async def teardown(self) -> None:
+        """Stop the background task and publish any outstanding changes."""
+        if self._publishing_task is not None:
+            self._publishing_task.cancel()
+            try:
+                await self._publishing_task
+            except asyncio.CancelledError:
+                pass
+            self._publishing_task = None
+
+        self._publish_changes()
+
+    def handle_action(self, action: pe_actions.Action) -> None:
+        """Mark anything the action may change as needing publishing."""
+        if isinstance(action, pe_actions.UpdateCommandAction):
+            self._changed_command_ids[action.command.id] = None
+        elif isinstance(action, pe_actions.FailCommandAction):
+            self._changed_command_ids[action.command_id] = None
+
+        self._change_notifier.notify()
+
+    async def _publish_forever(self) -> None:
+        # Plugins see actions before the StateStore does, so publishing
+        # happens here, once this task is next scheduled, rather than in
+        # `handle_action`, to read state that reflects them.
+        while True:
+            self._publish_changes()
+            await self._change_notifier.wait()
+
+    def _publish_changes(self) -> None:
+        commands = self.state.commands
+
+        changed_command_ids = self._changed_command_ids
+        self._changed_command_ids = {}
+
+        for command_id in changed_command_ids:
+            command = commands.get(command_id)
+            self._publish(
+                CommandStatusPayload(
+                    runId=self._run_id,
+                    commandId=command.id,
+                    commandKey=command.key,
+                    status=command.status,
+                )
+            )
+
+        current_command = commands.get_current()
+        if (
+            current_command is not None
+            and current_command.command_id != self._last_current_command_id
+        ):
+            self._last_current_command_id = current_command.command_id
+            self._publish(
+                CurrentCommandPayload(
+                    runId=self._run_id,
+                    commandId=current_command.command_id,
+                    commandKey=current_command.command_key,
+                    index=current_command.index,
+                )
+            )
+
+        status = commands.get_status()
+        if status != self._last_status:
+            self._last_status = status
+            self._publish(RunStatusPayload(runId=self._run_id, status=status))
+
+    def _publish(self, payload: RunEventPayload) -> None:
+        try:
+            self._publisher.send_nowait(
+                RobotEventTopics.RUN_EVENTS,
+                Event(createdOn=utc_now(), publisher=__name__, data=payload),
+            )
+        except Exception:
+            # Notifications are best-effort and must never break a run.
+            log.exception("Failed to publish run event.")
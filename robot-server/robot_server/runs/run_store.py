@@ -2,7 +2,6 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
 from typing import Any, Dict, List, Optional, cast
 
 import sqlalchemy
@@ -12,13 +11,23 @@ from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table
+from robot_server.persistence import (
+    CacheStats,
+    StoreCache,
+    action_table,
+    read_only_transaction,
+    run_table,
+)
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
 
 
-_CACHE_ENTRIES = 32
+# Enough to hold the full command lists of a few long runs.
+_CACHE_MAX_SIZE_BYTES = 32 * 1024 * 1024
+
+# Cache tag for reads that depend on every run.
+_ALL_RUNS = object()
 
 
 @dataclass(frozen=True)
@@ -57,6 +66,12 @@ class RunStore:
     def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
         """Initialize a RunStore with sql engine."""
         self._sql_engine = sql_engine
+        self._cache = StoreCache(max_size_bytes=_CACHE_MAX_SIZE_BYTES)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Get hit, miss, and size counters for this store's in-memory cache."""
+        return self._cache.stats
 
     def update_run_state(
         self,
@@ -107,7 +122,7 @@ class RunStore:
 
             action_rows = transaction.execute(select_actions).all()
 
-        self._clear_caches()
+        self._cache.invalidate(run_id, _ALL_RUNS)
         return _convert_row_to_run(row=run_row, action_rows=action_rows)
 
     def insert_action(self, run_id: str, action: RunAction) -> None:
@@ -130,7 +145,7 @@ class RunStore:
             except sqlalchemy.exc.IntegrityError as e:
                 raise RunNotFoundError(run_id=run_id) from e
 
-        self._clear_caches()
+        self._cache.invalidate(run_id, _ALL_RUNS)
 
     def insert(
         self,
@@ -171,17 +186,17 @@ class RunStore:
                 ), "Insert run failed due to unexpected IntegrityError"
                 raise ProtocolNotFoundError(protocol_id=run.protocol_id)
 
-        self._clear_caches()
+        self._cache.invalidate(run_id, _ALL_RUNS)
         return run
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def has(self, run_id: str) -> bool:
         """Whether a given run exists in the store."""
-        statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
-        with self._sql_engine.begin() as transaction:
-            return transaction.execute(statement).first() is not None
+        return self._cache.get_or_load(
+            key=("has", run_id),
+            load=lambda: self._sql_has(run_id),
+            tags=(run_id,),
+        )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get(self, run_id: str) -> RunResource:
         """Get a specific run entry by its identifier.
 
@@ -194,50 +209,24 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        select_run_resource = sqlalchemy.select(_run_columns).where(
-            run_table.c.id == run_id
+        return self._cache.get_or_load(
+            key=("get", run_id),
+            load=lambda: self._sql_get(run_id),
+            tags=(run_id,),
         )
 
-        select_actions = sqlalchemy.select(action_table).where(
-            action_table.c.run_id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            try:
-                run_row = transaction.execute(select_run_resource).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id) from e
-            action_rows = transaction.execute(select_actions).all()
-
-        return _convert_row_to_run(run_row, action_rows)
-
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_all(self) -> List[RunResource]:
         """Get all known run resources.
 
         Returns:
             All stored run entries.
         """
-        select_runs = sqlalchemy.select(_run_columns)
-        select_actions = sqlalchemy.select(action_table)
-        actions_by_run_id = defaultdict(list)
-
-        with self._sql_engine.begin() as transaction:
-            runs = transaction.execute(select_runs).all()
-            actions = transaction.execute(select_actions).all()
-
-        for action_row in actions:
-            actions_by_run_id[action_row.run_id].append(action_row)
-
-        return [
-            _convert_row_to_run(
-                row=run_row,
-                action_rows=actions_by_run_id[run_row.id],
-            )
-            for run_row in runs
-        ]
+        return self._cache.get_or_load(
+            key=("get_all",),
+            load=self._sql_get_all,
+            tags=(_ALL_RUNS,),
+        )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_state_summary(self, run_id: str) -> Optional[StateSummary]:
         """Get the archived run state summary.
 
@@ -245,33 +234,10 @@ class RunStore:
         captured when the run was archived. It contains
         status, equipment, and error information.
         """
-        select_run_data = sqlalchemy.select(run_table.c.state_summary).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            row = transaction.execute(select_run_data).one()
-
-        return (
-            StateSummary.parse_obj(row.state_summary)
-            if row.state_summary is not None
-            else None
-        )
-
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
-                raise RunNotFoundError(run_id=run_id)
-
-        return (
-            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
+        return self._cache.get_or_load(
+            key=("get_state_summary", run_id),
+            load=lambda: self._sql_get_state_summary(run_id),
+            tags=(run_id,),
         )
 
     def get_commands_slice(
@@ -313,7 +279,6 @@ class RunStore:
             commands=sliced_commands,
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_command(self, run_id: str, command_id: str) -> Command:
         """Get run command by id.
 
@@ -328,21 +293,11 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        return self._cache.get_or_load(
+            key=("get_command", run_id, command_id),
+            load=lambda: self._parse_command(run_id, command_id),
+            tags=(run_id,),
         )
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
-
-        try:
-            command = next(c for c in row.commands if c["id"] == command_id)
-        except StopIteration as e:
-            raise CommandNotFoundError(command_id=command_id) from e
-
-        return parse_obj_as(Command, command)  # type: ignore[arg-type]
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -364,15 +319,98 @@ class RunStore:
         if result.rowcount < 1:
             raise RunNotFoundError(run_id)
 
-        self._clear_caches()
+        self._cache.invalidate(run_id, _ALL_RUNS)
+
+    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
+        return self._cache.get_or_load(
+            key=("get_all_unparsed_commands", run_id),
+            load=lambda: self._sql_get_all_unparsed_commands(run_id),
+            tags=(run_id,),
+        )
+
+    def _parse_command(self, run_id: str, command_id: str) -> Command:
+        try:
+            command = next(
+                c
+                for c in self._get_all_unparsed_commands(run_id)
+                if c["id"] == command_id
+            )
+        except StopIteration as e:
+            raise CommandNotFoundError(command_id=command_id) from e
+
+        return parse_obj_as(Command, command)  # type: ignore[arg-type]
+
+    def _sql_has(self, run_id: str) -> bool:
+        statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+        with read_only_transaction(self._sql_engine) as transaction:
+            return transaction.execute(statement).first() is not None
+
+    def _sql_get(self, run_id: str) -> RunResource:
+        select_run_resource = sqlalchemy.select(_run_columns).where(
+            run_table.c.id == run_id
+        )
+
+        select_actions = sqlalchemy.select(action_table).where(
+            action_table.c.run_id == run_id
+        )
 
-    def _clear_caches(self) -> None:
-        self.has.cache_clear()
-        self.get.cache_clear()
-        self.get_all.cache_clear()
-        self.get_state_summary.cache_clear()
-        self.get_command.cache_clear()
-        self._get_all_unparsed_commands.cache_clear()
+        with read_only_transaction(self._sql_engine) as transaction:
+            try:
+                run_row = transaction.execute(select_run_resource).one()
+            except sqlalchemy.exc.NoResultFound as e:
+                raise RunNotFoundError(run_id) from e
+            action_rows = transaction.execute(select_actions).all()
+
+        return _convert_row_to_run(run_row, action_rows)
+
+    def _sql_get_all(self) -> List[RunResource]:
+        select_runs = sqlalchemy.select(_run_columns)
+        select_actions = sqlalchemy.select(action_table)
+        actions_by_run_id = defaultdict(list)
+
+        with read_only_transaction(self._sql_engine) as transaction:
+            runs = transaction.execute(select_runs).all()
+            actions = transaction.execute(select_actions).all()
+
+        for action_row in actions:
+            actions_by_run_id[action_row.run_id].append(action_row)
+
+        return [
+            _convert_row_to_run(
+                row=run_row,
+                action_rows=actions_by_run_id[run_row.id],
+            )
+            for run_row in runs
+        ]
+
+    def _sql_get_state_summary(self, run_id: str) -> Optional[StateSummary]:
+        select_run_data = sqlalchemy.select(run_table.c.state_summary).where(
+            run_table.c.id == run_id
+        )
+
+        with read_only_transaction(self._sql_engine) as transaction:
+            row = transaction.execute(select_run_data).one()
+
+        return (
+            StateSummary.parse_obj(row.state_summary)
+            if row.state_summary is not None
+            else None
+        )
+
+    def _sql_get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
+        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
+            run_table.c.id == run_id
+        )
+
+        with read_only_transaction(self._sql_engine) as transaction:
+            try:
+                row = transaction.execute(select_run_commands).one()
+            except sqlalchemy.exc.NoResultFound:
+                raise RunNotFoundError(run_id=run_id)
+
+        return (
+            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
+        )
 
 
 # The columns that must be present in a row passed to _convert_row_to_run().
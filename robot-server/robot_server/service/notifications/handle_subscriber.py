@@ -1,46 +1,50 @@
 """Websocket subscriber handler functions."""
 import asyncio
 import logging
-from asyncio import CancelledError
 from typing import List
 
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-from notify_server.clients.serdes import TopicEvent
-from notify_server.clients.subscriber import Subscriber, create
+from notify_server.broker import Subscription
 
-from robot_server.settings import get_settings
+from .relay import NotificationRelay
 
 log = logging.getLogger(__name__)
 
 
-async def handle_socket(websocket: WebSocket, topics: List[str]) -> None:
+async def handle_socket(
+    websocket: WebSocket, topics: List[str], relay: NotificationRelay
+) -> None:
     """Handle a websocket connection."""
-    subscriber = create(get_settings().notification_server_subscriber_address, topics)
-    await asyncio.gather(
-        receive(websocket, subscriber), route_events(websocket, subscriber)
-    )
+    subscription = relay.subscribe(topics)
+    try:
+        await asyncio.gather(
+            receive(websocket, subscription), route_events(websocket, subscription)
+        )
+    finally:
+        relay.unsubscribe(subscription)
 
 
-async def receive(websocket: WebSocket, subscriber: Subscriber) -> None:
+async def receive(websocket: WebSocket, subscription: Subscription[str]) -> None:
     """Read data from websocket. Will exit on websocket disconnect."""
     try:
         while True:
             await websocket.receive_json()
     except WebSocketDisconnect:
         log.info("Websocket subscriber disconnected.")
-        subscriber.close()
+        subscription.close()
 
 
-async def send(websocket: WebSocket, entry: TopicEvent) -> None:
-    """Send entry to web socket."""
-    await websocket.send_text(entry.json())
+async def send(websocket: WebSocket, text: str) -> None:
+    """Send a serialized entry to web socket."""
+    await websocket.send_text(text)
 
 
-async def route_events(websocket: WebSocket, subscriber: Subscriber) -> None:
-    """Route events from subscriber to websocket."""
-    try:
-        async for entry in subscriber:
+async def route_events(websocket: WebSocket, subscription: Subscription[str]) -> None:
+    """Route events from subscription to websocket until it is closed."""
+    while True:
+        entries = await subscription.take_all()
+        if not entries:
+            return
+        for entry in entries:
             await send(websocket, entry)
-    except CancelledError:
-        log.exception("Connection to notify-server closed.")
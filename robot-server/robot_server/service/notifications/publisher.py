@@ -0,0 +1,26 @@
+"""Notification server publisher dependency."""
+from fastapi import Depends
+
+from notify_server.clients.publisher import Publisher, create
+from notify_server.settings import Settings as NotifyServerSettings
+
+from server_utils.fastapi_utils.app_state import (
+    AppState,
+    AppStateAccessor,
+    get_app_state,
+)
+
+_publisher_accessor = AppStateAccessor[Publisher]("notify_server_publisher")
+
+
+async def get_notify_publisher(
+    app_state: AppState = Depends(get_app_state),
+) -> Publisher:
+    """Get a singleton Publisher connected to the notification server."""
+    publisher = _publisher_accessor.get_from(app_state)
+
+    if publisher is None:
+        publisher = create(NotifyServerSettings().publisher_address.connection_string())
+        _publisher_accessor.set_on(app_state, publisher)
+
+    return publisher
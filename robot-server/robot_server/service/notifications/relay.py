@@ -0,0 +1,105 @@
+"""Share one notification server subscription among websocket clients."""
+import asyncio
+import logging
+from typing import Optional, Sequence
+
+from fastapi import Depends
+
+from notify_server.broker import Broker, BrokerStats, Subscription
+from notify_server.clients.subscriber import Subscriber, create
+from notify_server.models.coalescing import get_coalescing_key
+
+from server_utils.fastapi_utils.app_state import (
+    AppState,
+    AppStateAccessor,
+    get_app_state,
+)
+
+from robot_server.settings import get_settings
+
+log = logging.getLogger(__name__)
+
+
+class NotificationRelay:
+    """Multiplex websocket subscribers over a single notification server connection.
+
+    Every event is received and serialized to JSON once, then fanned out to
+    per-client subscriptions, so N websocket clients cost about the same as
+    one. Each client's subscription is bounded and coalesces state-style
+    events, so a slow client only falls behind on its own.
+    """
+
+    def __init__(self, subscriber_address: str) -> None:
+        """Construct a relay that will connect to the given address."""
+        self._subscriber_address = subscriber_address
+        self._broker: Broker[str] = Broker()
+        self._subscriber: Optional[Subscriber] = None
+        self._relay_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def stats(self) -> BrokerStats:
+        """Get the counters of events relayed to websocket clients."""
+        return self._broker.stats
+
+    def subscribe(self, topics: Sequence[str]) -> Subscription[str]:
+        """Subscribe to topics, connecting to the notification server if needed."""
+        if self._relay_task is None or self._relay_task.done():
+            self._subscriber = create(self._subscriber_address, [""])
+            self._relay_task = asyncio.create_task(self._relay(self._subscriber))
+
+        return self._broker.subscribe(topics)
+
+    def unsubscribe(self, subscription: Subscription[str]) -> None:
+        """Remove a subscription."""
+        self._broker.unsubscribe(subscription)
+
+    async def close(self) -> None:
+        """Disconnect from the notification server and close all subscriptions."""
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
+            self._relay_task = None
+
+        if self._subscriber is not None:
+            self._subscriber.close()
+            self._subscriber = None
+
+        self._broker.close()
+
+    async def _relay(self, subscriber: Subscriber) -> None:
+        async for entry in subscriber:
+            self._broker.publish(
+                entry.topic,
+                entry.json(),
+                get_coalescing_key(entry.topic, entry.event),
+            )
+
+        log.info("Connection to notify-server closed.")
+
+
+_relay_accessor = AppStateAccessor[NotificationRelay]("notification_relay")
+
+
+async def get_notification_relay(
+    app_state: AppState = Depends(get_app_state),
+) -> NotificationRelay:
+    """Get the singleton NotificationRelay."""
+    relay = _relay_accessor.get_from(app_state)
+
+    if relay is None:
+        relay = NotificationRelay(get_settings().notification_server_subscriber_address)
+        _relay_accessor.set_on(app_state, relay)
+
+    return relay
+
+
+async def clean_up_notification_relay(app_state: AppState) -> None:
+    """Close the NotificationRelay, if one was created."""
+    relay = _relay_accessor.get_from(app_state)
+
+    if relay is not None:
+        await relay.close()
+        _relay_accessor.set_on(app_state, None)
@@ -0,0 +1,98 @@
+"""Tests for SQLite database configuration and utilities."""
+from datetime import datetime, timezone
+
+import sqlalchemy
+import pytest
+
+from robot_server.persistence import protocol_table, read_only_transaction
+from robot_server.persistence._database import optimize_db
+
+
+def _insert_protocol(
+    connection: sqlalchemy.engine.Connection, protocol_id: str
+) -> None:
+    connection.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id=protocol_id,
+            created_at=datetime(year=2022, month=1, day=1, tzinfo=timezone.utc),
+            protocol_key=None,
+        )
+    )
+
+
+def _count_protocols(connection: sqlalchemy.engine.Connection) -> int:
+    statement = sqlalchemy.select(sqlalchemy.func.count()).select_from(protocol_table)
+    return int(connection.execute(statement).scalar_one())
+
+
+def test_pragmas(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """It should configure each connection for WAL mode and foreign keys."""
+    with sql_engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        # 1 is NORMAL.
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        cache_size = connection.exec_driver_sql("PRAGMA cache_size").scalar()
+        assert cache_size is not None and cache_size < 0
+
+
+def test_connections_are_pooled(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """It should reuse connections across transactions."""
+    # Temporary tables only exist for the connection that created them.
+    with sql_engine.connect() as connection:
+        connection.exec_driver_sql("CREATE TEMP TABLE connection_marker (id INTEGER)")
+    with sql_engine.connect() as connection:
+        connection.exec_driver_sql("SELECT * FROM connection_marker")
+
+
+def test_read_during_write(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """It should let a read proceed while a write transaction is open."""
+    with sql_engine.begin() as write_transaction:
+        _insert_protocol(write_transaction, "protocol-1")
+
+        with read_only_transaction(sql_engine) as read_transaction:
+            # The read sees a snapshot from before the uncommitted write.
+            assert _count_protocols(read_transaction) == 0
+
+    with read_only_transaction(sql_engine) as read_transaction:
+        assert _count_protocols(read_transaction) == 1
+
+
+def test_read_only_transaction_is_a_snapshot(
+    sql_engine: sqlalchemy.engine.Engine,
+) -> None:
+    """It should not see writes committed after the read transaction started."""
+    with read_only_transaction(sql_engine) as read_transaction:
+        assert _count_protocols(read_transaction) == 0
+
+        with sql_engine.begin() as write_transaction:
+            _insert_protocol(write_transaction, "protocol-1")
+
+        assert _count_protocols(read_transaction) == 0
+
+
+def test_read_only_transaction_rejects_writes(
+    sql_engine: sqlalchemy.engine.Engine,
+) -> None:
+    """It should raise if a read-only transaction attempts to write."""
+    with pytest.raises(sqlalchemy.exc.OperationalError):
+        with read_only_transaction(sql_engine) as read_transaction:
+            _insert_protocol(read_transaction, "protocol-1")
+
+    # The connection returned to the pool should be writable again.
+    with sql_engine.begin() as write_transaction:
+        _insert_protocol(write_transaction, "protocol-1")
+
+    with read_only_transaction(sql_engine) as read_transaction:
+        assert _count_protocols(read_transaction) == 1
+
+
+def test_optimize_db(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """It should checkpoint the WAL without disturbing the data."""
+    with sql_engine.begin() as write_transaction:
+        _insert_protocol(write_transaction, "protocol-1")
+
+    optimize_db(sql_engine)
+
+    with read_only_transaction(sql_engine) as read_transaction:
+        assert _count_protocols(read_transaction) == 1
@@ -0,0 +1,160 @@
+"""Tests for the in-memory store cache."""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from robot_server.persistence import CacheStats, StoreCache
+from robot_server.persistence._store_cache import estimate_size
+
+
+def _size_of_len(value: object) -> int:
+    assert isinstance(value, str)
+    return len(value)
+
+
+def test_read_through() -> None:
+    """It should load on a miss and return the cached value on a hit."""
+    subject = StoreCache(max_size_bytes=100, size_of=_size_of_len)
+    loads: List[str] = []
+
+    def load() -> str:
+        loads.append("load")
+        return "value"
+
+    assert subject.get_or_load(key="key", load=load) == "value"
+    assert subject.get_or_load(key="key", load=load) == "value"
+    assert loads == ["load"]
+    assert subject.stats == CacheStats(hits=1, misses=1, entries=1, size_bytes=5)
+
+
+def test_load_error_not_cached() -> None:
+    """It should not cache anything if loading raises."""
+    subject = StoreCache(max_size_bytes=100, size_of=_size_of_len)
+
+    def load() -> str:
+        raise LookupError("oh no")
+
+    with pytest.raises(LookupError):
+        subject.get_or_load(key="key", load=load)
+
+    assert subject.get_or_load(key="key", load=lambda: "value") == "value"
+    assert subject.stats.misses == 2
+
+
+def test_invalidate_by_tag() -> None:
+    """It should only drop entries tagged with an invalidated resource."""
+    subject = StoreCache(max_size_bytes=100, size_of=_size_of_len)
+    subject.get_or_load(key=("get", "a"), load=lambda: "a", tags=["a"])
+    subject.get_or_load(key=("get", "b"), load=lambda: "b", tags=["b"])
+    subject.get_or_load(key="get_all", load=lambda: "ab", tags=["all"])
+
+    subject.invalidate("b", "all")
+
+    assert subject.get_or_load(key=("get", "a"), load=lambda: "new-a") == "a"
+    assert subject.get_or_load(key=("get", "b"), load=lambda: "new-b") == "new-b"
+    assert subject.get_or_load(key="get_all", load=lambda: "new-ab") == "new-ab"
+    assert subject.stats.invalidations == 2
+
+
+def test_evicts_least_recently_used_by_size() -> None:
+    """It should evict the least recently used entries to stay under its size."""
+    subject = StoreCache(max_size_bytes=10, size_of=_size_of_len)
+    subject.get_or_load(key="a", load=lambda: "aaaa")
+    subject.get_or_load(key="b", load=lambda: "bbbb")
+    subject.get_or_load(key="a", load=lambda: "new-a")
+    subject.get_or_load(key="c", load=lambda: "cccc")
+
+    assert subject.stats.evictions == 1
+    assert subject.stats.size_bytes == 8
+    assert subject.get_or_load(key="a", load=lambda: "new-a") == "aaaa"
+    assert subject.get_or_load(key="b", load=lambda: "new-b") == "new-b"
+
+
+def test_skips_oversized_values() -> None:
+    """It should return, but not cache, a value bigger than the whole cache."""
+    subject = StoreCache(max_size_bytes=4, size_of=_size_of_len)
+    subject.get_or_load(key="a", load=lambda: "aaaa")
+
+    assert subject.get_or_load(key="b", load=lambda: "bbbbbbbb") == "bbbbbbbb"
+    assert subject.stats == CacheStats(misses=2, entries=1, size_bytes=4)
+
+
+def test_clear() -> None:
+    """It should drop all entries."""
+    subject = StoreCache(max_size_bytes=100, size_of=_size_of_len)
+    subject.get_or_load(key="a", load=lambda: "aaaa", tags=["a"])
+
+    subject.clear()
+
+    assert subject.stats.entries == 0
+    assert subject.stats.size_bytes == 0
+    assert subject.get_or_load(key="a", load=lambda: "new-a") == "new-a"
+
+
+def test_estimate_size() -> None:
+    """It should grow with the contents of nested containers."""
+    small = {"commands": [{"id": "command-id"}]}
+    large = {"commands": [{"id": f"command-id-{i}"} for i in range(100)]}
+
+    assert estimate_size(large) > 10 * estimate_size(small)
+
+
+def test_load_overlapping_invalidation_not_cached() -> None:
+    """It should not cache a value whose load overlapped an invalidation."""
+    subject = StoreCache(max_size_bytes=100, size_of=_size_of_len)
+
+    def load() -> str:
+        # Another thread writes the resource while this one reads it.
+        subject.invalidate("a")
+        return "old-a"
+
+    assert subject.get_or_load(key="a", load=load, tags=["a"]) == "old-a"
+    assert subject.get_or_load(key="a", load=lambda: "new-a", tags=["a"]) == "new-a"
+    assert subject.get_or_load(key="a", load=lambda: "newer-a") == "new-a"
+
+
+def test_concurrent_reads() -> None:
+    """It should keep consistent counters when used from many threads."""
+    subject = StoreCache(max_size_bytes=1000, size_of=_size_of_len)
+
+    def read(i: int) -> str:
+        key = str(i % 10)
+        return subject.get_or_load(key=key, load=lambda: key * 10, tags=[key])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(read, range(1000)))
+
+    assert results == [str(i % 10) * 10 for i in range(1000)]
+    stats = subject.stats
+    assert stats.hits + stats.misses == 1000
+    assert stats.entries == 10
+    assert stats.size_bytes == 100
+
+
+def test_estimate_size_samples_long_containers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It should estimate a long list from a sample of its items."""
+    commands: List[Dict[str, Any]] = [
+        {"id": f"command-id-{i}", "params": {"i": i}} for i in range(10000)
+    ]
+    getsizeof = sys.getsizeof
+    calls: List[object] = []
+
+    def counting_getsizeof(obj: object) -> int:
+        calls.append(obj)
+        return getsizeof(obj)
+
+    monkeypatch.setattr(sys, "getsizeof", counting_getsizeof)
+    estimate = estimate_size(commands)
+    monkeypatch.undo()
+
+    exact = getsizeof(commands) + sum(
+        getsizeof(c)
+        + getsizeof(c["id"])
+        + getsizeof(c["params"])
+        + getsizeof(c["params"]["i"])
+        for c in commands
+    )
+    assert len(calls) < 1000
+    assert estimate == pytest.approx(exact, rel=0.2)
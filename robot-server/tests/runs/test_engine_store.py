@@ -14,6 +14,9 @@ from opentrons.protocol_engine import ProtocolEngine, StateSummary, types as pe_
 from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 
+from notify_server.clients.publisher import Publisher
+from notify_server.models.topics import RobotEventTopics
+
 from robot_server.protocols import ProtocolResource
 from robot_server.runs.engine_store import EngineStore, EngineConflictError
 
@@ -66,6 +69,26 @@ async def test_create_engine_uses_robot_type(
     assert subject.engine.state_view.config.robot_type == robot_type
 
 
+async def test_create_engine_publishes_run_events(decoy: Decoy) -> None:
+    """It should publish run events of the created engine, if given a publisher."""
+    hardware_api = decoy.mock(cls=HardwareControlAPI)
+    notify_publisher = decoy.mock(cls=Publisher)
+    subject = EngineStore(
+        hardware_api=hardware_api,
+        robot_type="OT-2 Standard",
+        notify_publisher=notify_publisher,
+    )
+
+    await subject.create(run_id="run-id", labware_offsets=[], protocol=None)
+    await subject.runner.run()
+    await subject.clear()
+
+    decoy.verify(
+        notify_publisher.send_nowait(RobotEventTopics.RUN_EVENTS, matchers.Anything()),
+        ignore_extra_args=True,
+    )
+
+
 async def test_create_engine_with_labware_offsets(subject: EngineStore) -> None:
     """It should create an engine for a run with labware offsets."""
     labware_offset = pe_types.LabwareOffsetCreate(
@@ -0,0 +1,153 @@
+"""Tests for the RunEventPublisher plugin."""
+import asyncio
+from datetime import datetime
+from typing import List
+
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.protocol_engine import (
+    EngineStatus,
+    StateView,
+    actions as pe_actions,
+    commands as pe_commands,
+)
+from opentrons.protocol_engine.state.commands import CurrentCommand
+
+from notify_server.clients.publisher import Publisher
+from notify_server.models.event import Event
+from notify_server.models.payload_type import PayloadType
+from notify_server.models.topics import RobotEventTopics
+from notify_server.models.run_event import (
+    RunStatusPayload,
+    CurrentCommandPayload,
+    CommandStatusPayload,
+)
+
+from robot_server.runs.run_event_publisher import RunEventPublisher
+
+
+@pytest.fixture
+def mock_state_view(decoy: Decoy) -> StateView:
+    """Get a mock StateView."""
+    return decoy.mock(cls=StateView)
+
+
+@pytest.fixture
+def mock_publisher(decoy: Decoy) -> Publisher:
+    """Get a mock notification server Publisher."""
+    return decoy.mock(cls=Publisher)
+
+
+@pytest.fixture
+def subject(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    mock_publisher: Publisher,
+) -> RunEventPublisher:
+    """Get a configured RunEventPublisher with its dependencies mocked out."""
+    plugin = RunEventPublisher(run_id="run-id", publisher=mock_publisher)
+    plugin._configure(
+        state=mock_state_view,
+        action_dispatcher=decoy.mock(cls=pe_actions.ActionDispatcher),
+    )
+    return plugin
+
+
+@pytest.fixture
+def published(decoy: Decoy, mock_publisher: Publisher) -> List[PayloadType]:
+    """Get the payloads of all events sent to the run events topic."""
+    payloads: List[PayloadType] = []
+
+    def _append(topic: str, event: Event) -> "asyncio.Future[None]":
+        payloads.append(event.data)
+        sent: "asyncio.Future[None]" = asyncio.get_event_loop().create_future()
+        sent.set_result(None)
+        return sent
+
+    decoy.when(
+        mock_publisher.send_nowait(RobotEventTopics.RUN_EVENTS, matchers.Anything())
+    ).then_do(_append)
+
+    return payloads
+
+
+def _make_command(
+    command_id: str, status: pe_commands.CommandStatus
+) -> pe_commands.Command:
+    return pe_commands.WaitForResume(
+        id=command_id,
+        key=f"{command_id}-key",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=status,
+        params=pe_commands.WaitForResumeParams(),
+    )
+
+
+async def test_publishes_changes(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    published: List[PayloadType],
+    subject: RunEventPublisher,
+) -> None:
+    """It should publish command status, current command, and run status."""
+    running_command = _make_command("command-id", pe_commands.CommandStatus.RUNNING)
+
+    decoy.when(mock_state_view.commands.get("command-id")).then_return(running_command)
+    decoy.when(mock_state_view.commands.get_current()).then_return(
+        CurrentCommand(
+            command_id="command-id",
+            command_key="command-id-key",
+            created_at=datetime(year=2021, month=1, day=1),
+            index=0,
+        )
+    )
+    decoy.when(mock_state_view.commands.get_status()).then_return(EngineStatus.RUNNING)
+
+    subject.setup()
+    subject.handle_action(pe_actions.PlayAction(requested_at=datetime.now()))
+    subject.handle_action(pe_actions.UpdateCommandAction(command=running_command))
+    await subject.teardown()
+
+    assert published == [
+        CommandStatusPayload(
+            runId="run-id",
+            commandId="command-id",
+            commandKey="command-id-key",
+            status=pe_commands.CommandStatus.RUNNING,
+        ),
+        CurrentCommandPayload(
+            runId="run-id",
+            commandId="command-id",
+            commandKey="command-id-key",
+            index=0,
+        ),
+        RunStatusPayload(runId="run-id", status=EngineStatus.RUNNING),
+    ]
+
+
+async def test_coalesces_unchanged_state(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    published: List[PayloadType],
+    subject: RunEventPublisher,
+) -> None:
+    """It should only publish values that changed since they were last published."""
+    decoy.when(mock_state_view.commands.get_current()).then_return(None)
+    decoy.when(mock_state_view.commands.get_status()).then_return(EngineStatus.IDLE)
+
+    subject.setup()
+    subject.handle_action(pe_actions.PlayAction(requested_at=datetime.now()))
+    await asyncio.sleep(0)
+    subject.handle_action(pe_actions.PauseAction(source=pe_actions.PauseSource.CLIENT))
+    await asyncio.sleep(0)
+
+    decoy.when(mock_state_view.commands.get_status()).then_return(
+        EngineStatus.SUCCEEDED
+    )
+    await subject.teardown()
+
+    assert published == [
+        RunStatusPayload(runId="run-id", status=EngineStatus.IDLE),
+        RunStatusPayload(runId="run-id", status=EngineStatus.SUCCEEDED),
+    ]
@@ -494,3 +494,55 @@ def test_get_commands_slice_run_not_found(subject: RunStore) -> None:
     )
     with pytest.raises(RunNotFoundError):
         subject.get_commands_slice(run_id="not-run-id", cursor=1, length=3)
+
+
+def test_cache_invalidated_per_run(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """Writing to one run should not evict another run's cached reads."""
+    subject.insert(
+        run_id="run-a", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    subject.update_run_state(
+        run_id="run-a",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    subject.get_commands_slice(run_id="run-a", length=3, cursor=0)
+    subject.get_all()
+    misses_before = subject.cache_stats.misses
+
+    subject.insert(
+        run_id="run-b", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+
+    subject.get_commands_slice(run_id="run-a", length=3, cursor=0)
+    assert subject.cache_stats.misses == misses_before
+
+    result = subject.get_all()
+    assert subject.cache_stats.misses == misses_before + 1
+    assert [r.run_id for r in result] == ["run-a", "run-b"]
+
+
+def test_cache_reflects_writes(subject: RunStore) -> None:
+    """It should not return stale reads after a write to the same run."""
+    assert subject.has("run-id") is False
+
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    assert subject.has("run-id") is True
+    assert subject.get("run-id").actions == []
+
+    action = RunAction(
+        actionType=RunActionType.PLAY,
+        createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+        id="action-id",
+    )
+    subject.insert_action(run_id="run-id", action=action)
+    assert subject.get("run-id").actions == [action]
+
+    subject.remove(run_id="run-id")
+    assert subject.has("run-id") is False
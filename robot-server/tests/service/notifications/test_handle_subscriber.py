@@ -1,11 +1,9 @@
-from typing import AsyncIterator
-
 import pytest
-from mock import MagicMock, patch, DEFAULT
-from notify_server.clients.serdes import TopicEvent
-from starlette.websockets import WebSocket
+from mock import MagicMock, patch
+from notify_server.broker import Subscription
+from starlette.websockets import WebSocket, WebSocketDisconnect
 from robot_server.service.notifications import handle_subscriber
-from robot_server.settings import get_settings
+from robot_server.service.notifications.relay import NotificationRelay
 
 
 @pytest.fixture
@@ -14,35 +12,41 @@ def mock_socket() -> MagicMock:
     return MagicMock(spec=WebSocket)
 
 
-async def test_create_subscriber(mock_socket: MagicMock) -> None:
-    """Test that a subscriber is created correctly."""
-    # Why two patch calls? `create` is the name of an arg to `patch.multiple`.
-    with patch(
-        "robot_server.service.notifications.handle_subscriber.create"
-    ) as mock_create:
-        with patch.multiple(
-            handle_subscriber, route_events=DEFAULT, receive=DEFAULT
-        ) as values:
-            await handle_subscriber.handle_socket(mock_socket, ["a", "b"])
-            mock_create.assert_called_once_with(
-                get_settings().notification_server_subscriber_address, ["a", "b"]
-            )
-            values["route_events"].assert_called_once()
-            values["receive"].assert_called_once()
-
-
-async def test_route_events(
-    mock_socket: MagicMock,
-    mock_subscriber: AsyncIterator[TopicEvent],
-    topic_event: TopicEvent,
-) -> None:
-    """Test that an event is read from subscriber and sent to websocket."""
+@pytest.fixture
+def mock_relay() -> MagicMock:
+    """A mock notification relay."""
+    return MagicMock(spec=NotificationRelay)
+
+
+async def test_handle_socket(mock_socket: MagicMock, mock_relay: MagicMock) -> None:
+    """Test that a subscription is created and removed correctly."""
+    subscription = Subscription[str](topics=["a", "b"])
+    mock_relay.subscribe.return_value = subscription
+    mock_socket.receive_json.side_effect = WebSocketDisconnect()
+
+    await handle_subscriber.handle_socket(mock_socket, ["a", "b"], mock_relay)
+
+    mock_relay.subscribe.assert_called_once_with(["a", "b"])
+    mock_relay.unsubscribe.assert_called_once_with(subscription)
+    assert subscription.closed
+
+
+async def test_route_events(mock_socket: MagicMock) -> None:
+    """Test that events are read from subscription and sent to websocket."""
+    subscription = Subscription[str](topics=[""])
+    subscription.put("event-1")
+    subscription.put("event-2")
+    subscription.close()
+
     with patch.object(handle_subscriber, "send") as mock_send:
-        await handle_subscriber.route_events(mock_socket, mock_subscriber)
-        mock_send.assert_called_once_with(mock_socket, topic_event)
+        await handle_subscriber.route_events(mock_socket, subscription)
+        assert mock_send.call_args_list == [
+            ((mock_socket, "event-1"),),
+            ((mock_socket, "event-2"),),
+        ]
 
 
-async def test_send_entry(topic_event: TopicEvent, mock_socket: MagicMock) -> None:
-    """Test that entry is sent as json."""
-    await handle_subscriber.send(mock_socket, topic_event)
-    mock_socket.send_text.assert_called_once_with(topic_event.json())
+async def test_send_entry(mock_socket: MagicMock) -> None:
+    """Test that entry is sent as text."""
+    await handle_subscriber.send(mock_socket, '{"topic": "some_topic"}')
+    mock_socket.send_text.assert_called_once_with('{"topic": "some_topic"}')
@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator
+
+from mock import patch
+from opentrons.hardware_control.types import DoorState
+from notify_server.clients.serdes import TopicEvent
+from notify_server.models.event import Event
+from notify_server.models.hardware_event import DoorStatePayload
+
+from robot_server.service.notifications import relay
+from robot_server.service.notifications.relay import NotificationRelay
+
+
+def _door_event(state: DoorState) -> TopicEvent:
+    return TopicEvent(
+        topic="hardware_events",
+        event=Event(
+            createdOn=datetime(2020, 1, 1),
+            publisher="some_one",
+            data=DoorStatePayload(state=state),
+        ),
+    )
+
+
+async def test_relay_fans_out(
+    mock_subscriber: AsyncIterator[TopicEvent], topic_event: TopicEvent
+) -> None:
+    """Test that one connection serves every matching subscription."""
+    with patch.object(relay, "create", return_value=mock_subscriber) as mock_create:
+        subject = NotificationRelay("tcp://localhost:5555")
+        first = subject.subscribe(["some_topic"])
+        second = subject.subscribe(["some"])
+        other = subject.subscribe(["other_topic"])
+        await asyncio.sleep(0)
+
+    mock_create.assert_called_once_with("tcp://localhost:5555", [""])
+    assert await first.take_all() == [topic_event.json()]
+    assert await second.take_all() == [topic_event.json()]
+    assert subject.stats.published == 1
+    assert subject.stats.delivered == 2
+
+    subject.unsubscribe(other)
+    assert await other.take_all() == []
+
+
+async def test_relay_coalesces() -> None:
+    """Test that a slow subscriber only gets the latest state-style event."""
+
+    async def _subscriber() -> AsyncIterator[TopicEvent]:
+        yield _door_event(DoorState.OPEN)
+        yield _door_event(DoorState.CLOSED)
+
+    with patch.object(relay, "create", return_value=_subscriber()):
+        subject = NotificationRelay("tcp://localhost:5555")
+        subscription = subject.subscribe(["hardware_events"])
+        await asyncio.sleep(0)
+
+    assert await subscription.take_all() == [_door_event(DoorState.CLOSED).json()]
+    assert subject.stats.coalesced == 1
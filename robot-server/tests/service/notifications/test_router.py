@@ -7,7 +7,7 @@ from notify_server.clients.serdes import TopicEvent
 from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
-from robot_server.service.notifications import handle_subscriber
+from robot_server.service.notifications import handle_subscriber, relay
 
 
 def test_subscribe(api_client: TestClient):
@@ -30,8 +30,8 @@ def test_integration(
     topic_event: TopicEvent,
 ) -> None:
     """Test receiving a single event."""
-    with patch.object(handle_subscriber, "create", return_value=mock_subscriber):
-        sock = api_client.websocket_connect("/notifications/subscribe?topic=t")
+    with patch.object(relay, "create", return_value=mock_subscriber):
+        sock = api_client.websocket_connect("/notifications/subscribe?topic=some_topic")
         event = sock.receive()
         assert event["text"] == topic_event.json()
         assert event["type"] == "websocket.send"
@@ -40,14 +40,13 @@ async def main() -> NoReturn:
         LOG.error("udev did not generate a serial handle")
         exit(-1)
 
-    ser = None
-
     monitor = usb_monitor.USBConnectionMonitorFactory.create(
         phy_udev_name=default_config.PHY_NAME, udc_folder=config.udc_folder()
     )
 
-    # Create a tcp connection that will be managed by `listen`
+    # Create a tcp connection that will be managed by the listener
     tcp = tcp_conn.TCPConnection()
+    bridge = listener.Listener(monitor, config, tcp)
 
     # After the gadget starts up, need time to populate state
     time.sleep(1)
@@ -56,10 +55,10 @@ async def main() -> NoReturn:
 
     if monitor.host_connected():
         LOG.debug("USB connected on startup")
-        ser = listener.update_ser_handle(config, ser, True, tcp)
+        bridge.update_ser_handle(True)
 
     while True:
-        ser = listener.listen(monitor, config, ser, tcp)
+        bridge.listen()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,118 @@
+"""Buffering and accounting for one direction of the USB-TCP bridge."""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+LOG = logging.getLogger(__name__)
+
+# The most data buffered in one direction before the source stops being read
+MAX_BUFFERED = 64 * 1024
+
+
+@dataclass
+class PipeStats:
+    """Counters for one direction of the bridge."""
+
+    bytes_in: int = 0
+    bytes_out: int = 0
+    flushes: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Average time from data arriving to the buffer being fully written."""
+        if self.flushes == 0:
+            return 0.0
+        return self.total_latency / self.flushes
+
+
+class DataPipe:
+    """A buffer of data read from a source, waiting to be written to a sink.
+
+    Data from any number of reads is coalesced into a single contiguous
+    buffer, which is reused for the life of the pipe and written out with as
+    few write calls as the sink allows. Once `max_buffered` bytes are waiting,
+    the pipe stops accepting data so the source is no longer read, pushing
+    back on a fast sender instead of growing memory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_buffered: int = MAX_BUFFERED,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty pipe.
+
+        Args:
+            name: A name for the direction of this pipe, used in logs
+
+            max_buffered: The buffer size at which to stop accepting data
+
+            clock: Monotonic time source, in seconds
+        """
+        self._name = name
+        self._max_buffered = max_buffered
+        self._clock = clock
+        self._buf = bytearray()
+        self._pending_since: Optional[float] = None
+        self.stats = PipeStats()
+
+    @property
+    def name(self) -> str:
+        """The name of this pipe."""
+        return self._name
+
+    def accepting(self) -> bool:
+        """Check whether the source should be read."""
+        return len(self._buf) < self._max_buffered
+
+    def space(self) -> int:
+        """Get how many more bytes the pipe accepts."""
+        return max(self._max_buffered - len(self._buf), 0)
+
+    def pending(self) -> bool:
+        """Check whether any data is waiting to be written."""
+        return len(self._buf) > 0
+
+    def feed(self, data: bytes) -> None:
+        """Add data read from the source."""
+        if not data:
+            return
+        if not self._buf:
+            self._pending_since = self._clock()
+        self._buf += data
+        self.stats.bytes_in += len(data)
+
+    def flush(self, write: Callable[[memoryview], Optional[int]]) -> int:
+        """Write as much pending data as the sink accepts.
+
+        Args:
+            write: A non-blocking write function for the sink, which returns
+            the number of bytes it accepted.
+
+        Returns the number of bytes written.
+        """
+        if not self._buf:
+            return 0
+        with memoryview(self._buf) as view:
+            written = write(view) or 0
+        if written:
+            del self._buf[:written]
+            self.stats.bytes_out += written
+        if not self._buf and self._pending_since is not None:
+            latency = self._clock() - self._pending_since
+            self._pending_since = None
+            self.stats.flushes += 1
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+        return written
+
+    def clear(self) -> None:
+        """Drop any pending data, for example after a disconnect."""
+        if self._buf:
+            LOG.debug(f"{self._name}: dropping {len(self._buf)} pending bytes")
+        self._buf.clear()
+        self._pending_since = None
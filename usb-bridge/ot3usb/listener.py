@@ -1,17 +1,21 @@
 """Module to poll for input from all sources."""
 
 import logging
-import select
-from typing import Optional, List, Any
+import os
+import selectors
+from typing import Dict, Optional, Tuple, Union
 import serial  # type: ignore[import]
 
 from . import usb_config, default_config, usb_monitor, tcp_conn
+from .data_pipe import DataPipe, PipeStats, MAX_BUFFERED
 
 LOG = logging.getLogger(__name__)
 
 # 1 second polling for select()
 POLL_TIMEOUT = 1.0
 
+_Source = Union[usb_monitor.USBConnectionMonitor, serial.Serial, tcp_conn.TCPConnection]
+
 
 def update_ser_handle(
     config: usb_config.SerialGadget,
@@ -57,54 +61,176 @@ def check_monitor(monitor: usb_monitor.USBConnectionMonitor, msg_ready: bool) ->
         monitor.update_state()
 
 
-def listen(
-    monitor: usb_monitor.USBConnectionMonitor,
-    config: usb_config.SerialGadget,
-    ser: Optional[serial.Serial],
-    tcp: tcp_conn.TCPConnection,
-) -> Optional[serial.Serial]:
-    """Process any available incoming data.
+class Listener:
+    """Relay data between the USB serial port and the internal TCP server.
 
-    This function will check for input from any of the input sources to the
-    USB bridge:
+    A single selector waits on every input source of the USB bridge:
         - The serial port, if it is available
         - The UDEV message stream (usb_monitor)
         - The TCP connection to the NGINX server, if a connection is open
 
-    Args:
-        monitor: The USB connection monitor
-
-        config: Serial gadget configuration
-
-        ser: Handle for the serial port
-
-        tcp: Handle for the socket connection to the internal server
+    Each direction of the bridge is buffered in a `DataPipe`. A readable
+    source is drained completely when the selector reports it, and a sink is
+    only written to when it is writable, with everything pending for it in
+    a single write. A sink that falls behind fills its pipe, at which point
+    its source stops being read until the sink catches up.
     """
-    rlist: List[Any] = [monitor]
-    if ser is not None:
-        rlist.append(ser)
-        rlist.append(tcp)
-
-    ready = select.select(rlist, [], [], POLL_TIMEOUT)[0]
-    if len(ready) == 0 or monitor in ready:
-        # Read a new udev messages
-        check_monitor(monitor, monitor in ready)
-        ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
-        # ALWAYS exit early if we had a change in udev messages
-        return ser
-    if ser and ser in ready:
-        # Ready serial data
+
+    def __init__(
+        self,
+        monitor: usb_monitor.USBConnectionMonitor,
+        config: usb_config.SerialGadget,
+        tcp: tcp_conn.TCPConnection,
+        selector: Optional[selectors.BaseSelector] = None,
+        max_buffered: int = MAX_BUFFERED,
+    ) -> None:
+        """Create a listener, with no serial port open yet.
+
+        Args:
+            monitor: The USB connection monitor
+
+            config: Serial gadget configuration
+
+            tcp: Handle for the socket connection to the internal server
+
+            selector: The selector to wait for readiness with
+
+            max_buffered: The most data to buffer in each direction
+        """
+        self._monitor = monitor
+        self._config = config
+        self._tcp = tcp
+        self._ser: Optional[serial.Serial] = None
+        self._selector = selector or selectors.DefaultSelector()
+        self._serial_to_tcp = DataPipe("serial->tcp", max_buffered)
+        self._tcp_to_serial = DataPipe("tcp->serial", max_buffered)
+        self._tcp_read_buf = bytearray(tcp_conn.MAX_BUF)
+        self._registered_tcp_id: Optional[int] = None
+
+    @property
+    def ser(self) -> Optional[serial.Serial]:
+        """The handle for the serial port, if it is open."""
+        return self._ser
+
+    def stats(self) -> Dict[str, PipeStats]:
+        """Get the byte and latency counters for each direction."""
+        return {
+            pipe.name: pipe.stats for pipe in (self._serial_to_tcp, self._tcp_to_serial)
+        }
+
+    def update_ser_handle(self, connected: bool) -> None:
+        """Open or close the serial port according to the USB host connection."""
+        ser = update_ser_handle(self._config, self._ser, connected, self._tcp)
+        if ser is None and self._ser is not None:
+            for name, stats in self.stats().items():
+                LOG.info(f"{name}: {stats}")
+            self._serial_to_tcp.clear()
+            self._tcp_to_serial.clear()
+        self._ser = ser
+
+    def listen(self, timeout: float = POLL_TIMEOUT) -> Optional[serial.Serial]:
+        """Wait for and process any available incoming data.
+
+        Returns the handle for the serial port, if it is open.
+
+        Args:
+            timeout: Longest time to wait for any source, in seconds
+        """
+        self._update_registrations()
+        ready: Dict[_Source, int] = {
+            key.data: events for key, events in self._selector.select(timeout)
+        }
+        if len(ready) == 0 or self._monitor in ready:
+            # Read a new udev messages
+            check_monitor(self._monitor, self._monitor in ready)
+            self.update_ser_handle(self._monitor.host_connected())
+            # ALWAYS exit early if we had a change in udev messages
+            return self._ser
+
+        ser = self._ser
+        if ser is None:
+            return None
+        ser_events = ready.get(ser, 0)
+        tcp_events = ready.get(self._tcp, 0)
         try:
-            data = ser.read_all()
-            LOG.debug(f"Received: {data}")
-            tcp.send(data)
+            if ser_events & selectors.EVENT_READ:
+                self._serial_to_tcp.feed(
+                    ser.read(min(ser.in_waiting, self._serial_to_tcp.space()))
+                )
+            if ser_events & selectors.EVENT_WRITE:
+                self._tcp_to_serial.flush(self._write_serial)
         except OSError:
             LOG.debug("Got an OSError when disconnecting")
-            monitor.update_state()
-            ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
-    if ser and tcp in ready:
-        # Ready TCP data to echo to serial
-        data = tcp.read()
-        if len(data) > 0:
-            ser.write(data)
-    return ser
+            self._monitor.update_state()
+            self.update_ser_handle(self._monitor.host_connected())
+            return self._ser
+
+        if tcp_events & selectors.EVENT_READ:
+            self._read_tcp()
+        if tcp_events & selectors.EVENT_WRITE:
+            self._serial_to_tcp.flush(self._tcp.send_some)
+        return self._ser
+
+    def _read_tcp(self) -> None:
+        """Drain the TCP socket, as far as the pipe accepts."""
+        with memoryview(self._tcp_read_buf) as buf:
+            while self._tcp_to_serial.accepting():
+                read = self._tcp.read_into(buf[: self._tcp_to_serial.space()])
+                if read <= 0:
+                    break
+                self._tcp_to_serial.feed(buf[:read])
+
+    def _write_serial(self, data: memoryview) -> int:
+        """Write to the serial port without blocking."""
+        assert self._ser is not None
+        try:
+            return os.write(self._ser.fileno(), data)
+        except BlockingIOError:
+            return 0
+
+    def _wanted_events(self) -> Dict[int, Tuple[int, _Source]]:
+        """Get the events each source is currently interested in, by file number."""
+        wanted: Dict[int, Tuple[int, _Source]] = {
+            self._monitor.fileno(): (selectors.EVENT_READ, self._monitor)
+        }
+        if self._ser is None or not self._tcp.connected():
+            return wanted
+
+        ser_events = 0
+        tcp_events = 0
+        if self._serial_to_tcp.accepting():
+            ser_events |= selectors.EVENT_READ
+        if self._serial_to_tcp.pending():
+            tcp_events |= selectors.EVENT_WRITE
+        if self._tcp_to_serial.accepting():
+            tcp_events |= selectors.EVENT_READ
+        if self._tcp_to_serial.pending():
+            ser_events |= selectors.EVENT_WRITE
+        if ser_events:
+            wanted[self._ser.fileno()] = (ser_events, self._ser)
+        if tcp_events:
+            wanted[self._tcp.fileno()] = (tcp_events, self._tcp)
+        return wanted
+
+    def _update_registrations(self) -> None:
+        """Register each source for the events it is currently interested in.
+
+        Sources are registered by file number. A reconnected TCP socket often
+        gets the file number of the socket it replaced, but the selector
+        stopped watching that socket when it closed, so the TCP connection is
+        always registered again after it reconnects.
+        """
+        wanted = self._wanted_events()
+        registered = self._selector.get_map()
+        if self._tcp.connection_id != self._registered_tcp_id:
+            for fd in [fd for fd, key in registered.items() if key.data is self._tcp]:
+                self._selector.unregister(fd)
+            self._registered_tcp_id = self._tcp.connection_id
+        for fd in [fd for fd in registered if fd not in wanted]:
+            self._selector.unregister(fd)
+        for fd, (events, source) in wanted.items():
+            key = registered.get(fd)
+            if key is None:
+                self._selector.register(fd, events, source)
+            elif key.events != events or key.data is not source:
+                self._selector.modify(fd, events, source)
@@ -15,6 +15,7 @@ class TCPConnection:
         """Create a new TCPConnection, not connected to any socket yet."""
         self._sock: Optional[socket.socket] = None
         self._host: Optional[Tuple[str, int]] = None
+        self._connection_id = 0
 
     def connect(self, ip: str, port: int) -> bool:
         """Open the connection.
@@ -31,10 +32,14 @@ class TCPConnection:
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._host = (ip, port)
             self._sock.connect(self._host)
+            # The listener only reads or writes when the socket is ready,
+            # and must never block on a slow peer
+            self._sock.setblocking(False)
         except Exception as err:
             LOG.error(f"Could not open TCP: {str(err)}")
             self._sock = None
             return False
+        self._connection_id += 1
         LOG.debug(f"Opened socket to {ip}:{port}")
         return True
 
@@ -52,7 +57,11 @@ class TCPConnection:
     def disconnect(self) -> None:
         """If a connection exists, disconnect it."""
         if self._sock is not None:
-            self._sock.shutdown(socket.SHUT_RDWR)
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                # The peer already reset or closed the connection
+                pass
             self._sock.close()
             self._sock = None
             LOG.debug("Shut down socket")
@@ -61,6 +70,15 @@ class TCPConnection:
         """Check if the connection is active."""
         return self.fileno() != -1
 
+    @property
+    def connection_id(self) -> int:
+        """A number that changes every time the connection is opened.
+
+        A new socket often reuses the file number of the one it replaced,
+        so this is how to tell that the connection was reopened.
+        """
+        return self._connection_id
+
     def fileno(self) -> int:
         """Get the selectable file number for the socket.
 
@@ -70,25 +88,46 @@ class TCPConnection:
             return -1
         return self._sock.fileno()
 
-    def read(self) -> bytes:
-        """Read available data over the socket."""
+    def read_into(self, buf: memoryview) -> int:
+        """Read available data over the socket into a buffer.
+
+        Returns the number of bytes read, which is 0 if no data is available
+        or if the connection died and was reconnected.
+
+        Args:
+            buf: buffer to read into; at most its length is read.
+        """
         if not self._sock:
-            return bytes()
-        ret = self._sock.recv(MAX_BUF)
-        if len(ret) == 0:
+            return 0
+        try:
+            ret = self._sock.recv_into(buf)
+        except BlockingIOError:
+            return 0
+        except OSError as err:
+            LOG.debug(f"Got an OSError when reading: {err}")
+            self._reconnect()
+            return 0
+        if ret == 0:
             # The socket connection died! Just reconnect to the server.
             self._reconnect()
-        LOG.debug(f"Received [{len(ret)}] bytes")
         return ret
 
-    def send(self, data: bytes) -> bool:
-        """Send some data over the socket.
+    def send_some(self, data: memoryview) -> int:
+        """Send as much data as the socket accepts without blocking.
+
+        Returns the number of bytes sent, which is 0 if the socket is full or
+        if the connection died and was reconnected.
 
         Args:
-            data: raw data array to send over the socket.
+            data: raw data to send over the socket.
         """
         if not self._sock:
-            return False
-        sent = self._sock.send(data)
-        LOG.debug(f"Sent [{sent}] bytes")
-        return sent == len(data)
+            return 0
+        try:
+            return self._sock.send(data)
+        except BlockingIOError:
+            return 0
+        except OSError as err:
+            LOG.debug(f"Got an OSError when sending: {err}")
+            self._reconnect()
+            return 0
@@ -0,0 +1,75 @@
+"""Tests for the DataPipe class."""
+
+from typing import List
+
+from ot3usb.data_pipe import DataPipe
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_feed_and_flush() -> None:
+    subject = DataPipe("test")
+    written: List[bytes] = []
+
+    def _write(data: memoryview) -> int:
+        written.append(bytes(data))
+        return len(data)
+
+    assert not subject.pending()
+    assert subject.flush(_write) == 0
+
+    subject.feed(b"abc")
+    subject.feed(b"def")
+    assert subject.pending()
+
+    # Data from both reads goes out in a single write
+    assert subject.flush(_write) == 6
+    assert written == [b"abcdef"]
+    assert not subject.pending()
+    assert subject.stats.bytes_in == 6
+    assert subject.stats.bytes_out == 6
+
+
+def test_partial_flush_and_latency() -> None:
+    clock = FakeClock()
+    subject = DataPipe("test", clock=clock)
+
+    subject.feed(b"abcdef")
+    clock.now = 1.0
+    assert subject.flush(lambda data: 4) == 4
+    assert subject.pending()
+    assert subject.stats.flushes == 0
+
+    clock.now = 3.0
+    assert subject.flush(lambda data: len(data)) == 2
+    assert subject.stats.flushes == 1
+    assert subject.stats.max_latency == 3.0
+    assert subject.stats.average_latency == 3.0
+
+
+def test_backpressure() -> None:
+    subject = DataPipe("test", max_buffered=4)
+    assert subject.accepting()
+    assert subject.space() == 4
+
+    subject.feed(b"abcd")
+    assert not subject.accepting()
+    assert subject.space() == 0
+
+    subject.flush(lambda data: 2)
+    assert subject.accepting()
+    assert subject.space() == 2
+
+
+def test_clear() -> None:
+    subject = DataPipe("test")
+    subject.feed(b"abcd")
+    subject.clear()
+    assert not subject.pending()
+    assert subject.stats.flushes == 0
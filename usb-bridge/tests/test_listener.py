@@ -1,9 +1,14 @@
 """Tests for the main file for ot3usb."""
 
+import fcntl
+import socket
+import struct
+import termios
+from typing import Iterator, Tuple
+
 import pytest
 import mock
 
-import select
 import serial  # type: ignore[import]
 
 from ot3usb import usb_config, tcp_conn, usb_monitor, listener
@@ -69,71 +74,237 @@ def test_check_monitor() -> None:
     monitor.update_state.assert_called_once()
 
 
-TIMEOUT = listener.POLL_TIMEOUT
-
 SER_DATA = b"abcd"
 TCP_DATA = b"efgh"
 
+SocketPair = Tuple[socket.socket, socket.socket]
+
+
+@pytest.fixture
+def monitor_pair() -> Iterator[SocketPair]:
+    """A socket pair standing in for the udev message stream."""
+    pair = socket.socketpair()
+    yield pair
+    for s in pair:
+        s.close()
+
 
-def test_listen(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture
+def serial_pair() -> Iterator[SocketPair]:
+    """A socket pair standing in for the USB serial port and its host."""
+    pair = socket.socketpair()
+    for s in pair:
+        s.setblocking(False)
+    yield pair
+    for s in pair:
+        s.close()
+
+
+@pytest.fixture
+def tcp_pair() -> Iterator[SocketPair]:
+    """A socket pair standing in for the TCP connection and its server."""
+    pair = socket.socketpair()
+    for s in pair:
+        s.setblocking(False)
+    yield pair
+    for s in pair:
+        s.close()
+
+
+@pytest.fixture
+def monitor(monitor_pair: SocketPair) -> mock.MagicMock:
     monitor = monitor_mock()
-    config = config_mock()
-    tcp = tcp_mock()
+    monitor.fileno.return_value = monitor_pair[0].fileno()
+    monitor.host_connected.return_value = True
+    return monitor
+
+
+@pytest.fixture
+def ser(serial_pair: SocketPair) -> mock.MagicMock:
     ser = serial_mock()
+    ser.fileno.return_value = serial_pair[0].fileno()
+
+    def _in_waiting() -> int:
+        waiting = fcntl.ioctl(serial_pair[0].fileno(), termios.FIONREAD, b"\0" * 4)
+        return int(struct.unpack("i", waiting)[0])
+
+    def _read(size: int) -> bytes:
+        try:
+            return serial_pair[0].recv(size)
+        except BlockingIOError:
+            return b""
+
+    type(ser).in_waiting = mock.PropertyMock(side_effect=_in_waiting)
+    ser.read.side_effect = _read
+    return ser
+
+
+@pytest.fixture
+def tcp(tcp_pair: SocketPair) -> tcp_conn.TCPConnection:
+    tcp = tcp_conn.TCPConnection()
+    tcp._sock = tcp_pair[0]
+    return tcp
 
-    ser.read_all.return_value = SER_DATA
-    tcp.read.return_value = TCP_DATA
 
-    tcp.connected.return_value = False
+def _listen_until_idle(subject: listener.Listener) -> None:
+    for _ in range(5):
+        subject.listen(timeout=0.01)
 
-    select_mock = mock.MagicMock(select.select)
-    monkeypatch.setattr("select.select", select_mock)
 
-    # FIRST TESTS - NO SERIAL OPEN
-    select_mock.return_value = ([], None, None)
+def test_listen_monitor(monitor: mock.MagicMock, monitor_pair: SocketPair) -> None:
+    config = config_mock()
+    tcp = tcp_mock()
+    config.get_handle.return_value = FAKE_HANDLE
+    subject = listener.Listener(monitor, config, tcp)
 
     # No message ready, monitor disconnected
     monitor.host_connected.return_value = False
-    assert listener.listen(monitor, config, None, tcp) is None
+    assert subject.listen(timeout=0) is None
     monitor.update_state.assert_called_once()
-    select_mock.assert_called_with([monitor], [], [], TIMEOUT)
-    select_mock.reset_mock()
+    monitor.read_message.assert_not_called()
     monitor.reset_mock()
 
     # Monitor has a message and is connected
     monitor.host_connected.return_value = True
-    select_mock.return_value = ([monitor], None, None)
-    assert listener.listen(monitor, config, None, tcp) is not None
-    # Monitor should be manually updated
+    monitor_pair[1].send(b"udev")
+    assert subject.listen(timeout=0) == FAKE_HANDLE
+    monitor.read_message.assert_called_once()
+    # Monitor should not be manually updated
     monitor.update_state.assert_not_called()
-    select_mock.assert_called_with([monitor], [], [], TIMEOUT)
-    select_mock.reset_mock()
-    monitor.reset_mock()
-
-    # NEXT TESTS - SERIAL IS OPEN
+    tcp.connect.assert_called_once()
 
-    # Nothing ready to read
-    select_mock.return_value = ([], None, None)
-    tcp.connected.return_value = True
-    monitor.host_connected.return_value = True
-    assert listener.listen(monitor, config, ser, tcp) == ser
-    select_mock.assert_called_with([monitor, ser, tcp], [], [], TIMEOUT)
-    select_mock.reset_mock()
-    monitor.reset_mock()
 
-    # Serial and TCP ready to read
-    select_mock.return_value = ([ser, tcp], None, None)
-    tcp.connected.return_value = True
-    monitor.host_connected.return_value = True
-    assert listener.listen(monitor, config, ser, tcp) == ser
-    select_mock.assert_called_with([monitor, ser, tcp], [], [], TIMEOUT)
-    ser.read_all.assert_called_once()
-    tcp.send.assert_called_with(SER_DATA)
-    tcp.read.assert_called_once()
-    ser.write.assert_called_with(TCP_DATA)
-
-    ser.reset_mock()
-    select_mock.reset_mock()
-    monitor.reset_mock()
+def test_listen_relays_data(
+    monitor: mock.MagicMock,
+    ser: mock.MagicMock,
+    tcp: tcp_conn.TCPConnection,
+    serial_pair: SocketPair,
+    tcp_pair: SocketPair,
+) -> None:
+    config = config_mock()
+    subject = listener.Listener(monitor, config, tcp)
+    subject._ser = ser
+
+    serial_pair[1].send(SER_DATA)
+    tcp_pair[1].send(TCP_DATA)
+    _listen_until_idle(subject)
+
+    assert tcp_pair[1].recv(4096) == SER_DATA
+    assert serial_pair[1].recv(4096) == TCP_DATA
+
+    stats = subject.stats()
+    assert stats["serial->tcp"].bytes_in == len(SER_DATA)
+    assert stats["serial->tcp"].bytes_out == len(SER_DATA)
+    assert stats["serial->tcp"].flushes == 1
+    assert stats["tcp->serial"].bytes_out == len(TCP_DATA)
+
+
+def test_listen_backpressure(
+    monitor: mock.MagicMock,
+    ser: mock.MagicMock,
+    tcp: tcp_conn.TCPConnection,
+    tcp_pair: SocketPair,
+    serial_pair: SocketPair,
+) -> None:
+    config = config_mock()
+    subject = listener.Listener(monitor, config, tcp, max_buffered=8)
+    subject._ser = ser
+    # Fill the serial port so it accepts no more writes
+    serial_pair[0].setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1)
+    try:
+        while True:
+            serial_pair[0].send(b"x" * 4096)
+    except BlockingIOError:
+        pass
+
+    tcp_pair[1].send(TCP_DATA * 4)
+    _listen_until_idle(subject)
+
+    # Only as much as the pipe holds is read; the rest waits in the socket
+    assert subject.stats()["tcp->serial"].bytes_in == 8
+    assert tcp_pair[0].recv(4096) == (TCP_DATA * 4)[8:]
+
+
+def test_listen_serial_backpressure(
+    monitor: mock.MagicMock,
+    ser: mock.MagicMock,
+    tcp: tcp_conn.TCPConnection,
+    tcp_pair: SocketPair,
+    serial_pair: SocketPair,
+) -> None:
+    config = config_mock()
+    subject = listener.Listener(monitor, config, tcp, max_buffered=8)
+    subject._ser = ser
+    # Fill the TCP socket so it accepts no more writes
+    tcp_pair[0].setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1)
+    try:
+        while True:
+            tcp_pair[0].send(b"x" * 4096)
+    except BlockingIOError:
+        pass
+
+    serial_pair[1].send(SER_DATA * 4)
+    _listen_until_idle(subject)
+
+    # Only as much as the pipe holds is read; the rest waits in the port
+    assert subject.stats()["serial->tcp"].bytes_in == 8
+    assert serial_pair[0].recv(4096) == (SER_DATA * 4)[8:]
+
+
+@pytest.mark.parametrize("reset", [False, True])
+def test_listen_tcp_reconnect(
+    monitor: mock.MagicMock,
+    ser: mock.MagicMock,
+    serial_pair: SocketPair,
+    reset: bool,
+) -> None:
+    """It should keep relaying after the server drops the connection."""
+    config = config_mock()
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(2)
+        server.settimeout(1)
+        tcp = tcp_conn.TCPConnection()
+        assert tcp.connect(*server.getsockname())
+        old_fileno = tcp.fileno()
+        subject = listener.Listener(monitor, config, tcp)
+        subject._ser = ser
+        _listen_until_idle(subject)
+
+        old_conn, _ = server.accept()
+        if reset:
+            # Close with a RST, so the bridge gets a ConnectionResetError
+            old_conn.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+        old_conn.close()
+        _listen_until_idle(subject)
+
+        new_conn, _ = server.accept()
+        with new_conn:
+            # The new socket takes over the old one's file number
+            assert tcp.fileno() == old_fileno
+            new_conn.send(TCP_DATA)
+            serial_pair[1].send(SER_DATA)
+            _listen_until_idle(subject)
+            new_conn.settimeout(1)
+            assert new_conn.recv(4096) == SER_DATA
+        assert serial_pair[1].recv(4096) == TCP_DATA
+        tcp.disconnect()
+
+
+def test_listen_serial_disconnect(
+    monitor: mock.MagicMock,
+    ser: mock.MagicMock,
+    tcp: tcp_conn.TCPConnection,
+    serial_pair: SocketPair,
+) -> None:
+    config = config_mock()
+    subject = listener.Listener(monitor, config, mock.MagicMock(wraps=tcp))
+    subject._ser = ser
+    ser.read.side_effect = OSError("Disconnected")
+    monitor.host_connected.return_value = False
 
-    # Check for handling when the serial line disconnecs
+    serial_pair[1].send(SER_DATA)
+    assert subject.listen(timeout=0.01) is None
+    monitor.update_state.assert_called_once()
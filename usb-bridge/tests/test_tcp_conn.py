@@ -52,7 +52,7 @@ def test_connect(
     monkeypatch.setattr("socket.socket", mock.MagicMock(socket.socket))
 
     # When disconnected, should not be able to read
-    assert subject.read() == b""
+    assert subject.read_into(memoryview(bytearray(16))) == 0
 
     # Reconnection should not work now
     subject._reconnect()
@@ -61,6 +61,7 @@ def test_connect(
     # Dry run connection
     assert subject.connect(IP, PORT)
     assert subject.connected()
+    assert subject.connection_id == 1
 
     # Make sure disconnection clears out the port
     subject.disconnect()
@@ -69,6 +70,7 @@ def test_connect(
     # Reconnection should work now
     subject._reconnect()
     assert subject.connected()
+    assert subject.connection_id == 2
 
     # Now test error case
     mock_sock = mock.MagicMock(socket.socket)
@@ -78,43 +80,65 @@ def test_connect(
     assert not subject.connect(IP, PORT)
 
 
-def test_read(
+def test_disconnect_after_reset(
+    subject_connected: TCPConnection, socket_driver: mock.Mock
+) -> None:
+    socket_driver.shutdown.side_effect = OSError("Not connected")
+    subject_connected.disconnect()
+    socket_driver.close.assert_called_once()
+    assert not subject_connected.connected()
+
+
+def test_read_into(
     subject_connected: TCPConnection,
     socket_driver: mock.Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     subject = subject_connected
-    socket_driver.recv.return_value = RECV_RET
-    # Set up a patch on the reconnect function
     reconnect_mock = mock.MagicMock(TCPConnection._reconnect)
     monkeypatch.setattr(subject, "_reconnect", reconnect_mock)
+    buf = memoryview(bytearray(16))
 
-    # Make sure that reading returns the data
-    data = subject.read()
-    socket_driver.recv.assert_called_once()
-    assert data == RECV_RET
+    socket_driver.recv_into.return_value = len(RECV_RET)
+    assert subject.read_into(buf) == len(RECV_RET)
+    socket_driver.recv_into.assert_called_once_with(buf)
 
-    # Check error case
-    socket_driver.reset_mock()
-    socket_driver.recv.return_value = b""
-    data = subject.read()
-    assert data == b""
-    reconnect_mock.assert_called_once()
+    # No data available on the non-blocking socket
+    socket_driver.recv_into.side_effect = BlockingIOError()
+    assert subject.read_into(buf) == 0
+    reconnect_mock.assert_not_called()
 
+    # Connection died
+    socket_driver.recv_into.side_effect = None
+    socket_driver.recv_into.return_value = 0
+    assert subject.read_into(buf) == 0
+    reconnect_mock.assert_called_once()
 
-def test_send(subject_connected: TCPConnection, socket_driver: mock.Mock) -> None:
-    subject = subject_connected
-    socket_driver.send.return_value = len(SEND_DATA)
+    # Connection reset
+    reconnect_mock.reset_mock()
+    socket_driver.recv_into.side_effect = ConnectionResetError()
+    assert subject.read_into(buf) == 0
+    reconnect_mock.assert_called_once()
 
-    assert subject.send(SEND_DATA)
 
-    socket_driver.send.return_value = len(SEND_DATA) - 1
-    assert not subject.send(SEND_DATA)
+def test_send_some(
+    subject_connected: TCPConnection,
+    subject_disconnected: TCPConnection,
+    socket_driver: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    reconnect_mock = mock.MagicMock(TCPConnection._reconnect)
+    monkeypatch.setattr(subject_connected, "_reconnect", reconnect_mock)
+    data = memoryview(SEND_DATA)
+    socket_driver.send.return_value = 4
+    assert subject_connected.send_some(data) == 4
 
+    socket_driver.send.side_effect = BlockingIOError()
+    assert subject_connected.send_some(data) == 0
+    reconnect_mock.assert_not_called()
 
-def test_send_fail(
-    subject_disconnected: TCPConnection, socket_driver: mock.Mock
-) -> None:
-    assert not subject_disconnected.send(SEND_DATA)
+    socket_driver.send.side_effect = BrokenPipeError()
+    assert subject_connected.send_some(data) == 0
+    reconnect_mock.assert_called_once()
 
-    socket_driver.send.assert_not_called()
+    assert subject_disconnected.send_some(data) == 0